@@ -112,6 +112,9 @@ def __getattr__(name):
     elif name == 'DegradationAlert':
         from .performance_tracker import DegradationAlert
         return DegradationAlert
+    elif name == 'StreamingDegradationDetector':
+        from .degradation_detector import StreamingDegradationDetector
+        return StreamingDegradationDetector
     elif name == 'ProviderRecommendation':
         from .context_learner import ProviderRecommendation
         return ProviderRecommendation
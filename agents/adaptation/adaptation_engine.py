@@ -285,6 +285,8 @@ class AdaptationEngine:
         """Clean up resources on shutdown."""
         if self.performance_tracker:
             self.performance_tracker.flush_buffer()
+        if self.context_learner:
+            self.context_learner.flush()
 
         # Components remain loaded but inactive
         logger.info("Adaptation resources cleaned up")
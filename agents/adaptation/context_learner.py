@@ -4,6 +4,15 @@ Context Learner for Real-Time Adaptation
 Learns from execution patterns and provides intelligent recommendations
 for provider selection and resource allocation. Uses exponential moving
 averages for continuous learning and multi-factor confidence scoring.
+
+Persistence is incremental: the knowledge base lives in a JSON snapshot
+plus an append-only journal (``<storage>.journal``) of per-pattern rows.
+Recording an execution only marks the pattern dirty; a background flusher
+appends dirty rows to the journal on a time/count debounce, and the
+snapshot is rewritten atomically (temp file + rename) only on compaction.
+Journal rows carry a sequence number and the snapshot records the last one
+it covers, so rows left behind by a crash between the snapshot rename and
+the journal removal are skipped on replay.
 """
 
 from datetime import datetime, timedelta
@@ -11,7 +20,10 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass
 import json
 import os
+import atexit
 import logging
+import threading
+import weakref
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +32,12 @@ ALPHA = 0.3  # EMA weighting factor (30% new, 70% old)
 CONFIDENCE_CAP_EXECUTIONS = 20  # Max executions for base confidence
 RECENCY_HALF_LIFE_DAYS = 30  # 30-day half-life for recency factor
 
+# Persistence parameters
+FLUSH_INTERVAL_SECONDS = 5.0  # Max delay before dirty patterns hit disk
+FLUSH_MAX_PENDING = 50  # Dirty patterns that force an early flush
+JOURNAL_COMPACT_ROWS = 1000  # Journal rows before snapshot is rewritten
+MAX_ADAPTATION_HISTORY = 100
+
 
 @dataclass
 class ProviderRecommendation:
@@ -42,6 +60,38 @@ class ResourcePrediction:
     sample_count: int
 
 
+def _flush_at_exit(learner_ref):
+    """Persist pending updates of a still-alive learner at interpreter exit."""
+    learner = learner_ref()
+    if learner is None:
+        return
+    # Skip learners whose storage directory has since been removed
+    if os.path.isdir(os.path.dirname(learner.storage_path) or '.'):
+        learner.flush()
+
+
+def _flush_loop(learner_ref, flush_event, stop_event, interval):
+    """
+    Background flusher: persist dirty patterns on a time/count debounce.
+
+    Holds the learner only by weak reference between flushes, so a learner
+    that is no longer referenced can be collected and the thread exits.
+    """
+    while not stop_event.is_set():
+        flush_event.wait(timeout=interval)
+        flush_event.clear()
+        if stop_event.is_set():
+            break
+        learner = learner_ref()
+        if learner is None:
+            break
+        try:
+            learner.flush()
+        except Exception as e:
+            logger.error(f"Error flushing knowledge base: {e}")
+        del learner
+
+
 class ContextLearner:
     """
     Pattern learning and recommendation system.
@@ -50,19 +100,44 @@ class ContextLearner:
     and provides intelligent recommendations with confidence scoring.
     """
 
-    def __init__(self, storage_path: Optional[str] = None):
+    def __init__(
+        self,
+        storage_path: Optional[str] = None,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        flush_max_pending: int = FLUSH_MAX_PENDING
+    ):
         """
         Initialize context learner.
 
         Args:
             storage_path: Path to knowledge storage file (JSON)
+            flush_interval: Seconds a dirty pattern may wait before flushing
+            flush_max_pending: Dirty pattern count that triggers an early flush
         """
         self.storage_path = storage_path or self._get_default_storage_path()
+        self.journal_path = self.storage_path + '.journal'
         self.knowledge_base = {}  # Pattern key -> Pattern data
         self.adaptation_history = []  # Recent adaptations
 
+        # Task type -> {provider_id: pattern} index for O(providers) lookups
+        self._task_index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+        # Debounced persistence state
+        self.flush_interval = flush_interval
+        self.flush_max_pending = flush_max_pending
+        self._lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._dirty_keys = set()
+        self._pending_adaptations = []
+        self._journal_rows = 0
+        self._journal_seq = 0  # Sequence number of the last journaled row
+        self._flush_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._flush_thread = None
+
         # Load existing knowledge
         self._load_knowledge()
+        atexit.register(_flush_at_exit, weakref.ref(self))
 
         logger.info(f"ContextLearner initialized (storage: {self.storage_path})")
 
@@ -84,32 +159,34 @@ class ContextLearner:
         """
         pattern_key = f"{task_type}::{provider_id}"
 
-        # Get or create pattern
-        if pattern_key not in self.knowledge_base:
-            self.knowledge_base[pattern_key] = self._create_new_pattern(
-                task_type, provider_id
-            )
+        with self._lock:
+            # Get or create pattern
+            if pattern_key not in self.knowledge_base:
+                self._index_pattern(
+                    pattern_key, self._create_new_pattern(task_type, provider_id)
+                )
 
-        pattern = self.knowledge_base[pattern_key]
+            pattern = self.knowledge_base[pattern_key]
 
-        # Update execution count
-        pattern['execution_count'] += 1
+            # Update execution count
+            pattern['execution_count'] += 1
 
-        # Update success rate using EMA
-        old_success_rate = pattern['success_rate']
-        new_observation = 1.0 if success else 0.0
-        pattern['success_rate'] = (
-            ALPHA * new_observation + (1 - ALPHA) * old_success_rate
-        )
+            # Update success rate using EMA
+            old_success_rate = pattern['success_rate']
+            new_observation = 1.0 if success else 0.0
+            pattern['success_rate'] = (
+                ALPHA * new_observation + (1 - ALPHA) * old_success_rate
+            )
 
-        # Update resource profile using EMA
-        self._update_resource_profile(pattern['resource_profile'], metrics)
+            # Update resource profile using EMA
+            self._update_resource_profile(pattern['resource_profile'], metrics)
 
-        # Update timestamp
-        pattern['last_updated'] = datetime.now().isoformat()
+            # Update timestamp
+            pattern['last_updated'] = datetime.now().isoformat()
 
-        # Persist knowledge
-        self._save_knowledge()
+            # Defer persistence to the background flusher
+            self._dirty_keys.add(pattern_key)
+            self._schedule_flush()
 
         logger.debug(f"Recorded execution: {pattern_key}, success={success}")
 
@@ -129,11 +206,15 @@ class ContextLearner:
             'timestamp': result.timestamp.isoformat()
         }
 
-        self.adaptation_history.append(adaptation_record)
+        with self._lock:
+            self.adaptation_history.append(adaptation_record)
+
+            # Keep only recent 100 adaptations
+            if len(self.adaptation_history) > MAX_ADAPTATION_HISTORY:
+                self.adaptation_history = self.adaptation_history[-MAX_ADAPTATION_HISTORY:]
 
-        # Keep only recent 100 adaptations
-        if len(self.adaptation_history) > 100:
-            self.adaptation_history = self.adaptation_history[-100:]
+            self._pending_adaptations.append(adaptation_record)
+            self._schedule_flush()
 
         logger.debug(f"Recorded adaptation: {task_id}, success={result.success}")
 
@@ -149,13 +230,15 @@ class ContextLearner:
         """
         patterns = []
 
-        for pattern_key, pattern_data in self.knowledge_base.items():
-            if pattern_data['task_type'] == task_type:
-                # Calculate current confidence
-                confidence = self._calculate_confidence(pattern_data)
-                pattern_with_confidence = pattern_data.copy()
-                pattern_with_confidence['confidence'] = confidence
-                patterns.append(pattern_with_confidence)
+        with self._lock:
+            task_patterns = list(self._task_index.get(task_type, {}).values())
+
+        for pattern_data in task_patterns:
+            # Calculate current confidence
+            confidence = self._calculate_confidence(pattern_data)
+            pattern_with_confidence = pattern_data.copy()
+            pattern_with_confidence['confidence'] = confidence
+            patterns.append(pattern_with_confidence)
 
         # Sort by confidence (highest first)
         patterns.sort(key=lambda x: x['confidence'], reverse=True)
@@ -349,18 +432,75 @@ class ContextLearner:
         cutoff_date = datetime.now() - timedelta(days=days_old)
         stale_keys = []
 
-        for pattern_key, pattern in self.knowledge_base.items():
-            last_updated = datetime.fromisoformat(pattern['last_updated'])
-            if last_updated < cutoff_date:
-                stale_keys.append(pattern_key)
+        with self._lock:
+            for pattern_key, pattern in self.knowledge_base.items():
+                last_updated = datetime.fromisoformat(pattern['last_updated'])
+                if last_updated < cutoff_date:
+                    stale_keys.append(pattern_key)
 
-        for key in stale_keys:
-            del self.knowledge_base[key]
+            for key in stale_keys:
+                self._unindex_pattern(key)
+                self._dirty_keys.discard(key)
 
         if stale_keys:
+            # Deletions are not journaled; rewrite the snapshot instead
             self._save_knowledge()
             logger.info(f"Cleared {len(stale_keys)} stale patterns")
 
+    def flush(self):
+        """
+        Write pending pattern updates to the journal.
+
+        Called by the background flusher; may also be called directly to
+        force pending updates to disk (e.g. before shutdown).
+        """
+        with self._io_lock:
+            with self._lock:
+                rows = [
+                    {'key': key, 'pattern': self.knowledge_base[key]}
+                    for key in self._dirty_keys if key in self.knowledge_base
+                ]
+                rows.extend({'adaptation': a} for a in self._pending_adaptations)
+                for row in rows:
+                    self._journal_seq += 1
+                    row['seq'] = self._journal_seq
+                self._dirty_keys.clear()
+                self._pending_adaptations = []
+                # Serialize under the lock so concurrent updates can't tear rows
+                lines = ''.join(json.dumps(row) + '\n' for row in rows)
+
+            if not lines:
+                return
+
+            if not os.path.exists(self.storage_path):
+                # First flush writes a full snapshot so the store is readable
+                self._write_snapshot()
+                return
+
+            try:
+                with open(self.journal_path, 'a') as f:
+                    f.write(lines)
+                    f.flush()
+                    os.fsync(f.fileno())
+                self._journal_rows += len(rows)
+                logger.debug(f"Journaled {len(rows)} knowledge rows")
+            except Exception as e:
+                logger.error(f"Error writing knowledge journal: {e}")
+                return
+
+            if self._journal_rows >= JOURNAL_COMPACT_ROWS:
+                self._write_snapshot()
+
+    def close(self):
+        """Stop the background flusher and persist any pending updates."""
+        self._stop_event.set()
+        self._flush_event.set()
+        thread = self._flush_thread
+        if thread is not None and thread is not threading.current_thread():
+            thread.join(timeout=self.flush_interval + 1.0)
+        self._flush_thread = None
+        self.flush()
+
     # Private methods
 
     def _get_default_storage_path(self) -> str:
@@ -370,6 +510,38 @@ class ContextLearner:
         os.makedirs(data_dir, exist_ok=True)
         return os.path.join(data_dir, 'knowledge_base.json')
 
+    def _index_pattern(self, pattern_key: str, pattern: Dict[str, Any]):
+        """Insert a pattern into the knowledge base and task index."""
+        self.knowledge_base[pattern_key] = pattern
+        self._task_index.setdefault(pattern['task_type'], {})[pattern['provider_id']] = pattern
+
+    def _unindex_pattern(self, pattern_key: str):
+        """Remove a pattern from the knowledge base and task index."""
+        pattern = self.knowledge_base.pop(pattern_key, None)
+        if pattern is None:
+            return
+        providers = self._task_index.get(pattern['task_type'], {})
+        providers.pop(pattern['provider_id'], None)
+        if not providers:
+            self._task_index.pop(pattern['task_type'], None)
+
+    def _schedule_flush(self):
+        """Start the flusher if needed and wake it early when enough is pending."""
+        if self._flush_thread is None or not self._flush_thread.is_alive():
+            self._stop_event.clear()
+            self._flush_thread = threading.Thread(
+                target=_flush_loop,
+                args=(weakref.ref(self), self._flush_event, self._stop_event,
+                      self.flush_interval),
+                name="ContextLearnerFlush",
+                daemon=True
+            )
+            self._flush_thread.start()
+
+        pending = len(self._dirty_keys) + len(self._pending_adaptations)
+        if pending >= self.flush_max_pending:
+            self._flush_event.set()
+
     def _create_new_pattern(self, task_type: str, provider_id: str) -> Dict[str, Any]:
         """Create a new pattern entry."""
         return {
@@ -472,7 +644,7 @@ class ContextLearner:
             return f"Limited data ({execution_count} executions, {success_rate:.1%} success rate)"
 
     def _load_knowledge(self):
-        """Load knowledge base from JSON storage."""
+        """Load knowledge base from the JSON snapshot and replay the journal."""
         if not os.path.exists(self.storage_path):
             logger.debug("No existing knowledge base found")
             return
@@ -480,26 +652,74 @@ class ContextLearner:
         try:
             with open(self.storage_path, 'r') as f:
                 data = json.load(f)
-                self.knowledge_base = data.get('patterns', {})
-                self.adaptation_history = data.get('adaptation_history', [])
-
-            logger.info(f"Loaded {len(self.knowledge_base)} patterns from storage")
+            patterns = data.get('patterns', {})
+            self.adaptation_history = data.get('adaptation_history', [])
+            snapshot_seq = data.get('journal_seq', 0)
         except Exception as e:
             logger.error(f"Error loading knowledge base: {e}")
             self.knowledge_base = {}
             self.adaptation_history = []
+            return
+
+        if os.path.exists(self.journal_path):
+            try:
+                with open(self.journal_path, 'r') as f:
+                    for line in f:
+                        try:
+                            row = json.loads(line)
+                        except json.JSONDecodeError:
+                            # Torn trailing row from an interrupted append
+                            continue
+                        seq = row.get('seq', 0)
+                        if snapshot_seq and seq <= snapshot_seq:
+                            # Already folded into the snapshot; the journal
+                            # outlived a compaction that crashed mid-way
+                            continue
+                        self._journal_seq = max(self._journal_seq, seq)
+                        if 'key' in row:
+                            patterns[row['key']] = row['pattern']
+                        elif 'adaptation' in row:
+                            self.adaptation_history.append(row['adaptation'])
+                        self._journal_rows += 1
+            except Exception as e:
+                logger.error(f"Error replaying knowledge journal: {e}")
+
+        self._journal_seq = max(self._journal_seq, snapshot_seq)
+        self.adaptation_history = self.adaptation_history[-MAX_ADAPTATION_HISTORY:]
+        for pattern_key, pattern in patterns.items():
+            self._index_pattern(pattern_key, pattern)
+
+        logger.info(f"Loaded {len(self.knowledge_base)} patterns from storage")
 
     def _save_knowledge(self):
-        """Save knowledge base to JSON storage."""
+        """Compact the knowledge base into a fresh JSON snapshot."""
+        with self._lock:
+            self._dirty_keys.clear()
+            self._pending_adaptations = []
+        with self._io_lock:
+            self._write_snapshot()
+
+    def _write_snapshot(self):
+        """Atomically rewrite the JSON snapshot and truncate the journal."""
         try:
-            data = {
-                'patterns': self.knowledge_base,
-                'adaptation_history': self.adaptation_history,
-                'last_saved': datetime.now().isoformat()
-            }
-
-            with open(self.storage_path, 'w') as f:
-                json.dump(data, f, indent=2)
+            with self._lock:
+                payload = json.dumps({
+                    'patterns': self.knowledge_base,
+                    'adaptation_history': self.adaptation_history,
+                    'journal_seq': self._journal_seq,
+                    'last_saved': datetime.now().isoformat()
+                }, indent=2)
+
+            tmp_path = self.storage_path + '.tmp'
+            with open(tmp_path, 'w') as f:
+                f.write(payload)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
+
+            if os.path.exists(self.journal_path):
+                os.remove(self.journal_path)
+            self._journal_rows = 0
 
             logger.debug("Knowledge base saved")
         except Exception as e:
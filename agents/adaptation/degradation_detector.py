@@ -0,0 +1,435 @@
+"""
+Streaming Degradation Detector for Real-Time Adaptation
+
+Online change-point detection fed directly from PerformanceTracker.collect_metrics.
+Each provider/metric pair keeps O(1) state: a Welford/EWMA baseline, a fast
+EWMA of recent values, a one-sided CUSUM statistic and an exponentially
+weighted linear regression for the trend. Alerts are raised the moment a
+shift is detected and published on the EventBus as PROVIDER_DEGRADED events.
+"""
+
+from typing import Optional, Dict, Any, List, Callable, Tuple
+import logging
+import math
+import threading
+
+from .performance_tracker import TrendAnalysis, DegradationAlert
+
+logger = logging.getLogger(__name__)
+
+# Detection parameters
+WARMUP_SAMPLES = 20  # Samples used to establish the baseline
+BASELINE_ALPHA = 0.02  # Slow EWMA for baseline drift while healthy
+FAST_ALPHA = 0.3  # Fast EWMA tracking recent behavior
+REGRESSION_DECAY = 0.95  # Forgetting factor for the streaming trend fit
+CUSUM_SLACK = 0.5  # Allowed drift (in baseline std devs) before accumulating
+CUSUM_THRESHOLD = 5.0  # CUSUM decision interval (in baseline std devs)
+MIN_RELATIVE_STD = 0.05  # Std dev floor as a fraction of the baseline mean
+
+# Absolute alert levels (match PerformanceTracker.detect_all_degradations)
+ERROR_RATE_ALERT = 0.2
+CPU_ALERT = 0.75
+RAM_ALERT = 0.70
+LEVEL_HYSTERESIS = 0.05
+
+
+class MetricStream:
+    """
+    O(1) streaming statistics for a single provider metric.
+
+    Tracks the baseline, a fast EWMA, an upper CUSUM and an exponentially
+    weighted least-squares fit over sample index.
+    """
+
+    __slots__ = (
+        'count', 'baseline_mean', 'baseline_m2', 'fast_mean', 'cusum',
+        'last_value', 'alarm', '_s0', '_sx', '_sy', '_sxx', '_sxy', '_syy'
+    )
+
+    def __init__(self):
+        self.count = 0
+        self.baseline_mean = 0.0
+        self.baseline_m2 = 0.0  # Welford M2 during warmup, EW variance after
+        self.fast_mean = 0.0
+        self.cusum = 0.0
+        self.last_value = 0.0
+        self.alarm = False
+
+        # Exponentially weighted regression sums; newest sample sits at x=0
+        self._s0 = 0.0
+        self._sx = 0.0
+        self._sy = 0.0
+        self._sxx = 0.0
+        self._sxy = 0.0
+        self._syy = 0.0
+
+    @property
+    def baseline_std(self) -> float:
+        """Baseline standard deviation with a relative floor."""
+        if self.count < 2:
+            variance = 0.0
+        elif self.count < WARMUP_SAMPLES:
+            variance = self.baseline_m2 / (self.count - 1)
+        else:
+            variance = self.baseline_m2
+        floor = max(abs(self.baseline_mean) * MIN_RELATIVE_STD, 1e-9)
+        return max(math.sqrt(max(variance, 0.0)), floor)
+
+    @property
+    def warmed_up(self) -> bool:
+        return self.count >= WARMUP_SAMPLES
+
+    def update(self, value: float):
+        """Fold one sample into every statistic."""
+        self.count += 1
+        self.last_value = value
+
+        # Baseline: exact during warmup, slow EWMA afterwards (frozen in alarm)
+        if self.count <= WARMUP_SAMPLES:
+            delta = value - self.baseline_mean
+            self.baseline_mean += delta / self.count
+            self.baseline_m2 += delta * (value - self.baseline_mean)
+            if self.count == WARMUP_SAMPLES:
+                self.baseline_m2 = self.baseline_m2 / max(self.count - 1, 1)
+        elif not self.alarm:
+            delta = value - self.baseline_mean
+            self.baseline_mean += BASELINE_ALPHA * delta
+            self.baseline_m2 = (1 - BASELINE_ALPHA) * (
+                self.baseline_m2 + BASELINE_ALPHA * delta * delta
+            )
+
+        # Fast EWMA
+        if self.count == 1:
+            self.fast_mean = value
+        else:
+            self.fast_mean = FAST_ALPHA * value + (1 - FAST_ALPHA) * self.fast_mean
+
+        # Upper CUSUM on standardized deviation from baseline
+        if self.warmed_up:
+            z = (value - self.baseline_mean) / self.baseline_std
+            self.cusum = max(0.0, self.cusum + z - CUSUM_SLACK)
+
+        # Streaming regression: decay, shift existing points to x-1, add x=0
+        lam = REGRESSION_DECAY
+        s0, sx, sy = lam * self._s0, lam * self._sx, lam * self._sy
+        sxx, sxy, syy = lam * self._sxx, lam * self._sxy, lam * self._syy
+        sxx = sxx - 2 * sx + s0
+        sxy = sxy - sy
+        sx = sx - s0
+        self._s0 = s0 + 1.0
+        self._sx = sx
+        self._sy = sy + value
+        self._sxx = sxx
+        self._sxy = sxy
+        self._syy = syy + value * value
+
+    def trend(self) -> TrendAnalysis:
+        """Current trend from the weighted regression."""
+        if self.count < 3:
+            return TrendAnalysis(slope=0, direction='insufficient_data', confidence=0)
+
+        n = self._s0
+        var_x = n * self._sxx - self._sx * self._sx
+        var_y = n * self._syy - self._sy * self._sy
+        cov = n * self._sxy - self._sx * self._sy
+        if var_x <= 0:
+            return TrendAnalysis(slope=0, direction='insufficient_data', confidence=0)
+
+        slope = cov / var_x
+        r_squared = (cov * cov) / (var_x * var_y) if var_y > 0 else 0.0
+
+        if slope < -0.01:
+            direction = 'improving'
+        elif slope > 0.01:
+            direction = 'degrading'
+        else:
+            direction = 'stable'
+
+        return TrendAnalysis(slope=slope, direction=direction, confidence=r_squared)
+
+    def reset_alarm(self):
+        self.alarm = False
+        self.cusum = 0.0
+
+
+class StreamingDegradationDetector:
+    """
+    Online degradation detector for all providers.
+
+    Fed one metrics dict per sample; keeps constant work per sample and
+    publishes a DegradationAlert the moment a change point is detected.
+    """
+
+    RELATIVE_METRICS = ('latency',)
+    LEVEL_METRICS = {
+        'error_rate': ERROR_RATE_ALERT,
+        'cpu_usage': CPU_ALERT,
+        'ram_usage': RAM_ALERT,
+    }
+
+    def __init__(
+        self,
+        threshold: float = 0.2,
+        publish_events: bool = True,
+        on_alert: Optional[Callable[[DegradationAlert], None]] = None
+    ):
+        """
+        Initialize streaming detector.
+
+        Args:
+            threshold: Relative latency increase over baseline that must
+                       accompany a CUSUM change point (20% default)
+            publish_events: Publish alerts on the global EventBus
+            on_alert: Optional callback invoked with each new alert
+        """
+        self.threshold = threshold
+        self.publish_events = publish_events
+        self.on_alert = on_alert
+
+        self._streams: Dict[Tuple[str, str], MetricStream] = {}
+        self._active_alerts: Dict[Tuple[str, str], DegradationAlert] = {}
+        self._lock = threading.Lock()
+
+    def update(self, metrics: Dict[str, Any]) -> List[DegradationAlert]:
+        """
+        Feed one metrics sample into the detector.
+
+        Args:
+            metrics: Metrics dict as produced by PerformanceTracker.collect_metrics
+
+        Returns:
+            Alerts newly raised by this sample (usually empty)
+        """
+        provider_id = metrics.get('provider_id')
+        if not provider_id:
+            return []
+
+        new_alerts = []
+        with self._lock:
+            for metric in self.RELATIVE_METRICS + tuple(self.LEVEL_METRICS):
+                value = metrics.get(metric)
+                if value is None:
+                    continue
+                if metric in self.RELATIVE_METRICS and value <= 0:
+                    # 0.0 latency means the task was never timed, not a fast task
+                    continue
+
+                key = (provider_id, metric)
+                stream = self._streams.get(key)
+                if stream is None:
+                    stream = self._streams[key] = MetricStream()
+                stream.update(float(value))
+
+                if metric in self.LEVEL_METRICS:
+                    alert = self._check_level(provider_id, metric, stream)
+                else:
+                    alert = self._check_change_point(provider_id, metric, stream)
+
+                if alert is not None:
+                    self._active_alerts[key] = alert
+                    new_alerts.append(alert)
+
+        for alert in new_alerts:
+            self._emit(alert)
+
+        return new_alerts
+
+    def get_active_alerts(self, provider_id: Optional[str] = None) -> List[DegradationAlert]:
+        """
+        Return currently active alerts.
+
+        Args:
+            provider_id: Filter by provider (optional)
+
+        Returns:
+            List of active DegradationAlerts
+        """
+        with self._lock:
+            alerts = list(self._active_alerts.values())
+        if provider_id:
+            alerts = [a for a in alerts if a.provider_id == provider_id]
+        return alerts
+
+    def get_alerts(self, provider_id: str, threshold: Optional[float] = None) -> List[DegradationAlert]:
+        """
+        Alerts for one provider, with latency judged at a given threshold.
+
+        Level alerts are the active ones. The latency check is re-evaluated
+        against the current stream state when threshold differs from the
+        detector's own, without changing alarm state.
+
+        Args:
+            provider_id: Provider to check
+            threshold: Relative latency increase over baseline (default: the
+                       detector's threshold)
+
+        Returns:
+            List of DegradationAlerts
+        """
+        if threshold is None or threshold == self.threshold:
+            return self.get_active_alerts(provider_id)
+
+        with self._lock:
+            alerts = [a for key, a in self._active_alerts.items()
+                      if key[0] == provider_id and key[1] not in self.RELATIVE_METRICS]
+            for metric in self.RELATIVE_METRICS:
+                stream = self._streams.get((provider_id, metric))
+                if stream is None or not stream.warmed_up:
+                    continue
+                if stream.alarm or stream.cusum >= CUSUM_THRESHOLD:
+                    alert = self._relative_alert(provider_id, metric, stream, threshold)
+                    if alert is not None:
+                        alerts.append(alert)
+        return alerts
+
+    def get_trend(self, provider_id: str, metric_name: str) -> TrendAnalysis:
+        """Return the streaming trend for a provider metric."""
+        with self._lock:
+            stream = self._streams.get((provider_id, metric_name))
+            if stream is None:
+                return TrendAnalysis(slope=0, direction='no_data', confidence=0)
+            return stream.trend()
+
+    def is_tracking(self, provider_id: str) -> bool:
+        """Whether the detector has a warmed-up baseline for a provider."""
+        with self._lock:
+            stream = self._streams.get((provider_id, 'latency'))
+            return stream is not None and stream.warmed_up
+
+    def get_providers(self) -> List[str]:
+        """Providers the detector has seen."""
+        with self._lock:
+            return sorted({provider for provider, _ in self._streams})
+
+    def reset(self, provider_id: Optional[str] = None):
+        """Forget state for one provider, or for all providers."""
+        with self._lock:
+            for store in (self._streams, self._active_alerts):
+                for key in [k for k in store if provider_id is None or k[0] == provider_id]:
+                    del store[key]
+
+    # Private methods
+
+    def _check_change_point(
+        self,
+        provider_id: str,
+        metric: str,
+        stream: MetricStream
+    ) -> Optional[DegradationAlert]:
+        """CUSUM change point plus relative increase over the baseline."""
+        if not stream.warmed_up:
+            return None
+
+        baseline = stream.baseline_mean
+        current = stream.fast_mean
+        key = (provider_id, metric)
+
+        if stream.alarm:
+            # Recover once the recent level is back near the baseline
+            if current <= baseline * (1 + self.threshold / 2):
+                stream.reset_alarm()
+                self._active_alerts.pop(key, None)
+            return None
+
+        if stream.cusum < CUSUM_THRESHOLD:
+            return None
+
+        alert = self._relative_alert(provider_id, metric, stream, self.threshold)
+        if alert is not None:
+            stream.alarm = True
+        return alert
+
+    def _relative_alert(
+        self,
+        provider_id: str,
+        metric: str,
+        stream: MetricStream,
+        threshold: float
+    ) -> Optional[DegradationAlert]:
+        """Alert if the recent level exceeds the baseline by more than threshold."""
+        baseline = stream.baseline_mean
+        current = stream.fast_mean
+        # No usable baseline: any positive value would read as an increase
+        if baseline <= 0 or current <= baseline * (1 + threshold):
+            return None
+
+        trend = stream.trend()
+        return DegradationAlert(
+            provider_id=provider_id,
+            metric=metric,
+            severity='high' if current > baseline * 1.5 else 'medium',
+            details={
+                'current_avg': current,
+                'baseline_avg': baseline,
+                'increase_percent': ((current - baseline) / baseline) * 100,
+                'cusum': stream.cusum,
+                'slope': trend.slope,
+                'samples': stream.count
+            }
+        )
+
+    def _check_level(
+        self,
+        provider_id: str,
+        metric: str,
+        stream: MetricStream
+    ) -> Optional[DegradationAlert]:
+        """Absolute level alerts with hysteresis for rate/resource metrics."""
+        limit = self.LEVEL_METRICS[metric]
+        current = stream.fast_mean
+        key = (provider_id, metric)
+
+        if stream.alarm:
+            if current < limit - LEVEL_HYSTERESIS:
+                stream.reset_alarm()
+                self._active_alerts.pop(key, None)
+            return None
+
+        # Require a handful of samples so a single spike can't alert
+        if stream.count < 10 or current <= limit:
+            return None
+
+        stream.alarm = True
+        if metric == 'error_rate':
+            severity = 'critical' if current > 0.5 else 'high'
+            details = {'current_error_rate': current}
+        elif metric == 'cpu_usage':
+            severity = 'high' if current > 0.85 else 'medium'
+            details = {'avg_cpu': current, 'threshold': limit}
+        else:
+            severity = 'high' if current > 0.80 else 'medium'
+            details = {'avg_ram': current, 'threshold': limit}
+
+        return DegradationAlert(
+            provider_id=provider_id,
+            metric=metric,
+            severity=severity,
+            details=details
+        )
+
+    def _emit(self, alert: DegradationAlert):
+        """Deliver a new alert to the callback and the EventBus."""
+        logger.warning(f"Degradation detected: {alert.provider_id} {alert.metric} "
+                       f"({alert.severity})")
+
+        if self.on_alert:
+            try:
+                self.on_alert(alert)
+            except Exception as e:
+                logger.error(f"Degradation alert callback error: {e}")
+
+        if not self.publish_events:
+            return
+
+        try:
+            from data.events import EventBus, EventType
+            EventBus().emit(
+                EventType.PROVIDER_DEGRADED,
+                source='adaptation',
+                provider_id=alert.provider_id,
+                metric=alert.metric,
+                severity=alert.severity,
+                details=alert.details
+            )
+        except Exception as e:
+            logger.error(f"Error publishing degradation alert: {e}")
@@ -3,7 +3,9 @@ Performance Tracker for Real-Time Adaptation
 
 Collects and analyzes execution metrics for provider performance monitoring.
 Maintains historical data and calculates trends to identify optimization
-opportunities and performance degradation.
+opportunities and performance degradation. Degradation is detected online by
+a StreamingDegradationDetector fed from collect_metrics; the query-based
+path is only used for providers the detector is not yet tracking.
 """
 
 from datetime import datetime, timedelta
@@ -68,6 +70,10 @@ class PerformanceTracker:
         self.throughput_window_start = time.time()
         self.completed_tasks_in_window = 0
 
+        # Online degradation detection (O(1) per sample)
+        from .degradation_detector import StreamingDegradationDetector
+        self.degradation_detector = StreamingDegradationDetector()
+
         logger.info(f"PerformanceTracker initialized (storage: {self.storage_path})")
 
     def collect_metrics(self, task_id: str, provider_id: str) -> Dict[str, Any]:
@@ -96,6 +102,9 @@ class PerformanceTracker:
         # Store in current metrics
         self.current_metrics[task_id] = metrics
 
+        # Feed the streaming detector; alerts are published as they happen
+        self.degradation_detector.update(metrics)
+
         # Buffer for batch storage
         self.metric_buffer.append(metrics)
         if len(self.metric_buffer) >= self.buffer_size:
@@ -153,7 +162,8 @@ class PerformanceTracker:
                 confidence=0
             )
 
-        recent = history[-window_size:]
+        # History is newest-first; fit the latest window in time order
+        recent = history[:window_size][::-1]
         values = [m[metric_name] for m in recent if metric_name in m]
 
         if not values:
@@ -196,19 +206,36 @@ class PerformanceTracker:
         Returns:
             DegradationAlert if detected, None otherwise
         """
+        if self.degradation_detector.is_tracking(provider_id):
+            alerts = self.degradation_detector.get_alerts(provider_id, threshold)
+            for metric in ('latency', 'error_rate'):
+                for alert in alerts:
+                    if alert.metric == metric:
+                        return alert
+            return None
+
+        return self._detect_degradation_from_history(provider_id, threshold)
+
+    def _detect_degradation_from_history(
+        self,
+        provider_id: str,
+        threshold: float = 0.2
+    ) -> Optional[DegradationAlert]:
+        """Query-based degradation check for providers without streaming state."""
         latency_trend = self.calculate_trends(provider_id, 'latency')
         error_trend = self.calculate_trends(provider_id, 'error_rate')
 
         # Check latency degradation
         if latency_trend.slope > 0 and latency_trend.confidence > 0.7:
-            history = self.get_performance_history(provider_id, window_hours=24)
+            history = self.get_performance_history(provider_id, window_hours=24)[::-1]
             if len(history) < 20:
                 return None
 
             recent_avg = self._avg_metric(history[-10:], 'latency')
             baseline_avg = self._avg_metric(history[:100], 'latency')
 
-            if recent_avg > baseline_avg * (1 + threshold):
+            # A zero baseline (untimed tasks) would flag any positive latency
+            if baseline_avg > 0 and recent_avg > baseline_avg * (1 + threshold):
                 return DegradationAlert(
                     provider_id=provider_id,
                     metric='latency',
@@ -222,7 +249,7 @@ class PerformanceTracker:
 
         # Check error rate degradation
         if error_trend.slope > 0 and error_trend.confidence > 0.7:
-            history = self.get_performance_history(provider_id, window_hours=1)
+            history = self.get_performance_history(provider_id, window_hours=1)[::-1]
             if len(history) < 10:
                 return None
 
@@ -237,47 +264,57 @@ class PerformanceTracker:
 
         return None
 
-    def detect_all_degradations(self) -> List[DegradationAlert]:
+    def detect_all_degradations(self, threshold: float = 0.2) -> List[DegradationAlert]:
         """
         Check all providers for degradation across all metrics.
 
+        Providers the streaming detector tracks are served from its alerts
+        without touching the metrics database; the rest (e.g. after a
+        restart) fall back to a scan of the last 24 hours of history.
+
+        Args:
+            threshold: Latency degradation threshold (20% default)
+
         Returns:
             List of degradation alerts
         """
+        detector = self.degradation_detector
         alerts = []
+        for provider_id in detector.get_providers():
+            if detector.is_tracking(provider_id):
+                alerts.extend(detector.get_alerts(provider_id, threshold))
 
-        # Get unique providers from recent history
-        recent_history = self.get_performance_history(window_hours=24)
-        providers = set(m.get('provider_id') for m in recent_history if m.get('provider_id'))
+        recent_history = self.get_performance_history(window_hours=24)[::-1]
+        by_provider: Dict[str, List[Dict[str, Any]]] = {}
+        for m in recent_history:
+            provider_id = m.get('provider_id')
+            if provider_id and not detector.is_tracking(provider_id):
+                by_provider.setdefault(provider_id, []).append(m)
 
-        for provider_id in providers:
-            # Check for degradation
-            alert = self.detect_degradation(provider_id)
+        for provider_id, recent_metrics in by_provider.items():
+            alert = self._detect_degradation_from_history(provider_id, threshold)
             if alert:
                 alerts.append(alert)
 
             # Also check for critical resource usage
-            recent_metrics = [m for m in recent_history if m.get('provider_id') == provider_id]
-            if recent_metrics:
-                recent_cpu = self._avg_metric(recent_metrics[-10:], 'cpu_usage')
-                recent_ram = self._avg_metric(recent_metrics[-10:], 'ram_usage')
-
-                # Alert if consistently high resource usage
-                if recent_cpu > 0.75:  # >75% CPU
-                    alerts.append(DegradationAlert(
-                        provider_id=provider_id,
-                        metric='cpu_usage',
-                        severity='high' if recent_cpu > 0.85 else 'medium',
-                        details={'avg_cpu': recent_cpu, 'threshold': 0.75}
-                    ))
-
-                if recent_ram > 0.70:  # >70% RAM
-                    alerts.append(DegradationAlert(
-                        provider_id=provider_id,
-                        metric='ram_usage',
-                        severity='high' if recent_ram > 0.80 else 'medium',
-                        details={'avg_ram': recent_ram, 'threshold': 0.70}
-                    ))
+            recent_cpu = self._avg_metric(recent_metrics[-10:], 'cpu_usage')
+            recent_ram = self._avg_metric(recent_metrics[-10:], 'ram_usage')
+
+            if recent_cpu > 0.75:  # >75% CPU
+                alerts.append(DegradationAlert(
+                    provider_id=provider_id,
+                    metric='cpu_usage',
+                    severity='high' if recent_cpu > 0.85 else 'medium',
+                    details={'avg_cpu': recent_cpu, 'threshold': 0.75}
+                ))
+
+            if recent_ram > 0.70:  # >70% RAM
+                alerts.append(DegradationAlert(
+                    provider_id=provider_id,
+                    metric='ram_usage',
+                    severity='high' if recent_ram > 0.80 else 'medium',
+                    details={'avg_ram': recent_ram, 'threshold': 0.70}
+                ))
 
         return alerts
 
@@ -55,6 +55,10 @@ class BaseAgent(ABC):
     requires_filesystem: bool = False
     max_execution_time: int = 30  # seconds
 
+    # Dispatch hints for the Sauron orchestrator ("*" = every action)
+    pure_actions: frozenset = frozenset()       # Result depends only on kwargs (memoizable)
+    cpu_bound_actions: frozenset = frozenset()  # Worth a worker process when pure
+
     def __init__(self):
         self.status = AgentStatus.IDLE
         self._start_time: Optional[datetime] = None
@@ -21,6 +21,7 @@ class ComputeAgent(BaseAgent):
     requires_network = False
     requires_filesystem = False
     max_execution_time = 5
+    pure_actions = frozenset({"*"})
 
     # Safe operations
     SAFE_OPS = {
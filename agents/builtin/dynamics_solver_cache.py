@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Dynamics Solver Cache
+Phase 3.5: Reusable QuTiP master-equation solvers for QuantumDynamicsAgent
+
+mesolve and decoherence used to go through qutip.mesolve, which builds the
+Liouvillian and integrator afresh on every call, and kept every density
+matrix in result.states so purity could be computed afterwards - memory
+grew as O(T * 4^n) with the length of the time list.
+
+SolverCache is a thread-safe LRU of compiled qutip.MESolver instances:
+
+    operators   keyed by dims and a content digest of H and each collapse
+                operator, so repeated runs on the same system (new rho0,
+                new tlist, new e_ops) reuse the compiled Liouvillian
+    channels    decoherence channels are built once per (channel, dim) as
+                gamma * D with D the unit-rate dissipator; gamma is a solver
+                argument, so a sweep over gamma reuses one solver
+
+Observables are evaluated during integration through e_ops - purity as a
+callable e_op - and full states are kept only when asked for.
+QuTiP and NumPy are imported on first use, never at module import.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, List, Optional
+
+from .factorization_cache import matrix_key
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+MAX_SOLVERS = 8                     # Compiled MESolver instances kept (LRU)
+
+# Unit-rate collapse operators per channel: (operator names, rate factor).
+# The channel's Lindblad term at rate gamma is factor * gamma * D(c) summed
+# over the operators, matching c = sqrt(factor * gamma) * op.
+DECOHERENCE_CHANNELS = {
+    "amplitude_damping": (("destroy",), 1.0),
+    "dephasing": (("sigmaz",), 0.5),
+    "depolarizing": (("sigmax", "sigmay", "sigmaz"), 0.25),
+}
+
+
+def purity(t: float, rho) -> float:
+    """Tr(rho^2) as a callable e_op: the squared Frobenius norm, O(d^2)."""
+    return rho.norm("fro") ** 2
+
+
+def _rate(t: float, gamma: float) -> float:
+    """Time-independent coefficient: the gamma solver argument."""
+    return gamma
+
+
+def operator_key(qt, op) -> Optional[Hashable]:
+    """Cache key for a Qobj (dims and contents); None if not a constant Qobj."""
+    if not isinstance(op, qt.Qobj):
+        return None
+    return repr(op.dims), matrix_key(op.full())
+
+
+def system_key(qt, hamiltonian, c_ops: List) -> Optional[Hashable]:
+    """Key for an (H, c_ops) pair; None when any part is time-dependent."""
+    keys = [operator_key(qt, op) for op in [hamiltonian, *c_ops]]
+    if any(key is None for key in keys):
+        return None
+    return tuple(keys)
+
+
+class CachedSolver:
+    """One compiled MESolver; runs are serialized since options are per-solver."""
+
+    def __init__(self, solver):
+        self.solver = solver
+        self._lock = threading.Lock()
+
+    def run(self, state, tlist, e_ops: List, store_states: bool,
+            args: Optional[Dict[str, Any]] = None):
+        """
+        Integrate from state over tlist.
+
+        Args:
+            state:        Initial ket or density matrix
+            tlist:        Time points
+            e_ops:        Operators or callables f(t, rho), evaluated per step
+            store_states: Keep the density matrix at every time point
+            args:         Solver arguments (gamma for channel solvers)
+
+        Returns:
+            qutip Result; final_state is always kept
+        """
+        with self._lock:
+            self.solver.options = {"store_states": store_states, "store_final_state": True}
+            return self.solver.run(state, tlist, e_ops=e_ops, args=args)
+
+
+class SolverCache:
+    """Thread-safe LRU of CachedSolver keyed by system structure."""
+
+    def __init__(self, max_solvers: int = MAX_SOLVERS):
+        self.max_solvers = max_solvers
+        self._solvers: "OrderedDict[Hashable, CachedSolver]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _get(self, key: Optional[Hashable], build) -> CachedSolver:
+        with self._lock:
+            cached = self._solvers.get(key) if key is not None else None
+            if cached is not None:
+                self._solvers.move_to_end(key)
+                self.hits += 1
+                return cached
+            self.misses += 1
+        # Built outside the lock: constructing a Liouvillian can take a while
+        cached = CachedSolver(build())
+        if key is None:
+            return cached
+        with self._lock:
+            cached = self._solvers.setdefault(key, cached)
+            while len(self._solvers) > self.max_solvers:
+                self._solvers.popitem(last=False)
+        return cached
+
+    def system(self, qt, hamiltonian, c_ops: List) -> CachedSolver:
+        """Solver for H and c_ops; time-dependent systems are built uncached."""
+        return self._get(
+            system_key(qt, hamiltonian, c_ops),
+            lambda: qt.MESolver(hamiltonian, c_ops, options={"progress_bar": ""}),
+        )
+
+    def channel(self, qt, channel: str, dim: int) -> CachedSolver:
+        """
+        Solver for gamma * D of a decoherence channel; run with args={'gamma': g}.
+
+        Only amplitude damping depends on dim - the Pauli channels are qubit-only.
+        """
+        names, factor = DECOHERENCE_CHANNELS[channel]
+
+        def build():
+            ops = [qt.destroy(dim) if name == "destroy" else getattr(qt, name)()
+                   for name in names]
+            D = qt.lindblad_dissipator(ops[0])
+            for op in ops[1:]:
+                D = D + qt.lindblad_dissipator(op)
+            return qt.MESolver(qt.QobjEvo([[factor * D, _rate]], args={"gamma": 0.0}),
+                               options={"progress_bar": ""})
+
+        return self._get(("channel", channel, dim), build)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._solvers.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {"solvers": len(self._solvers), "hits": self.hits, "misses": self.misses}
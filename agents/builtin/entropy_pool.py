@@ -0,0 +1,366 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Entropy Pool
+Phase 3.5: Pre-generated, health-tested entropy for QuantumCryptoAgent
+
+generate_entropy used to call qencrypt_local.quantum_entropy.get_entropy on
+the caller's thread for every request, so each 32-byte request paid the
+full generation latency - and the 'auto' source tried remote sources
+before falling back.
+
+EntropyPool keeps a locked byte ring per source, refilled in the
+background in CHUNK_BYTES chunks: when the ring drops below the low-water
+mark it is filled back to the high-water mark (its capacity). Requests
+the ring can cover are served by copying out of it; larger ones wait for
+refills. Served bytes are zeroed in the ring.
+
+    provenance  every chunk records its source metadata; take() reports
+                which chunks (and how many bytes of each) were served
+    health      chunks pass NIST SP 800-90B continuous health tests before
+                entering the ring - the repetition count test and the
+                adaptive proportion test, with byte samples. A failing
+                chunk is discarded; MAX_HEALTH_FAILURES in a row mark the
+                pool failed and take() raises EntropyUnavailable
+    errors      a generator error fails waiting take() calls at once
+                rather than at their timeout; MAX_GENERATOR_ERRORS in a
+                row mark the pool failed and stop the refill thread
+"""
+
+import logging
+import math
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+HIGH_WATER = 4096               # Ring capacity, bytes; refills stop here
+LOW_WATER = 1024                # Refill starts below this, bytes
+CHUNK_BYTES = 256               # Bytes per generator call
+TAKE_TIMEOUT = 30.0             # Max wait for refills in take(), seconds
+REFILL_RETRY_DELAY = 1.0        # Back-off after a generator error, seconds
+MAX_HEALTH_FAILURES = 3         # Consecutive failing chunks before the pool fails
+MAX_GENERATOR_ERRORS = 3        # Consecutive generator errors before the pool fails
+
+ASSESSED_MIN_ENTROPY = 8.0      # Claimed min-entropy per byte sample (H), bits
+FALSE_POSITIVE_EXP = 20         # Health-test false-positive rate 2^-20 per sample
+APT_WINDOW = 512                # Adaptive proportion window for non-binary samples
+
+Generator = Callable[[int, str], Tuple[bytes, Dict[str, Any]]]
+
+
+class EntropyUnavailable(RuntimeError):
+    """The pool cannot serve: it failed, generation failed, or refills did not arrive in time."""
+
+
+def _qencrypt_generator(n_bytes: int, source: str) -> Tuple[bytes, Dict[str, Any]]:
+    from qencrypt_local.quantum_entropy import get_entropy
+    return get_entropy(n_bytes, source=source, allow_fallback=True)
+
+
+def _binomial_cutoff(n: int, p: float, alpha: float) -> int:
+    """1 + smallest k with P(X <= k) >= 1 - alpha, X ~ Binomial(n, p)."""
+    cdf = 0.0
+    for k in range(n + 1):
+        cdf += math.comb(n, k) * p ** k * (1 - p) ** (n - k)
+        if cdf >= 1 - alpha:
+            return 1 + k
+    return n + 1
+
+
+# ── Health tests ───────────────────────────────────────────────────────────────
+
+class HealthTests:
+    """
+    SP 800-90B section 4.4 continuous tests over a stream of byte samples.
+
+    State carries across chunks, so a run or window may span two of them.
+    """
+
+    def __init__(self, min_entropy: float = ASSESSED_MIN_ENTROPY,
+                 false_positive_exp: int = FALSE_POSITIVE_EXP, window: int = APT_WINDOW):
+        """
+        Args:
+            min_entropy:        Assessed min-entropy per byte, bits (0 < H <= 8)
+            false_positive_exp: alpha = 2^-false_positive_exp
+            window:             Adaptive proportion test window, samples
+        """
+        self.rct_cutoff = 1 + math.ceil(false_positive_exp / min_entropy)
+        self.apt_cutoff = _binomial_cutoff(window, 2.0 ** -min_entropy,
+                                           2.0 ** -false_positive_exp)
+        self.window = window
+        self.samples = 0
+        self.reset()
+
+    def reset(self) -> None:
+        self._last = None
+        self._run = 0
+        self._apt_ref = None
+        self._apt_count = 0
+        self._apt_seen = 0
+
+    def check(self, data: bytes) -> Optional[str]:
+        """Feed samples; the failing test's description, or None if all pass."""
+        last, run = self._last, self._run
+        ref, count, seen = self._apt_ref, self._apt_count, self._apt_seen
+        try:
+            for sample in data:
+                # Repetition count: C identical samples in a row
+                if sample == last:
+                    run += 1
+                    if run >= self.rct_cutoff:
+                        return f"repetition count: {run} x 0x{sample:02x}"
+                else:
+                    last, run = sample, 1
+
+                # Adaptive proportion: first sample of each window recurring C times
+                if seen == 0 or seen >= self.window:
+                    ref, count, seen = sample, 1, 1
+                else:
+                    seen += 1
+                    if sample == ref:
+                        count += 1
+                        if count >= self.apt_cutoff:
+                            return (f"adaptive proportion: 0x{sample:02x} {count} times "
+                                    f"in {seen} samples")
+            return None
+        finally:
+            self.samples += len(data)
+            self._last, self._run = last, run
+            self._apt_ref, self._apt_count, self._apt_seen = ref, count, seen
+
+
+# ── Pool ───────────────────────────────────────────────────────────────────────
+
+class EntropyPool:
+    """Background-refilled, health-tested ring of entropy bytes from one source."""
+
+    def __init__(self, source: str = "local", high_water: int = HIGH_WATER,
+                 low_water: int = LOW_WATER, chunk_size: int = CHUNK_BYTES,
+                 generator: Optional[Generator] = None,
+                 health: Optional[HealthTests] = None):
+        """
+        Args:
+            source:     Entropy source passed to the generator
+            high_water: Ring capacity; refills stop here
+            low_water:  Refills start when fewer bytes remain
+            chunk_size: Bytes per generator call
+            generator:  (n_bytes, source) -> (bytes, meta); default:
+                        qencrypt_local get_entropy with fallback
+            health:     Health tests (default: SP 800-90B at ASSESSED_MIN_ENTROPY)
+        """
+        if not 0 <= low_water < high_water or chunk_size > high_water:
+            raise ValueError("need 0 <= low_water < high_water and chunk_size <= high_water")
+        self.source = source
+        self.capacity = high_water
+        self.low_water = low_water
+        self.chunk_size = chunk_size
+        self._generate = generator or _qencrypt_generator
+        self._health = health or HealthTests()
+
+        self._ring = bytearray(high_water)
+        self._head = 0                  # Ring index of the next byte to serve
+        self._size = 0
+        self._served = 0                # Stream position of _head
+        self._chunks: deque = deque()   # [end stream position, provenance] per chunk
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+        self._failure: Optional[str] = None
+        self._consecutive_failures = 0
+        self._generator_error: Optional[Exception] = None
+        self._consecutive_errors = 0
+        self._next_chunk = 1
+        self._stats = {"bytes_served": 0, "requests": 0, "waits": 0, "chunks": 0,
+                       "generator_errors": 0, "health_failures": 0}
+
+    # ── Serving ────────────────────────────────────────────────────────────
+
+    def take(self, n_bytes: int, timeout: float = TAKE_TIMEOUT) -> Tuple[bytes, List[Dict[str, Any]]]:
+        """
+        Serve n_bytes from the ring, waiting for refills if it runs short.
+
+        Returns:
+            (bytes, provenance) - provenance lists each chunk served from:
+            chunk id, source metadata and the number of bytes taken
+
+        Raises:
+            EntropyUnavailable: the pool failed, the ring ran dry after a
+                                generator error, or the bytes did not
+                                arrive within timeout
+        """
+        if n_bytes < 0:
+            raise ValueError("n_bytes must be non-negative")
+        out = bytearray()
+        provenance: List[Dict[str, Any]] = []
+        deadline = time.monotonic() + timeout
+        with self._cond:
+            self._start()
+            self._stats["requests"] += 1
+            while len(out) < n_bytes:
+                if self._failure is not None:
+                    raise EntropyUnavailable(f"entropy pool {self.source!r} failed: {self._failure}")
+                if self._size:
+                    self._pop(min(n_bytes - len(out), self._size), out, provenance)
+                    if self._size < self.low_water:
+                        self._cond.notify_all()
+                    continue
+                if self._generator_error is not None:
+                    raise EntropyUnavailable(
+                        f"entropy generation from {self.source!r} failed: {self._generator_error}"
+                    ) from self._generator_error
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or self._closed:
+                    raise EntropyUnavailable(
+                        f"entropy pool: {len(out)} of {n_bytes} bytes within {timeout:.1f}s"
+                    )
+                self._stats["waits"] += 1
+                self._cond.notify_all()
+                self._cond.wait(remaining)
+            self._stats["bytes_served"] += n_bytes
+        return bytes(out), provenance
+
+    def _pop(self, n: int, out: bytearray, provenance: List[Dict[str, Any]]) -> None:
+        """Move n bytes from the head of the ring to out, zeroing them. Caller holds the lock."""
+        end = self._head + n
+        if end <= self.capacity:
+            out += self._ring[self._head:end]
+            self._ring[self._head:end] = bytes(n)
+        else:
+            wrap = end - self.capacity
+            out += self._ring[self._head:] + self._ring[:wrap]
+            self._ring[self._head:] = bytes(self.capacity - self._head)
+            self._ring[:wrap] = bytes(wrap)
+
+        start, stop = self._served, self._served + n
+        for chunk_end, info in self._chunks:
+            chunk_start = chunk_end - info["length"]
+            if chunk_start >= stop:
+                break
+            taken = min(chunk_end, stop) - max(chunk_start, start)
+            if provenance and provenance[-1]["chunk"] == info["chunk"]:
+                provenance[-1]["bytes"] += taken
+            else:
+                provenance.append({"chunk": info["chunk"], "source": info["source"],
+                                   "meta": info["meta"], "bytes": taken})
+        while self._chunks and self._chunks[0][0] <= stop:
+            self._chunks.popleft()
+
+        self._head = end % self.capacity
+        self._size -= n
+        self._served = stop
+
+    # ── Refill ─────────────────────────────────────────────────────────────
+
+    def _start(self) -> None:
+        """Start the refill thread on first use. Caller holds the lock."""
+        if self._thread is None and not self._closed:
+            self._thread = threading.Thread(target=self._refill_loop, daemon=True,
+                                            name=f"EntropyPool-{self.source}")
+            self._thread.start()
+
+    def _refill_loop(self) -> None:
+        while True:
+            with self._cond:
+                while not self._closed and self._failure is None and self._size >= self.low_water:
+                    self._cond.wait()
+                if self._closed or self._failure is not None:
+                    return
+            # Fill to the high-water mark
+            while True:
+                with self._cond:
+                    if self._closed or self._failure is not None:
+                        return
+                    if self._size + self.chunk_size > self.capacity:
+                        break
+                try:
+                    data, meta = self._generate(self.chunk_size, self.source)
+                except Exception as e:
+                    if not self._generator_failed(e):
+                        return
+                    continue
+                self._admit(bytes(data[:self.chunk_size]), meta or {})
+
+    def _generator_failed(self, error: Exception) -> bool:
+        """Record a generator error and back off; False once the pool has failed."""
+        with self._cond:
+            self._stats["generator_errors"] += 1
+            self._consecutive_errors += 1
+            if self._generator_error is None:
+                # Only the first of a run is logged; waiting take() calls raise it
+                logger.warning("Entropy generation from %r failed: %s", self.source, error)
+                self._generator_error = error
+            self._cond.notify_all()
+            if self._consecutive_errors >= MAX_GENERATOR_ERRORS:
+                self._failure = (f"{self._consecutive_errors} generator errors in a row, "
+                                 f"last: {error}")
+                logger.error("Entropy pool %r failed: %s", self.source, self._failure)
+                return False
+            self._cond.wait(REFILL_RETRY_DELAY)
+            return not self._closed
+
+    def _admit(self, data: bytes, meta: Dict[str, Any]) -> None:
+        """Health-test a chunk and append it to the ring if it passes."""
+        failure = self._health.check(data) if len(data) == self.chunk_size else (
+            f"short chunk: {len(data)} of {self.chunk_size} bytes")
+        with self._cond:
+            if self._closed:
+                return
+            self._generator_error = None
+            self._consecutive_errors = 0
+            if failure is not None:
+                self._health.reset()
+                self._stats["health_failures"] += 1
+                self._consecutive_failures += 1
+                logger.warning("Entropy chunk from %r discarded: %s", self.source, failure)
+                if self._consecutive_failures >= MAX_HEALTH_FAILURES:
+                    self._failure = f"health tests: {failure}"
+                    logger.error("Entropy pool %r failed: %s", self.source, failure)
+                    self._cond.notify_all()
+                return
+            self._consecutive_failures = 0
+            tail = (self._head + self._size) % self.capacity
+            first = min(len(data), self.capacity - tail)
+            self._ring[tail:tail + first] = data[:first]
+            self._ring[:len(data) - first] = data[first:]
+            self._size += len(data)
+            self._chunks.append((self._served + self._size, {
+                "chunk": self._next_chunk,
+                "source": meta.get("source", self.source),
+                "meta": meta,
+                "generated_at": time.time(),
+                "length": len(data),
+            }))
+            self._next_chunk += 1
+            self._stats["chunks"] += 1
+            self._cond.notify_all()
+
+    # ── Lifecycle ──────────────────────────────────────────────────────────
+
+    def close(self) -> None:
+        """Stop refilling and zero the ring."""
+        with self._cond:
+            self._closed = True
+            self._ring[:] = bytes(self.capacity)
+            self._size = 0
+            self._chunks.clear()
+            self._cond.notify_all()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            return {
+                "source": self.source,
+                "available": self._size,
+                "capacity": self.capacity,
+                "low_water": self.low_water,
+                "healthy": self._failure is None,
+                "failure": self._failure,
+                "samples_tested": self._health.samples,
+                "rct_cutoff": self._health.rct_cutoff,
+                "apt_cutoff": self._health.apt_cutoff,
+                **self._stats,
+            }
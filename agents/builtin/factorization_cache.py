@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Factorization Cache
+Phase 3.5: Shared matrix decompositions for NumericalComputingAgent
+
+matrix_analysis used to call matrix_rank, norm(M, 2) and cond - three
+separate SVDs of the same matrix - plus det and an M @ M^H product for the
+unitarity check; eigenvalues, svd, matrix_exp and solve_linear refactored
+matrices that repeat across calls.
+
+MatrixFactors holds the decompositions of one matrix, each computed on
+first use and kept: singular values (or the full SVD), eigendecomposition
+(general or Hermitian), LU factors, and the matrix exponential. Derived
+quantities come from them - rank, 2-norm, Frobenius norm, condition number
+and unitarity from one set of singular values, determinant and linear
+solves from one LU factorization.
+
+FactorizationCache is a thread-safe LRU of MatrixFactors keyed by dtype,
+shape and a content digest, bounded by entry count and by bytes held.
+NumPy/SciPy are imported on first use, never at module import.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+MAX_ENTRIES = 16                    # Matrices with cached factors (LRU)
+MAX_BYTES = 512 * 1024 * 1024       # Bytes of factors held across all entries
+
+
+def matrix_key(M) -> Hashable:
+    """Cache key for a matrix: dtype, shape and a digest of its contents."""
+    import numpy as np
+    data = np.ascontiguousarray(M)
+    digest = hashlib.blake2b(data.view(np.uint8), digest_size=16).hexdigest()
+    return str(M.dtype), M.shape, digest
+
+
+class MatrixFactors:
+    """Decompositions of one (read-only) matrix, each computed once."""
+
+    def __init__(self, M):
+        self.matrix = M
+        self._singular_values = None
+        self._svd: Dict[bool, Tuple[Any, Any, Any]] = {}
+        self._eig: Dict[bool, Tuple[Any, Any]] = {}
+        self._lu = None
+        self._expm = None
+        self._lock = threading.Lock()
+
+    # ── Decompositions ─────────────────────────────────────────────────────
+
+    def singular_values(self):
+        """Singular values, descending. Reuses a full SVD if one exists."""
+        with self._lock:
+            if self._singular_values is None:
+                import numpy as np
+                if self._svd:
+                    self._singular_values = next(iter(self._svd.values()))[1]
+                else:
+                    self._singular_values = np.linalg.svd(self.matrix, compute_uv=False)
+            return self._singular_values
+
+    def svd(self, full_matrices: bool = False):
+        """(U, S, Vh) with M = U @ diag(S) @ Vh."""
+        with self._lock:
+            if full_matrices not in self._svd:
+                import numpy as np
+                self._svd[full_matrices] = np.linalg.svd(self.matrix, full_matrices=full_matrices)
+                if self._singular_values is None:
+                    self._singular_values = self._svd[full_matrices][1]
+            return self._svd[full_matrices]
+
+    def eig(self, hermitian: bool = False):
+        """(eigenvalues, eigenvectors); eigh when hermitian."""
+        with self._lock:
+            if hermitian not in self._eig:
+                import numpy as np
+                solver = np.linalg.eigh if hermitian else np.linalg.eig
+                self._eig[hermitian] = solver(self.matrix)
+            return self._eig[hermitian]
+
+    def lu(self):
+        """LU factors with partial pivoting, as scipy.linalg.lu_factor returns them."""
+        with self._lock:
+            if self._lu is None:
+                import warnings
+                from scipy.linalg import lu_factor
+                with warnings.catch_warnings():
+                    # Singular matrices are reported by det()/solve(), not warned about
+                    warnings.simplefilter("ignore")
+                    self._lu = lu_factor(self.matrix, check_finite=False)
+            return self._lu
+
+    def expm(self):
+        """Matrix exponential."""
+        with self._lock:
+            if self._expm is None:
+                from scipy.linalg import expm
+                self._expm = expm(self.matrix)
+            return self._expm
+
+    # ── Derived quantities ─────────────────────────────────────────────────
+
+    def rank(self) -> int:
+        """Numerical rank, with numpy.linalg.matrix_rank's default tolerance."""
+        import numpy as np
+        S = self.singular_values()
+        if S.size == 0:
+            return 0
+        tol = S[0] * max(self.matrix.shape) * np.finfo(S.dtype).eps
+        return int(np.count_nonzero(S > tol))
+
+    def spectral_norm(self) -> float:
+        S = self.singular_values()
+        return float(S[0]) if S.size else 0.0
+
+    def frobenius_norm(self) -> float:
+        import numpy as np
+        return float(np.sqrt(np.sum(self.singular_values() ** 2)))
+
+    def condition_number(self) -> float:
+        """2-norm condition number S[0] / S[-1] (inf when singular)."""
+        S = self.singular_values()
+        if S.size == 0 or S[-1] == 0:
+            return float("inf")
+        return float(S[0] / S[-1])
+
+    def is_unitary(self) -> bool:
+        """M @ M^H == I, checked as every singular value being 1."""
+        import numpy as np
+        M = self.matrix
+        return M.shape[0] == M.shape[1] and bool(np.allclose(self.singular_values() ** 2, 1.0))
+
+    def determinant(self):
+        """det(M) from the LU diagonal and the pivot parity."""
+        import numpy as np
+        lu, piv = self.lu()
+        diag = np.diagonal(lu)
+        magnitude = np.abs(diag)
+        if np.any(magnitude == 0):
+            return diag.dtype.type(0)
+        # Phase and log-magnitude separately: the running product of a
+        # large diagonal overflows long before the determinant does
+        swaps = np.count_nonzero(piv != np.arange(piv.size))
+        sign = np.prod(diag / magnitude) * (-1 if swaps % 2 else 1)
+        return sign * np.exp(np.sum(np.log(magnitude)))
+
+    def solve(self, b):
+        """Solve M x = b with the cached LU factors."""
+        import numpy as np
+        from scipy.linalg import lu_solve
+        lu, piv = self.lu()
+        if np.any(np.diagonal(lu) == 0):
+            raise np.linalg.LinAlgError("Singular matrix")
+        return lu_solve((lu, piv), b, check_finite=False)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the matrix and every factor computed so far."""
+        held = [self.matrix, self._singular_values, self._expm]
+        for factors in list(self._svd.values()) + list(self._eig.values()):
+            held.extend(factors)
+        if self._lu is not None:
+            held.extend(self._lu)
+        return sum(getattr(a, "nbytes", 0) for a in held if a is not None)
+
+
+class FactorizationCache:
+    """Thread-safe LRU of MatrixFactors keyed by matrix content."""
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Hashable, MatrixFactors]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, M) -> MatrixFactors:
+        """
+        Factors for M, creating an empty entry on a miss.
+
+        The entry keeps a read-only copy of M, so later changes to the
+        caller's array cannot invalidate it.
+        """
+        key = matrix_key(M)
+        with self._lock:
+            factors = self._entries.get(key)
+            if factors is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return factors
+            self.misses += 1
+            copy = M.copy()
+            copy.flags.writeable = False
+            factors = self._entries[key] = MatrixFactors(copy)
+            self._evict()
+            return factors
+
+    def trim(self) -> None:
+        """Evict least-recently-used entries until within the byte budget."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self) -> None:
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+        total = sum(f.nbytes for f in self._entries.values())
+        while len(self._entries) > 1 and total > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            total -= evicted.nbytes
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": sum(f.nbytes for f in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -0,0 +1,329 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Numerical Batch Execution
+Phase 3.5: Parameter sweeps for NumericalComputingAgent
+
+integrate_ode, integrate_quad and optimize solve one problem per call, so
+a sweep over N parameter values paid N rounds of agent overhead and ran
+serially on one core. The batch operations take N independent problems
+at once and pick the cheapest strategy that is exact for them:
+
+    stacked      ODEs: when the right-hand side broadcasts over a (d, N)
+                 state, all N systems are integrated as one solve_ivp call
+                 with a vectorized right-hand side. Tolerances are divided
+                 by sqrt(N) so each system's error stays within what a solo
+                 solve would allow (solve_ivp controls the RMS error over
+                 the whole stacked state).
+    vectorized   Quadrature: when the integrand broadcasts, the N integrals
+                 are mapped onto [0, 1] and computed by one quad_vec call
+                 with a max-norm error target.
+    process      Otherwise, problems fan out across a process pool sized to
+                 SAFETY.MAX_WORKER_THREADS (capped at the CPU count) - if the
+                 function can be pickled (module-level functions can,
+                 lambdas cannot).
+    serial       Last resort: one after another in this process.
+
+Whether a function broadcasts is checked by evaluating it once on the
+stacked input and comparing against per-problem evaluations. For ODEs the
+probe uses perturbed states, distinct in every column, at a time inside
+t_span: sweeps usually share y0, so a right-hand side reducing across the
+state (sum, mean, norm) would agree with the solo calls at y0 itself.
+NumPy/SciPy are imported on first use.
+"""
+
+import logging
+import math
+import os
+import pickle
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from core.safety import SAFETY
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+PROBE_SAMPLES = 3               # Quadrature problems checked against the stacked evaluation
+PROBE_PERTURBATION = 0.1        # Relative spread of the ODE probe states
+PROBE_TIME = 0.37               # ODE probe time, as a fraction of t_span
+CHUNKS_PER_WORKER = 4           # Process-pool chunks per worker (load balance)
+POOL_WORKERS = min(SAFETY.MAX_WORKER_THREADS, os.cpu_count() or 1)
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> ProcessPoolExecutor:
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=POOL_WORKERS)
+        return _pool
+
+
+def _discard_pool(pool: ProcessPoolExecutor) -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False)
+
+
+def shutdown_pool() -> None:
+    """Stop the shared batch process pool (it restarts on next use)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown(wait=True)
+
+
+# ── Per-problem workers (module level so the process pool can pickle them) ─────
+
+def _solve_ivp_one(func, t_span, y0, method, t_eval, args, options) -> Dict[str, Any]:
+    from scipy.integrate import solve_ivp
+    result = solve_ivp(func, t_span, y0, method=method, t_eval=t_eval,
+                       args=args or None, **options)
+    return {"t": result.t.tolist(), "y": result.y.tolist(),
+            "success": bool(result.success), "message": result.message}
+
+
+def _quad_one(func, a, b, args) -> Dict[str, Any]:
+    from scipy.integrate import quad
+    value, error = quad(func, a, b, args=tuple(args or ()))
+    return {"value": float(value), "error_estimate": float(error), "interval": [a, b]}
+
+
+def _minimize_one(func, x0, method, args) -> Dict[str, Any]:
+    from scipy.optimize import minimize
+    result = minimize(func, x0, method=method, args=tuple(args or ()))
+    return {"x_optimal": result.x.tolist(), "fun_optimal": float(result.fun),
+            "success": bool(result.success), "message": result.message,
+            "iterations": int(getattr(result, "nit", 0))}
+
+
+def _run_chunk(worker: Callable, calls: List[tuple]) -> List[Dict[str, Any]]:
+    return [worker(*call) for call in calls]
+
+
+# ── Helpers ────────────────────────────────────────────────────────────────────
+
+def _picklable(*objects: Any) -> bool:
+    try:
+        pickle.dumps(objects)
+        return True
+    except Exception:
+        return False
+
+
+def _stack_args(args_list: Optional[Sequence[Sequence[Any]]], n: int) -> Tuple[Any, ...]:
+    """Per-problem extra args as one array per position, length n each."""
+    import numpy as np
+    if not args_list:
+        return ()
+    return tuple(np.asarray([args[j] for args in args_list]) for j in range(len(args_list[0])))
+
+
+def _sample(n: int) -> List[int]:
+    return sorted({0, n // 2, n - 1})[:PROBE_SAMPLES]
+
+
+def _fan_out(worker: Callable, calls: List[tuple], func: Callable) -> Tuple[List[Dict[str, Any]], str]:
+    """Run worker(*call) for every call; in the process pool when func pickles."""
+    if len(calls) > 1 and POOL_WORKERS > 1 and _picklable(func, calls[0]):
+        pool = _get_pool()
+        size = max(1, math.ceil(len(calls) / (POOL_WORKERS * CHUNKS_PER_WORKER)))
+        chunks = [calls[i:i + size] for i in range(0, len(calls), size)]
+        try:
+            futures = [pool.submit(_run_chunk, worker, chunk) for chunk in chunks]
+            return [r for future in futures for r in future.result()], "process"
+        except (BrokenProcessPool, pickle.PicklingError, OSError) as exc:
+            logger.warning("Batch process pool unavailable (%s); running serially", exc)
+            _discard_pool(pool)
+    return [worker(*call) for call in calls], "serial"
+
+
+def _report(results: List[Dict[str, Any]], strategy: str, start: float) -> Dict[str, Any]:
+    elapsed = time.perf_counter() - start
+    return {
+        "results": results,
+        "problems": len(results),
+        "strategy": strategy,
+        "elapsed_s": elapsed,
+        "problems_per_second": len(results) / elapsed if elapsed > 0 else float("inf"),
+    }
+
+
+# ── ODE systems ────────────────────────────────────────────────────────────────
+
+def _ode_stacked_rhs(func: Callable, t_span, Y0, stacked_args: tuple,
+                     args_list) -> Optional[Callable]:
+    """A rhs over the flattened (d, N) state, or None if func does not broadcast."""
+    import numpy as np
+    d, n = Y0.shape
+    t = t_span[0] + PROBE_TIME * (t_span[1] - t_span[0])
+    # Distinct in every entry, so coupling across columns shows up
+    spread = np.random.default_rng(0).uniform(-1.0, 1.0, size=(d, n))
+    Y = Y0 + PROBE_PERTURBATION * spread * (np.abs(Y0) + 1.0)
+    try:
+        out = np.asarray(func(t, Y.copy(), *stacked_args), dtype=float)
+        if out.shape != (d, n):
+            return None
+        for i in range(n):
+            solo_args = tuple(args_list[i]) if args_list else ()
+            solo = np.asarray(func(t, Y[:, i].copy(), *solo_args), dtype=float)
+            if not np.allclose(out[:, i], solo, rtol=1e-12, atol=1e-12):
+                return None
+    except Exception:
+        return None
+
+    def rhs(t, y):
+        return np.asarray(func(t, y.reshape(d, n), *stacked_args), dtype=float).reshape(-1)
+
+    return rhs
+
+
+def integrate_ode_batch(func: Callable, y0s, t_span, t_eval=None, method: str = "RK45",
+                        args_list: Optional[Sequence[Sequence[Any]]] = None,
+                        rtol: float = 1e-3, atol: float = 1e-6,
+                        stack: bool = True) -> Dict[str, Any]:
+    """
+    Solve N initial value problems sharing func, t_span and t_eval.
+
+    Args:
+        func:      f(t, y, *args) -> dy/dt
+        y0s:       Initial conditions, shape (N, d)
+        t_span:    (t0, tf)
+        t_eval:    Times at which to store each solution
+        method:    solve_ivp method
+        args_list: Per-problem extra args for func (N tuples)
+        rtol/atol: solve_ivp tolerances for each problem
+        stack:     Try the stacked single-solve strategy first
+    """
+    import numpy as np
+    from scipy.integrate import solve_ivp
+
+    start = time.perf_counter()
+    y0s = np.atleast_2d(np.asarray(y0s, dtype=float))
+    n = len(y0s)
+    if args_list is not None and len(args_list) != n:
+        raise ValueError(f"args_list has {len(args_list)} entries for {n} problems")
+
+    rhs = None
+    # LSODA takes no Jacobian sparsity: a stacked system would get a dense N*d Jacobian
+    if stack and n > 1 and method != "LSODA":
+        rhs = _ode_stacked_rhs(func, t_span, y0s.T, _stack_args(args_list, n), args_list)
+    if rhs is not None:
+        scale = math.sqrt(n)
+        options = {}
+        if method in ("Radau", "BDF"):
+            # Systems are independent: component j of problem i (index j*N + i)
+            # only couples to components of problem i
+            from scipy.sparse import eye, kron
+            options["jac_sparsity"] = kron(np.ones((y0s.shape[1], y0s.shape[1])), eye(n))
+        sol = solve_ivp(rhs, t_span, y0s.T.reshape(-1), method=method, t_eval=t_eval,
+                        rtol=rtol / scale, atol=atol / scale, **options)
+        Y = sol.y.reshape(y0s.shape[1], n, -1)
+        t = sol.t.tolist()
+        results = [{"t": t, "y": Y[:, i, :].tolist(), "success": bool(sol.success),
+                    "message": sol.message} for i in range(n)]
+        return _report(results, "stacked", start)
+
+    options = {"rtol": rtol, "atol": atol}
+    calls = [(func, tuple(t_span), y0s[i], method, t_eval,
+              tuple(args_list[i]) if args_list else None, options) for i in range(n)]
+    results, strategy = _fan_out(_solve_ivp_one, calls, func)
+    return _report(results, strategy, start)
+
+
+# ── Quadrature ─────────────────────────────────────────────────────────────────
+
+def integrate_quad_batch(func: Callable, limits: Sequence[Sequence[float]],
+                         args_list: Optional[Sequence[Sequence[Any]]] = None,
+                         epsabs: float = 1.49e-8, epsrel: float = 1.49e-8,
+                         vectorize: bool = True) -> Dict[str, Any]:
+    """
+    N definite integrals of func over limits[i] (with args_list[i]).
+
+    Args:
+        func:      f(x, *args) -> float
+        limits:    N (a, b) pairs
+        args_list: Per-problem extra args for func
+        epsabs/epsrel: Error targets for each integral
+        vectorize: Try the single quad_vec strategy first (finite limits only)
+    """
+    import numpy as np
+
+    start = time.perf_counter()
+    bounds = np.asarray(limits, dtype=float).reshape(-1, 2)
+    n = len(bounds)
+    if args_list is not None and len(args_list) != n:
+        raise ValueError(f"args_list has {len(args_list)} entries for {n} problems")
+
+    if vectorize and n > 1 and np.all(np.isfinite(bounds)):
+        result = _quad_vectorized(func, bounds, args_list, epsabs, epsrel)
+        if result is not None:
+            values, error = result
+            results = [{"value": float(v), "error_estimate": float(error),
+                        "interval": [float(a), float(b)]}
+                       for v, (a, b) in zip(values, bounds)]
+            return _report(results, "vectorized", start)
+
+    calls = [(func, float(a), float(b), tuple(args_list[i]) if args_list else None)
+             for i, (a, b) in enumerate(bounds)]
+    results, strategy = _fan_out(_quad_one, calls, func)
+    return _report(results, strategy, start)
+
+
+def _quad_vectorized(func, bounds, args_list, epsabs, epsrel):
+    """quad_vec over u in [0, 1] with x_i = a_i + (b_i - a_i) u; None if func does not broadcast."""
+    import numpy as np
+    from scipy.integrate import quad_vec
+
+    a, width = bounds[:, 0], bounds[:, 1] - bounds[:, 0]
+    stacked_args = _stack_args(args_list, len(bounds))
+
+    def integrand(u):
+        return width * np.asarray(func(a + width * u, *stacked_args), dtype=float)
+
+    try:
+        probe = integrand(0.37)
+        if probe.shape != a.shape:
+            return None
+        for i in _sample(len(bounds)):
+            solo_args = tuple(args_list[i]) if args_list else ()
+            solo = width[i] * float(func(a[i] + width[i] * 0.37, *solo_args))
+            if not np.isclose(probe[i], solo, rtol=1e-12, atol=1e-12):
+                return None
+        values, error = quad_vec(integrand, 0.0, 1.0, epsabs=epsabs, epsrel=epsrel, norm="max")
+    except Exception:
+        return None
+    return values, error
+
+
+# ── Optimization ───────────────────────────────────────────────────────────────
+
+def optimize_batch(func: Callable, x0s, method: str = "Nelder-Mead",
+                   args_list: Optional[Sequence[Sequence[Any]]] = None) -> Dict[str, Any]:
+    """
+    N independent minimizations (one per starting point / args entry).
+
+    Minimizers do not share iterations, so these fan out across the process
+    pool when func can be pickled, and run serially otherwise.
+    """
+    import numpy as np
+
+    start = time.perf_counter()
+    x0s = np.atleast_2d(np.asarray(x0s, dtype=float))
+    n = len(x0s)
+    if args_list is not None and len(args_list) != n:
+        raise ValueError(f"args_list has {len(args_list)} entries for {n} problems")
+    calls = [(func, x0s[i], method, tuple(args_list[i]) if args_list else None)
+             for i in range(n)]
+    results, strategy = _fan_out(_minimize_one, calls, func)
+    return _report(results, strategy, start)
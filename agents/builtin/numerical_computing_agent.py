@@ -5,11 +5,16 @@ Phase 3.5: Lazy-loaded wrapper for NumPy and SciPy toolsets
 
 Provides advanced numerical methods: linear algebra, eigenvalue decomposition,
 matrix exponentials, numerical integration, optimization, and FFT.
+
+Matrix decompositions are cached by matrix content (factorization_cache.py),
+so a matrix that repeats across calls is factored once per decomposition.
+Parameter sweeps use the *_batch operations (numerical_batch.py).
 """
 
 from typing import Any, Dict, List, Optional, Union
 
 from ..base import BaseAgent, AgentResult
+from .factorization_cache import FactorizationCache
 
 
 class NumericalComputingAgent(BaseAgent):
@@ -20,6 +25,7 @@ class NumericalComputingAgent(BaseAgent):
     - Linear algebra (solve, eigenvalues, SVD, matrix exponential)
     - Numerical integration (ODE solvers, quadrature)
     - Optimization (minimize, root-finding)
+    - Batched sweeps of N ODE / quadrature / optimization problems
     - Fast Fourier Transform
     - Matrix analysis (norm, rank, condition number)
     """
@@ -30,11 +36,14 @@ class NumericalComputingAgent(BaseAgent):
     requires_network = False
     requires_filesystem = False
     max_execution_time = 60
+    pure_actions = frozenset({"*"})         # Every operation is deterministic
+    cpu_bound_actions = frozenset({"*"})
 
     def __init__(self):
         super().__init__()
         self._np = None
         self._scipy = None
+        self._factors = FactorizationCache()
 
     def _ensure_loaded(self):
         """Lazy-load NumPy and SciPy only when a method is actually called."""
@@ -61,7 +70,8 @@ class NumericalComputingAgent(BaseAgent):
         Args:
             operation: One of 'solve_linear', 'eigenvalues', 'matrix_exp',
                        'svd', 'integrate_ode', 'integrate_quad', 'optimize',
-                       'fft', 'matrix_analysis'
+                       'fft', 'matrix_analysis', 'integrate_ode_batch',
+                       'integrate_quad_batch', 'optimize_batch'
             **kwargs: Operation-specific parameters
         """
         if not operation:
@@ -69,7 +79,8 @@ class NumericalComputingAgent(BaseAgent):
                 success=False,
                 error="No operation specified. Available: solve_linear, eigenvalues, "
                       "matrix_exp, svd, integrate_ode, integrate_quad, optimize, "
-                      "fft, matrix_analysis",
+                      "fft, matrix_analysis, integrate_ode_batch, "
+                      "integrate_quad_batch, optimize_batch",
             )
 
         dispatch = {
@@ -82,6 +93,9 @@ class NumericalComputingAgent(BaseAgent):
             "optimize": self._run_optimize,
             "fft": self._run_fft,
             "matrix_analysis": self._run_matrix_analysis,
+            "integrate_ode_batch": self._run_integrate_ode_batch,
+            "integrate_quad_batch": self._run_integrate_quad_batch,
+            "optimize_batch": self._run_optimize_batch,
         }
 
         handler = dispatch.get(operation)
@@ -99,6 +113,13 @@ class NumericalComputingAgent(BaseAgent):
             return AgentResult(success=False, error=str(exc))
         except Exception as exc:
             return AgentResult(success=False, error=f"{type(exc).__name__}: {exc}")
+        finally:
+            # Factors computed by this call count against the byte budget
+            self._factors.trim()
+
+    def factorization_stats(self) -> Dict[str, Any]:
+        """Entries, bytes held, hits and misses of the factorization cache."""
+        return self._factors.stats()
 
     # ── Linear system solving ────────────────────────────────────────────
 
@@ -124,7 +145,10 @@ class NumericalComputingAgent(BaseAgent):
         A = np.asarray(A, dtype=float)
         b = np.asarray(b, dtype=float)
 
-        x = np.linalg.solve(A, b)
+        if A.ndim == 2 and A.shape[0] == A.shape[1]:
+            x = self._factors.get(A).solve(b)
+        else:
+            x = np.linalg.solve(A, b)
         residual = np.linalg.norm(A @ x - b)
 
         return AgentResult(
@@ -158,11 +182,7 @@ class NumericalComputingAgent(BaseAgent):
             )
 
         M = np.asarray(matrix, dtype=complex)
-
-        if hermitian:
-            eigenvalues, eigenvectors = np.linalg.eigh(M)
-        else:
-            eigenvalues, eigenvectors = np.linalg.eig(M)
+        eigenvalues, eigenvectors = self._factors.get(M).eig(hermitian)
 
         return AgentResult(
             success=True,
@@ -190,8 +210,6 @@ class NumericalComputingAgent(BaseAgent):
             matrix: Square matrix (list of lists or ndarray)
         """
         np = self._np
-        sp = self._scipy
-        from scipy import linalg as sp_linalg
 
         if matrix is None:
             return AgentResult(
@@ -199,7 +217,7 @@ class NumericalComputingAgent(BaseAgent):
             )
 
         M = np.asarray(matrix, dtype=complex)
-        result = sp_linalg.expm(M)
+        result = self._factors.get(M).expm()
 
         return AgentResult(
             success=True,
@@ -229,7 +247,7 @@ class NumericalComputingAgent(BaseAgent):
             return AgentResult(success=False, error="svd requires a matrix")
 
         M = np.asarray(matrix, dtype=complex)
-        U, S, Vh = np.linalg.svd(M, full_matrices=full_matrices)
+        U, S, Vh = self._factors.get(M).svd(full_matrices)
 
         return AgentResult(
             success=True,
@@ -413,6 +431,9 @@ class NumericalComputingAgent(BaseAgent):
         Comprehensive analysis of a matrix: norm, rank, determinant,
         condition number, trace.
 
+        Rank, norms, condition number and unitarity all come from one set
+        of singular values; the determinant from one LU factorization.
+
         Args:
             matrix: Input matrix (list of lists or ndarray)
         """
@@ -423,25 +444,122 @@ class NumericalComputingAgent(BaseAgent):
             )
 
         M = np.asarray(matrix, dtype=complex)
+        factors = self._factors.get(M)
 
         analysis = {
             "shape": list(M.shape),
-            "rank": int(np.linalg.matrix_rank(M)),
+            "rank": factors.rank(),
             "trace": complex(np.trace(M)),
-            "frobenius_norm": float(np.linalg.norm(M, "fro")),
-            "spectral_norm": float(np.linalg.norm(M, 2)),
+            "frobenius_norm": factors.frobenius_norm(),
+            "spectral_norm": factors.spectral_norm(),
         }
 
         # Determinant and condition number only for square matrices
         if M.shape[0] == M.shape[1]:
-            analysis["determinant"] = complex(np.linalg.det(M))
-            analysis["condition_number"] = float(np.linalg.cond(M))
+            analysis["determinant"] = complex(factors.determinant())
+            analysis["condition_number"] = factors.condition_number()
             analysis["is_hermitian"] = bool(np.allclose(M, M.conj().T))
-            analysis["is_unitary"] = bool(
-                np.allclose(M @ M.conj().T, np.eye(M.shape[0]))
-            )
+            analysis["is_unitary"] = factors.is_unitary()
 
         return AgentResult(
             success=True,
             data=analysis,
         )
+
+    # ── Batched sweeps ───────────────────────────────────────────────────
+
+    def _run_integrate_ode_batch(
+        self,
+        func=None,
+        y0s=None,
+        t_span=None,
+        t_eval=None,
+        method: str = "RK45",
+        args_list=None,
+        **kwargs,
+    ) -> AgentResult:
+        """
+        Solve N initial value problems that share func and t_span.
+
+        Stacked into one vectorized solve_ivp when func broadcasts over a
+        (d, N) state; otherwise fanned out across the batch process pool.
+
+        Args:
+            func: Right-hand side f(t, y, *args) -> dy/dt
+            y0s: Initial conditions, one row per problem
+            t_span: (t0, tf) integration interval
+            t_eval: Times at which to store every solution
+            method: Integration method ('RK45', 'RK23', 'DOP853', 'Radau', 'BDF')
+            args_list: Optional per-problem extra arguments for func
+        """
+        from .numerical_batch import integrate_ode_batch
+
+        if func is None or y0s is None or t_span is None:
+            return AgentResult(
+                success=False,
+                error="integrate_ode_batch requires func, y0s, and t_span",
+            )
+
+        report = integrate_ode_batch(func, y0s, t_span, t_eval=t_eval, method=method,
+                                     args_list=args_list)
+        report["method"] = method
+        return AgentResult(success=True, data=report)
+
+    def _run_integrate_quad_batch(
+        self,
+        func=None,
+        limits=None,
+        args_list=None,
+        **kwargs,
+    ) -> AgentResult:
+        """
+        Compute N definite integrals.
+
+        One quad_vec call over all of them when func broadcasts and the
+        limits are finite; otherwise fanned out across the batch process pool.
+
+        Args:
+            func: Integrand f(x, *args) -> float
+            limits: (a, b) pair per problem
+            args_list: Optional per-problem extra arguments for func
+        """
+        from .numerical_batch import integrate_quad_batch
+
+        if func is None or limits is None:
+            return AgentResult(
+                success=False, error="integrate_quad_batch requires func and limits"
+            )
+
+        return AgentResult(
+            success=True,
+            data=integrate_quad_batch(func, limits, args_list=args_list),
+        )
+
+    def _run_optimize_batch(
+        self,
+        func=None,
+        x0s=None,
+        method: str = "Nelder-Mead",
+        args_list=None,
+        **kwargs,
+    ) -> AgentResult:
+        """
+        Run N independent minimizations across the batch process pool.
+
+        Args:
+            func: Objective function f(x, *args) -> float (module-level to
+                  run in worker processes; lambdas run serially)
+            x0s: Initial guess per problem
+            method: Optimization method
+            args_list: Optional per-problem extra arguments for func
+        """
+        from .numerical_batch import optimize_batch
+
+        if func is None or x0s is None:
+            return AgentResult(
+                success=False, error="optimize_batch requires func and x0s"
+            )
+
+        report = optimize_batch(func, x0s, method=method, args_list=args_list)
+        report["method"] = method
+        return AgentResult(success=True, data=report)
@@ -7,9 +7,16 @@ Provides quantum-assisted encryption, decryption, entropy generation,
 and key management using AES-256-GCM with quantum entropy seeding.
 """
 
+import threading
 from typing import Any, Dict, Optional
 
 from ..base import BaseAgent, AgentResult
+from .entropy_pool import EntropyPool
+
+
+ENTROPY_SOURCES = ("local", "ibm_simulator", "ibm_hardware", "auto")
+# Remote sources spend backend time per chunk; they are not pre-filled by default
+POOLED_SOURCES = ("local",)
 
 
 class QuantumCryptoAgent(BaseAgent):
@@ -19,7 +26,8 @@ class QuantumCryptoAgent(BaseAgent):
     Capabilities:
     - Quantum-assisted text encryption (AES-256-GCM + quantum entropy)
     - Decryption of encrypted packages
-    - Quantum entropy generation (IBM hardware, simulator, or local)
+    - Quantum entropy generation (IBM hardware, simulator, or local); local
+      entropy is served from a background-refilled, health-tested pool
     - Encryption package inspection and validation
     """
 
@@ -33,6 +41,8 @@ class QuantumCryptoAgent(BaseAgent):
     def __init__(self):
         super().__init__()
         self._qencrypt = None
+        self._pools: Dict[str, EntropyPool] = {}
+        self._pools_lock = threading.Lock()
 
     def _ensure_loaded(self):
         """Lazy-load qencrypt_local only when a method is actually called."""
@@ -82,6 +92,27 @@ class QuantumCryptoAgent(BaseAgent):
         except Exception as exc:
             return AgentResult(success=False, error=f"{type(exc).__name__}: {exc}")
 
+    def _entropy_pool(self, source: str) -> EntropyPool:
+        if source not in ENTROPY_SOURCES:
+            raise ValueError(f"Unknown entropy source: {source!r}")
+        with self._pools_lock:
+            if source not in self._pools:
+                self._pools[source] = EntropyPool(source)
+            return self._pools[source]
+
+    def entropy_stats(self) -> Dict[str, Any]:
+        """Fill level, health-test state and counters of each entropy pool."""
+        with self._pools_lock:
+            pools = list(self._pools.values())
+        return {pool.source: pool.stats() for pool in pools}
+
+    def close(self) -> None:
+        """Stop entropy refills and zero the pools."""
+        with self._pools_lock:
+            pools, self._pools = list(self._pools.values()), {}
+        for pool in pools:
+            pool.close()
+
     # ── Encryption ───────────────────────────────────────────────────────
 
     def _run_encrypt(
@@ -162,30 +193,56 @@ class QuantumCryptoAgent(BaseAgent):
         self,
         n_bytes: int = 32,
         source: str = "local",
+        pooled: Optional[bool] = None,
         **kwargs,
     ) -> AgentResult:
         """
         Generate quantum entropy bytes.
 
+        Pooled requests are served from the source's entropy pool, which is
+        refilled in the background and health-tested (see entropy_pool.py).
+
         Args:
             n_bytes: Number of entropy bytes to generate (default 32)
             source: 'local', 'ibm_simulator', 'ibm_hardware', or 'auto'
+            pooled: True serves from the pool, False generates the bytes
+                    synchronously, untested; default: pooled for 'local' only
         """
-        from qencrypt_local.quantum_entropy import get_entropy
-
-        entropy_bytes, meta = get_entropy(
-            n_bytes,
-            source=source,
-            allow_fallback=True,
-        )
+        if source not in ENTROPY_SOURCES:
+            return AgentResult(
+                success=False,
+                error=f"Unknown entropy source: {source!r}. "
+                      f"Available: {', '.join(ENTROPY_SOURCES)}",
+            )
+        if pooled is None:
+            pooled = source in POOLED_SOURCES
+        if not pooled:
+            from qencrypt_local.quantum_entropy import get_entropy
+
+            entropy_bytes, meta = get_entropy(
+                n_bytes,
+                source=source,
+                allow_fallback=True,
+            )
+            return AgentResult(
+                success=True,
+                data={
+                    "entropy_hex": entropy_bytes.hex(),
+                    "n_bytes": len(entropy_bytes),
+                    "source_used": meta.get("source", "unknown"),
+                    "meta": meta,
+                },
+            )
 
+        entropy_bytes, provenance = self._entropy_pool(source).take(n_bytes)
+        sources = sorted({chunk["source"] for chunk in provenance})
         return AgentResult(
             success=True,
             data={
                 "entropy_hex": entropy_bytes.hex(),
                 "n_bytes": len(entropy_bytes),
-                "source_used": meta.get("source", "unknown"),
-                "meta": meta,
+                "source_used": sources[0] if len(sources) == 1 else ",".join(sources) or "unknown",
+                "meta": {"pooled": True, "chunks": provenance},
             },
         )
 
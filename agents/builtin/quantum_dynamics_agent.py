@@ -10,6 +10,7 @@ decoherence modeling, and open quantum system simulations.
 from typing import Any, Dict, List, Optional
 
 from ..base import BaseAgent, AgentResult
+from .dynamics_solver_cache import DECOHERENCE_CHANNELS, SolverCache, purity
 
 
 class QuantumDynamicsAgent(BaseAgent):
@@ -18,7 +19,9 @@ class QuantumDynamicsAgent(BaseAgent):
 
     Capabilities:
     - Schrodinger equation solving (sesolve)
-    - Lindblad master equation solving (mesolve)
+    - Lindblad master equation solving (mesolve), with compiled solvers
+      reused across calls on the same system
+    - Observables (including purity) evaluated during integration
     - Monte Carlo quantum trajectories (mcsolve)
     - Steady-state computation
     - Decoherence modeling via collapse operators
@@ -35,6 +38,7 @@ class QuantumDynamicsAgent(BaseAgent):
     def __init__(self):
         super().__init__()
         self._qutip = None
+        self._solvers = SolverCache()
 
     def _ensure_loaded(self):
         """Lazy-load QuTiP only when a method is actually called."""
@@ -87,6 +91,10 @@ class QuantumDynamicsAgent(BaseAgent):
         except Exception as exc:
             return AgentResult(success=False, error=f"{type(exc).__name__}: {exc}")
 
+    def solver_stats(self) -> Dict[str, Any]:
+        """Solvers held, hits and misses of the master-equation solver cache."""
+        return self._solvers.stats()
+
     # ── Master equation (Lindblad) ───────────────────────────────────────
 
     def _run_mesolve(
@@ -96,17 +104,24 @@ class QuantumDynamicsAgent(BaseAgent):
         tlist=None,
         c_ops: Optional[List] = None,
         e_ops: Optional[List] = None,
+        store_states: Optional[bool] = None,
         **kwargs,
     ) -> AgentResult:
         """
         Solve the Lindblad master equation for an open quantum system.
 
+        The compiled solver for (hamiltonian, c_ops) is cached, so repeated
+        runs on the same system skip building the Liouvillian.
+
         Args:
             hamiltonian: Qobj Hamiltonian (or list for time-dependent)
             rho0: Initial state (ket or density matrix)
             tlist: Array of time points
             c_ops: List of collapse operators (decoherence channels)
-            e_ops: List of expectation-value operators
+            e_ops: Expectation-value operators, callables f(t, rho), or
+                   'purity'; evaluated during integration
+            store_states: Keep the density matrix at every time point
+                          (default: only when no e_ops are given)
         """
         qt = self._qutip
         if hamiltonian is None or rho0 is None or tlist is None:
@@ -115,16 +130,19 @@ class QuantumDynamicsAgent(BaseAgent):
                 error="mesolve requires hamiltonian, rho0, and tlist",
             )
 
-        result = qt.mesolve(
-            hamiltonian, rho0, tlist,
-            c_ops=c_ops or [],
-            e_ops=e_ops or [],
-        )
+        if store_states is None:
+            store_states = not e_ops
+        observables = [purity if isinstance(op, str) and op == "purity" else op
+                       for op in e_ops or []]
+
+        solver = self._solvers.system(qt, hamiltonian, c_ops or [])
+        result = solver.run(rho0, tlist, observables, store_states)
         return AgentResult(
             success=True,
             data={
-                "states": result.states if not e_ops else None,
+                "states": result.states if store_states else None,
                 "expect": result.expect if e_ops else None,
+                "final_state": result.final_state,
                 "num_collapse": result.num_collapse
                     if hasattr(result, "num_collapse") else None,
                 "solver": "mesolve",
@@ -292,16 +310,23 @@ class QuantumDynamicsAgent(BaseAgent):
         gamma: float = 0.1,
         tlist=None,
         decoherence_type: str = "amplitude_damping",
+        gammas: Optional[List[float]] = None,
+        store_states: bool = False,
         **kwargs,
     ) -> AgentResult:
         """
         Model decoherence effects on a quantum state.
 
+        Purity is computed during integration; one cached solver per channel
+        serves every gamma.
+
         Args:
             state: Initial Qobj ket state
             gamma: Decoherence rate
             tlist: Array of time points
             decoherence_type: 'amplitude_damping', 'dephasing', or 'depolarizing'
+            gammas: Rates to sweep; results per rate under 'sweep'
+            store_states: Keep the density matrix at every time point
         """
         qt = self._qutip
         import numpy as np
@@ -312,43 +337,45 @@ class QuantumDynamicsAgent(BaseAgent):
                 error="decoherence requires state and tlist",
             )
 
-        dim = state.shape[0]
-
-        # Build collapse operators based on decoherence type
-        if decoherence_type == "amplitude_damping":
-            # Spontaneous emission: sqrt(gamma) * |0><1|
-            c_ops = [np.sqrt(gamma) * qt.destroy(dim)]
-            H = qt.qeye(dim) * 0  # free evolution (no Hamiltonian drive)
-        elif decoherence_type == "dephasing":
-            # Pure dephasing: sqrt(gamma/2) * sigma_z
-            c_ops = [np.sqrt(gamma / 2.0) * qt.sigmaz()]
-            H = qt.qeye(2) * 0
-        elif decoherence_type == "depolarizing":
-            # Depolarizing channel: equal rates on x, y, z
-            rate = np.sqrt(gamma / 4.0)
-            c_ops = [
-                rate * qt.sigmax(),
-                rate * qt.sigmay(),
-                rate * qt.sigmaz(),
-            ]
-            H = qt.qeye(2) * 0
-        else:
+        if decoherence_type not in DECOHERENCE_CHANNELS:
             return AgentResult(
                 success=False,
                 error=f"Unknown decoherence_type: {decoherence_type!r}. "
                       "Use 'amplitude_damping', 'dephasing', or 'depolarizing'.",
             )
 
-        result = qt.mesolve(H, state, tlist, c_ops=c_ops)
-
-        # Compute purity at each time step
-        purities = [(rho * rho).tr().real for rho in result.states]
-
+        # Amplitude damping lowers through all levels; the Pauli channels act on a qubit
+        dim = state.shape[0] if decoherence_type == "amplitude_damping" else 2
+        solver = self._solvers.channel(qt, decoherence_type, dim)
+
+        runs = []
+        for rate in (gammas if gammas is not None else [gamma]):
+            result = solver.run(state, tlist, [purity], store_states,
+                                args={"gamma": float(rate)})
+            runs.append({
+                "gamma": rate,
+                "purities": np.real(result.expect[0]).tolist(),
+                "final_state": result.final_state,
+                "states": result.states if store_states else None,
+            })
+
+        if gammas is not None:
+            return AgentResult(
+                success=True,
+                data={
+                    "sweep": runs,
+                    "decoherence_type": decoherence_type,
+                    "times": list(tlist),
+                    "solver": "mesolve (decoherence)",
+                },
+            )
+        run = runs[0]
         return AgentResult(
             success=True,
             data={
-                "states": result.states,
-                "purities": purities,
+                "states": run["states"],
+                "purities": run["purities"],
+                "final_state": run["final_state"],
                 "gamma": gamma,
                 "decoherence_type": decoherence_type,
                 "times": list(tlist),
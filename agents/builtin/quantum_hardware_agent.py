@@ -10,6 +10,7 @@ circuit optimization, statevector simulation, and noise modeling.
 from typing import Any, Dict, List, Optional, Union
 
 from ..base import BaseAgent, AgentResult
+from .transpile_cache import TranspileCache
 
 
 class QuantumHardwareAgent(BaseAgent):
@@ -20,6 +21,8 @@ class QuantumHardwareAgent(BaseAgent):
     - Quantum circuit construction
     - Circuit transpilation for target backends
     - Circuit optimization (levels 0–3)
+    - Transpile reuse: pooled backend targets, and structurally identical
+      circuits (differing only in angles) bound into a cached transpilation
     - Statevector / density-matrix simulation
     - Circuit depth and gate-count analysis
     """
@@ -34,6 +37,7 @@ class QuantumHardwareAgent(BaseAgent):
     def __init__(self):
         super().__init__()
         self._qiskit = None
+        self._transpiler = TranspileCache()
 
     def _ensure_loaded(self):
         """Lazy-load Qiskit only when a method is actually called."""
@@ -85,6 +89,10 @@ class QuantumHardwareAgent(BaseAgent):
         except Exception as exc:
             return AgentResult(success=False, error=f"{type(exc).__name__}: {exc}")
 
+    def transpile_stats(self) -> Dict[str, Any]:
+        """Templates, targets, hits and misses of the transpile cache."""
+        return self._transpiler.stats()
+
     # ── Circuit construction ─────────────────────────────────────────────
 
     def _run_build_circuit(
@@ -142,6 +150,8 @@ class QuantumHardwareAgent(BaseAgent):
         num_qubits: int = 5,
         basis_gates: Optional[List[str]] = None,
         optimization_level: int = 1,
+        parameter_values: Optional[Dict[Any, float]] = None,
+        cache: bool = True,
         **kwargs,
     ) -> AgentResult:
         """
@@ -152,23 +162,27 @@ class QuantumHardwareAgent(BaseAgent):
             num_qubits: Backend qubit count for GenericBackendV2
             basis_gates: Target basis gate set (default: ['cx', 'id', 'rz', 'sx', 'x'])
             optimization_level: 0 (none) to 3 (heavy)
+            parameter_values: Values for the circuit's free Parameters, by
+                              Parameter or name, bound after transpilation
+            cache: Reuse a cached transpilation of the same circuit structure.
+                   The first call with a structure is transpiled exactly;
+                   later ones bind their angles into the cached template and
+                   may miss angle-specific simplifications (False: transpile
+                   every call exactly)
         """
-        qk = self._qiskit
-
         if circuit is None:
             return AgentResult(
                 success=False,
                 error="transpile requires a 'circuit' argument",
             )
 
-        from qiskit.providers.fake_provider import GenericBackendV2
-        backend = GenericBackendV2(num_qubits=max(num_qubits, circuit.num_qubits))
-
-        transpiled = qk.transpile(
+        transpiled, hit = self._transpiler.transpile(
             circuit,
-            backend=backend,
+            num_qubits=max(num_qubits, circuit.num_qubits),
             basis_gates=basis_gates,
             optimization_level=optimization_level,
+            parameter_values=parameter_values,
+            cache=cache,
         )
 
         return AgentResult(
@@ -181,6 +195,7 @@ class QuantumHardwareAgent(BaseAgent):
                 "transpiled_gates": transpiled.size(),
                 "optimization_level": optimization_level,
                 "backend_qubits": num_qubits,
+                "cache_hit": hit,
             },
         )
 
@@ -190,6 +205,8 @@ class QuantumHardwareAgent(BaseAgent):
         self,
         circuit=None,
         optimization_level: int = 3,
+        parameter_values: Optional[Dict[Any, float]] = None,
+        cache: bool = False,
         **kwargs,
     ) -> AgentResult:
         """
@@ -198,18 +215,23 @@ class QuantumHardwareAgent(BaseAgent):
         Args:
             circuit: A Qiskit QuantumCircuit
             optimization_level: 0 (none) to 3 (heavy optimization)
+            parameter_values: Values for the circuit's free Parameters
+            cache: Reuse a cached optimization of the same circuit structure.
+                   Off by default: the cached template treats every angle as
+                   a free parameter, so it misses angle-specific merging and
+                   simplification and reduces the circuit less
         """
-        qk = self._qiskit
-
         if circuit is None:
             return AgentResult(
                 success=False,
                 error="optimize requires a 'circuit' argument",
             )
 
-        optimized = qk.transpile(
+        optimized, hit = self._transpiler.transpile(
             circuit,
             optimization_level=optimization_level,
+            parameter_values=parameter_values,
+            cache=cache,
         )
 
         return AgentResult(
@@ -224,6 +246,7 @@ class QuantumHardwareAgent(BaseAgent):
                     (1 - optimized.size() / max(circuit.size(), 1)) * 100, 1
                 ),
                 "optimization_level": optimization_level,
+                "cache_hit": hit,
             },
         )
 
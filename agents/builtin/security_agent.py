@@ -113,14 +113,23 @@ class SecurityAgent(BaseAgent):
         }
 
     def _get_audit_recent(self, lines: int) -> Dict[str, Any]:
-        """Read the last N lines from the sauron audit log."""
+        """Last N records of the sauron audit log."""
+        import json
+        import sys
         from pathlib import Path
         log_path = Path.home() / ".frankenstein" / "logs" / "sauron_audit.log"
+        # If Sauron is running, its in-memory tail includes records the
+        # background writer has not flushed yet
+        audit_mod = sys.modules.get("agents.sauron.audit")
+        audit = getattr(audit_mod, "_sauron_audit", None) if audit_mod else None
+        if audit is not None:
+            recent = [json.dumps(r, default=str) for r in audit.get_recent(lines)]
+            return {"lines": recent, "log_path": str(log_path), "exists": log_path.exists()}
         if not log_path.exists():
             return {"lines": [], "log_path": str(log_path), "exists": False}
         try:
-            all_lines = log_path.read_text(encoding="utf-8").splitlines()
-            recent = all_lines[-lines:]
+            from agents.sauron.audit_sink import read_tail_lines
+            recent = read_tail_lines(log_path, lines)
             return {"lines": recent, "log_path": str(log_path), "exists": True}
         except Exception as exc:
             return {"lines": [], "error": str(exc), "exists": True}
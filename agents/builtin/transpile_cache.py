@@ -0,0 +1,287 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Transpile Cache
+Phase 3.5: Reusable targets and transpiled circuits for QuantumHardwareAgent
+
+transpile and optimize used to construct a GenericBackendV2 and run a full
+qiskit.transpile on every call, so a variational loop transpiling the same
+ansatz hundreds of times - only the angles changing - paid the full
+layout/routing/optimization cost each time.
+
+TranspileCache keeps:
+
+    targets         one GenericBackendV2 per (num_qubits, basis_gates), and
+                    one preset pass manager per (target, optimization level)
+    results         an LRU of transpiled templates keyed by a structural
+                    circuit hash and the optimization level
+
+The structural hash covers gate names, qubit and clbit positions and any
+symbolic parameters, but not numeric angles: on a miss each numeric angle
+of a standard gate is replaced by a placeholder Parameter and the template
+is transpiled; on a hit the caller's angles (and parameter_values, if any)
+are bound into a copy of it. The template is valid for every angle, so it
+may miss value-specific simplifications (an rz(0) that could be dropped).
+A miss therefore returns the exact transpilation of the caller's circuit
+and only later calls with the same structure are served from the template
+- a one-off transpile gives the same circuit as an uncached one. Callers
+that want every call exact pass cache=False, as QuantumHardwareAgent's
+optimize does by default.
+
+Qiskit is imported on first use, never at module import.
+"""
+
+import threading
+from collections import OrderedDict
+from numbers import Real
+from typing import Any, Dict, Hashable, List, Optional, Tuple
+
+from .factorization_cache import matrix_key
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+MAX_TEMPLATES = 256                 # Transpiled templates kept (LRU)
+MAX_TARGETS = 16                    # Backends (and their pass managers) kept
+SLOT_PREFIX = "_transpile_slot"     # Placeholder parameter names for numeric angles
+
+_STANDARD_GATES_MODULE = "qiskit.circuit.library.standard_gates"
+# Gates built with to_gate()/to_instruction(): identified by their definition
+_USER_DEFINED_MODULES = ("qiskit.circuit.gate", "qiskit.circuit.instruction",
+                         "qiskit.circuit.controlledgate")
+
+
+def _is_angle(value) -> bool:
+    return isinstance(value, Real) and not isinstance(value, bool)
+
+
+def _module(op) -> str:
+    # Singleton gate classes (CXGate(), HGate(), ...) have no __module__
+    return type(op).__module__ or ""
+
+
+def _templatable(op) -> bool:
+    """Standard gates rebuild their definition from params; custom gates do not."""
+    return _module(op).startswith(_STANDARD_GATES_MODULE)
+
+
+def _param_key(value) -> Hashable:
+    if hasattr(value, "parameters"):                # ParameterExpression
+        return "expr", str(value)
+    if _is_angle(value):
+        return "value", float(value)
+    if hasattr(value, "shape"):                     # unitary / initialize data
+        import numpy as np
+        return "array", matrix_key(np.asarray(value))
+    return "raw", repr(value)
+
+
+def structural_key(circuit, template: bool = True) -> Tuple[Hashable, List[float]]:
+    """
+    Hash a circuit's structure.
+
+    Args:
+        circuit:  QuantumCircuit
+        template: Leave numeric angles of standard gates out of the key
+
+    Returns:
+        (key, angles) - angles are the numeric values left out, in order
+    """
+    angles: List[float] = []
+    phase = circuit.global_phase
+    # Numeric global phase is carried over on bind; a symbolic one is structure
+    parts = [circuit.num_qubits, circuit.num_clbits,
+             None if _is_angle(phase) else _param_key(phase)]
+    for instruction in circuit.data:
+        op = instruction.operation
+        slot = template and _templatable(op)
+        params = []
+        for value in op.params:
+            if slot and _is_angle(value):
+                angles.append(float(value))
+                params.append("slot")
+            else:
+                params.append(_param_key(value))
+        definition = None
+        if _module(op) in _USER_DEFINED_MODULES and op.definition is not None:
+            definition = structural_key(op.definition, template=False)[0]
+        parts.append((
+            op.name,
+            tuple(circuit.find_bit(q).index for q in instruction.qubits),
+            tuple(circuit.find_bit(c).index for c in instruction.clbits),
+            tuple(params),
+            repr(getattr(op, "condition", None)),
+            definition,
+        ))
+    return tuple(parts), angles
+
+
+def _make_template(circuit, slots):
+    """Copy of circuit with each numeric standard-gate angle replaced by a slot."""
+    template = circuit.copy_empty_like()
+    slot_iter = iter(slots)
+    for instruction in circuit.data:
+        op = instruction.operation
+        if _templatable(op) and any(_is_angle(v) for v in op.params):
+            op = op.copy()
+            op.params = [next(slot_iter) if _is_angle(v) else v for v in op.params]
+        template.append(op, instruction.qubits, instruction.clbits)
+    return template
+
+
+def _bind_parameters(circuit, bindings: Dict[Any, Any], parameter_values: Optional[Dict]):
+    """Copy of circuit with bindings and parameter_values (by Parameter or name) assigned."""
+    bindings = dict(bindings)
+    if parameter_values:
+        by_name = {p.name: p for p in circuit.parameters}
+        for name, value in parameter_values.items():
+            param = by_name.get(getattr(name, "name", name))
+            if param is not None:
+                bindings[param] = value
+    if not bindings:
+        return circuit.copy()
+    return circuit.assign_parameters(bindings, inplace=False)
+
+
+class _Template:
+    """A transpiled circuit with placeholder angles, ready for binding."""
+
+    def __init__(self, circuit, slots, global_phase):
+        self.circuit = circuit
+        self.slots = slots
+        self.global_phase = global_phase
+
+    def bind(self, angles: List[float], global_phase, parameter_values: Optional[Dict]):
+        bound = _bind_parameters(self.circuit, dict(zip(self.slots, angles)), parameter_values)
+        if _is_angle(global_phase) and _is_angle(self.global_phase):
+            bound.global_phase += global_phase - self.global_phase
+        return bound
+
+
+class TranspileCache:
+    """Thread-safe pool of targets and LRU of transpiled circuit templates."""
+
+    def __init__(self, max_templates: int = MAX_TEMPLATES, max_targets: int = MAX_TARGETS):
+        self.max_templates = max_templates
+        self.max_targets = max_targets
+        self._backends: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._pass_managers: Dict[Hashable, Any] = {}
+        self._templates: "OrderedDict[Hashable, _Template]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    # ── Targets ────────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _target_key(num_qubits: Optional[int], basis_gates: Optional[List[str]]) -> Hashable:
+        return num_qubits, tuple(basis_gates) if basis_gates else None
+
+    def backend(self, num_qubits: int, basis_gates: Optional[List[str]] = None):
+        """Pooled GenericBackendV2 for (num_qubits, basis_gates)."""
+        key = self._target_key(num_qubits, basis_gates)
+        with self._lock:
+            backend = self._backends.get(key)
+            if backend is not None:
+                self._backends.move_to_end(key)
+                return backend
+        from qiskit.providers.fake_provider import GenericBackendV2
+        options = {"basis_gates": list(basis_gates)} if basis_gates else {}
+        backend = GenericBackendV2(num_qubits=num_qubits, **options)
+        with self._lock:
+            backend = self._backends.setdefault(key, backend)
+            while len(self._backends) > self.max_targets:
+                evicted, _ = self._backends.popitem(last=False)
+                for pm_key in [k for k in self._pass_managers if k[0] == evicted]:
+                    del self._pass_managers[pm_key]
+        return backend
+
+    def pass_manager(self, num_qubits: Optional[int], basis_gates: Optional[List[str]],
+                     optimization_level: int):
+        """
+        Preset pass manager for the pooled target.
+
+        num_qubits None means no target: optimization only, as
+        transpile(circuit, optimization_level=...) with no backend.
+        """
+        target_key = self._target_key(num_qubits, basis_gates)
+        key = (target_key, optimization_level)
+        with self._lock:
+            pm = self._pass_managers.get(key)
+        if pm is not None:
+            return pm
+        from qiskit.transpiler.preset_passmanagers import generate_preset_pass_manager
+        if num_qubits is None:
+            pm = generate_preset_pass_manager(optimization_level, basis_gates=basis_gates)
+        else:
+            pm = generate_preset_pass_manager(
+                optimization_level, target=self.backend(num_qubits, basis_gates).target,
+            )
+        with self._lock:
+            return self._pass_managers.setdefault(key, pm)
+
+    # ── Transpilation ──────────────────────────────────────────────────────
+
+    def transpile(self, circuit, num_qubits: Optional[int] = None,
+                  basis_gates: Optional[List[str]] = None, optimization_level: int = 1,
+                  parameter_values: Optional[Dict] = None, cache: bool = True):
+        """
+        Transpile a circuit, reusing a cached template when its structure matches.
+
+        Args:
+            circuit:            QuantumCircuit
+            num_qubits:         Backend qubit count; None transpiles without a target
+            basis_gates:        Target basis gate set (default: the backend's)
+            optimization_level: 0 (none) to 3 (heavy)
+            parameter_values:   Values for the circuit's free Parameters, by
+                                Parameter or name, bound into the result
+            cache:              False transpiles this exact circuit, uncached
+
+        Returns:
+            (transpiled circuit, cache hit) - on a miss, the exact
+            transpilation of circuit; on a hit, the bound template
+        """
+        pm = self.pass_manager(num_qubits, basis_gates, optimization_level)
+        if not cache:
+            self.misses += 1
+            return _bind_parameters(pm.run(circuit), {}, parameter_values), False
+
+        shape, angles = structural_key(circuit)
+        key = (shape, self._target_key(num_qubits, basis_gates), optimization_level)
+        with self._lock:
+            template = self._templates.get(key)
+            if template is not None:
+                self._templates.move_to_end(key)
+                self.hits += 1
+            else:
+                self.misses += 1
+        if template is not None:
+            return template.bind(angles, circuit.global_phase, parameter_values), True
+
+        from qiskit.circuit import ParameterVector
+        slots = list(ParameterVector(SLOT_PREFIX, len(angles)))
+        template = _Template(pm.run(_make_template(circuit, slots)), slots, circuit.global_phase)
+        with self._lock:
+            self._templates.setdefault(key, template)
+            while len(self._templates) > self.max_templates:
+                self._templates.popitem(last=False)
+        if not angles:
+            # No numeric angles: the template is this circuit's exact transpilation
+            return template.bind(angles, circuit.global_phase, parameter_values), False
+        # The template serves later calls; this one keeps angle-specific simplifications
+        return _bind_parameters(pm.run(circuit), {}, parameter_values), False
+
+    def clear(self) -> None:
+        with self._lock:
+            self._templates.clear()
+            self._pass_managers.clear()
+            self._backends.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "templates": len(self._templates),
+                "targets": len(self._backends),
+                "pass_managers": len(self._pass_managers),
+                "hits": self.hits,
+                "misses": self.misses,
+            }
@@ -8,6 +8,12 @@ with Sauron-specific event types. All events write to:
   - ~/.frankenstein/logs/security.log      (existing security pipeline)
   - security.monitor (real-time threat tracking, active threats list)
 
+The file write is buffered: records go through AuditSink (audit_sink.py),
+which queues them without I/O on the caller's thread, appends them in
+batches from a background flusher, fsyncs CRITICAL/HIGH events straight
+away, and rotates and gzips the log by size and by day. get_recent() reads
+from the sink's in-memory tail.
+
 Event severity mapping:
   RING1_BLOCK, WEB_BLOCKED, INJECTION_ALERT  → CRITICAL / HIGH
   PERMISSION_DENY                             → MEDIUM
@@ -15,15 +21,14 @@ Event severity mapping:
   QUERY, MEMORY_READ, PERMISSION_GRANT        → INFO
 """
 
-import json
 import logging
-import threading
-import time
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
 from typing import Any, Dict, Optional
 
+from .audit_sink import AuditSink
+
 logger = logging.getLogger(__name__)
 
 LOG_DIR = Path.home() / ".frankenstein" / "logs"
@@ -75,9 +80,7 @@ class SauronAudit:
     """
 
     def __init__(self):
-        self._lock = threading.Lock()
-        self._buffer: list = []
-        self._max_buffer = 200
+        self._sink: Optional[AuditSink] = None
         self._initialized = False
         self._shield = None
         self._monitor = None
@@ -91,6 +94,7 @@ class SauronAudit:
             SAURON_LOG_FILE.touch(exist_ok=True)
         except Exception as e:
             logger.warning("Could not create sauron audit log: %s", e)
+        self._sink = AuditSink(SAURON_LOG_FILE)
 
         # Connect to existing security pipeline (lazy, non-fatal if unavailable)
         try:
@@ -133,14 +137,8 @@ class SauronAudit:
             "details": details or {},
         }
 
-        # Write to file
-        self._write_to_file(record)
-
-        # Keep in-memory buffer
-        with self._lock:
-            self._buffer.append(record)
-            if len(self._buffer) > self._max_buffer:
-                self._buffer.pop(0)
+        # Queue for the file; high-severity events are fsynced with their batch
+        self._write_to_file(record, durable=severity in ("CRITICAL", "HIGH"))
 
         # Forward HIGH/CRITICAL to existing security monitor
         if severity in ("CRITICAL", "HIGH", "MEDIUM"):
@@ -156,12 +154,10 @@ class SauronAudit:
         }.get(severity, logger.debug)
         log_fn("[%s] %s", event.value, message)
 
-    def _write_to_file(self, record: dict) -> None:
-        """Append JSON line to sauron_audit.log."""
+    def _write_to_file(self, record: dict, durable: bool = False) -> None:
+        """Queue a JSON line for sauron_audit.log (written by the sink's flusher)."""
         try:
-            with self._lock:
-                with open(SAURON_LOG_FILE, "a", encoding="utf-8") as f:
-                    f.write(json.dumps(record) + "\n")
+            self._sink.write(record, durable=durable)
         except Exception as e:
             logger.warning("Audit file write failed: %s", e)
 
@@ -237,9 +233,20 @@ class SauronAudit:
         )
 
     def get_recent(self, n: int = 50) -> list:
-        """Return the n most recent audit records from the in-memory buffer."""
-        with self._lock:
-            return list(self._buffer[-n:])
+        """Return the n most recent audit records from the in-memory tail."""
+        return self._sink.recent(n)
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """Block until every record logged so far is on disk."""
+        return self._sink.flush(timeout)
+
+    def close(self) -> None:
+        """Flush and stop the background writer."""
+        self._sink.close()
+
+    def stats(self) -> Dict[str, Any]:
+        """Writer counters: records, batches, fsyncs, rotations, errors."""
+        return self._sink.stats()
 
 
 # ── Singleton ──────────────────────────────────────────────────────────────────
@@ -0,0 +1,334 @@
+"""
+FRANKENSTEIN 1.0 - Eye of Sauron: Audit Sink
+Buffered, rotated JSONL writer behind SauronAudit
+
+SauronAudit used to take a lock, open sauron_audit.log, write one line and
+close it again for every event, on the caller's thread: every tool call,
+permission check and web fetch paid for a file open. The log never rotated.
+
+AuditSink splits that up:
+
+    enqueue    write() serializes the record and puts it on a SimpleQueue
+               and a bounded tail ring; no lock, no I/O
+    flusher    one background thread drains the queue and appends each
+               batch with a single write (group commit), then fsyncs
+               according to the policy:
+                   "always"    every batch
+                   "interval"  at most every FSYNC_INTERVAL seconds, and
+                               always for batches holding a durable record
+                   "never"     leave it to the OS
+    rotation   when the file passes MAX_BYTES or the calendar day changes
+               it is renamed to sauron_audit.YYYYMMDD-HHMMSS.log and
+               gzip-compressed; BACKUP_COUNT archives are kept
+    tail       recent(n) reads the last n records from the in-memory ring
+
+Usage:
+    sink = AuditSink(LOG_DIR / "sauron_audit.log")
+    sink.write(record, durable=severity in ("CRITICAL", "HIGH"))
+    sink.recent(50)
+"""
+
+import atexit
+import gzip
+import itertools
+import json
+import logging
+import os
+import queue
+import shutil
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+from typing import List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+FSYNC_POLICIES = ("always", "interval", "never")
+FSYNC_POLICY = "interval"
+FSYNC_INTERVAL = 1.0            # Seconds between fsyncs under "interval"
+FLUSH_INTERVAL = 0.2            # Max seconds a record waits in the queue
+GROUP_COMMIT_MAX = 512          # Records per batch write
+MAX_BYTES = 5 * 1024 * 1024     # Rotate the live file past this size
+BACKUP_COUNT = 10               # Compressed archives kept
+TAIL_SIZE = 2000                # Records kept in memory for recent()
+TAIL_READ_BLOCK = 64 * 1024     # Block size for reading a file backwards
+
+
+def read_tail_lines(path: Path, n: int) -> List[str]:
+    """
+    Last n lines of a text file, reading backwards in blocks.
+
+    Cost is proportional to the bytes of those n lines, not to the file size.
+    """
+    if n <= 0:
+        return []
+    try:
+        with open(path, "rb") as f:
+            f.seek(0, os.SEEK_END)
+            end = f.tell()
+            data = b""
+            while end > 0 and data.count(b"\n") <= n:
+                start = max(0, end - TAIL_READ_BLOCK)
+                f.seek(start)
+                data = f.read(end - start) + data
+                end = start
+    except OSError:
+        return []
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return lines[-n:]
+
+
+class AuditSink:
+    """
+    Append-only JSONL sink with a background group-commit flusher.
+
+    Thread-safe. write() never blocks on I/O; call flush() to wait until
+    everything written so far is on disk (fsynced).
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        fsync_policy: str = FSYNC_POLICY,
+        max_bytes: int = MAX_BYTES,
+        backup_count: int = BACKUP_COUNT,
+        tail_size: int = TAIL_SIZE,
+        rotate_daily: bool = True,
+    ):
+        """
+        Args:
+            path:         Live log file
+            fsync_policy: "always", "interval" or "never"
+            max_bytes:    Size that triggers rotation (0 disables)
+            backup_count: Compressed archives kept after rotation
+            tail_size:    Records kept in memory for recent()
+            rotate_daily: Also rotate when the calendar day changes
+        """
+        if fsync_policy not in FSYNC_POLICIES:
+            raise ValueError(f"fsync_policy must be one of {FSYNC_POLICIES}, not {fsync_policy!r}")
+        self.path = Path(path)
+        self.fsync_policy = fsync_policy
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.rotate_daily = rotate_daily
+
+        self._queue: "queue.SimpleQueue" = queue.SimpleQueue()
+        self._tail: deque = deque(maxlen=tail_size)
+        self._enqueue_ids = itertools.count(1).__next__     # Atomic under the GIL
+        self._committed = 0
+        self._commit_cond = threading.Condition()
+        self._closed = False
+
+        self._file = None
+        self._size = 0
+        self._period: Optional[str] = None
+        self._last_fsync = 0.0
+        self._synced_records = 0
+        self._stats = {"records": 0, "batches": 0, "fsyncs": 0, "rotations": 0, "errors": 0}
+
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True,
+                                         name="SauronAudit-Flusher")
+        self._flusher.start()
+        atexit.register(self.close)
+
+    # ── Producer side ──────────────────────────────────────────────────────────
+
+    def write(self, record: dict, durable: bool = False) -> None:
+        """
+        Queue one record.
+
+        Args:
+            record:  JSON-serializable dict
+            durable: fsync the batch holding this record regardless of policy
+        """
+        line = json.dumps(record, default=str) + "\n"
+        # SimpleQueue.put and deque.append are atomic: no lock on this path
+        seq = self._enqueue_ids()
+        self._tail.append(record)
+        self._queue.put((seq, line, durable))
+
+    def recent(self, n: int = 50) -> List[dict]:
+        """The n most recent records, oldest first. O(n)."""
+        if n <= 0:
+            return []
+        for _ in range(5):
+            try:
+                newest = list(itertools.islice(reversed(self._tail), n))
+                break
+            except RuntimeError:
+                continue    # Ring appended to mid-copy; retry
+        else:
+            newest = list(self._tail)[-n:][::-1]
+        newest.reverse()
+        return newest
+
+    def flush(self, timeout: Optional[float] = 5.0) -> bool:
+        """
+        Wait until every record queued before this call is committed.
+
+        Returns:
+            True if committed within the timeout
+        """
+        if self._closed:
+            return True                         # close() already committed everything
+        # The marker takes the next id itself: once the flusher commits it,
+        # every record queued before it is on disk. Forces an fsync.
+        target = self._enqueue_ids()
+        self._queue.put((target, None, True))
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._commit_cond:
+            while self._committed < target:
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._commit_cond.wait(remaining)
+        return True
+
+    def close(self) -> None:
+        """Flush and stop the flusher."""
+        if self._closed:
+            return
+        self.flush()
+        self._closed = True
+        self._queue.put((None, None, False))
+        self._flusher.join(timeout=5.0)
+
+    def stats(self) -> dict:
+        stats = dict(self._stats)
+        stats["fsync_policy"] = self.fsync_policy
+        stats["file_bytes"] = self._size
+        return stats
+
+    # ── Flusher ────────────────────────────────────────────────────────────────
+
+    def _flush_loop(self) -> None:
+        while True:
+            try:
+                first = self._queue.get(timeout=FLUSH_INTERVAL)
+            except queue.Empty:
+                self._maybe_fsync(False)
+                continue
+            batch = [first]
+            while len(batch) < GROUP_COMMIT_MAX:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._commit(batch)
+            except Exception as e:
+                self._stats["errors"] += 1
+                logger.warning("Audit file write failed: %s", e)
+            finally:
+                last = max((seq for seq, _, _ in batch if seq is not None), default=0)
+                with self._commit_cond:
+                    self._committed = max(self._committed, last)
+                    self._commit_cond.notify_all()
+            if self._closed and self._queue.empty():
+                self._close_file()
+                return
+
+    def _commit(self, batch: list) -> None:
+        lines = [line for _, line, _ in batch if line is not None]
+        durable = any(flag for _, _, flag in batch)
+        if lines:
+            self._ensure_open()
+            data = "".join(lines).encode("utf-8")
+            self._file.write(data)
+            self._file.flush()
+            self._size += len(data)
+            self._stats["records"] += len(lines)
+            self._stats["batches"] += 1
+        self._maybe_fsync(durable)
+        if lines and self.max_bytes and self._size >= self.max_bytes:
+            self._rotate()
+
+    def _maybe_fsync(self, durable: bool) -> None:
+        if self._file is None or self._stats["records"] == self._synced_records:
+            return
+        now = time.monotonic()
+        if self.fsync_policy == "never" and not durable:
+            return
+        if (self.fsync_policy == "interval" and not durable
+                and now - self._last_fsync < FSYNC_INTERVAL):
+            return
+        os.fsync(self._file.fileno())
+        self._last_fsync = now
+        self._synced_records = self._stats["records"]
+        self._stats["fsyncs"] += 1
+
+    # ── File handling ──────────────────────────────────────────────────────────
+
+    @staticmethod
+    def _day(timestamp: float) -> str:
+        return datetime.fromtimestamp(timestamp).strftime("%Y%m%d")
+
+    def _ensure_open(self) -> None:
+        today = self._day(time.time())
+        if self._file is not None:
+            if self.rotate_daily and self._period != today:
+                self._rotate()
+            else:
+                return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            st = self.path.stat()
+            existing_day = self._day(st.st_mtime) if st.st_size else today
+        except OSError:
+            existing_day = today
+        if self.rotate_daily and existing_day != today:
+            # Leftover from a previous day: archive before appending
+            self._archive(self.path)
+        self._file = open(self.path, "ab")
+        self._size = self._file.tell()
+        self._period = today
+
+    def _close_file(self) -> None:
+        if self._file is None:
+            return
+        try:
+            self._file.flush()
+            if self.fsync_policy != "never":
+                os.fsync(self._file.fileno())
+        finally:
+            self._file.close()
+            self._file = None
+
+    def _rotate(self) -> None:
+        self._close_file()
+        self._archive(self.path)
+        self._stats["rotations"] += 1
+        self._ensure_open()
+
+    def _archive(self, live: Path) -> None:
+        """Rename the live file with a timestamp, gzip it, prune old archives."""
+        if not live.exists() or live.stat().st_size == 0:
+            return
+        stamp = datetime.fromtimestamp(live.stat().st_mtime).strftime("%Y%m%d-%H%M%S")
+        rotated = live.with_name(f"{live.stem}.{stamp}{live.suffix}")
+        n = 1
+        while rotated.exists() or rotated.with_name(rotated.name + ".gz").exists():
+            rotated = live.with_name(f"{live.stem}.{stamp}-{n}{live.suffix}")
+            n += 1
+        os.replace(live, rotated)
+        try:
+            with open(rotated, "rb") as src, gzip.open(f"{rotated}.gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            rotated.unlink()
+        except OSError as e:
+            logger.warning("Audit log compression failed (kept %s): %s", rotated.name, e)
+        self._prune(live)
+
+    def _prune(self, live: Path) -> None:
+        archives = sorted(live.parent.glob(f"{live.stem}.*{live.suffix}.gz"),
+                          key=lambda p: p.stat().st_mtime_ns)
+        for old in archives[:max(0, len(archives) - self.backup_count)]:
+            try:
+                old.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,362 @@
+"""
+FRANKENSTEIN 1.0 - Eye of Sauron: Context Snapshot
+Incrementally maintained system context for the chat preamble
+
+The preamble injected into every chat turn used to be rebuilt from scratch:
+globbing and stat-ing every saved state and circuit, walking the memory
+store for its size and building the full probability dict of the live
+statevector just to show three states. With a large register loaded that
+work sat directly in time-to-first-token.
+
+ContextSnapshot keeps each section pre-rendered and refreshes it only when
+it changes:
+
+    quantum   engine.state_version (bumped on every gate / state change)
+    states    QUANTUM_ARTIFACT_SAVED / _DELETED events, directory mtime
+    circuits  same events (CircuitLibrary saves and deletes)
+    storage   age only
+
+Every section has a staleness bound. A stale or invalidated section is
+served as-is while a single background thread refreshes it, so render()
+only reads cached strings and a few counters.
+
+Usage:
+    snapshot = get_context_snapshot()
+    preamble = snapshot.render()
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+SYNTHESIS_DATA_DIR = Path.home() / ".frankenstein" / "synthesis_data"
+
+# Maximum age (seconds) before a section is re-checked even without a change
+# notification. States/circuits re-check is a single directory stat.
+SECTION_MAX_AGE = {
+    "quantum": 5.0,
+    "states": 60.0,
+    "circuits": 60.0,
+    "storage": 300.0,
+}
+
+TOP_STATES = 3                  # Basis states listed for the live register
+ARTIFACTS_LISTED = 5            # Most recent saved states / circuits shown
+RESOURCE_WARNING_PERCENT = 65
+
+
+# ── Section Builders ───────────────────────────────────────────────────────────
+
+def _loaded_engine():
+    """The SynthesisEngine singleton if it is already loaded (never force-load)."""
+    module = sys.modules.get("synthesis.engine")
+    return getattr(module, "_engine", None) if module is not None else None
+
+
+def top_basis_states(statevector: np.ndarray, n_qubits: int, k: int = TOP_STATES) -> List[Tuple[str, float]]:
+    """
+    The k most probable basis states without building the full probability dict.
+
+    Uses argpartition over |amplitude|², so only k labels are formatted.
+    """
+    probs = np.abs(statevector) ** 2
+    k = min(k, probs.size)
+    if k == 0:
+        return []
+    idx = np.argpartition(probs, -k)[-k:]
+    idx = idx[np.argsort(-probs[idx], kind="stable")]
+    return [(format(int(i), f"0{n_qubits}b"), float(probs[i])) for i in idx if probs[i] > 1e-10]
+
+
+def _artifact_line(label: str, directory: Path, pattern: str) -> str:
+    if not directory.exists():
+        return ""
+    files = sorted(directory.glob(pattern), key=lambda f: f.stat().st_mtime, reverse=True)
+    if not files:
+        return ""
+    names = [f.stem for f in files[:ARTIFACTS_LISTED]]
+    extra = f" (+{len(files) - ARTIFACTS_LISTED} more)" if len(files) > ARTIFACTS_LISTED else ""
+    return f"{label}: {', '.join(names)}{extra}"
+
+
+def _dir_mtime(directory: Path) -> float:
+    try:
+        return directory.stat().st_mtime
+    except OSError:
+        return 0.0
+
+
+# ── Snapshot ───────────────────────────────────────────────────────────────────
+
+class ContextSnapshot:
+    """
+    Pre-rendered context sections kept current from change notifications.
+
+    Thread-safe. render() never touches the filesystem or the statevector;
+    refresh work runs on a single-flight background thread.
+    """
+
+    def __init__(self, data_dir: Optional[Path] = None, subscribe: bool = True):
+        """
+        Args:
+            data_dir:  synthesis_data directory holding states/ and circuits/
+            subscribe: Listen for artifact events on the global EventBus
+        """
+        data_dir = data_dir or SYNTHESIS_DATA_DIR
+        self.states_dir = data_dir / "states"
+        self.circuits_dir = data_dir / "circuits"
+
+        self._lock = threading.Lock()
+        self._lines: Dict[str, str] = {name: "" for name in SECTION_MAX_AGE}
+        self._refreshed: Dict[str, float] = {name: 0.0 for name in SECTION_MAX_AGE}
+        self._dirty = set(SECTION_MAX_AGE)
+        self._dir_mtimes: Dict[str, float] = {}
+        self._top_states: List[Tuple[str, float]] = []
+        self._top_states_key: Optional[Tuple[int, int]] = None
+        self._refresh_thread: Optional[threading.Thread] = None
+
+        if subscribe:
+            self._subscribe()
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def render(self) -> str:
+        """
+        Assemble the preamble from cached sections.
+
+        Stale or invalidated sections are refreshed in the background; the
+        last rendered value is used until the refresh lands.
+        """
+        self._check_engine()
+
+        lines = ["## CURRENT SYSTEM CONTEXT", f"Working directory: {os.getcwd()}"]
+
+        session = self._session_line()
+        if session:
+            lines.append(session)
+
+        quantum = self._quantum_lines()
+        lines.extend(quantum)
+
+        now = time.monotonic()
+        stale = False
+        with self._lock:
+            for name in ("states", "circuits", "storage"):
+                if self._lines[name]:
+                    lines.append(self._lines[name])
+            for name, max_age in SECTION_MAX_AGE.items():
+                if name in self._dirty or now - self._refreshed[name] > max_age:
+                    stale = True
+
+        lines.extend(self._resource_lines())
+
+        if stale:
+            self._schedule_refresh()
+        return "\n".join(lines) + "\n"
+
+    def invalidate(self, section: Optional[str] = None) -> None:
+        """Mark one section (or all) for refresh on the next render."""
+        with self._lock:
+            if section is None:
+                self._dirty.update(SECTION_MAX_AGE)
+            elif section in SECTION_MAX_AGE:
+                self._dirty.add(section)
+
+    def refresh(self) -> None:
+        """Synchronously refresh every dirty or stale section."""
+        now = time.monotonic()
+        with self._lock:
+            due = [(name, name in self._dirty) for name, max_age in SECTION_MAX_AGE.items()
+                   if name in self._dirty or now - self._refreshed[name] > max_age]
+            self._dirty.difference_update(name for name, _ in due)
+
+        for name, forced in due:
+            try:
+                getattr(self, f"_refresh_{name}")(forced)
+            except Exception as e:
+                logger.debug("Context section %s refresh failed: %s", name, e)
+            with self._lock:
+                self._refreshed[name] = time.monotonic()
+
+    def prime(self) -> None:
+        """Start a background refresh so the first render has full context."""
+        self._schedule_refresh()
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an in-flight background refresh to finish.
+
+        Returns:
+            True if no refresh is running when this returns
+        """
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    # ── Cheap inline sections ──────────────────────────────────────────────────
+
+    @staticmethod
+    def _session_line() -> str:
+        try:
+            from core.memory import get_memory
+            stats = get_memory().get_session_stats()
+            return (
+                f"Session: {stats.get('uptime_human', '?')} uptime, "
+                f"{stats.get('task_count', 0)} tasks "
+                f"({stats.get('successful_tasks', 0)} ok, "
+                f"{stats.get('failed_tasks', 0)} failed)"
+            )
+        except Exception:
+            return ""
+
+    def _quantum_lines(self) -> List[str]:
+        engine = _loaded_engine()
+        if engine is None:
+            return []
+        try:
+            n = engine.get_num_qubits()
+        except Exception:
+            return []
+        if n <= 0:
+            return []
+
+        gates = getattr(engine, "gate_count", len(getattr(engine, "_gate_log", [])))
+        lines = [f"Quantum engine: {n} qubits active, {gates} gates applied"]
+        with self._lock:
+            top = list(self._top_states)
+            current = self._top_states_key == self._engine_key(engine)
+        if top:
+            suffix = "" if current else " (updating)"
+            lines.append("  Top states: " + ", ".join(f"|{s}⟩={p:.3f}" for s, p in top) + suffix)
+        return lines
+
+    @staticmethod
+    def _resource_lines() -> List[str]:
+        try:
+            import psutil
+            cpu = psutil.cpu_percent(interval=None)
+            ram = psutil.virtual_memory().percent
+        except Exception:
+            return []
+        lines = [f"Resources: CPU {cpu:.0f}%, RAM {ram:.0f}%"]
+        if cpu > RESOURCE_WARNING_PERCENT or ram > RESOURCE_WARNING_PERCENT:
+            lines.append("WARNING: Resources elevated — keep responses short")
+        return lines
+
+    # ── Change detection ───────────────────────────────────────────────────────
+
+    @staticmethod
+    def _engine_key(engine) -> Tuple[int, int]:
+        return id(engine), getattr(engine, "state_version", len(getattr(engine, "_gate_log", [])))
+
+    def _check_engine(self) -> None:
+        """O(1): compare the engine's state version with the cached top states."""
+        engine = _loaded_engine()
+        if engine is None:
+            return
+        key = self._engine_key(engine)
+        with self._lock:
+            if key != self._top_states_key:
+                self._dirty.add("quantum")
+
+    def _subscribe(self) -> None:
+        try:
+            from data.events import EventBus, EventType
+            bus = EventBus()
+            bus.subscribe(EventType.QUANTUM_ARTIFACT_SAVED, self._on_artifact_event)
+            bus.subscribe(EventType.QUANTUM_ARTIFACT_DELETED, self._on_artifact_event)
+            bus.start()
+        except Exception as e:
+            logger.debug("Context snapshot running without EventBus: %s", e)
+
+    def _on_artifact_event(self, event) -> None:
+        kind = event.data.get("kind")
+        if kind == "state":
+            self.invalidate("states")
+        elif kind == "circuit":
+            self.invalidate("circuits")
+        else:
+            self.invalidate("states")
+            self.invalidate("circuits")
+
+    # ── Background refresh ─────────────────────────────────────────────────────
+
+    def _schedule_refresh(self) -> None:
+        """Start a single-flight background refresh."""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self.refresh,
+                daemon=True,
+                name="SauronContext-Refresh",
+            )
+            self._refresh_thread.start()
+
+    def _refresh_quantum(self, forced: bool) -> None:
+        engine = _loaded_engine()
+        if engine is None or getattr(engine, "_statevector", None) is None:
+            with self._lock:
+                self._top_states, self._top_states_key = [], None
+            return
+
+        key = self._engine_key(engine)
+        top = top_basis_states(engine._statevector, engine.get_num_qubits())
+        with self._lock:
+            self._top_states = top
+            self._top_states_key = key
+        if self._engine_key(engine) != key:
+            # Gates landed while we were reading; pick them up next render
+            self.invalidate("quantum")
+
+    def _refresh_artifacts(self, name: str, forced: bool, directory: Path,
+                           label: str, pattern: str) -> None:
+        # Without a change event, an unchanged directory mtime means no
+        # file was added or removed: skip the glob and per-file stats
+        mtime = _dir_mtime(directory)
+        with self._lock:
+            if not forced and self._dir_mtimes.get(name) == mtime:
+                return
+        line = _artifact_line(label, directory, pattern)
+        with self._lock:
+            self._lines[name] = line
+            self._dir_mtimes[name] = mtime
+
+    def _refresh_states(self, forced: bool) -> None:
+        self._refresh_artifacts("states", forced, self.states_dir, "Saved states", "*.npz")
+
+    def _refresh_circuits(self, forced: bool) -> None:
+        self._refresh_artifacts("circuits", forced, self.circuits_dir, "Saved circuits", "*.json")
+
+    def _refresh_storage(self, forced: bool) -> None:
+        from core.memory import get_memory
+        usage = get_memory().get_storage_usage()
+        line = f"Storage: {usage.get('total_mb', 0):.1f} MB used of 10 GB budget"
+        with self._lock:
+            self._lines["storage"] = line
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_snapshot_instance: Optional[ContextSnapshot] = None
+
+
+def get_context_snapshot() -> ContextSnapshot:
+    """Get or create the global ContextSnapshot singleton."""
+    global _snapshot_instance
+    if _snapshot_instance is None:
+        _snapshot_instance = ContextSnapshot()
+    return _snapshot_instance
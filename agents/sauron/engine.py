@@ -16,6 +16,8 @@ from typing import Iterator, Optional
 import ollama
 
 from core.safety import SAFETY
+from agents.sauron.prompt import PromptAssembler, estimate_message_tokens, get_prompt_metrics
+from agents.sauron.context import get_context_snapshot
 
 logger = logging.getLogger(__name__)
 
@@ -86,7 +88,9 @@ class EyeOfSauron:
 
     Wraps Ollama inference for Llama 3.2 3B Instruct (Q4_K_M).
     Provides single-turn queries, streaming, and multi-turn chat.
-    Memory is bounded to MAX_CONVERSATION_TURNS to prevent RAM growth.
+    History is bounded by the num_ctx token budget (and MAX_CONVERSATION_TURNS)
+    to prevent RAM growth, and prompts keep a byte-stable prefix so Ollama
+    can reuse its KV cache between turns.
     Supports two inference profiles: normal (Profile B) and quantum-active (Profile A).
     """
 
@@ -100,6 +104,8 @@ class EyeOfSauron:
         self._loaded = False
         self._quantum_active = False       # Tracks if quantum engine is running
         self._system_prompt = _load_prompt("system.txt") or self._default_system_prompt()
+        self._prompt = PromptAssembler(self._system_prompt)
+        get_context_snapshot().prime()
         self._verify_model()
         logger.info("Eye of Sauron initialized (model: %s).", MODEL_NAME)
 
@@ -145,143 +151,66 @@ class EyeOfSauron:
             logger.error("Model verification failed: %s", e)
             raise
 
-    def _trim_conversation(self) -> None:
+    def _trim_conversation(self, reserved_tokens: int = 0) -> None:
         """
-        Keep conversation within MAX_CONVERSATION_TURNS to bound RAM usage.
-        When approaching the limit (75% full), summarize the oldest half of turns
-        into a compact context message rather than discarding them silently.
+        Keep conversation within the token budget left by num_ctx.
+
+        The budget is num_ctx minus the output cap, the static system prompt
+        and reserved_tokens (the volatile context tail). Once exceeded, the
+        oldest turns are dropped to a low-water mark and folded into a
+        compact summary message rather than discarded silently. Trimming
+        well below the limit keeps the prompt prefix stable for the next
+        several turns.
         """
-        max_messages = self.MAX_CONVERSATION_TURNS * 2  # user + assistant per turn
-        threshold = int(max_messages * 0.75)
-
-        if threshold < len(self._conversation) <= max_messages:
-            # Approaching limit — summarize oldest half into a compact summary message
-            half = len(self._conversation) // 2
-            old_turns = self._conversation[:half]
-            summary_parts = []
-            for msg in old_turns:
-                role = msg["role"]
-                content = msg["content"][:80]
-                if role == "user":
-                    summary_parts.append(f"User asked about: {content}")
-                elif role == "assistant":
-                    summary_parts.append(f"Frank responded about: {content}")
-            summary = "CONVERSATION SUMMARY (older turns):\n" + "\n".join(summary_parts[-6:])
-            self._conversation = (
-                [{"role": "system", "content": summary}]
-                + self._conversation[half:]
-            )
-            logger.debug("Conversation summarized: %d old messages → 1 summary.", half)
+        budget = self._prompt.history_budget(self._get_options(), reserved_tokens)
+        kept, dropped = self._prompt.fit_history(
+            self._conversation, budget, max_messages=self.MAX_CONVERSATION_TURNS * 2
+        )
+        if not dropped:
+            return
+
+        summary_parts = []
+        for msg in dropped:
+            role = msg["role"]
+            content = (msg.get("content") or "")[:80]
+            if role == "user":
+                summary_parts.append(f"User asked about: {content}")
+            elif role == "assistant":
+                summary_parts.append(f"Frank responded about: {content}")
+            elif content.startswith("CONVERSATION SUMMARY"):
+                summary_parts.extend(content.splitlines()[1:])
+        summary = "CONVERSATION SUMMARY (older turns):\n" + "\n".join(summary_parts[-6:])
+        self._conversation = [{"role": "system", "content": summary}] + kept
+        logger.debug("Conversation summarized: %d old messages → 1 summary.", len(dropped))
+
+    def _prepare_messages(self, user_message: str) -> list:
+        """
+        Append the user turn, trim history and assemble the request.
 
-        elif len(self._conversation) > max_messages:
-            # Hard trim — past absolute limit
-            self._conversation = self._conversation[-max_messages:]
-            logger.debug("Conversation hard-trimmed to %d messages.", max_messages)
+        The static system prompt leads, history follows unchanged, and the
+        live context preamble sits just ahead of the new user message so
+        only the tail of the prompt differs from the previous request.
+        """
+        self._conversation.append({"role": "user", "content": user_message})
+        context = self._build_context_preamble()
+        self._trim_conversation(estimate_message_tokens({"content": context}))
+        return self._prompt.assemble(self._conversation, context=context,
+                                     options=self._get_options())
 
     def _build_context_preamble(self) -> str:
         """
-        Build a compact system-context summary injected into every chat() turn.
-        Lazy-loads all sources — never crashes if a module is unavailable.
-        Covers: working dir, session stats, quantum engine state, saved artifacts,
-        storage usage, and current CPU/RAM.
-        """
-        lines = ["## CURRENT SYSTEM CONTEXT"]
-
-        # Working directory
-        import os
-        lines.append(f"Working directory: {os.getcwd()}")
+        Compact system-context summary injected into every chat() turn.
 
-        # Session stats
-        try:
-            from core.memory import get_memory
-            stats = get_memory().get_session_stats()
-            lines.append(
-                f"Session: {stats.get('uptime_human', '?')} uptime, "
-                f"{stats.get('task_count', 0)} tasks "
-                f"({stats.get('successful_tasks', 0)} ok, "
-                f"{stats.get('failed_tasks', 0)} failed)"
-            )
-        except Exception:
-            pass
-
-        # Active quantum engine state — only if already loaded (never force-load here)
-        try:
-            import sys as _sys
-            _se_mod = _sys.modules.get('synthesis.engine')
-            if _se_mod is not None:
-                engine = getattr(_se_mod, '_engine', None)
-                if engine is not None:
-                    n = engine.get_num_qubits()
-                    if n > 0:
-                        gate_log = getattr(engine, "_gate_log", [])
-                        lines.append(
-                            f"Quantum engine: {n} qubits active, {len(gate_log)} gates applied"
-                        )
-                        try:
-                            probs = engine.get_probabilities()
-                            top = sorted(probs.items(), key=lambda kv: -kv[1])[:3]
-                            lines.append(
-                                "  Top states: " + ", ".join(f"|{s}⟩={p:.3f}" for s, p in top)
-                            )
-                        except Exception:
-                            pass
-        except Exception:
-            pass
-
-        # Saved quantum states
-        try:
-            from pathlib import Path
-            states_dir = Path.home() / ".frankenstein" / "synthesis_data" / "states"
-            if states_dir.exists():
-                state_files = sorted(
-                    states_dir.glob("*.npz"),
-                    key=lambda f: f.stat().st_mtime,
-                    reverse=True,
-                )
-                if state_files:
-                    names = [f.stem for f in state_files[:5]]
-                    extra = f" (+{len(state_files) - 5} more)" if len(state_files) > 5 else ""
-                    lines.append(f"Saved states: {', '.join(names)}{extra}")
-        except Exception:
-            pass
-
-        # Saved circuits
-        try:
-            from pathlib import Path
-            circuits_dir = Path.home() / ".frankenstein" / "synthesis_data" / "circuits"
-            if circuits_dir.exists():
-                circuit_files = sorted(
-                    circuits_dir.glob("*.json"),
-                    key=lambda f: f.stat().st_mtime,
-                    reverse=True,
-                )
-                if circuit_files:
-                    names = [f.stem for f in circuit_files[:5]]
-                    extra = f" (+{len(circuit_files) - 5} more)" if len(circuit_files) > 5 else ""
-                    lines.append(f"Saved circuits: {', '.join(names)}{extra}")
-        except Exception:
-            pass
-
-        # Storage usage
-        try:
-            from core.memory import get_memory
-            usage = get_memory().get_storage_usage()
-            lines.append(f"Storage: {usage.get('total_mb', 0):.1f} MB used of 10 GB budget")
-        except Exception:
-            pass
-
-        # CPU / RAM
+        Served from the incrementally maintained ContextSnapshot: working
+        dir, session stats, quantum engine state, saved artifacts, storage
+        usage and current CPU/RAM. No filesystem scans or statevector work
+        happen on this path. Never crashes if a source is unavailable.
+        """
         try:
-            import psutil
-            cpu = psutil.cpu_percent(interval=None)
-            ram = psutil.virtual_memory().percent
-            lines.append(f"Resources: CPU {cpu:.0f}%, RAM {ram:.0f}%")
-            if cpu > 65 or ram > 65:
-                lines.append("WARNING: Resources elevated — keep responses short")
-        except Exception:
-            pass
-
-        return "\n".join(lines) + "\n"
+            return get_context_snapshot().render()
+        except Exception as e:
+            logger.debug("Context snapshot unavailable: %s", e)
+            return "## CURRENT SYSTEM CONTEXT\n"
 
     # ── Public API ─────────────────────────────────────────────────────────────
 
@@ -324,23 +253,18 @@ class EyeOfSauron:
     def chat(self, user_message: str) -> str:
         """
         Multi-turn chat with context awareness.
-        Injects execution reminder and live system context into every turn.
-        History is automatically trimmed/summarized at MAX_CONVERSATION_TURNS.
+        Live system context goes at the tail of the prompt, after the stable
+        system prompt and history. History is trimmed/summarized to the
+        token budget.
         """
-        self._conversation.append({"role": "user", "content": user_message})
-        self._trim_conversation()
-
-        # Build context-enriched system prompt
-        context = self._build_context_preamble()
-        full_system = self._system_prompt + "\n\n" + context
-
-        messages = [{"role": "system", "content": full_system}] + self._conversation
+        messages = self._prepare_messages(user_message)
 
         response = ollama.chat(
             model=MODEL_NAME,
             messages=messages,
             options=self._get_options(),
         )
+        get_prompt_metrics().record("chat", response, messages)
         reply = response.message.content
 
         self._conversation.append({"role": "assistant", "content": reply})
@@ -350,19 +274,12 @@ class EyeOfSauron:
         """
         Multi-turn streaming chat with context awareness.
         Yields tokens; saves full reply to history.
-        Injects execution reminder and live system context into every turn.
+        Live system context goes at the tail of the prompt, as in chat().
 
         History cleanup runs in a finally block so it executes even when
         the consumer breaks early (e.g. user typed 'stop').
         """
-        self._conversation.append({"role": "user", "content": user_message})
-        self._trim_conversation()
-
-        # Build context-enriched system prompt
-        context = self._build_context_preamble()
-        full_system = self._system_prompt + "\n\n" + context
-
-        messages = [{"role": "system", "content": full_system}] + self._conversation
+        messages = self._prepare_messages(user_message)
 
         full_reply = []
         try:
@@ -376,6 +293,8 @@ class EyeOfSauron:
                 if token:
                     full_reply.append(token)
                     yield token
+                if chunk.done:
+                    get_prompt_metrics().record("chat", chunk, messages)
         finally:
             # Always append assistant reply, even if consumer stopped iteration early.
             self._conversation.append({"role": "assistant", "content": "".join(full_reply)})
@@ -397,6 +316,7 @@ class EyeOfSauron:
                 "quantum_active": self._quantum_active,
                 "conversation_turns": len(self._conversation) // 2,
                 "max_turns": self.MAX_CONVERSATION_TURNS,
+                "prompt_eval": get_prompt_metrics().summary(),
                 "inference_threads": INFERENCE_THREADS,
                 "safety_cpu_limit": SAFETY.MAX_CPU_PERCENT,
                 "safety_ram_limit": SAFETY.MAX_MEMORY_PERCENT,
@@ -27,11 +27,23 @@ Two synthesis engines, two dispatch targets
                                load_state, delete_state, initialize, measure,
                                state_info, bell_state, ghz_state, schrodinger
 
-Thread safety
-─────────────
-All dispatches honour SAFETY.MAX_WORKER_THREADS (3).  The ThreadPoolExecutor
-uses min(requested, MAX_WORKER_THREADS) workers so concurrent multi-dispatch
-never exceeds the hard cap.
+Dispatch runtime
+────────────────
+One long-lived ThreadPoolExecutor serves every multi-dispatch, sized to
+SAFETY.MAX_WORKER_THREADS.  Admission control (a semaphore of the same size)
+caps in-flight fan-out work across concurrent callers: a submission waits
+for a free slot and fails after ADMISSION_TIMEOUT_SEC rather than queueing
+without bound.
+
+Agents mark actions as pure (result depends only on kwargs) or CPU-bound
+via BaseAgent.pure_actions / cpu_bound_actions.  Pure actions are memoized
+in an LRU keyed by (agent, action, canonical kwargs), and identical pure
+calls in one fan-out run once.  With process_pool=True, pure CPU-bound
+actions run in a ProcessPoolExecutor so they do not serialize behind the
+GIL.  Synthesis actions always run in-process: both engines hold the live
+quantum state.
+
+Engine singletons and registry agents are resolved once and cached.
 
 Lazy loading
 ────────────
@@ -41,17 +53,35 @@ Importing this file has zero startup cost.
 
 from __future__ import annotations
 
+import copy
+import hashlib
 import logging
+import pickle
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Hashable, List, Optional, Tuple
 
 from core.safety import SAFETY
 
 logger = logging.getLogger(__name__)
 
 
+# ── Runtime tuning ─────────────────────────────────────────────────────────────
+
+ADMISSION_TIMEOUT_SEC = 30.0    # Max wait for a worker slot before a call fails
+MEMO_MAX_ENTRIES = 128          # Memoized pure-action results (LRU)
+
+# Synthesis actions whose result never depends on engine state
+PURE_SYNTHESIS_ACTIONS = frozenset({
+    ("synthesis", "schrodinger"),
+    ("true_synthesis", "schrodinger"),
+})
+
+
 # ── Data classes ───────────────────────────────────────────────────────────────
 
 @dataclass
@@ -72,6 +102,7 @@ class DispatchResult:
     data: Any = None
     error: Optional[str] = None
     execution_time: float = 0.0
+    cached: bool = False
 
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -81,6 +112,7 @@ class DispatchResult:
             "data": self.data,
             "error": self.error,
             "execution_time_ms": round(self.execution_time * 1000, 1),
+            "cached": self.cached,
         }
 
 
@@ -109,6 +141,82 @@ class MultiDispatchResult:
         }
 
 
+# ── Memoization ────────────────────────────────────────────────────────────────
+
+def _canonical(value: Any) -> Hashable:
+    """
+    Hashable, order-independent form of a kwargs value.
+
+    Types are part of the key so 1, 1.0 and True stay distinct.  Raises
+    TypeError for values that cannot be keyed (the call is then not memoized).
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return type(value).__name__, value
+    if isinstance(value, dict):
+        return "dict", tuple(sorted((str(k), _canonical(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_canonical(v) for v in value)
+    if hasattr(value, "dtype") and hasattr(value, "tobytes"):
+        digest = hashlib.sha1(value.tobytes()).hexdigest()
+        return "ndarray", str(value.dtype), tuple(value.shape), digest
+    raise TypeError(f"cannot memoize argument of type {type(value).__name__}")
+
+
+class _ResultMemo:
+    """Thread-safe LRU of pure-action results."""
+
+    _MISS = object()
+
+    def __init__(self, max_entries: int = MEMO_MAX_ENTRIES):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            if key not in self._entries:
+                self.misses += 1
+                return self._MISS
+            self._entries.move_to_end(key)
+            self.hits += 1
+            data = self._entries[key]
+        return copy.deepcopy(data)
+
+    def put(self, key: Hashable, data: Any) -> None:
+        data = copy.deepcopy(data)
+        with self._lock:
+            self._entries[key] = data
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+def _execute_registry_agent(agent: Any, action: str, kwargs: Dict[str, Any]) -> Any:
+    result = agent.execute(action=action, **kwargs)
+    if not result.success:
+        raise RuntimeError(result.error or "Agent returned failure")
+    return result.data
+
+
+def _run_agent_in_process(agent_name: str, action: str, kwargs: Dict[str, Any]) -> Any:
+    """ProcessPoolExecutor entry point: resolve the agent in the worker process."""
+    from agents.registry import get_registry
+
+    agent = get_registry().get(agent_name)
+    if agent is None:
+        raise ValueError(f"Agent '{agent_name}' not found in registry.")
+    return _execute_registry_agent(agent, action, kwargs)
+
+
 # ── Orchestrator ───────────────────────────────────────────────────────────────
 
 class SauronOrchestrator:
@@ -137,11 +245,26 @@ class SauronOrchestrator:
     SYNTHESIS_AGENT_NAME      = "synthesis"       # synthesis/engine.py  (fast, RAM-only)
     TRUE_SYNTHESIS_AGENT_NAME = "true_synthesis"  # synthesis/core/true_engine.py (20GB disk)
 
-    def __init__(self):
+    def __init__(self, process_pool: bool = False):
+        """
+        Args:
+            process_pool: Run pure CPU-bound agent actions in worker processes
+                          (each worker costs a Python + NumPy start-up)
+        """
         # Max concurrent workers capped at SAFETY hard limit
         self._max_workers: int = min(SAFETY.MAX_WORKER_THREADS, 3)
+        self._slots = threading.BoundedSemaphore(self._max_workers)
+        self._pool_lock = threading.Lock()
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self._use_process_pool = process_pool
+        self._memo = _ResultMemo()
+        self._targets: Dict[str, Any] = {}
+        self._agent_names: Optional[List[str]] = None
+        self._rejected = 0
         logger.debug(
-            "SauronOrchestrator initialised (max_workers=%d)", self._max_workers
+            "SauronOrchestrator initialised (max_workers=%d, process_pool=%s)",
+            self._max_workers, process_pool,
         )
 
     # ── Discovery ──────────────────────────────────────────────────────────────
@@ -211,8 +334,10 @@ class SauronOrchestrator:
         return infos
 
     def agent_names(self) -> List[str]:
-        """Return list of all available agent names."""
-        return [a.name for a in self.discover() if a.available]
+        """Return list of all available agent names (cached after first discovery)."""
+        if self._agent_names is None:
+            self._agent_names = [a.name for a in self.discover() if a.available]
+        return list(self._agent_names)
 
     def has_agent(self, name: str) -> bool:
         """Check whether an agent with this name is available."""
@@ -235,6 +360,18 @@ class SauronOrchestrator:
         Returns a DispatchResult — never raises.
         """
         start = time.time()
+        key = self._memo_key(agent_name, action, kwargs)
+        if key is not None:
+            data = self._memo.get(key)
+            if data is not _ResultMemo._MISS:
+                return DispatchResult(
+                    agent_name=agent_name,
+                    action=action,
+                    success=True,
+                    data=data,
+                    execution_time=time.time() - start,
+                    cached=True,
+                )
 
         try:
             if agent_name == self.SYNTHESIS_AGENT_NAME:
@@ -244,6 +381,9 @@ class SauronOrchestrator:
             else:
                 data = self._dispatch_registry_agent(agent_name, action, **kwargs)
 
+            if key is not None:
+                self._memo.put(key, data)
+
             return DispatchResult(
                 agent_name=agent_name,
                 action=action,
@@ -278,8 +418,10 @@ class SauronOrchestrator:
             action (str, optional) — defaults to "status"
             **kwargs               — forwarded to agent execute()
 
-        Workers are capped at SAFETY.MAX_WORKER_THREADS to protect
-        the i3's 4-core budget.
+        Calls run on the shared worker pool.  At most
+        SAFETY.MAX_WORKER_THREADS calls are in flight across all callers,
+        to protect the i3's 4-core budget; identical pure calls run once.
+        Results are returned in call order.
 
         Returns MultiDispatchResult — never raises.
         """
@@ -287,30 +429,55 @@ class SauronOrchestrator:
             return MultiDispatchResult()
 
         start = time.time()
-        workers = min(len(calls), self._max_workers)
-        results: List[DispatchResult] = []
-
-        with ThreadPoolExecutor(max_workers=workers) as pool:
-            future_map = {}
-            for call in calls:
-                agent_name = call.get("agent", "")
-                action = call.get("action", "status")
-                extra = {k: v for k, v in call.items() if k not in ("agent", "action")}
+        pool = self._get_thread_pool()
+        shared: Dict[Hashable, Future] = {}
+        pending: List[Tuple[str, str, Optional[Future], Optional[str]]] = []
+
+        for call in calls:
+            agent_name = call.get("agent", "")
+            action = call.get("action", "status")
+            extra = {k: v for k, v in call.items() if k not in ("agent", "action")}
+
+            key = self._memo_key(agent_name, action, extra)
+            if key is not None and key in shared:
+                pending.append((agent_name, action, shared[key], None))
+                continue
+
+            if not self._slots.acquire(timeout=ADMISSION_TIMEOUT_SEC):
+                self._rejected += 1
+                pending.append((agent_name, action, None, (
+                    f"Admission timeout: {self._max_workers} dispatches already in "
+                    f"flight for {ADMISSION_TIMEOUT_SEC:.0f}s"
+                )))
+                continue
+
+            try:
                 future = pool.submit(self.dispatch, agent_name, action, **extra)
-                future_map[future] = (agent_name, action)
+            except Exception:
+                self._slots.release()
+                raise
+            future.add_done_callback(lambda _f: self._slots.release())
+            if key is not None:
+                shared[key] = future
+            pending.append((agent_name, action, future, None))
 
-            for future in as_completed(future_map):
-                try:
-                    results.append(future.result())
-                except Exception as exc:
-                    agent_name, action = future_map[future]
-                    results.append(DispatchResult(
-                        agent_name=agent_name,
-                        action=action,
-                        success=False,
-                        error=f"Future raised: {exc}",
-                        execution_time=0.0,
-                    ))
+        results: List[DispatchResult] = []
+        for agent_name, action, future, error in pending:
+            if future is None:
+                results.append(DispatchResult(
+                    agent_name=agent_name, action=action, success=False, error=error,
+                ))
+                continue
+            try:
+                results.append(future.result())
+            except Exception as exc:
+                results.append(DispatchResult(
+                    agent_name=agent_name,
+                    action=action,
+                    success=False,
+                    error=f"Future raised: {exc}",
+                    execution_time=0.0,
+                ))
 
         total = time.time() - start
         all_ok = all(r.success for r in results)
@@ -321,28 +488,145 @@ class SauronOrchestrator:
             all_success=all_ok,
         )
 
-    # ── Internal routing ───────────────────────────────────────────────────────
+    # ── Runtime ────────────────────────────────────────────────────────────────
 
-    def _dispatch_registry_agent(
-        self, agent_name: str, action: str, **kwargs: Any
-    ) -> Any:
-        """Delegate to a BaseAgent via AgentRegistry."""
-        from agents.registry import get_registry
+    def get_stats(self) -> Dict[str, Any]:
+        """Worker pool, admission and memoization counters."""
+        return {
+            "max_workers": self._max_workers,
+            "thread_pool": self._thread_pool is not None,
+            "process_pool": self._process_pool is not None,
+            "admission_rejected": self._rejected,
+            "memo_entries": len(self._memo),
+            "memo_hits": self._memo.hits,
+            "memo_misses": self._memo.misses,
+        }
 
-        registry = get_registry()
-        agent = registry.get(agent_name)
-        if agent is None:
-            raise ValueError(
-                f"Agent '{agent_name}' not found in registry. "
-                f"Available: {[a['name'] for a in registry.list_agents()]}"
-            )
+    def clear_cache(self) -> None:
+        """Drop memoized results and cached agent / engine resolution."""
+        self._memo.clear()
+        self._targets.clear()
+        self._agent_names = None
+
+    def shutdown(self, wait: bool = True) -> None:
+        """Stop the worker pools; they are recreated on next use."""
+        with self._pool_lock:
+            thread_pool, self._thread_pool = self._thread_pool, None
+            process_pool, self._process_pool = self._process_pool, None
+        if thread_pool is not None:
+            thread_pool.shutdown(wait=wait)
+        if process_pool is not None:
+            process_pool.shutdown(wait=wait)
+
+    def _get_thread_pool(self) -> ThreadPoolExecutor:
+        with self._pool_lock:
+            if self._thread_pool is None:
+                self._thread_pool = ThreadPoolExecutor(
+                    max_workers=self._max_workers,
+                    thread_name_prefix="SauronDispatch",
+                )
+            return self._thread_pool
+
+    def _get_process_pool(self) -> Optional[ProcessPoolExecutor]:
+        with self._pool_lock:
+            if self._process_pool is None and self._use_process_pool:
+                self._process_pool = ProcessPoolExecutor(max_workers=self._max_workers)
+            return self._process_pool
+
+    def _discard_process_pool(self, pool: ProcessPoolExecutor) -> None:
+        """Drop a broken process pool; the next call starts a fresh one."""
+        with self._pool_lock:
+            if self._process_pool is pool:
+                self._process_pool = None
+
+    @staticmethod
+    def _declares(actions: Any, action: str) -> bool:
+        return bool(actions) and ("*" in actions or action in actions)
+
+    def _memo_key(self, agent_name: str, action: str,
+                  kwargs: Dict[str, Any]) -> Optional[Hashable]:
+        """(agent, action, canonical kwargs) for a pure action, else None."""
+        if agent_name in (self.SYNTHESIS_AGENT_NAME, self.TRUE_SYNTHESIS_AGENT_NAME):
+            pure = (agent_name, action) in PURE_SYNTHESIS_ACTIONS
+        else:
+            try:
+                agent = self._registry_agent(agent_name)
+            except Exception:
+                return None
+            pure = self._declares(getattr(agent, "pure_actions", None), action)
+        if not pure:
+            return None
+        try:
+            return agent_name, action, _canonical(kwargs)
+        except TypeError:
+            return None
 
-        result = agent.execute(action=action, **kwargs)
+    # ── Internal routing ───────────────────────────────────────────────────────
 
-        if not result.success:
-            raise RuntimeError(result.error or "Agent returned failure")
+    def _registry_agent(self, agent_name: str) -> Any:
+        """Resolve a registry agent once; later lookups hit the cache."""
+        agent = self._targets.get(agent_name)
+        if agent is None:
+            from agents.registry import get_registry
+
+            registry = get_registry()
+            agent = registry.get(agent_name)
+            if agent is None:
+                raise ValueError(
+                    f"Agent '{agent_name}' not found in registry. "
+                    f"Available: {[a['name'] for a in registry.list_agents()]}"
+                )
+            self._targets[agent_name] = agent
+        return agent
 
-        return result.data
+    def _dispatch_registry_agent(
+        self, agent_name: str, action: str, **kwargs: Any
+    ) -> Any:
+        """Delegate to a BaseAgent via AgentRegistry (or a worker process)."""
+        agent = self._registry_agent(agent_name)
+
+        if (self._use_process_pool
+                and self._declares(getattr(agent, "pure_actions", None), action)
+                and self._declares(getattr(agent, "cpu_bound_actions", None), action)):
+            pool = self._get_process_pool()
+            try:
+                # Pickle here so argument errors surface now, not from future.result()
+                pickle.dumps(kwargs)
+                future = pool.submit(_run_agent_in_process, agent_name, action, kwargs)
+            except (BrokenProcessPool, pickle.PicklingError, TypeError, AttributeError) as exc:
+                # Dead pool or unpicklable arguments — run it here instead
+                logger.warning("Process pool unavailable (%s); running %s.%s in-process",
+                               exc, agent_name, action)
+                if isinstance(exc, BrokenProcessPool):
+                    self._discard_process_pool(pool)
+            else:
+                # Anything raised now came from the agent (or a worker that died
+                # running it) and is reported, not retried
+                try:
+                    return future.result()
+                except BrokenProcessPool:
+                    self._discard_process_pool(pool)
+                    raise
+
+        return _execute_registry_agent(agent, action, kwargs)
+
+    def _synthesis_target(self) -> Tuple[Any, Any]:
+        """(SynthesisEngine singleton, ComputeMode), resolved once."""
+        target = self._targets.get(self.SYNTHESIS_AGENT_NAME)
+        if target is None:
+            from synthesis.engine import get_synthesis_engine, ComputeMode
+            target = (get_synthesis_engine(), ComputeMode)
+            self._targets[self.SYNTHESIS_AGENT_NAME] = target
+        return target
+
+    def _true_synthesis_target(self) -> Any:
+        """TrueSynthesisEngine singleton, resolved once."""
+        engine = self._targets.get(self.TRUE_SYNTHESIS_AGENT_NAME)
+        if engine is None:
+            from synthesis.core.true_engine import get_true_engine
+            engine = get_true_engine()
+            self._targets[self.TRUE_SYNTHESIS_AGENT_NAME] = engine
+        return engine
 
     def _dispatch_synthesis(self, action: str, **kwargs: Any) -> Any:
         """
@@ -356,9 +640,7 @@ class SauronOrchestrator:
           schrodinger — evolve_schrodinger stub (returns capability info)
           get_state — get_state() → real/imag arrays
         """
-        from synthesis.engine import get_synthesis_engine, ComputeMode
-
-        engine = get_synthesis_engine()
+        engine, ComputeMode = self._synthesis_target()
 
         if action == "status":
             return {
@@ -445,9 +727,7 @@ class SauronOrchestrator:
                           kwargs: n_qubits (int, default 3)
           schrodinger   — Capability description (full solver available via terminal)
         """
-        from synthesis.core.true_engine import get_true_engine
-
-        engine = get_true_engine()
+        engine = self._true_synthesis_target()
 
         if action == "status":
             return engine.status()
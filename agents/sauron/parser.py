@@ -31,6 +31,7 @@ import ollama
 
 from agents.sauron.engine import MODEL_NAME, INFERENCE_OPTIONS
 from agents.sauron.audit import SauronEvent, get_sauron_audit
+from agents.sauron.prompt import MIN_HISTORY_TURNS, PromptAssembler, get_prompt_metrics
 
 logger = logging.getLogger(__name__)
 
@@ -721,11 +722,16 @@ class ParsedIntent:
 
     If has_tool_call is False, text_response contains the model's final answer
     and the ReAct loop should terminate.
+
+    When the model requests several tools in one reply, tool_calls holds
+    every call in order ({"name", "arguments"} dicts); tool_name and
+    arguments mirror the first one.
     """
     tool_name: Optional[str]        # None → model gave a direct text answer
     arguments: dict                  # Tool arguments from model's function call
     text_response: Optional[str]     # Model's text when no tool call
     raw_tool_call: Optional[dict]    # Raw tool_call dict for debugging
+    tool_calls: list = field(default_factory=list)  # All calls in this reply
 
     @property
     def has_tool_call(self) -> bool:
@@ -736,6 +742,21 @@ class ParsedIntent:
         """Convenience: extract 'action' from arguments."""
         return self.arguments.get("action", "")
 
+    def split(self) -> list:
+        """One single-call ParsedIntent per requested tool call."""
+        if len(self.tool_calls) <= 1:
+            return [self] if self.has_tool_call else []
+        return [
+            ParsedIntent(
+                tool_name=call["name"],
+                arguments=call["arguments"],
+                text_response=None,
+                raw_tool_call=call,
+                tool_calls=[call],
+            )
+            for call in self.tool_calls
+        ]
+
 
 # ── Intent Parser ──────────────────────────────────────────────────────────────
 
@@ -754,9 +775,17 @@ class IntentParser:
     def __init__(self):
         self._tools = TOOL_SCHEMAS
         self._system_messages = self._build_system_messages()
+        self._prompt = PromptAssembler(self._system_messages[0]["content"], tools=self._tools)
         logger.info(
             "IntentParser initialized with %d tool schemas.", len(self._tools)
         )
+        if self._prompt.history_budget(INFERENCE_OPTIONS) == 0:
+            logger.warning(
+                "System prompt and tool schemas (~%d tokens) fill num_ctx=%d; "
+                "only the last %d turns will be sent.",
+                self._prompt.prefix_tokens, INFERENCE_OPTIONS.get("num_ctx", 0),
+                MIN_HISTORY_TURNS,
+            )
 
     def _build_system_messages(self) -> list:
         """
@@ -773,7 +802,9 @@ class IntentParser:
         Run one inference step against the current message list.
 
         The system messages are prepended automatically — do not include them
-        in the `messages` argument.
+        in the `messages` argument. Old turns that do not fit the context
+        budget are left out of the request (never fewer than the last
+        MIN_HISTORY_TURNS); `messages` itself is not modified.
 
         Args:
             messages : Conversation history. The last entry should be the
@@ -782,7 +813,8 @@ class IntentParser:
         Returns:
             ParsedIntent with has_tool_call=True (tool call) or False (text answer).
         """
-        full_messages = self._system_messages + messages
+        full_messages = self._prompt.assemble(messages, options=INFERENCE_OPTIONS,
+                                              min_turns=MIN_HISTORY_TURNS)
 
         get_sauron_audit().log(
             SauronEvent.QUERY,
@@ -796,6 +828,8 @@ class IntentParser:
                 tools=self._tools,
                 options=INFERENCE_OPTIONS,
             )
+            get_prompt_metrics().record("parser", response, full_messages,
+                                        prefix_tokens=self._prompt.tool_tokens)
         except Exception as e:
             logger.error("Ollama inference error: %s", e, exc_info=True)
             return ParsedIntent(
@@ -809,27 +843,31 @@ class IntentParser:
 
         # ── Tool call path ─────────────────────────────────────────────────────
         if msg.tool_calls:
-            call = msg.tool_calls[0]
-            name = call.function.name
-            raw_args = call.function.arguments
-
-            # Ollama may return arguments as a JSON string or already a dict
-            if isinstance(raw_args, str):
-                try:
-                    args = json.loads(raw_args)
-                except json.JSONDecodeError:
-                    logger.warning("Could not parse tool arguments as JSON: %s", raw_args[:200])
-                    args = {}
-            else:
-                args = dict(raw_args) if raw_args else {}
-
-            get_sauron_audit().log_tool_call(name, str(args)[:150])
-
+            calls = []
+            for call in msg.tool_calls:
+                name = call.function.name
+                raw_args = call.function.arguments
+
+                # Ollama may return arguments as a JSON string or already a dict
+                if isinstance(raw_args, str):
+                    try:
+                        args = json.loads(raw_args)
+                    except json.JSONDecodeError:
+                        logger.warning("Could not parse tool arguments as JSON: %s", raw_args[:200])
+                        args = {}
+                else:
+                    args = dict(raw_args) if raw_args else {}
+
+                get_sauron_audit().log_tool_call(name, str(args)[:150])
+                calls.append({"name": name, "arguments": args})
+
+            first = calls[0]
             return ParsedIntent(
-                tool_name=name,
-                arguments=args,
+                tool_name=first["name"],
+                arguments=first["arguments"],
                 text_response=None,
-                raw_tool_call={"name": name, "arguments": args},
+                raw_tool_call=first,
+                tool_calls=calls,
             )
 
         # ── Text-only path ─────────────────────────────────────────────────────
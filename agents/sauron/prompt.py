@@ -0,0 +1,292 @@
+"""
+FRANKENSTEIN 1.0 - Eye of Sauron: Prompt Assembly
+Prefix-stable prompts and token budgeting for Ollama calls
+
+Ollama keeps the KV cache of the previous request and only re-evaluates the
+prompt from the first token that differs. On a CPU-only box prompt eval
+dominates latency, so every request is laid out to share the longest
+possible prefix with the one before it:
+
+    [static system prompt]  byte-identical for the life of the process
+    [history]               append-only between trims
+    [volatile context]      live system snapshot, rebuilt every turn
+    [current turn]          latest user message (+ tool observations)
+
+History is trimmed by estimated token count rather than turn count. A trim
+drops down to a low-water mark, so the prefix then stays stable for several
+turns instead of sliding on every request.
+
+PromptMetrics reads prompt_eval_count / prompt_eval_duration from each
+response to show how much of each prompt Ollama actually re-evaluated.
+
+Usage:
+    assembler = PromptAssembler(system_prompt)
+    messages = assembler.assemble(history, context=preamble, options=options)
+    response = ollama.chat(model=MODEL_NAME, messages=messages, options=options)
+    get_prompt_metrics().record("chat", response, messages)
+"""
+
+import json
+import logging
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+# ── Budget Constants ───────────────────────────────────────────────────────────
+
+CHARS_PER_TOKEN = 4             # Rough estimate for Llama/Qwen BPE on English text
+MESSAGE_OVERHEAD_TOKENS = 4     # Role header and separators per chat message
+DEFAULT_NUM_CTX = 2048
+DEFAULT_NUM_PREDICT = 300
+TRIM_LOW_WATER = 0.6            # After a trim, history fills this share of its budget
+MIN_HISTORY_TURNS = 3           # Latest user turns the tool parser always sends
+METRICS_HISTORY = 200           # Recent calls kept for prompt_eval statistics
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of a string without a tokenizer."""
+    if not text:
+        return 0
+    return len(text) // CHARS_PER_TOKEN + 1
+
+
+def estimate_message_tokens(message: dict) -> int:
+    """Estimate tokens for one chat message, tool calls included."""
+    tokens = MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.get("content") or "")
+    if message.get("tool_calls"):
+        tokens += estimate_tokens(json.dumps(message["tool_calls"], default=str))
+    return tokens
+
+
+# ── Assembler ──────────────────────────────────────────────────────────────────
+
+class PromptAssembler:
+    """
+    Builds Ollama message lists with a byte-stable prefix and a token budget.
+
+    The static prefix (system prompt and, for tool calling, the tool schemas)
+    is fixed at construction. Everything that changes per turn goes after
+    the history.
+    """
+
+    def __init__(self, system_prompt: str, tools: Optional[list] = None):
+        """
+        Args:
+            system_prompt: Static system prompt, never modified afterwards
+            tools:         Tool schemas sent with each request (counted
+                           against the budget; Ollama renders them into
+                           the prompt prefix)
+        """
+        self._prefix: Tuple[dict, ...] = ({"role": "system", "content": system_prompt},)
+        self._tool_tokens = estimate_tokens(json.dumps(tools, sort_keys=True)) if tools else 0
+        self._prefix_tokens = estimate_message_tokens(self._prefix[0]) + self._tool_tokens
+
+    @property
+    def prefix_tokens(self) -> int:
+        """Estimated tokens taken by the static prefix."""
+        return self._prefix_tokens
+
+    @property
+    def tool_tokens(self) -> int:
+        """Estimated tokens of the tool schemas rendered into the prompt."""
+        return self._tool_tokens
+
+    def history_budget(self, options: Optional[dict] = None, reserved: int = 0) -> int:
+        """
+        Tokens left for history once prefix, output and reserved tail are paid.
+
+        Args:
+            options:  Ollama options (num_ctx, num_predict)
+            reserved: Tokens needed by the volatile tail (context, current turn)
+        """
+        options = options or {}
+        num_ctx = options.get("num_ctx", DEFAULT_NUM_CTX)
+        num_predict = options.get("num_predict", DEFAULT_NUM_PREDICT)
+        return max(0, num_ctx - num_predict - self._prefix_tokens - reserved)
+
+    def fit_history(
+        self,
+        history: List[dict],
+        budget: int,
+        max_messages: Optional[int] = None,
+        min_turns: int = 1,
+    ) -> Tuple[List[dict], List[dict]]:
+        """
+        Split history into (kept, dropped) so kept fits the token budget.
+
+        Messages from the last min_turns user turns onwards are always kept,
+        even past the budget. When the budget (or max_messages) is exceeded,
+        the oldest messages are dropped until history sits at TRIM_LOW_WATER
+        of the limit, on a user-turn boundary so the kept history never
+        opens with an orphaned reply. The input list is not modified.
+        """
+        if not history:
+            return [], []
+
+        costs = [estimate_message_tokens(m) for m in history]
+        total = sum(costs)
+        over_count = max_messages is not None and len(history) > max_messages
+        if total <= budget and not over_count:
+            return list(history), []
+
+        pinned = len(history)
+        turns = 0
+        while pinned > 0 and turns < max(1, min_turns):
+            pinned -= 1
+            if history[pinned].get("role") == "user":
+                turns += 1
+
+        target = int(budget * TRIM_LOW_WATER)
+        keep_max = int(max_messages * TRIM_LOW_WATER) if max_messages else len(history)
+        cut = 0
+        while cut < pinned and (total > target or len(history) - cut > keep_max):
+            total -= costs[cut]
+            cut += 1
+        while cut < pinned and history[cut].get("role") != "user":
+            cut += 1
+
+        logger.debug("History trimmed: dropped %d of %d messages (budget %d tokens).",
+                     cut, len(history), budget)
+        return list(history[cut:]), list(history[:cut])
+
+    def assemble(
+        self,
+        history: List[dict],
+        context: Optional[str] = None,
+        options: Optional[dict] = None,
+        min_turns: int = 1,
+    ) -> List[dict]:
+        """
+        Build the message list for one request.
+
+        Args:
+            history: Conversation so far, ending with the current user turn
+                     (and any tool observations for it)
+            context: Volatile system context, inserted before the current turn
+            options: Ollama options used for budgeting
+            min_turns: Latest user turns kept even past the budget
+
+        Returns:
+            Message list: static prefix + history, with the volatile
+            context placed just ahead of the current user turn
+        """
+        reserved = 0
+        tail_message = None
+        if context:
+            tail_message = {"role": "system", "content": context}
+            reserved = estimate_message_tokens(tail_message)
+
+        kept, _ = self.fit_history(history, self.history_budget(options, reserved),
+                                   min_turns=min_turns)
+        messages = list(self._prefix) + kept
+        if tail_message is not None:
+            turn = len(messages) - 1
+            while turn > len(self._prefix) and messages[turn].get("role") != "user":
+                turn -= 1
+            messages.insert(turn, tail_message)
+        return messages
+
+
+# ── Metrics ────────────────────────────────────────────────────────────────────
+
+@dataclass
+class PromptEvalRecord:
+    """Timing for one Ollama response."""
+    source: str
+    prompt_tokens_est: int      # Our estimate for the full prompt
+    prompt_eval_count: int      # Tokens Ollama actually evaluated
+    prompt_eval_ms: float
+    eval_count: int
+    eval_ms: float
+
+
+def _field(response: Any, name: str) -> Any:
+    value = getattr(response, name, None)
+    if value is None and isinstance(response, dict):
+        value = response.get(name)
+    return value
+
+
+class PromptMetrics:
+    """Rolling prompt_eval statistics across engine and parser calls."""
+
+    def __init__(self, history: int = METRICS_HISTORY):
+        self._lock = threading.Lock()
+        self._records: deque = deque(maxlen=history)
+
+    def record(
+        self,
+        source: str,
+        response: Any,
+        messages: Optional[List[dict]] = None,
+        prefix_tokens: int = 0,
+    ) -> None:
+        """
+        Record timing fields from a (final) Ollama response.
+
+        Streaming chunks without prompt_eval_count are ignored, so this can
+        be called on every chunk.
+
+        Args:
+            source:        Caller label ("chat", "parser")
+            response:      Ollama response or final stream chunk
+            messages:      Messages sent, for the prompt size estimate
+            prefix_tokens: Prompt tokens not in messages (rendered tool schemas)
+        """
+        prompt_eval_count = _field(response, "prompt_eval_count")
+        if prompt_eval_count is None:
+            return
+        record = PromptEvalRecord(
+            source=source,
+            prompt_tokens_est=prefix_tokens + sum(estimate_message_tokens(m) for m in messages or []),
+            prompt_eval_count=int(prompt_eval_count),
+            prompt_eval_ms=(_field(response, "prompt_eval_duration") or 0) / 1e6,
+            eval_count=int(_field(response, "eval_count") or 0),
+            eval_ms=(_field(response, "eval_duration") or 0) / 1e6,
+        )
+        with self._lock:
+            self._records.append(record)
+
+        logger.debug("%s prompt eval: %d tokens in %.0f ms (est. prompt %d tokens)",
+                     source, record.prompt_eval_count, record.prompt_eval_ms,
+                     record.prompt_tokens_est)
+
+    def summary(self, source: Optional[str] = None) -> dict:
+        """Aggregate statistics, optionally for one source ("chat", "parser")."""
+        with self._lock:
+            records = [r for r in self._records if source is None or r.source == source]
+        if not records:
+            return {"calls": 0}
+
+        evaluated = sum(r.prompt_eval_count for r in records)
+        estimated = sum(r.prompt_tokens_est for r in records)
+        prompt_ms = sum(r.prompt_eval_ms for r in records)
+        return {
+            "calls": len(records),
+            "avg_prompt_eval_tokens": evaluated / len(records),
+            "avg_prompt_eval_ms": prompt_ms / len(records),
+            "avg_eval_ms": sum(r.eval_ms for r in records) / len(records),
+            "prompt_ms_per_token": prompt_ms / evaluated if evaluated else 0.0,
+            # Share of the estimated prompt Ollama did not have to re-evaluate
+            "prefix_reuse_ratio": max(0.0, 1 - evaluated / estimated) if estimated else 0.0,
+            "last": records[-1].__dict__,
+        }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._records.clear()
+
+
+_metrics_instance: Optional[PromptMetrics] = None
+
+
+def get_prompt_metrics() -> PromptMetrics:
+    """Get or create the global PromptMetrics singleton."""
+    global _metrics_instance
+    if _metrics_instance is None:
+        _metrics_instance = PromptMetrics()
+    return _metrics_instance
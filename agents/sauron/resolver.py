@@ -0,0 +1,450 @@
+"""
+FRANKENSTEIN 1.0 - Eye of Sauron: Fast-Path Intent Resolver
+Deterministic grammar/keyword matching in front of the IntentParser
+
+Short, literal requests ("git status", "list states", "search for TODO in
+./agents") do not need an LLM round trip to pick a tool. The resolver
+compiles a phrase table from TOOL_SCHEMAS — every action enum value becomes a
+phrase — plus a small grammar of argument-bearing rules, and resolves those
+inputs locally with a confidence score.
+
+Only Ring 3 actions (as listed in each schema's description) that are also
+in READ_ONLY_ACTIONS are eligible, so the fast path can never skip an
+approval prompt or change state. Anything below the confidence threshold,
+or with an argument that does not look like a path, falls through to the
+IntentParser unchanged.
+
+In shadow mode the resolver still answers, but the router keeps calling the
+LLM and records whether both picked the same tool and action. That gives the
+agreement rate needed before trusting a rule in production.
+
+Usage:
+    resolver = get_resolver()
+    intent = resolver.resolve("git log -n 5")
+    if intent is not None and resolver.accepts(intent):
+        result = registry.execute(intent.tool_name, **intent.arguments)
+"""
+
+import logging
+import re
+import threading
+from collections import deque
+from dataclasses import dataclass
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+from agents.sauron.parser import TOOL_SCHEMAS, ParsedIntent
+from agents.sauron.audit import SauronEvent, get_sauron_audit
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+FAST_PATH_THRESHOLD = 0.85      # Minimum confidence to bypass the LLM
+EXACT_CONFIDENCE = 1.0          # Input is a full action phrase ("git status")
+ALIAS_CONFIDENCE = 0.8          # Action without its tool prefix ("status"); shadow-only by default
+MAX_FAST_PATH_CHARS = 200       # Longer inputs are conversational, not commands
+SHADOW_MISMATCH_HISTORY = 100   # Recent disagreements kept for inspection
+
+# Leading courtesy words stripped before matching
+_POLITE_PREFIX = re.compile(
+    r"^(?:please |pls |can you |could you |would you |sauron,? |hey sauron,? )+",
+    re.IGNORECASE,
+)
+# Actions that only read: the fast path and parallel dispatch are limited to
+# these. Ring 3 alone is not enough — quantum run_preset, memory load_state
+# and file_copy are auto-approved but change session or disk state.
+READ_ONLY_ACTIONS: Dict[str, FrozenSet[str]] = {
+    "git": frozenset({
+        "git_status", "git_log", "git_diff", "git_branch", "git_remote",
+        "git_show", "git_stash_list", "git_tag_list",
+    }),
+    "code": frozenset({"code_read", "code_format", "code_lint"}),
+    "shell": frozenset({"shell_info", "env_read"}),
+    "package": frozenset({
+        "pip_list", "pip_show", "pip_freeze", "pip_check",
+        "npm_list", "npm_outdated", "conda_list", "conda_env_list",
+    }),
+    "file": frozenset({"file_read"}),
+    "dir": frozenset({"dir_list", "dir_navigate", "dir_tree"}),
+    "search": frozenset({"file_search", "content_search"}),
+    "memory": frozenset({"list_states", "list_circuits", "get_session_summary"}),
+    "quantum": frozenset({
+        "get_state_info", "list_circuits", "synthesis_status", "true_engine_status",
+    }),
+}
+# Pronouns that fill a path slot in casual speech ("read this.pdf")
+_FILLER_WORDS = frozenset({"all", "everything", "it", "my", "that", "the", "these", "this", "those"})
+
+_RING3_SEGMENT = re.compile(r"Ring 3\b(.*?)(?=Ring [12]\b|$)", re.DOTALL)
+
+
+# ── Result Type ────────────────────────────────────────────────────────────────
+
+@dataclass
+class FastIntent:
+    """A locally resolved tool call with the confidence of the match."""
+    tool_name: str
+    arguments: dict
+    confidence: float
+    rule: str
+
+    @property
+    def action(self) -> str:
+        return self.arguments.get("action", "")
+
+    def to_parsed_intent(self) -> ParsedIntent:
+        """Present the match in the same shape the IntentParser returns."""
+        return ParsedIntent(
+            tool_name=self.tool_name,
+            arguments=dict(self.arguments),
+            text_response=None,
+            raw_tool_call={
+                "name": self.tool_name,
+                "arguments": dict(self.arguments),
+                "source": "fast_path",
+                "rule": self.rule,
+                "confidence": self.confidence,
+            },
+        )
+
+
+# ── Grammar ────────────────────────────────────────────────────────────────────
+# (rule name, pattern, tool, action, confidence, argument builder)
+# Patterns run against the normalised input; builders map match groups onto
+# the keyword arguments the tool's handler actually accepts (search takes
+# `root`, not the schema's `path`), or return None to refuse the match.
+
+def _strip_quotes(value: str) -> str:
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "'\"`":
+        return value[1:-1]
+    return value
+
+
+def _path(token: Optional[str], default: Optional[str] = None) -> Optional[str]:
+    """
+    A grammar token as a path, or None if it does not look like one.
+
+    Flags ("-la"), bare words ("everything", "view") and pronouns
+    ("this.pdf") are refused so the input falls through to the LLM; a path
+    needs a separator, a dot or a leading "~".
+    """
+    if token is None:
+        return default
+    token = _strip_quotes(token)
+    if not token or token.startswith("-"):
+        return None
+    stem = re.split(r"[/\\.]", token.lstrip("~./\\"), maxsplit=1)[0]
+    if stem.lower() in _FILLER_WORDS:
+        return None
+    if token.startswith("~") or re.search(r"[/\\.]", token):
+        return token
+    return None
+
+
+def _path_args(**tokens: Optional[str]) -> Optional[dict]:
+    """Arguments whose values passed _path(); None if any was refused."""
+    args = {}
+    for name, value in tokens.items():
+        if value is None:
+            return None
+        args[name] = value
+    return args
+
+
+_GRAMMAR: List[Tuple[str, str, str, str, float, Callable[[re.Match], Optional[dict]]]] = [
+    (
+        "git_log_n",
+        r"git log(?: -n ?| -| --max-count[= ])(\d{1,4})",
+        "git", "git_log", 1.0,
+        lambda m: {"n": int(m.group(1))},
+    ),
+    (
+        "git_show_ref",
+        r"git show ([\w./@{}~^-]+)",
+        "git", "git_show", 0.95,
+        lambda m: None if m.group(1).startswith("-") else {"ref": m.group(1)},
+    ),
+    (
+        "content_search_in",
+        r"(?:search|grep) (?:for )?(\"[^\"]+\"|'[^']+'|\S+) in (\S+)",
+        "search", "content_search", 0.9,
+        lambda m: _path_args(pattern=_strip_quotes(m.group(1)), root=_path(m.group(2))),
+    ),
+    (
+        "file_search_in",
+        r"(?:find|locate) (?:files? )?(?:named |matching )?(\S*[*?]\S*) in (\S+)",
+        "search", "file_search", 0.9,
+        lambda m: _path_args(pattern=m.group(1), root=_path(m.group(2))),
+    ),
+    (
+        "dir_list",
+        r"(?:ls|list files|list directory|list dir)(?: in)?(?: (\S+))?",
+        "dir", "dir_list", 0.95,
+        lambda m: _path_args(path=_path(m.group(1), ".")),
+    ),
+    (
+        "dir_tree",
+        r"(?:tree|show tree)(?: of)?(?: (\S+))?",
+        "dir", "dir_tree", 0.9,
+        lambda m: _path_args(path=_path(m.group(1), ".")),
+    ),
+    (
+        "dir_navigate",
+        r"pwd|where am i",
+        "dir", "dir_navigate", 0.95,
+        lambda m: {"path": "."},
+    ),
+    (
+        "file_read",
+        r"(?:cat|read file|read) (\S+\.\w+)",
+        "file", "file_read", 0.9,
+        lambda m: _path_args(path=_path(m.group(1))),
+    ),
+]
+
+
+# ── Schema Helpers ─────────────────────────────────────────────────────────────
+
+def _ring3_actions(function: dict) -> List[str]:
+    """
+    Actions a schema lists as Ring 3.
+
+    A "Ring 3 ..." clause that names actions selects those; one that names
+    none (e.g. "Search operations. Ring 3 (free).") covers the whole enum.
+    """
+    params = function.get("parameters", {}).get("properties", {})
+    action_spec = params.get("action", {})
+    actions = action_spec.get("enum")
+    if not actions:
+        # quantum keeps its action list in the description only
+        actions = re.findall(r"\b[a-z]+(?:_[a-z]+)+\b", action_spec.get("description", ""))
+
+    text = function.get("description", "") + " " + action_spec.get("description", "")
+    safe: List[str] = []
+    for match in _RING3_SEGMENT.finditer(text):
+        segment = match.group(1)
+        named = [a for a in actions if re.search(rf"\b{re.escape(a)}\b", segment)]
+        for action in named or actions:
+            if action not in safe:
+                safe.append(action)
+    return safe
+
+
+def is_read_only_action(tool_name: Optional[str], action: Optional[str]) -> bool:
+    """Whether (tool, action) is in the static READ_ONLY_ACTIONS table."""
+    return action in READ_ONLY_ACTIONS.get(tool_name or "", ())
+
+
+def _normalise(text: str) -> str:
+    """Collapse whitespace and drop courtesy words; case is kept for arguments."""
+    text = " ".join(text.split()).rstrip("?.!").strip()
+    return _POLITE_PREFIX.sub("", text)
+
+
+# ── Resolver ───────────────────────────────────────────────────────────────────
+
+class FastIntentResolver:
+    """
+    Deterministic intent matcher compiled from the tool schemas.
+
+    Thread-safe. Matching is pure (no I/O); shadow statistics are guarded
+    by a lock because the router may be shared across threads.
+    """
+
+    def __init__(
+        self,
+        schemas: Optional[list] = None,
+        threshold: float = FAST_PATH_THRESHOLD,
+        shadow: bool = False,
+    ):
+        """
+        Compile the phrase table and grammar.
+
+        Args:
+            schemas:   Ollama tool schemas (default TOOL_SCHEMAS)
+            threshold: Minimum confidence for accepts()
+            shadow:    Resolve and record agreement, but never bypass the LLM
+        """
+        self.threshold = threshold
+        self.shadow = shadow
+
+        self._safe: Dict[str, set] = {}
+        self._required: Dict[str, set] = {}
+        for schema in schemas if schemas is not None else TOOL_SCHEMAS:
+            function = schema["function"]
+            name = function["name"]
+            self._safe[name] = set(_ring3_actions(function)) & READ_ONLY_ACTIONS.get(name, set())
+            required = set(function.get("parameters", {}).get("required", []))
+            self._required[name] = required - {"action"}
+
+        self._phrases = self._compile_phrases()
+        self._grammar = [
+            (rule, re.compile(pattern, re.IGNORECASE), tool, action, confidence, build)
+            for rule, pattern, tool, action, confidence, build in _GRAMMAR
+            if action in self._safe.get(tool, ())
+        ]
+
+        self._lock = threading.Lock()
+        self._stats = {"resolved": 0, "accepted": 0, "shadow_agree": 0, "shadow_disagree": 0}
+        self._mismatches: deque = deque(maxlen=SHADOW_MISMATCH_HISTORY)
+
+        logger.info(
+            "FastIntentResolver compiled %d phrases and %d grammar rules (shadow=%s).",
+            len(self._phrases), len(self._grammar), shadow,
+        )
+
+    # ── Public API ─────────────────────────────────────────────────────────────
+
+    def resolve(self, user_message: str) -> Optional[FastIntent]:
+        """
+        Match a user message against the phrase table and grammar.
+
+        Args:
+            user_message: Raw user input
+
+        Returns:
+            FastIntent for the best match, or None if nothing matched
+        """
+        if not user_message or len(user_message) > MAX_FAST_PATH_CHARS:
+            return None
+        text = _normalise(user_message)
+        if not text:
+            return None
+
+        intent = self._match_phrase(text) or self._match_grammar(text)
+        if intent is not None:
+            with self._lock:
+                self._stats["resolved"] += 1
+        return intent
+
+    def accepts(self, intent: Optional[FastIntent]) -> bool:
+        """Whether the router may execute this match without the LLM."""
+        if intent is None or self.shadow or intent.confidence < self.threshold:
+            return False
+        with self._lock:
+            self._stats["accepted"] += 1
+        return True
+
+    def is_read_only(self, tool_name: str, action: str) -> bool:
+        """Whether an action is a read that may run alongside others."""
+        return is_read_only_action(tool_name, action)
+
+    def record_shadow(self, user_message: str, fast: FastIntent, llm: ParsedIntent) -> bool:
+        """
+        Compare a fast-path match with the LLM's decision for the same input.
+
+        Args:
+            user_message: Input both resolvers saw
+            fast:         Fast-path match
+            llm:          IntentParser result for the first ReAct step
+
+        Returns:
+            True if both chose the same tool and action
+        """
+        agree = llm.tool_name == fast.tool_name and llm.action == fast.action
+        with self._lock:
+            self._stats["shadow_agree" if agree else "shadow_disagree"] += 1
+            if not agree:
+                self._mismatches.append({
+                    "input": user_message[:MAX_FAST_PATH_CHARS],
+                    "rule": fast.rule,
+                    "confidence": fast.confidence,
+                    "fast": f"{fast.tool_name}.{fast.action}",
+                    "llm": f"{llm.tool_name}.{llm.action}" if llm.has_tool_call else "text",
+                })
+
+        if not agree:
+            get_sauron_audit().log(
+                SauronEvent.QUERY,
+                f"Fast-path shadow mismatch: {fast.tool_name}.{fast.action} "
+                f"vs {llm.tool_name or 'text'}.{llm.action}",
+                details={"rule": fast.rule, "confidence": fast.confidence},
+                source="fast_path",
+            )
+        return agree
+
+    def get_stats(self) -> dict:
+        """Match counters plus the shadow agreement rate."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["recent_mismatches"] = list(self._mismatches)
+        compared = stats["shadow_agree"] + stats["shadow_disagree"]
+        stats["shadow_agreement_rate"] = stats["shadow_agree"] / compared if compared else None
+        stats["threshold"] = self.threshold
+        stats["shadow"] = self.shadow
+        return stats
+
+    # ── Private helpers ────────────────────────────────────────────────────────
+
+    def _compile_phrases(self) -> Dict[str, List[Tuple[str, str, float]]]:
+        """
+        Map spoken forms of every Ring 3 action to (tool, action, confidence).
+
+        "git_status" yields "git status" (exact) and "status" (alias);
+        "list_states" yields "list states" and "memory list states". Actions
+        with required parameters other than `action` are left to the grammar.
+        """
+        phrases: Dict[str, List[Tuple[str, str, float]]] = {}
+
+        def add(phrase: str, tool: str, action: str, confidence: float) -> None:
+            entries = phrases.setdefault(phrase, [])
+            if all((t, a) != (tool, action) for t, a, _ in entries):
+                entries.append((tool, action, confidence))
+
+        for tool, actions in self._safe.items():
+            if self._required[tool]:
+                continue
+            for action in actions:
+                words = action.replace("_", " ")
+                add(words, tool, action, EXACT_CONFIDENCE)
+                if words.startswith(tool + " "):
+                    add(words[len(tool) + 1:], tool, action, ALIAS_CONFIDENCE)
+                else:
+                    add(f"{tool} {words}", tool, action, EXACT_CONFIDENCE)
+        return phrases
+
+    def _match_phrase(self, text: str) -> Optional[FastIntent]:
+        entries = self._phrases.get(text.lower())
+        if not entries:
+            return None
+        tool, action, confidence = entries[0]
+        if len(entries) > 1:
+            # "list circuits" exists in both memory and quantum — let the LLM decide
+            confidence = min(c for _, _, c in entries) / len(entries)
+        return FastIntent(
+            tool_name=tool,
+            arguments={"action": action},
+            confidence=confidence,
+            rule="phrase",
+        )
+
+    def _match_grammar(self, text: str) -> Optional[FastIntent]:
+        for rule, pattern, tool, action, confidence, build in self._grammar:
+            match = pattern.fullmatch(text)
+            if match is None:
+                continue
+            args = build(match)
+            if args is None:
+                continue
+            return FastIntent(
+                tool_name=tool,
+                arguments={"action": action, **args},
+                confidence=confidence,
+                rule=rule,
+            )
+        return None
+
+
+# ── Singleton ──────────────────────────────────────────────────────────────────
+
+_resolver_instance: Optional[FastIntentResolver] = None
+
+
+def get_resolver() -> FastIntentResolver:
+    """Get or create the global FastIntentResolver singleton."""
+    global _resolver_instance
+    if _resolver_instance is None:
+        _resolver_instance = FastIntentResolver()
+    return _resolver_instance
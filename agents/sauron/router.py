@@ -8,16 +8,28 @@ to decide what to do, executes tool calls via the ToolRegistry, appends
 structured messages so the model can observe results, and returns a
 RouterResult when the model produces a final text answer or the step
 limit is reached.
+
+When the model requests several tools in one reply, consecutive read-only
+Ring 3 calls run concurrently and every result is appended before the
+next inference.
+
+Literal commands ("git status", "ls agents") are first offered to the
+FastIntentResolver. A confident Ring 3 match is executed directly and its
+output returned without any LLM call; a failed fast-path call falls back
+to the ReAct loop with the error already in context.
 """
 
 from __future__ import annotations
 
 import json
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from typing import Optional
 
+from core.safety import SAFETY
 from agents.sauron.parser import get_parser, ParsedIntent
+from agents.sauron.resolver import get_resolver, is_read_only_action
 from agents.sauron.tools import get_registry
 from agents.sauron.tools.base import ToolResult
 
@@ -45,6 +57,7 @@ class RouterResult:
     steps: int = 0
     success: bool = True
     stopped_early: bool = False                    # True if MAX_STEPS was hit
+    fast_path: bool = False                        # True if answered without the LLM
 
 
 # ─────────────────────────────────────────────
@@ -73,16 +86,23 @@ class ActionRouter:
     then iterates up to MAX_STEPS:
 
       1. Call IntentParser → ParsedIntent
-      2a. If has_tool_call  → execute, append assistant + tool messages, loop
+      2a. If has_tool_call  → execute every requested call (independent
+                              reads in parallel), append assistant +
+                              tool messages, loop
       2b. If text response  → append assistant message, return RouterResult
 
     On hitting MAX_STEPS the router injects a summary prompt so the
     model produces a graceful final answer rather than a hard stop.
+
+    Before step 1 the FastIntentResolver gets a chance to answer literal
+    commands locally. A match it does not accept (shadow mode, or below
+    the confidence threshold) is compared against the LLM's first decision.
     """
 
     def __init__(self) -> None:
         self._parser = get_parser()
         self._registry = get_registry()
+        self._resolver = get_resolver()
 
     # ──────────────────────────────────────
     # Public API
@@ -99,12 +119,30 @@ class ActionRouter:
         Returns:
             RouterResult with final answer and execution history.
         """
-        # Append the new user turn
+        # Append the new user turn (each request sends a budget-trimmed copy)
         messages.append({"role": "user", "content": user_message})
 
         executions: list[ToolExecution] = []
         step = 0
 
+        # ── Fast path: deterministic match, no LLM round trip ─────────────
+        fast = self._resolver.resolve(user_message)
+        if self._resolver.accepts(fast):
+            step = 1
+            tool_result = self._observe([fast.to_parsed_intent()], step, executions, messages)[0]
+            if tool_result.success:
+                answer = self._format_result(tool_result)
+                messages.append({"role": "assistant", "content": answer})
+                return RouterResult(
+                    final_answer=answer,
+                    executions=executions,
+                    steps=step,
+                    success=True,
+                    stopped_early=False,
+                    fast_path=True,
+                )
+            fast = None
+
         while step < MAX_STEPS:
             step += 1
             logger.debug("ReAct step %d/%d", step, MAX_STEPS)
@@ -112,6 +150,10 @@ class ActionRouter:
             # ── Parse intent ──────────────────────────────────────────────
             intent: ParsedIntent = self._parser.parse_from_messages(messages)
 
+            if fast is not None:
+                self._resolver.record_shadow(user_message, fast, intent)
+                fast = None
+
             # ── Text answer → done ────────────────────────────────────────
             if not intent.has_tool_call:
                 answer = intent.text_response or ""
@@ -124,46 +166,8 @@ class ActionRouter:
                     stopped_early=False,
                 )
 
-            # ── Tool call → execute ───────────────────────────────────────
-            tool_result = self._execute(intent)
-
-            execution = ToolExecution(
-                tool_name=intent.tool_name or "unknown",
-                action=intent.action or "unknown",
-                arguments=intent.arguments,
-                result=tool_result,
-                step=step,
-            )
-            executions.append(execution)
-
-            # Append assistant message with tool_calls (Ollama format)
-            messages.append({
-                "role": "assistant",
-                "content": None,
-                "tool_calls": [
-                    {
-                        "function": {
-                            "name": intent.tool_name,
-                            "arguments": intent.arguments,
-                        }
-                    }
-                ],
-            })
-
-            # Append tool result so the model can observe it
-            formatted = self._format_result(tool_result)
-            messages.append({
-                "role": "tool",
-                "content": formatted,
-            })
-
-            logger.debug(
-                "Step %d: %s.%s → success=%s",
-                step,
-                intent.tool_name,
-                intent.action,
-                tool_result.success,
-            )
+            # ── Tool call(s) → execute ────────────────────────────────────
+            self._observe(intent.split(), step, executions, messages)
 
         # ── MAX_STEPS reached — ask model to summarise ────────────────────
         logger.warning("ReAct loop hit MAX_STEPS (%d). Requesting summary.", MAX_STEPS)
@@ -192,6 +196,106 @@ class ActionRouter:
     # Private helpers
     # ──────────────────────────────────────
 
+    def _observe(
+        self,
+        calls: list[ParsedIntent],
+        step: int,
+        executions: list[ToolExecution],
+        messages: list[dict],
+    ) -> list[ToolResult]:
+        """
+        Execute one step's tool calls and record them as a single observation.
+
+        Appends one assistant message carrying every tool_call, followed by
+        one tool message per result in request order, so the model sees all
+        outcomes on its next step.
+        """
+        results = self._execute_all(calls)
+
+        for intent, tool_result in zip(calls, results):
+            executions.append(ToolExecution(
+                tool_name=intent.tool_name or "unknown",
+                action=intent.action or "unknown",
+                arguments=intent.arguments,
+                result=tool_result,
+                step=step,
+            ))
+            logger.debug(
+                "Step %d: %s.%s → success=%s",
+                step,
+                intent.tool_name,
+                intent.action,
+                tool_result.success,
+            )
+
+        # Append assistant message with tool_calls (Ollama format)
+        messages.append({
+            "role": "assistant",
+            "content": None,
+            "tool_calls": [
+                {
+                    "function": {
+                        "name": intent.tool_name,
+                        "arguments": intent.arguments,
+                    }
+                }
+                for intent in calls
+            ],
+        })
+
+        # Append tool results so the model can observe them
+        for tool_result in results:
+            messages.append({
+                "role": "tool",
+                "content": self._format_result(tool_result),
+            })
+
+        return results
+
+    def _execute_all(self, calls: list[ParsedIntent]) -> list[ToolResult]:
+        """
+        Execute tool calls in request order, overlapping independent reads.
+
+        Consecutive read-only Ring 3 calls run concurrently (capped at
+        SAFETY.MAX_WORKER_THREADS). Any other call is a barrier: it runs
+        alone on this thread — Ring 2 approval prompts need the terminal —
+        after everything requested before it has finished.
+        """
+        results: list[Optional[ToolResult]] = [None] * len(calls)
+        batch: list[int] = []
+
+        def flush() -> None:
+            if len(batch) == 1:
+                results[batch[0]] = self._execute(calls[batch[0]])
+            elif batch:
+                workers = min(len(batch), SAFETY.MAX_WORKER_THREADS)
+                with ThreadPoolExecutor(max_workers=workers,
+                                        thread_name_prefix="SauronToolCall") as pool:
+                    for index, result in zip(batch, pool.map(self._execute,
+                                                              [calls[i] for i in batch])):
+                        results[index] = result
+            batch.clear()
+
+        for index, intent in enumerate(calls):
+            if self._is_parallel_safe(intent):
+                batch.append(index)
+                continue
+            flush()
+            results[index] = self._execute(intent)
+        flush()
+
+        return results
+
+    def _is_parallel_safe(self, intent: ParsedIntent) -> bool:
+        """
+        Whether (tool, action) is in the static READ_ONLY_ACTIONS table.
+
+        Decided from the table alone, never from tool.permission_level:
+        tools such as QuantumTool rewrite that attribute on every execute(),
+        so reading it here would race with the calls it is meant to order.
+        """
+        return is_read_only_action(intent.tool_name, intent.action)
+
     def _execute(self, intent: ParsedIntent) -> ToolResult:
         """
         Dispatch the tool call to the ToolRegistry.
@@ -12,6 +12,7 @@ Permission mapping:
 
 import logging
 import shutil
+import sys
 from pathlib import Path
 from typing import Optional
 
@@ -29,6 +30,14 @@ MAX_READ_BYTES = 1_048_576
 MAX_WRITE_BYTES = 10_485_760
 
 
+def _invalidate_search(*paths: Path) -> None:
+    """Make search indexes covering a written path re-scan before the next query."""
+    module = sys.modules.get("core.search_index")
+    if module is not None:
+        for path in paths:
+            module.invalidate_search_indexes(path)
+
+
 class FileTool(BaseTool):
     """
     File system operations for Eye of Sauron.
@@ -136,6 +145,7 @@ class FileTool(BaseTool):
             p.parent.mkdir(parents=True, exist_ok=True)
             mode = "a" if append else "w"
             p.open(mode, encoding=encoding).write(content)
+            _invalidate_search(p)
             return ToolResult(
                 success=True,
                 data={"path": str(p), "bytes_written": len(content.encode(encoding)),
@@ -164,6 +174,7 @@ class FileTool(BaseTool):
                 return ToolResult(success=False,
                                   error="Use dir_tools for directory deletion.")
             p.unlink()
+            _invalidate_search(p)
             return ToolResult(
                 success=True,
                 data={"path": str(p)},
@@ -193,6 +204,7 @@ class FileTool(BaseTool):
                 return ToolResult(success=False, error=f"Source not found: {src}")
             dst_p.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(src_p, dst_p)
+            _invalidate_search(dst_p)
             return ToolResult(
                 success=True,
                 data={"src": str(src_p), "dst": str(dst_p)},
@@ -220,6 +232,7 @@ class FileTool(BaseTool):
                 return ToolResult(success=False, error=f"Source not found: {src}")
             dst_p.parent.mkdir(parents=True, exist_ok=True)
             shutil.move(str(src_p), str(dst_p))
+            _invalidate_search(src_p, dst_p)
             return ToolResult(
                 success=True,
                 data={"src": str(src_p), "dst": str(dst_p)},
@@ -4,6 +4,10 @@ Phase 4 / Day 3: Tool Framework
 
 File search (glob pattern) and content search (grep).
 All operations are Ring 3 (SAFE) — read-only filesystem queries.
+
+Both actions answer from the shared core.search_index index when it is
+built for the root; until then (or for trees too large to index) they walk
+the filesystem as before and the index builds in the background.
 """
 
 import fnmatch
@@ -26,6 +30,63 @@ MAX_GREP_LINE_LEN = 300   # chars — truncate long lines in output
 MAX_FILE_SIZE_GREP = 10_485_760  # 10 MB — skip larger files
 
 
+def _search_index(root_path: Path):
+    """The shared search index for root_path, if it can answer queries now."""
+    try:
+        from core.search_index import get_search_index
+        index = get_search_index(root_path)
+        return index if index.ensure_fresh() else None
+    except Exception as e:
+        logger.debug("Search index unavailable for %s: %s", root_path, e)
+        return None
+
+
+def _walk_matches(root_path: Path, pattern: str, max_depth: Optional[int],
+                  include_dirs: bool):
+    """(path, is_dir) for glob matches under root_path, in os.walk order."""
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        # Depth check
+        if max_depth is not None:
+            rel = Path(dirpath).relative_to(root_path)
+            depth = len(rel.parts)
+            if depth > max_depth:
+                dirnames.clear()
+                continue
+
+        # Sort for deterministic output; skip hidden
+        dirnames.sort()
+
+        current_dir = Path(dirpath)
+
+        # Check files
+        for fname in sorted(filenames):
+            if fnmatch.fnmatch(fname, pattern) or fnmatch.fnmatch(
+                str(current_dir / fname), pattern
+            ):
+                yield current_dir / fname, False
+
+        # Check dirs if requested
+        if include_dirs:
+            for dname in dirnames:
+                if fnmatch.fnmatch(dname, pattern):
+                    yield current_dir / dname, True
+
+
+def _walk_files(root_path: Path, file_pattern: str, max_depth: Optional[int]):
+    """Files under root_path whose name matches file_pattern, in os.walk order."""
+    for dirpath, dirnames, filenames in os.walk(root_path):
+        if max_depth is not None:
+            rel = Path(dirpath).relative_to(root_path)
+            if len(rel.parts) > max_depth:
+                dirnames.clear()
+                continue
+        dirnames.sort()
+
+        for fname in sorted(filenames):
+            if fnmatch.fnmatch(fname, file_pattern):
+                yield Path(dirpath) / fname
+
+
 class SearchTool(BaseTool):
     """
     Search operations for Eye of Sauron. All Ring 3 (SAFE).
@@ -82,62 +143,34 @@ class SearchTool(BaseTool):
             if not root_path.is_dir():
                 return ToolResult(success=False, error=f"Root must be a directory: {root}")
 
+            index = _search_index(root_path)
+            if index is not None:
+                found = index.find(pattern, root_path, max_depth, include_dirs,
+                                   limit=MAX_FILE_RESULTS + 1)
+            else:
+                found = _walk_matches(root_path, pattern, max_depth, include_dirs)
+
             matches = []
             skipped_permission = 0
+            truncated = False
 
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                # Depth check
-                if max_depth is not None:
-                    rel = Path(dirpath).relative_to(root_path)
-                    depth = len(rel.parts)
-                    if depth > max_depth:
-                        dirnames.clear()
-                        continue
-
-                # Sort for deterministic output; skip hidden
-                dirnames.sort()
-
-                current_dir = Path(dirpath)
-
-                # Check files
-                for fname in sorted(filenames):
-                    if fnmatch.fnmatch(fname, pattern) or fnmatch.fnmatch(
-                        str(current_dir / fname), pattern
-                    ):
-                        try:
-                            fp = current_dir / fname
-                            stat = fp.stat()
-                            matches.append({
-                                "path": str(fp),
-                                "type": "file",
-                                "size_bytes": stat.st_size,
-                                "modified": stat.st_mtime,
-                            })
-                        except PermissionError:
-                            skipped_permission += 1
-
-                # Check dirs if requested
-                if include_dirs:
-                    for dname in dirnames:
-                        if fnmatch.fnmatch(dname, pattern):
-                            try:
-                                dp = current_dir / dname
-                                stat = dp.stat()
-                                matches.append({
-                                    "path": str(dp),
-                                    "type": "dir",
-                                    "size_bytes": None,
-                                    "modified": stat.st_mtime,
-                                })
-                            except PermissionError:
-                                skipped_permission += 1
-
+            for path, is_dir in found:
                 if len(matches) >= MAX_FILE_RESULTS:
-                    matches = matches[:MAX_FILE_RESULTS]
                     truncated = True
                     break
-            else:
-                truncated = False
+                try:
+                    stat = path.stat()
+                except PermissionError:
+                    skipped_permission += 1
+                    continue
+                except FileNotFoundError:
+                    continue        # Removed since the index snapshot
+                matches.append({
+                    "path": str(path),
+                    "type": "dir" if is_dir else "file",
+                    "size_bytes": None if is_dir else stat.st_size,
+                    "modified": stat.st_mtime,
+                })
 
             summary_parts = [
                 f"Found {len(matches)} match(es) for '{pattern}' under {str(root_path)}."
@@ -211,84 +244,77 @@ class SearchTool(BaseTool):
             files_skipped_permission = 0
             total_matches = 0
 
-            for dirpath, dirnames, filenames in os.walk(root_path):
-                if max_depth is not None:
-                    rel = Path(dirpath).relative_to(root_path)
-                    if len(rel.parts) > max_depth:
-                        dirnames.clear()
-                        continue
-                dirnames.sort()
-
-                for fname in sorted(filenames):
-                    if not fnmatch.fnmatch(fname, file_pattern):
-                        continue
-
-                    fp = Path(dirpath) / fname
-
-                    try:
-                        size = fp.stat().st_size
-                    except PermissionError:
-                        files_skipped_permission += 1
-                        continue
-
-                    if size > MAX_FILE_SIZE_GREP:
-                        files_skipped_size += 1
-                        continue
-
-                    try:
-                        text = fp.read_text(encoding="utf-8", errors="replace")
-                    except PermissionError:
-                        files_skipped_permission += 1
-                        continue
-                    except Exception:
-                        files_skipped_binary += 1
-                        continue
-
-                    files_searched += 1
-                    lines = text.splitlines()
-                    file_hits = []
-
-                    for lineno, line in enumerate(lines, start=1):
-                        if compiled.search(line):
-                            # Build context block
-                            ctx_start = max(0, lineno - 1 - context_lines)
-                            ctx_end = min(len(lines), lineno + context_lines)
-                            ctx_block = []
-                            for ci in range(ctx_start, ctx_end):
-                                ctx_line = lines[ci]
-                                if len(ctx_line) > MAX_GREP_LINE_LEN:
-                                    ctx_line = ctx_line[:MAX_GREP_LINE_LEN] + "…"
-                                ctx_block.append({
-                                    "lineno": ci + 1,
-                                    "text": ctx_line,
-                                    "is_match": (ci + 1) == lineno,
-                                })
-                            file_hits.append({
-                                "lineno": lineno,
-                                "text": (
-                                    line[:MAX_GREP_LINE_LEN] + "…"
-                                    if len(line) > MAX_GREP_LINE_LEN
-                                    else line
-                                ),
-                                "context": ctx_block if context_lines > 0 else [],
+            index = _search_index(root_path)
+            if index is not None:
+                targets = index.content_candidates(
+                    pattern, flags, root_path, file_pattern, max_depth
+                )
+            else:
+                targets = _walk_files(root_path, file_pattern, max_depth)
+
+            truncated = False
+            for fp in targets:
+                try:
+                    size = fp.stat().st_size
+                except PermissionError:
+                    files_skipped_permission += 1
+                    continue
+                except FileNotFoundError:
+                    continue        # Removed since the index snapshot
+
+                if size > MAX_FILE_SIZE_GREP:
+                    files_skipped_size += 1
+                    continue
+
+                try:
+                    text = fp.read_text(encoding="utf-8", errors="replace")
+                except PermissionError:
+                    files_skipped_permission += 1
+                    continue
+                except Exception:
+                    files_skipped_binary += 1
+                    continue
+
+                files_searched += 1
+                lines = text.splitlines()
+                file_hits = []
+
+                for lineno, line in enumerate(lines, start=1):
+                    if compiled.search(line):
+                        # Build context block
+                        ctx_start = max(0, lineno - 1 - context_lines)
+                        ctx_end = min(len(lines), lineno + context_lines)
+                        ctx_block = []
+                        for ci in range(ctx_start, ctx_end):
+                            ctx_line = lines[ci]
+                            if len(ctx_line) > MAX_GREP_LINE_LEN:
+                                ctx_line = ctx_line[:MAX_GREP_LINE_LEN] + "…"
+                            ctx_block.append({
+                                "lineno": ci + 1,
+                                "text": ctx_line,
+                                "is_match": (ci + 1) == lineno,
                             })
-                            total_matches += 1
-
-                    if file_hits:
-                        results.append({
-                            "file": str(fp),
-                            "hit_count": len(file_hits),
-                            "hits": file_hits,
+                        file_hits.append({
+                            "lineno": lineno,
+                            "text": (
+                                line[:MAX_GREP_LINE_LEN] + "…"
+                                if len(line) > MAX_GREP_LINE_LEN
+                                else line
+                            ),
+                            "context": ctx_block if context_lines > 0 else [],
                         })
+                        total_matches += 1
 
-                    if total_matches >= MAX_GREP_RESULTS:
-                        break  # inner filenames loop
+                if file_hits:
+                    results.append({
+                        "file": str(fp),
+                        "hit_count": len(file_hits),
+                        "hits": file_hits,
+                    })
 
                 if total_matches >= MAX_GREP_RESULTS:
                     truncated = True
                     break
-            else:
-                truncated = False
 
             summary_parts = [
                 f"Pattern '{pattern}': {total_matches} match(es) in {len(results)} file(s) "
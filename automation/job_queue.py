@@ -0,0 +1,727 @@
+"""
+Job Queue - Persistent quantum/classical job queue for Frankenstein 1.0
+
+SQLite-backed queue with one lane per provider. Jobs are leased rather than
+popped, so a worker that dies mid-run only delays its jobs until the lease
+expires. Queued jobs are ranked by priority, estimated cost and ETA; small
+compatible jobs are leased together and submitted as one batch; failed jobs
+are retried on the next provider of their router fallback chain.
+
+Author: Frankenstein 1.0 Team
+Phase: 3, Step 6
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Queue defaults
+DEFAULT_LEASE_SECONDS = 60.0  # Lease length before a job is handed out again
+DEFAULT_MAX_ATTEMPTS = 3  # Submissions per job, across all providers
+SMALL_JOB_SIZE = 4  # Jobs at or below this size may be batched
+BATCH_MAX_JOBS = 16  # Max jobs per batched submission
+BATCH_MAX_SIZE = 32  # Max combined size per batched submission
+ETA_BASE_SECONDS = 2.0  # ETA of a size-1 job on a speed-1.0 provider
+
+
+class JobStatus(Enum):
+    """Job lifecycle states."""
+    QUEUED = "queued"
+    LEASED = "leased"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+@dataclass
+class Job:
+    """A quantum or classical job waiting for (or done with) a provider."""
+    job_id: str
+    kind: str  # quantum, classical
+    provider_id: str
+    payload: Dict[str, Any] = field(default_factory=dict)
+    priority: int = 0  # Higher runs first
+    size: int = 1  # Relative work units (shots/1000, circuit count, ...)
+    batch_key: Optional[str] = None  # Jobs sharing a key can share a submission
+    cost: float = 0.0
+    eta_seconds: float = 0.0
+    status: JobStatus = JobStatus.QUEUED
+    attempts: int = 0
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    tried_providers: List[str] = field(default_factory=list)
+    lease_owner: Optional[str] = None
+    lease_expires: Optional[float] = None
+    rank: int = 0
+    enqueued_at: float = 0.0
+    result: Optional[Any] = None
+    error: Optional[str] = None
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> 'Job':
+        return cls(
+            job_id=row["job_id"],
+            kind=row["kind"],
+            provider_id=row["provider_id"],
+            payload=json.loads(row["payload"] or "{}"),
+            priority=row["priority"],
+            size=row["size"],
+            batch_key=row["batch_key"],
+            cost=row["cost"],
+            eta_seconds=row["eta_seconds"],
+            status=JobStatus(row["status"]),
+            attempts=row["attempts"],
+            max_attempts=row["max_attempts"],
+            tried_providers=json.loads(row["tried_providers"] or "[]"),
+            lease_owner=row["lease_owner"],
+            lease_expires=row["lease_expires"],
+            rank=row["rank"],
+            enqueued_at=row["enqueued_at"],
+            result=json.loads(row["result"]) if row["result"] else None,
+            error=row["error"],
+        )
+
+
+class LocalStandInProvider:
+    """
+    Local stand-in for a real provider backend.
+
+    Accepts batched submissions and answers each job with an echo result, so
+    the queue can be exercised without credentials or network access.
+    """
+
+    def __init__(self, provider_id: str = "local_cpu", latency: float = 0.0,
+                 fail_with: Optional[str] = None):
+        """
+        Args:
+            provider_id: Provider this stand-in answers for
+            latency: Seconds to sleep per submission (not per job)
+            fail_with: If set, every submission raises RuntimeError(fail_with)
+        """
+        self.provider_id = provider_id
+        self.latency = latency
+        self.fail_with = fail_with
+        self.submissions: List[List[str]] = []
+
+    def submit(self, jobs: List[Job]) -> List[Dict[str, Any]]:
+        """Run a batch of jobs; returns one result per job, in order."""
+        self.submissions.append([job.job_id for job in jobs])
+        if self.latency:
+            time.sleep(self.latency)
+        if self.fail_with:
+            raise RuntimeError(self.fail_with)
+        return [
+            {"job_id": job.job_id, "provider_id": self.provider_id, "echo": job.payload}
+            for job in jobs
+        ]
+
+
+class JobQueue:
+    """
+    Persistent job queue with per-provider lanes and lease semantics.
+
+    Lifecycle: enqueue() -> lease()/lease_batch() -> complete() or fail().
+    dequeue() is the at-most-once shortcut that leases and completes in one
+    step. Every state change is a single SQLite transaction, so several
+    processes can share one queue file.
+    """
+
+    def __init__(self, db_path: Optional[str] = None,
+                 lease_seconds: float = DEFAULT_LEASE_SECONDS):
+        """
+        Initialize job queue.
+
+        Args:
+            db_path: Path to SQLite database file
+            lease_seconds: Default lease length
+        """
+        if db_path is None:
+            db_path = str(Path.home() / ".frankenstein" / "data" / "job_queue.db")
+        self.db_path = str(db_path)
+        self.lease_seconds = lease_seconds
+        self._lock = threading.Lock()
+
+        db_dir = os.path.dirname(self.db_path)
+        if db_dir:
+            os.makedirs(db_dir, exist_ok=True)
+        self._initialize_schema()
+
+    @contextmanager
+    def _transaction(self):
+        """Serializable write transaction (BEGIN IMMEDIATE)."""
+        conn = sqlite3.connect(self.db_path, timeout=10.0, isolation_level=None)
+        conn.row_factory = sqlite3.Row
+        try:
+            with self._lock:
+                conn.execute("BEGIN IMMEDIATE")
+                try:
+                    yield conn
+                    conn.execute("COMMIT")
+                except Exception:
+                    conn.execute("ROLLBACK")
+                    raise
+        finally:
+            conn.close()
+
+    def _initialize_schema(self):
+        """Create database schema if it doesn't exist."""
+        with self._transaction() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS jobs (
+                    job_id TEXT PRIMARY KEY,
+                    kind TEXT NOT NULL,
+                    provider_id TEXT NOT NULL,
+                    payload TEXT,
+                    priority INTEGER DEFAULT 0,
+                    size INTEGER DEFAULT 1,
+                    batch_key TEXT,
+                    cost REAL DEFAULT 0.0,
+                    eta_seconds REAL DEFAULT 0.0,
+                    status TEXT NOT NULL,
+                    attempts INTEGER DEFAULT 0,
+                    max_attempts INTEGER DEFAULT 3,
+                    tried_providers TEXT,
+                    lease_owner TEXT,
+                    lease_expires REAL,
+                    rank INTEGER DEFAULT 0,
+                    enqueued_at REAL NOT NULL,
+                    updated_at REAL NOT NULL,
+                    result TEXT,
+                    error TEXT
+                )
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lane
+                ON jobs(status, provider_id, rank)
+            """)
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_lease
+                ON jobs(status, lease_expires)
+            """)
+
+    # ------------------------------------------------------------------
+    # Enqueue / dequeue
+    # ------------------------------------------------------------------
+
+    def enqueue(
+        self,
+        kind: str,
+        provider_id: str,
+        payload: Optional[Dict[str, Any]] = None,
+        priority: int = 0,
+        size: int = 1,
+        batch_key: Optional[str] = None,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+        job_id: Optional[str] = None
+    ) -> Job:
+        """
+        Add a job to the end of its provider lane.
+
+        Args:
+            kind: 'quantum' or 'classical'
+            provider_id: Router provider id (e.g. 'ibm_quantum', 'local_cpu')
+            payload: JSON-serializable job description
+            priority: Higher runs first
+            size: Relative work units, used for ETA and batching
+            batch_key: Jobs with equal keys may be submitted together
+            max_attempts: Submissions allowed before the job fails for good
+            job_id: Explicit id (generated if omitted)
+
+        Returns:
+            The queued Job
+
+        Raises:
+            ValueError: If kind is not 'quantum' or 'classical'
+        """
+        if kind not in ("quantum", "classical"):
+            raise ValueError(f"Invalid job kind: {kind}. Must be 'quantum' or 'classical'")
+
+        now = time.time()
+        cost, eta = self._estimate(provider_id, size)
+        job = Job(
+            job_id=job_id or uuid.uuid4().hex[:12],
+            kind=kind,
+            provider_id=provider_id,
+            payload=payload or {},
+            priority=priority,
+            size=max(1, int(size)),
+            batch_key=batch_key,
+            cost=cost,
+            eta_seconds=eta,
+            max_attempts=max_attempts,
+            enqueued_at=now,
+        )
+
+        with self._transaction() as conn:
+            # New jobs join the end of the lane until the next reorder()
+            row = conn.execute(
+                "SELECT COALESCE(MAX(rank), -1) + 1 FROM jobs WHERE provider_id = ? AND status = ?",
+                (provider_id, JobStatus.QUEUED.value)
+            ).fetchone()
+            job.rank = row[0]
+            conn.execute("""
+                INSERT INTO jobs (
+                    job_id, kind, provider_id, payload, priority, size, batch_key,
+                    cost, eta_seconds, status, attempts, max_attempts, tried_providers,
+                    rank, enqueued_at, updated_at
+                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 0, ?, '[]', ?, ?, ?)
+            """, (
+                job.job_id, kind, provider_id, json.dumps(job.payload), priority,
+                job.size, batch_key, cost, eta, JobStatus.QUEUED.value,
+                max_attempts, job.rank, now, now
+            ))
+
+        return job
+
+    def dequeue(self, provider_id: Optional[str] = None,
+                kind: Optional[str] = None) -> Optional[Job]:
+        """
+        Remove and return the next job (at-most-once delivery).
+
+        Args:
+            provider_id: Restrict to one lane (optional)
+            kind: Restrict to 'quantum' or 'classical' (optional)
+
+        Returns:
+            The job, or None if nothing is queued
+        """
+        jobs = self.lease(owner="dequeue", provider_id=provider_id, kind=kind)
+        if not jobs:
+            return None
+        job = jobs[0]
+        self.complete(job.job_id, owner="dequeue")
+        job.status = JobStatus.COMPLETED
+        return job
+
+    # ------------------------------------------------------------------
+    # Leases
+    # ------------------------------------------------------------------
+
+    def lease(
+        self,
+        owner: str,
+        provider_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        max_jobs: int = 1,
+        lease_seconds: Optional[float] = None
+    ) -> List[Job]:
+        """
+        Lease the next jobs in rank order.
+
+        Without provider_id the lane with the shortest estimated backlog goes
+        first, breaking ties on cost.
+
+        Args:
+            owner: Worker identity; must match on complete()/fail()
+            provider_id: Restrict to one lane (optional)
+            kind: Restrict to 'quantum' or 'classical' (optional)
+            max_jobs: Maximum number of jobs to lease
+            lease_seconds: Lease length (defaults to the queue setting)
+
+        Returns:
+            Leased jobs (possibly empty)
+        """
+        with self._transaction() as conn:
+            self._reclaim_expired(conn)
+            lane = provider_id or self._pick_lane(conn, kind)
+            if lane is None:
+                return []
+            rows = self._queued_rows(conn, lane, kind, max_jobs)
+            return self._mark_leased(conn, rows, owner, lease_seconds)
+
+    def lease_batch(
+        self,
+        owner: str,
+        provider_id: Optional[str] = None,
+        kind: Optional[str] = None,
+        max_jobs: int = BATCH_MAX_JOBS,
+        max_size: int = BATCH_MAX_SIZE,
+        lease_seconds: Optional[float] = None
+    ) -> List[Job]:
+        """
+        Lease the head of a lane plus compatible small jobs behind it.
+
+        Jobs are compatible when they share the head job's lane, kind and
+        batch_key and are no larger than SMALL_JOB_SIZE. A head job without
+        a batch_key, or a large one, is leased alone.
+
+        Returns:
+            Jobs to submit together (possibly empty)
+        """
+        with self._transaction() as conn:
+            self._reclaim_expired(conn)
+            lane = provider_id or self._pick_lane(conn, kind)
+            if lane is None:
+                return []
+
+            head = self._queued_rows(conn, lane, kind, 1)
+            if not head:
+                return []
+            head = head[0]
+            rows = [head]
+
+            if head["batch_key"] is not None and head["size"] <= SMALL_JOB_SIZE:
+                total = head["size"]
+                candidates = conn.execute("""
+                    SELECT * FROM jobs
+                    WHERE status = ? AND provider_id = ? AND batch_key = ?
+                      AND kind = ? AND size <= ? AND job_id != ?
+                    ORDER BY rank, enqueued_at
+                """, (
+                    JobStatus.QUEUED.value, lane, head["batch_key"],
+                    head["kind"], SMALL_JOB_SIZE, head["job_id"]
+                )).fetchall()
+                for row in candidates:
+                    if len(rows) >= max_jobs or total + row["size"] > max_size:
+                        break
+                    rows.append(row)
+                    total += row["size"]
+
+            return self._mark_leased(conn, rows, owner, lease_seconds)
+
+    def extend_lease(self, job_id: str, owner: str,
+                     lease_seconds: Optional[float] = None) -> bool:
+        """Extend a lease still held by owner; False if it was lost."""
+        expires = time.time() + (lease_seconds or self.lease_seconds)
+        with self._transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE jobs SET lease_expires = ?, updated_at = ?
+                WHERE job_id = ? AND status = ? AND lease_owner = ?
+            """, (expires, time.time(), job_id, JobStatus.LEASED.value, owner))
+            return cursor.rowcount == 1
+
+    def complete(self, job_id: str, owner: str, result: Any = None) -> bool:
+        """
+        Acknowledge a leased job.
+
+        Returns:
+            False if the lease was lost (expired and re-leased elsewhere)
+        """
+        with self._transaction() as conn:
+            cursor = conn.execute("""
+                UPDATE jobs SET status = ?, result = ?, lease_owner = NULL,
+                       lease_expires = NULL, updated_at = ?
+                WHERE job_id = ? AND status = ? AND lease_owner = ?
+            """, (
+                JobStatus.COMPLETED.value, json.dumps(result) if result is not None else None,
+                time.time(), job_id, JobStatus.LEASED.value, owner
+            ))
+            return cursor.rowcount == 1
+
+    def fail(self, job_id: str, owner: str, error: str) -> Optional[Job]:
+        """
+        Report a failed submission and retry on the fallback chain.
+
+        The job moves to the first provider in router.fallback.get_fallback_chain
+        of its current provider that it has not tried yet (or stays put if the
+        chain is exhausted) until max_attempts is reached.
+
+        Returns:
+            The updated Job, or None if the lease was lost
+        """
+        from router.fallback import get_fallback_chain
+
+        with self._transaction() as conn:
+            row = conn.execute(
+                "SELECT * FROM jobs WHERE job_id = ? AND status = ? AND lease_owner = ?",
+                (job_id, JobStatus.LEASED.value, owner)
+            ).fetchone()
+            if row is None:
+                return None
+
+            job = Job.from_row(row)
+            job.attempts += 1
+            job.error = error
+            if job.provider_id not in job.tried_providers:
+                job.tried_providers.append(job.provider_id)
+
+            if job.attempts >= job.max_attempts:
+                job.status = JobStatus.FAILED
+            else:
+                job.status = JobStatus.QUEUED
+                untried = [p for p in get_fallback_chain(job.provider_id)
+                           if p not in job.tried_providers]
+                if untried:
+                    job.provider_id = untried[0]
+                    job.cost, job.eta_seconds = self._estimate(job.provider_id, job.size)
+                # Retries go to the front of their new lane
+                job.rank = conn.execute(
+                    "SELECT COALESCE(MIN(rank), 1) - 1 FROM jobs WHERE provider_id = ? AND status = ?",
+                    (job.provider_id, JobStatus.QUEUED.value)
+                ).fetchone()[0]
+
+            conn.execute("""
+                UPDATE jobs SET status = ?, provider_id = ?, cost = ?, eta_seconds = ?,
+                       attempts = ?, tried_providers = ?, rank = ?, error = ?,
+                       lease_owner = NULL, lease_expires = NULL, updated_at = ?
+                WHERE job_id = ?
+            """, (
+                job.status.value, job.provider_id, job.cost, job.eta_seconds,
+                job.attempts, json.dumps(job.tried_providers), job.rank, error,
+                time.time(), job_id
+            ))
+
+            job.lease_owner = None
+            job.lease_expires = None
+            return job
+
+    def reclaim_expired(self) -> int:
+        """Return jobs with expired leases to their lanes; returns the count."""
+        with self._transaction() as conn:
+            return self._reclaim_expired(conn)
+
+    # ------------------------------------------------------------------
+    # Reordering and processing
+    # ------------------------------------------------------------------
+
+    def reorder(self, kind: Optional[str] = None) -> int:
+        """
+        Re-rank queued jobs within each lane.
+
+        Order: priority (high first), then estimated cost, then ETA
+        (shortest first), then arrival.
+
+        Args:
+            kind: Restrict to 'quantum' or 'classical' (optional)
+
+        Returns:
+            Number of jobs whose position changed
+        """
+        with self._transaction() as conn:
+            query = "SELECT job_id, provider_id, priority, cost, eta_seconds, enqueued_at, rank " \
+                    "FROM jobs WHERE status = ?"
+            params: List[Any] = [JobStatus.QUEUED.value]
+            if kind:
+                query += " AND kind = ?"
+                params.append(kind)
+
+            lanes: Dict[str, List[sqlite3.Row]] = {}
+            for row in conn.execute(query, params).fetchall():
+                lanes.setdefault(row["provider_id"], []).append(row)
+
+            moved = 0
+            updates = []
+            for rows in lanes.values():
+                current = sorted(rows, key=lambda r: r["rank"])
+                ordered = sorted(rows, key=lambda r: (
+                    -r["priority"], r["cost"], r["eta_seconds"], r["enqueued_at"]
+                ))
+                for position, row in enumerate(ordered):
+                    if current[position]["job_id"] != row["job_id"]:
+                        moved += 1
+                    if row["rank"] != position:
+                        updates.append((position, row["job_id"]))
+
+            conn.executemany("UPDATE jobs SET rank = ? WHERE job_id = ?", updates)
+            return moved
+
+    def process(
+        self,
+        backends: Dict[str, Any],
+        owner: str = "workflow_engine",
+        kind: Optional[str] = None,
+        max_batches: int = 10
+    ) -> Dict[str, int]:
+        """
+        Lease batches and submit them to provider backends.
+
+        Args:
+            backends: provider_id -> object with submit(List[Job]) -> List[result]
+            owner: Lease owner for this worker
+            kind: Restrict to 'quantum' or 'classical' (optional)
+            max_batches: Upper bound on submissions for this call
+
+        Returns:
+            Counts of batches submitted, jobs completed, retried and failed
+        """
+        counts = {"batches": 0, "completed": 0, "retried": 0, "failed": 0}
+
+        for _ in range(max_batches):
+            batch = None
+            for provider_id in self._lanes_by_backlog(kind):
+                if provider_id in backends:
+                    batch = self.lease_batch(owner, provider_id=provider_id, kind=kind)
+                    if batch:
+                        break
+            if not batch:
+                break
+
+            backend = backends[batch[0].provider_id]
+            counts["batches"] += 1
+            try:
+                results = backend.submit(batch)
+            except Exception as e:
+                self._fail_batch(batch, owner, str(e), counts)
+                continue
+
+            results = list(results or [])
+            for job, result in zip(batch, results):
+                if self.complete(job.job_id, owner, result):
+                    counts["completed"] += 1
+            # Jobs the backend returned no result for must not stay leased
+            self._fail_batch(batch[len(results):], owner, "No result returned by backend", counts)
+
+        return counts
+
+    def _fail_batch(self, jobs: List[Job], owner: str, error: str,
+                    counts: Dict[str, int]) -> None:
+        """fail() each job, tallying 'failed' and 'retried' into counts."""
+        for job in jobs:
+            updated = self.fail(job.job_id, owner, error)
+            if updated is not None:
+                key = "failed" if updated.status == JobStatus.FAILED else "retried"
+                counts[key] += 1
+
+    # ------------------------------------------------------------------
+    # Queries
+    # ------------------------------------------------------------------
+
+    def get_job(self, job_id: str) -> Optional[Job]:
+        """Get a job by id."""
+        with self._transaction() as conn:
+            row = conn.execute("SELECT * FROM jobs WHERE job_id = ?", (job_id,)).fetchone()
+            return Job.from_row(row) if row else None
+
+    def get_lane(self, provider_id: str) -> List[Job]:
+        """Queued jobs of one provider lane, in lease order."""
+        with self._transaction() as conn:
+            rows = conn.execute(
+                "SELECT * FROM jobs WHERE provider_id = ? AND status = ? ORDER BY rank, enqueued_at",
+                (provider_id, JobStatus.QUEUED.value)
+            ).fetchall()
+            return [Job.from_row(row) for row in rows]
+
+    def stats(self, kind: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Queue depth per status and per lane.
+
+        Returns:
+            Dict with 'by_status', 'lanes' (queued jobs and ETA per provider)
+            and 'depth' (total queued)
+        """
+        query = "SELECT provider_id, status, COUNT(*) AS n, SUM(eta_seconds) AS eta " \
+                "FROM jobs {where} GROUP BY provider_id, status"
+        params: List[Any] = []
+        where = ""
+        if kind:
+            where = "WHERE kind = ?"
+            params.append(kind)
+
+        by_status = {status.value: 0 for status in JobStatus}
+        lanes: Dict[str, Dict[str, float]] = {}
+        with self._transaction() as conn:
+            for row in conn.execute(query.format(where=where), params).fetchall():
+                by_status[row["status"]] += row["n"]
+                if row["status"] == JobStatus.QUEUED.value:
+                    lanes[row["provider_id"]] = {
+                        "queued": row["n"],
+                        "eta_seconds": round(row["eta"] or 0.0, 2),
+                    }
+
+        return {
+            "by_status": by_status,
+            "lanes": lanes,
+            "depth": by_status[JobStatus.QUEUED.value],
+        }
+
+    def purge(self, older_than_seconds: float = 86400.0) -> int:
+        """Delete completed/failed jobs older than the cutoff; returns the count."""
+        cutoff = time.time() - older_than_seconds
+        with self._transaction() as conn:
+            cursor = conn.execute(
+                "DELETE FROM jobs WHERE status IN (?, ?) AND updated_at < ?",
+                (JobStatus.COMPLETED.value, JobStatus.FAILED.value, cutoff)
+            )
+            return cursor.rowcount
+
+    # ------------------------------------------------------------------
+    # Private helpers
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _estimate(provider_id: str, size: int) -> tuple:
+        """(cost, eta_seconds) for a job from the router's static estimates."""
+        from router.scoring import get_provider_estimates
+        estimates = get_provider_estimates(provider_id)
+        return estimates["cost"], ETA_BASE_SECONDS * estimates["speed"] * max(1, size)
+
+    def _reclaim_expired(self, conn: sqlite3.Connection) -> int:
+        cursor = conn.execute("""
+            UPDATE jobs SET status = ?, lease_owner = NULL, lease_expires = NULL, updated_at = ?
+            WHERE status = ? AND lease_expires < ?
+        """, (JobStatus.QUEUED.value, time.time(), JobStatus.LEASED.value, time.time()))
+        return cursor.rowcount
+
+    def _pick_lane(self, conn: sqlite3.Connection, kind: Optional[str]) -> Optional[str]:
+        """Lane with the smallest queued ETA, then lowest cost."""
+        lanes = self._lane_backlogs(conn, kind)
+        return lanes[0] if lanes else None
+
+    def _lanes_by_backlog(self, kind: Optional[str]) -> List[str]:
+        with self._transaction() as conn:
+            return self._lane_backlogs(conn, kind)
+
+    @staticmethod
+    def _lane_backlogs(conn: sqlite3.Connection, kind: Optional[str]) -> List[str]:
+        query = "SELECT provider_id, SUM(eta_seconds) AS eta, MIN(cost) AS cost " \
+                "FROM jobs WHERE status = ?"
+        params: List[Any] = [JobStatus.QUEUED.value]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " GROUP BY provider_id ORDER BY eta, cost, provider_id"
+        return [row["provider_id"] for row in conn.execute(query, params).fetchall()]
+
+    @staticmethod
+    def _queued_rows(conn: sqlite3.Connection, provider_id: str,
+                     kind: Optional[str], limit: int) -> List[sqlite3.Row]:
+        query = "SELECT * FROM jobs WHERE status = ? AND provider_id = ?"
+        params: List[Any] = [JobStatus.QUEUED.value, provider_id]
+        if kind:
+            query += " AND kind = ?"
+            params.append(kind)
+        query += " ORDER BY rank, enqueued_at LIMIT ?"
+        params.append(limit)
+        return conn.execute(query, params).fetchall()
+
+    def _mark_leased(self, conn: sqlite3.Connection, rows: List[sqlite3.Row],
+                     owner: str, lease_seconds: Optional[float]) -> List[Job]:
+        expires = time.time() + (lease_seconds or self.lease_seconds)
+        jobs = []
+        for row in rows:
+            conn.execute("""
+                UPDATE jobs SET status = ?, lease_owner = ?, lease_expires = ?, updated_at = ?
+                WHERE job_id = ?
+            """, (JobStatus.LEASED.value, owner, expires, time.time(), row["job_id"]))
+            job = Job.from_row(row)
+            job.status = JobStatus.LEASED
+            job.lease_owner = owner
+            job.lease_expires = expires
+            jobs.append(job)
+        return jobs
+
+
+# Singleton instance
+_job_queue: Optional[JobQueue] = None
+_job_queue_lock = threading.Lock()
+
+
+def get_job_queue() -> JobQueue:
+    """
+    Get the singleton JobQueue instance.
+
+    Returns:
+        JobQueue singleton
+    """
+    global _job_queue
+    if _job_queue is None:
+        with _job_queue_lock:
+            if _job_queue is None:
+                _job_queue = JobQueue()
+    return _job_queue
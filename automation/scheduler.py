@@ -8,16 +8,22 @@ Author: Frankenstein 1.0 Team
 Phase: 3, Step 6
 """
 
-import sched
+import heapq
+import itertools
 import time
 import threading
-from typing import Callable, Optional, List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, List, Dict, Any, Tuple
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import datetime, timedelta
 from enum import Enum
 import psutil
 from core.safety import SAFETY
 
+# Scheduling defaults
+DEFAULT_TASK_TIMEOUT_SECONDS = 300  # Run time before a task is marked failed
+TRIGGER_RECHECK_SECONDS = 5  # Re-check interval for triggers not bound to events
+
 
 class ScheduleType(Enum):
     """Task schedule types."""
@@ -51,18 +57,27 @@ class ScheduledTask:
     run_count: int = 0
     error_count: int = 0
     last_error: Optional[str] = None
+    timeout_seconds: Optional[float] = DEFAULT_TASK_TIMEOUT_SECONDS
+    trigger_events: List[Any] = field(default_factory=list)  # data.events.EventType
 
 
 class TaskScheduler:
     """
-    Lightweight task scheduler using Python's sched module.
+    Event-driven task scheduler.
+
+    A single scheduler thread keeps a heap of deadlines and sleeps on a
+    condition until the earliest one is due, or until a registration,
+    pause or cancellation wakes it. Due tasks are handed to a bounded
+    worker pool, so a slow task never delays the others. Event-triggered
+    tasks subscribe to the EventBus; only triggers that name no events
+    fall back to a periodic re-check.
 
     Supports recurring, one-time, and event-triggered tasks with resource safety checks.
     Maximum 5 concurrent tasks to support 28 providers efficiently.
     """
 
     _instance = None
-    _lock = threading.Lock()
+    _lock = threading.RLock()
     _initialized = False
 
     # Resource safety limits — sourced from core/safety.py (single source of truth)
@@ -83,9 +98,17 @@ class TaskScheduler:
 
         with self._lock:
             if not self._initialized:
-                self._scheduler = sched.scheduler(time.time, time.sleep)
+                self._wakeup = threading.Condition(self._lock)
+                # Heap entries: (monotonic deadline, seq, kind, task_id, token)
+                self._heap: List[Tuple[float, int, str, str, int]] = []
+                self._seq = itertools.count()
+                self._generations: Dict[str, int] = {}
+                self._current_run: Dict[str, int] = {}
                 self._tasks: Dict[str, ScheduledTask] = {}
                 self._running_tasks: set = set()
+                self._busy_workers = 0
+                self._executor: Optional[ThreadPoolExecutor] = None
+                self._subscriptions: Dict[Any, int] = {}
                 self._scheduler_thread: Optional[threading.Thread] = None
                 self._stop_event = threading.Event()
                 self._is_running = False
@@ -118,51 +141,110 @@ class TaskScheduler:
             True if task can run, False otherwise
         """
         with self._lock:
-            # Check concurrent task limit
-            if len(self._running_tasks) >= self.MAX_CONCURRENT_TASKS:
+            # Check concurrent task limit (timed-out runs still hold a worker)
+            if max(len(self._running_tasks), self._busy_workers) >= self.MAX_CONCURRENT_TASKS:
                 return False
 
             # Check resource limits
             return self._check_resources()
 
+    def _push(self, delay_seconds: float, kind: str, task_id: str, token: int):
+        """Add a heap entry and wake the scheduler thread (lock held)."""
+        heapq.heappush(
+            self._heap,
+            (time.monotonic() + delay_seconds, next(self._seq), kind, task_id, token)
+        )
+        self._wakeup.notify()
+
+    def _cancel_pending(self, task_id: str):
+        """Invalidate queued run/trigger entries for a task (lock held)."""
+        self._generations[task_id] = self._generations.get(task_id, 0) + 1
+        self._wakeup.notify()
+
     def _execute_task(self, task: ScheduledTask):
         """
-        Execute a scheduled task with error handling.
+        Hand a scheduled task to the worker pool.
 
         Args:
             task: ScheduledTask to execute
         """
         # Check if we can run the task
         if not self._can_run_task():
-            task.status = TaskStatus.SKIPPED
+            with self._lock:
+                task.status = TaskStatus.SKIPPED
+                # A skipped recurring task still gets its next slot
+                if task.schedule_type == ScheduleType.RECURRING:
+                    self._schedule_recurring_task(task)
             return
 
         # Mark task as running
         with self._lock:
+            if not self._is_running or self._executor is None:
+                return
+            if task.task_id in self._current_run:
+                return  # Previous run still in flight
+            run_id = next(self._seq)
             task.status = TaskStatus.RUNNING
             task.last_run = datetime.now()
             self._running_tasks.add(task.task_id)
+            self._current_run[task.task_id] = run_id
+            self._busy_workers += 1
+            if task.timeout_seconds:
+                self._push(task.timeout_seconds, "timeout", task.task_id, run_id)
+            executor = self._executor
 
         try:
-            # Execute the task function
-            task.task_func()
-
-            # Mark as completed
+            executor.submit(self._run_task, task, run_id)
+        except RuntimeError:
+            # Pool shut down between the check and the submit
             with self._lock:
-                task.status = TaskStatus.COMPLETED
-                task.run_count += 1
+                self._busy_workers -= 1
+                self._running_tasks.discard(task.task_id)
+                self._current_run.pop(task.task_id, None)
 
-        except Exception as e:
-            # Handle errors
-            with self._lock:
-                task.status = TaskStatus.FAILED
-                task.error_count += 1
-                task.last_error = str(e)
+    def _run_task(self, task: ScheduledTask, run_id: int):
+        """
+        Worker body: run the task function with error handling.
 
+        Args:
+            task: ScheduledTask to run
+            run_id: Token identifying this run
+        """
+        error = None
+        try:
+            # Execute the task function
+            task.task_func()
+        except Exception as e:
+            error = str(e)
         finally:
-            # Remove from running tasks
             with self._lock:
-                self._running_tasks.discard(task.task_id)
+                self._busy_workers -= 1
+
+        self._finish_run(task, run_id, error)
+
+    def _finish_run(self, task: ScheduledTask, run_id: int, error: Optional[str]):
+        """
+        Record the outcome of a run and reschedule recurring tasks.
+
+        Ignored if the run already timed out.
+        """
+        with self._lock:
+            if self._current_run.get(task.task_id) != run_id:
+                return
+            del self._current_run[task.task_id]
+            self._running_tasks.discard(task.task_id)
+
+            if error is None:
+                # Mark as completed
+                task.run_count += 1
+                if task.status == TaskStatus.RUNNING:
+                    task.status = TaskStatus.COMPLETED
+            else:
+                # Handle errors
+                task.error_count += 1
+                task.last_error = error
+                if task.status == TaskStatus.RUNNING:
+                    task.status = TaskStatus.FAILED
 
             # Reschedule if recurring
             if task.schedule_type == ScheduleType.RECURRING:
@@ -175,24 +257,21 @@ class TaskScheduler:
         Args:
             task: ScheduledTask to reschedule
         """
-        if not self._is_running or task.status == TaskStatus.PAUSED:
-            return
+        with self._lock:
+            if not self._is_running or task.status == TaskStatus.PAUSED:
+                return
 
-        if task.interval_seconds is not None:
-            # Calculate next run time
-            next_run = datetime.now().timestamp() + task.interval_seconds
-            task.next_run = datetime.fromtimestamp(next_run)
+            if task.interval_seconds is not None:
+                # Calculate next run time
+                task.next_run = datetime.now() + timedelta(seconds=task.interval_seconds)
 
-            # Schedule the task
-            self._scheduler.enter(
-                task.interval_seconds,
-                1,  # Priority
-                self._execute_task,
-                (task,)
-            )
+                # Schedule the task
+                self._push(
+                    task.interval_seconds, "run", task.task_id,
+                    self._generations.get(task.task_id, 0)
+                )
 
-            # Reset status to pending
-            with self._lock:
+                # Reset status to pending
                 task.status = TaskStatus.PENDING
 
     def _schedule_one_time_task(self, task: ScheduledTask, delay_seconds: int = 0):
@@ -203,65 +282,139 @@ class TaskScheduler:
             task: ScheduledTask to schedule
             delay_seconds: Delay before execution (default: 0 = immediate)
         """
-        if not self._is_running:
-            return
+        with self._lock:
+            if not self._is_running:
+                return
 
-        # Calculate run time
-        next_run = datetime.now().timestamp() + delay_seconds
-        task.next_run = datetime.fromtimestamp(next_run)
+            # Calculate run time
+            task.next_run = datetime.now() + timedelta(seconds=delay_seconds)
 
-        # Schedule the task
-        self._scheduler.enter(
-            delay_seconds,
-            1,  # Priority
-            self._execute_task,
-            (task,)
-        )
+            # Schedule the task
+            self._push(delay_seconds, "run", task.task_id, self._generations.get(task.task_id, 0))
+
+    def _schedule_event_task(self, task: ScheduledTask):
+        """
+        Arm an event-triggered task.
 
-    def _check_event_triggered_tasks(self):
-        """Check and execute event-triggered tasks if conditions are met."""
-        if not self._is_running:
+        Tasks with trigger_events subscribe to the EventBus; others have
+        their trigger checked now and then every TRIGGER_RECHECK_SECONDS.
+
+        Args:
+            task: ScheduledTask to arm
+        """
+        with self._lock:
+            if not self._is_running:
+                return
+
+            if task.trigger_events:
+                for event_type in task.trigger_events:
+                    self._subscribe(event_type)
+            else:
+                self._push(0, "trigger", task.task_id, self._generations.get(task.task_id, 0))
+
+    def _subscribe(self, event_type: Any):
+        """Reference-counted EventBus subscription (lock held)."""
+        count = self._subscriptions.get(event_type, 0)
+        self._subscriptions[event_type] = count + 1
+        if count == 0:
+            from data.events import EventBus
+            bus = EventBus()
+            bus.subscribe(event_type, self._on_bus_event)
+            bus.start()
+
+    def _unsubscribe(self, event_type: Any):
+        """Drop one reference to an EventBus subscription (lock held)."""
+        count = self._subscriptions.get(event_type, 0) - 1
+        if count > 0:
+            self._subscriptions[event_type] = count
             return
+        self._subscriptions.pop(event_type, None)
+        from data.events import EventBus
+        EventBus().unsubscribe(event_type, self._on_bus_event)
 
+    def _on_bus_event(self, event):
+        """Queue a trigger check for every pending task bound to this event."""
         with self._lock:
-            event_tasks = [
-                task for task in self._tasks.values()
-                if task.schedule_type == ScheduleType.EVENT_TRIGGERED
-                and task.status == TaskStatus.PENDING
-                and task.trigger_condition is not None
-            ]
+            if not self._is_running:
+                return
+            for task in self._tasks.values():
+                if (task.status == TaskStatus.PENDING
+                        and event.event_type in task.trigger_events):
+                    self._push(0, "trigger", task.task_id, self._generations.get(task.task_id, 0))
 
-        for task in event_tasks:
-            try:
-                # Check if trigger condition is met
-                if task.trigger_condition():
-                    self._execute_task(task)
-            except Exception as e:
-                task.last_error = f"Trigger check failed: {str(e)}"
-
-        # Reschedule event check
-        if self._is_running:
-            self._scheduler.enter(
-                5,  # Check every 5 seconds
-                2,  # Lower priority than regular tasks
-                self._check_event_triggered_tasks,
-                ()
-            )
+    def _check_trigger(self, task: ScheduledTask):
+        """
+        Evaluate an event-triggered task's condition and run it if met.
 
-    def _scheduler_loop(self):
-        """Main scheduler loop running in separate thread."""
-        # Start event-triggered task checker
-        self._scheduler.enter(5, 2, self._check_event_triggered_tasks, ())
+        Args:
+            task: Event-triggered ScheduledTask
+        """
+        if task.status != TaskStatus.PENDING or task.trigger_condition is None:
+            return
 
-        # Run scheduler
-        while not self._stop_event.is_set():
-            try:
-                # Run pending tasks
-                self._scheduler.run(blocking=False)
-                time.sleep(0.1)  # Short sleep to prevent CPU spinning
-            except Exception:
-                # Continue running even if there's an error
-                pass
+        try:
+            # Check if trigger condition is met
+            if task.trigger_condition():
+                self._execute_task(task)
+                return
+        except Exception as e:
+            task.last_error = f"Trigger check failed: {str(e)}"
+
+        # Triggers without events keep being re-checked
+        if not task.trigger_events:
+            with self._lock:
+                if self._is_running:
+                    self._push(
+                        TRIGGER_RECHECK_SECONDS, "trigger", task.task_id,
+                        self._generations.get(task.task_id, 0)
+                    )
+
+    def _expire_run(self, task: ScheduledTask, run_id: int):
+        """Fail a run that exceeded its timeout (lock held)."""
+        if self._current_run.get(task.task_id) != run_id:
+            return
+        del self._current_run[task.task_id]
+        self._running_tasks.discard(task.task_id)
+        task.error_count += 1
+        task.last_error = f"Timed out after {task.timeout_seconds}s"
+        if task.status == TaskStatus.RUNNING:
+            task.status = TaskStatus.FAILED
+        if task.schedule_type == ScheduleType.RECURRING:
+            self._schedule_recurring_task(task)
+
+    def _scheduler_loop(self):
+        """Main scheduler loop: sleep until the next deadline, then dispatch."""
+        while True:
+            with self._wakeup:
+                if self._stop_event.is_set():
+                    return
+
+                now = time.monotonic()
+                due = []
+                while self._heap and self._heap[0][0] <= now:
+                    _, _, kind, task_id, token = heapq.heappop(self._heap)
+                    task = self._tasks.get(task_id)
+                    if task is None:
+                        continue
+                    if kind == "timeout":
+                        self._expire_run(task, token)
+                    elif token == self._generations.get(task_id, 0):
+                        due.append((kind, task))
+
+                if not due:
+                    timeout = self._heap[0][0] - now if self._heap else None
+                    self._wakeup.wait(timeout)
+                    continue
+
+            for kind, task in due:
+                try:
+                    if kind == "trigger":
+                        self._check_trigger(task)
+                    else:
+                        self._execute_task(task)
+                except Exception:
+                    # Continue running even if there's an error
+                    pass
 
     def register_task(
         self,
@@ -270,7 +423,9 @@ class TaskScheduler:
         schedule_type: str,
         interval_seconds: Optional[int] = None,
         trigger_condition: Optional[Callable[[], bool]] = None,
-        target_providers: Optional[List[str]] = None
+        target_providers: Optional[List[str]] = None,
+        trigger_events: Optional[List[Any]] = None,
+        timeout_seconds: Optional[float] = DEFAULT_TASK_TIMEOUT_SECONDS
     ) -> ScheduledTask:
         """
         Register a new task with the scheduler.
@@ -282,6 +437,10 @@ class TaskScheduler:
             interval_seconds: Interval for recurring tasks
             trigger_condition: Condition function for event-triggered tasks
             target_providers: List of provider names this task monitors
+            trigger_events: EventBus event types (EventType or name) that
+                            re-check the trigger; without them it is polled
+            timeout_seconds: Run time before the task is marked failed
+                             (None disables the timeout)
 
         Returns:
             ScheduledTask instance
@@ -309,6 +468,17 @@ class TaskScheduler:
             if sched_type == ScheduleType.EVENT_TRIGGERED and trigger_condition is None:
                 raise ValueError("Event-triggered tasks require trigger_condition")
 
+            event_types = []
+            if trigger_events:
+                from data.events import EventType
+                for event_type in trigger_events:
+                    if isinstance(event_type, str):
+                        try:
+                            event_type = EventType[event_type.upper()]
+                        except KeyError:
+                            raise ValueError(f"Unknown trigger event: {event_type}")
+                    event_types.append(event_type)
+
             # Create task
             task = ScheduledTask(
                 task_id=task_id,
@@ -316,7 +486,9 @@ class TaskScheduler:
                 schedule_type=sched_type,
                 interval_seconds=interval_seconds,
                 trigger_condition=trigger_condition,
-                target_providers=target_providers or []
+                target_providers=target_providers or [],
+                timeout_seconds=timeout_seconds,
+                trigger_events=event_types
             )
 
             # Register task
@@ -328,10 +500,33 @@ class TaskScheduler:
                     self._schedule_recurring_task(task)
                 elif sched_type == ScheduleType.ONE_TIME:
                     self._schedule_one_time_task(task)
-                # Event-triggered tasks are checked periodically
+                else:
+                    self._schedule_event_task(task)
 
             return task
 
+    def cancel_task(self, task_id: str):
+        """
+        Remove a task; queued runs are dropped and a running one finishes unrecorded.
+
+        Args:
+            task_id: ID of task to cancel
+
+        Raises:
+            KeyError: If task_id not found
+        """
+        with self._lock:
+            if task_id not in self._tasks:
+                raise KeyError(f"Task '{task_id}' not found")
+
+            task = self._tasks.pop(task_id)
+            self._cancel_pending(task_id)
+            self._current_run.pop(task_id, None)
+            self._running_tasks.discard(task_id)
+            if self._is_running:
+                for event_type in task.trigger_events:
+                    self._unsubscribe(event_type)
+
     def start(self):
         """
         Start the scheduler (lazy - only when automation enabled).
@@ -344,20 +539,27 @@ class TaskScheduler:
 
             self._is_running = True
             self._stop_event.clear()
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_CONCURRENT_TASKS,
+                thread_name_prefix="FrankensteinTask"
+            )
 
             # Start scheduler thread
             self._scheduler_thread = threading.Thread(
                 target=self._scheduler_loop,
-                daemon=True
+                daemon=True,
+                name="FrankensteinScheduler"
             )
             self._scheduler_thread.start()
 
-            # Schedule all registered recurring and one-time tasks
+            # Schedule all registered tasks
             for task in self._tasks.values():
                 if task.schedule_type == ScheduleType.RECURRING:
                     self._schedule_recurring_task(task)
                 elif task.schedule_type == ScheduleType.ONE_TIME:
                     self._schedule_one_time_task(task)
+                else:
+                    self._schedule_event_task(task)
 
     def stop(self):
         """
@@ -373,21 +575,34 @@ class TaskScheduler:
             self._stop_event.set()
 
             # Clear scheduler queue
-            for event in self._scheduler.queue:
-                try:
-                    self._scheduler.cancel(event)
-                except ValueError:
-                    pass
-
-            # Wait for scheduler thread to finish
-            if self._scheduler_thread and self._scheduler_thread.is_alive():
-                self._scheduler_thread.join(timeout=5)
+            self._heap.clear()
+            for task_id in self._tasks:
+                self._generations[task_id] = self._generations.get(task_id, 0) + 1
+            self._wakeup.notify_all()
+
+            # Drop EventBus subscriptions
+            for event_type in list(self._subscriptions):
+                self._subscriptions[event_type] = 1
+                self._unsubscribe(event_type)
+
+            # Running tasks finish in the background; their results are dropped
+            self._current_run.clear()
+            self._running_tasks.clear()
+            executor, self._executor = self._executor, None
+            scheduler_thread = self._scheduler_thread
 
             # Reset all task statuses
             for task in self._tasks.values():
                 if task.status == TaskStatus.RUNNING:
                     task.status = TaskStatus.PAUSED
 
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        # Wait for scheduler thread to finish (outside the lock it needs)
+        if scheduler_thread and scheduler_thread.is_alive():
+            scheduler_thread.join(timeout=5)
+
     def pause_task(self, task_id: str):
         """
         Pause a specific task.
@@ -404,6 +619,7 @@ class TaskScheduler:
 
             task = self._tasks[task_id]
             task.status = TaskStatus.PAUSED
+            self._cancel_pending(task_id)
 
     def resume_task(self, task_id: str):
         """
@@ -420,7 +636,14 @@ class TaskScheduler:
                 raise KeyError(f"Task '{task_id}' not found")
 
             task = self._tasks[task_id]
-            task.status = TaskStatus.PENDING
+            if task_id in self._current_run:
+                # The in-flight run reschedules itself in _finish_run; pushing
+                # here too would start a second schedule chain
+                task.status = TaskStatus.RUNNING
+                if task.schedule_type != ScheduleType.EVENT_TRIGGERED:
+                    return
+            else:
+                task.status = TaskStatus.PENDING
 
             # Reschedule if scheduler is running
             if self._is_running:
@@ -428,6 +651,8 @@ class TaskScheduler:
                     self._schedule_recurring_task(task)
                 elif task.schedule_type == ScheduleType.ONE_TIME:
                     self._schedule_one_time_task(task)
+                elif not task.trigger_events:
+                    self._schedule_event_task(task)
 
     def get_active_tasks(self) -> List[ScheduledTask]:
         """
@@ -49,6 +49,43 @@ class WorkflowEngine:
         # User consent flags - set to False to require permission
         self.user_consent_to_terminate = {}
 
+        # Job queue (opened lazily) and provider_id -> backend with submit(jobs)
+        self.job_queue = None
+        self.job_backends: Dict[str, Any] = {}
+
+    def _get_job_queue(self):
+        """Open the persistent job queue on first use."""
+        if self.job_queue is None:
+            from automation.job_queue import get_job_queue
+            self.job_queue = get_job_queue()
+        return self.job_queue
+
+    def register_job_backend(self, provider_id: str, backend: Any):
+        """
+        Register the backend that receives batched submissions for a provider lane.
+
+        Args:
+            provider_id: Router provider id (e.g. 'local_simulator')
+            backend: Object with submit(List[Job]) -> List[result]
+        """
+        self.job_backends[provider_id] = backend
+
+    def _run_job_queue(self, kind: str) -> Dict[str, Any]:
+        """Reclaim, reorder and submit one kind of queued jobs."""
+        queue = self._get_job_queue()
+        reclaimed = queue.reclaim_expired()
+        reordered = queue.reorder(kind=kind)
+        processed = queue.process(self.job_backends, kind=kind) if self.job_backends else {
+            "batches": 0, "completed": 0, "retried": 0, "failed": 0
+        }
+        stats = queue.stats(kind=kind)
+        return {
+            "reclaimed": reclaimed,
+            "reordered": reordered,
+            "processed": processed,
+            "stats": stats,
+        }
+
     def _check_resources(self) -> Dict[str, float]:
         """
         Check current resource usage.
@@ -161,13 +198,20 @@ class WorkflowEngine:
                 details=f"Optimizing queue for {len(quantum_providers)} quantum providers"
             )
 
-            # Placeholder: In production, this would interact with actual job queue
+            queue_run = self._run_job_queue("quantum")
+            processed = queue_run["processed"]
+
             result = {
                 "status": "success",
                 "providers_checked": len(quantum_providers),
                 "providers": quantum_providers,
-                "jobs_reordered": 0,  # Would be actual count
-                "jobs_rescheduled": 0,  # Would be actual count
+                "jobs_reordered": queue_run["reordered"],
+                "jobs_rescheduled": queue_run["reclaimed"] + processed["retried"],
+                "jobs_completed": processed["completed"],
+                "jobs_failed": processed["failed"],
+                "batches_submitted": processed["batches"],
+                "queue_depth": queue_run["stats"]["depth"],
+                "lanes": queue_run["stats"]["lanes"],
                 "timestamp": datetime.now().isoformat()
             }
 
@@ -217,11 +261,20 @@ class WorkflowEngine:
                 details=f"Optimizing queue for {len(classical_providers)} classical providers"
             )
 
+            queue_run = self._run_job_queue("classical")
+            processed = queue_run["processed"]
+
             result = {
                 "status": "success",
                 "providers_checked": len(classical_providers),
                 "providers": classical_providers,
-                "jobs_routed": 0,
+                "jobs_routed": processed["completed"],
+                "jobs_reordered": queue_run["reordered"],
+                "jobs_rescheduled": queue_run["reclaimed"] + processed["retried"],
+                "jobs_failed": processed["failed"],
+                "batches_submitted": processed["batches"],
+                "queue_depth": queue_run["stats"]["depth"],
+                "lanes": queue_run["stats"]["lanes"],
                 "load_balanced": True,
                 "timestamp": datetime.now().isoformat()
             }
@@ -0,0 +1,948 @@
+"""
+FRANKENSTEIN 1.0 - Search Index
+Persistent incremental file and content index
+
+Sauron's search tools and the terminal's find/grep used to walk the tree and
+read every file on every query. SearchIndex keeps, per indexed root:
+
+    path trie       directory nodes -> {name: file id}; answers subtree,
+                    depth and directory-name queries without touching disk
+    name trigrams   posting lists over lower-cased file names, so a glob
+                    like "*.py" or "test_*" only checks candidate names
+    content trigrams posting lists over case-folded file contents; a regex
+                    is reduced to the literals every match must contain and
+                    only files holding all of their trigrams are read
+
+Posting lists are sorted numpy arrays (CSR layout) plus a small delta map
+for incremental additions. Changed files get a fresh id and the old id is
+tombstoned, so an update never rewrites a posting list in place.
+
+Refresh compares (inode, size, mtime_ns) from one scandir pass against the
+file table and re-reads only what changed. Each refresh publishes a new
+immutable snapshot, so queries never wait on a refresh. The index is saved
+to ~/.frankenstein/search_index/ and reloaded on the next start; the first
+refresh after a load is then a stat-only delta scan.
+
+Queries return candidates. Callers still verify against the file itself, so
+a stale snapshot can only miss content written since the last refresh, never
+report content that is gone.
+
+Usage:
+    index = get_search_index("/path/to/project")
+    if index.ensure_fresh():
+        hits = index.find("*.py", under="/path/to/project/src")
+        files = index.content_candidates(r"def \\w+_search", under="/path/to/project")
+"""
+
+import fnmatch
+import hashlib
+import logging
+import os
+import threading
+import time
+import zipfile
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+
+try:
+    from re import _parser as _sre_parse      # Python 3.11+
+except ImportError:                           # pragma: no cover
+    import sre_parse as _sre_parse
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+INDEX_DIR = Path.home() / ".frankenstein" / "search_index"
+INDEX_FORMAT = 1                # Bump when the on-disk layout changes
+
+MAX_INDEXED_FILES = 100_000     # Larger trees are not indexed (callers walk)
+MAX_CONTENT_BYTES = 2_097_152   # 2 MB — larger text files are always candidates
+BINARY_PROBE_BYTES = 8192       # A NUL byte in this prefix marks a file binary
+REFRESH_INTERVAL = 2.0          # Seconds a snapshot is served before a re-scan
+SAVE_INTERVAL = 30.0            # Minimum seconds between index saves
+DELTA_MERGE_PAIRS = 200_000     # Delta postings merged into the CSR past this
+MIN_LITERAL = 3                 # Trigram length
+SORT_CANDIDATES = 2048          # Above this, candidates are filtered in a trie walk
+
+# File kinds in the file table
+KIND_TEXT = 0                   # Content trigrams indexed
+KIND_LARGE = 1                  # Text, too large to index — always a candidate
+KIND_BINARY = 2                 # Never a content candidate
+KIND_UNREADABLE = 3             # Always a candidate; the caller reports the error
+
+_EMPTY_IDS = np.empty(0, dtype=np.uint32)
+
+
+# ── Case folding ───────────────────────────────────────────────────────────────
+
+def _build_fold_table() -> dict:
+    """
+    Map characters that re.IGNORECASE treats as equal to one representative.
+
+    str.lower() alone misses pairs such as 'ſ'/'s' or 'ς'/'σ'; the regex
+    engine's own table of extra cases covers them.
+    """
+    table = {}
+    try:
+        from re import _casefix
+        for low, extras in _casefix._EXTRA_CASES.items():
+            group = (low,) + tuple(extras)
+            canon = min(group)
+            for code in group:
+                if code != canon:
+                    table[code] = chr(canon)
+    except (ImportError, AttributeError):
+        table.update({0x131: "i", 0x17F: "s", 0x212A: "k"})
+    return table
+
+
+_FOLD_TABLE = _build_fold_table()
+
+
+def fold_text(text: str) -> str:
+    """Case-fold text the same way indexed content is folded."""
+    if text.isascii():
+        return text.lower()
+    return text.replace("İ", "i").lower().translate(_FOLD_TABLE)
+
+
+def _fold_bytes(data: bytes) -> bytes:
+    if data.isascii():
+        return data.lower()
+    return fold_text(data.decode("utf-8", errors="replace")).encode("utf-8")
+
+
+def trigram_codes(data: bytes) -> np.ndarray:
+    """Sorted unique 24-bit trigram codes of a byte string."""
+    if len(data) < MIN_LITERAL:
+        return _EMPTY_IDS
+    a = np.frombuffer(data, dtype=np.uint8).astype(np.uint32)
+    return np.unique((a[:-2] << 16) | (a[1:-1] << 8) | a[2:])
+
+
+# ── Literal extraction ─────────────────────────────────────────────────────────
+
+def _collect_literals(items, out: List[str]) -> None:
+    run: List[str] = []
+    for op, av in items:
+        if op is _sre_parse.LITERAL:
+            run.append(chr(av))
+            continue
+        if run:
+            out.append("".join(run))
+            run = []
+        if op is _sre_parse.SUBPATTERN:
+            _collect_literals(av[-1], out)
+        elif op in (_sre_parse.MAX_REPEAT, _sre_parse.MIN_REPEAT) and av[0] >= 1:
+            _collect_literals(av[2], out)
+    if run:
+        out.append("".join(run))
+
+
+def regex_literals(pattern: str, flags: int = 0) -> List[str]:
+    """
+    Literal strings that every match of a regex must contain.
+
+    Only mandatory parts are used: alternations and optional repeats are
+    skipped, so the result is safe (possibly empty) for any pattern.
+    """
+    try:
+        parsed = _sre_parse.parse(pattern, flags)
+    except Exception:
+        return []
+    literals: List[str] = []
+    _collect_literals(parsed, literals)
+    return [lit for lit in literals if len(lit) >= MIN_LITERAL]
+
+
+def glob_runs(pattern: str) -> List[str]:
+    """
+    Literal runs of a glob pattern, split at *, ? and [...] classes.
+
+    The first and last runs are the pattern's leading and trailing
+    literals ("" when it starts or ends with a wildcard).
+    """
+    runs, run, i = [], [], 0
+    while i < len(pattern):
+        ch = pattern[i]
+        if ch in "*?":
+            runs.append("".join(run))
+            run = []
+        elif ch == "[" and pattern.find("]", i + 2) != -1:
+            runs.append("".join(run))
+            run = []
+            i = pattern.find("]", i + 2)
+        else:
+            run.append(ch)
+        i += 1
+    runs.append("".join(run))
+    return runs
+
+
+# ── Posting lists ──────────────────────────────────────────────────────────────
+
+class _Postings:
+    """
+    Trigram -> sorted file-id array, in CSR form plus a copy-on-write delta.
+
+    Instances are never mutated after publication: with_added() returns a
+    new object sharing the immutable CSR arrays.
+    """
+
+    __slots__ = ("codes", "offsets", "ids", "delta", "delta_pairs")
+
+    def __init__(self, codes=None, offsets=None, ids=None, delta=None, delta_pairs=0):
+        self.codes = codes if codes is not None else _EMPTY_IDS
+        self.offsets = offsets if offsets is not None else np.zeros(1, dtype=np.int64)
+        self.ids = ids if ids is not None else _EMPTY_IDS
+        self.delta: Dict[int, Tuple[int, ...]] = delta or {}
+        self.delta_pairs = delta_pairs
+
+    @classmethod
+    def from_pairs(cls, codes: np.ndarray, ids: np.ndarray) -> "_Postings":
+        if codes.size == 0:
+            return cls()
+        order = np.lexsort((ids, codes))
+        codes, ids = codes[order], ids[order].astype(np.uint32)
+        unique, starts = np.unique(codes, return_index=True)
+        offsets = np.append(starts, codes.size).astype(np.int64)
+        return cls(unique.astype(np.uint32), offsets, ids)
+
+    def pairs(self) -> Tuple[np.ndarray, np.ndarray]:
+        """All (code, id) pairs, delta included."""
+        counts = np.diff(self.offsets)
+        codes = [np.repeat(self.codes, counts)]
+        ids = [self.ids]
+        for code, fids in self.delta.items():
+            codes.append(np.full(len(fids), code, dtype=np.uint32))
+            ids.append(np.asarray(fids, dtype=np.uint32))
+        return np.concatenate(codes).astype(np.uint32), np.concatenate(ids).astype(np.uint32)
+
+    def with_added(self, fids: List[int], code_arrays: List[np.ndarray]) -> "_Postings":
+        added = sum(len(c) for c in code_arrays)
+        if not added:
+            return self
+        if self.delta_pairs + added > DELTA_MERGE_PAIRS:
+            codes, ids = self.pairs()
+            new_ids = np.repeat(np.asarray(fids, dtype=np.uint32), [len(c) for c in code_arrays])
+            return _Postings.from_pairs(
+                np.concatenate([codes] + code_arrays).astype(np.uint32),
+                np.concatenate([ids, new_ids]),
+            )
+        additions: Dict[int, List[int]] = {}
+        for fid, codes in zip(fids, code_arrays):
+            for code in codes.tolist():
+                additions.setdefault(code, []).append(fid)
+        delta = dict(self.delta)
+        for code, new_ids in additions.items():
+            delta[code] = delta.get(code, ()) + tuple(new_ids)
+        return _Postings(self.codes, self.offsets, self.ids, delta, self.delta_pairs + added)
+
+    def lookup(self, code: int) -> np.ndarray:
+        pos = np.searchsorted(self.codes, code)
+        if pos < self.codes.size and self.codes[pos] == code:
+            base = self.ids[self.offsets[pos]:self.offsets[pos + 1]]
+        else:
+            base = _EMPTY_IDS
+        extra = self.delta.get(code)
+        if extra:
+            # Ids only grow, so delta ids all sort after the CSR ids
+            return np.concatenate((base, np.asarray(extra, dtype=np.uint32)))
+        return base
+
+    def candidates(self, literals: List[bytes], id_count: int) -> Optional[np.ndarray]:
+        """
+        Ids present in the postings of every trigram of every literal.
+
+        Returns None when the literals give no trigram (no filtering possible).
+        """
+        codes = set()
+        for lit in literals:
+            codes.update(trigram_codes(lit).tolist())
+        if not codes:
+            return None
+        lists = sorted((self.lookup(code) for code in codes), key=len)
+        result = lists[0]
+        member = np.zeros(id_count, dtype=bool)
+        for ids in lists[1:]:
+            if result.size == 0:
+                break
+            member[ids] = True
+            result = result[member[result]]
+            member[ids] = False
+        return result
+
+    def compacted(self, remap: np.ndarray) -> "_Postings":
+        """Merge the delta and renumber ids through remap (-1 = dropped)."""
+        codes, ids = self.pairs()
+        new_ids = remap[ids] if ids.size else ids.astype(np.int64)
+        keep = new_ids >= 0
+        return _Postings.from_pairs(codes[keep], new_ids[keep].astype(np.uint32))
+
+
+# ── Snapshot ───────────────────────────────────────────────────────────────────
+
+class _DirNode:
+    """One directory in the path trie."""
+
+    __slots__ = ("dirs", "files", "_order")
+
+    def __init__(self):
+        self.dirs: Dict[str, "_DirNode"] = {}
+        self.files: Dict[str, int] = {}
+        self._order = None
+
+    def order(self) -> Tuple[List[Tuple[str, int]], List[Tuple[str, "_DirNode"]]]:
+        """(sorted files, sorted dirs); cached, nodes are immutable once published."""
+        if self._order is None:
+            self._order = (sorted(self.files.items()), sorted(self.dirs.items()))
+        return self._order
+
+
+@dataclass
+class _Snapshot:
+    """Immutable index state; refresh publishes a new one."""
+    tree: _DirNode
+    paths: List[Optional[str]]                  # fid -> path relative to root
+    stats: List[Tuple[int, int, int]]           # fid -> (inode, size, mtime_ns)
+    kinds: List[int]                            # fid -> KIND_*
+    alive: np.ndarray                           # fid -> bool
+    by_path: Dict[str, int]
+    names: _Postings
+    content: _Postings
+    unindexed: np.ndarray                       # Live KIND_LARGE / KIND_UNREADABLE ids
+    built_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def live_files(self) -> int:
+        return len(self.by_path)
+
+
+def _walk_key(rel: str, is_dir: bool) -> Tuple[Tuple[str, ...], int, str]:
+    """Sort key reproducing os.walk order: a directory's files, its
+    subdirectory names, then the subdirectories' contents."""
+    parts = rel.split(os.sep)
+    return tuple(parts[:-1]), 1 if is_dir else 0, parts[-1]
+
+
+def _unindexed_ids(kinds: List[int], fids) -> List[int]:
+    return [fid for fid in fids if kinds[fid] in (KIND_LARGE, KIND_UNREADABLE)]
+
+
+@dataclass
+class _ScanResult:
+    tree: _DirNode
+    by_path: Dict[str, int]
+    added: List[Tuple[str, Tuple[int, int, int]]] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+
+
+class _TooManyFiles(Exception):
+    pass
+
+
+# ── Index ──────────────────────────────────────────────────────────────────────
+
+class SearchIndex:
+    """
+    Path trie and trigram index for one directory tree.
+
+    Thread-safe. Queries read the current snapshot without locking; refresh
+    runs single-flight, on the caller's thread or in the background.
+    """
+
+    def __init__(self, root: Union[str, Path], index_dir: Optional[Path] = None,
+                 refresh_interval: float = REFRESH_INTERVAL):
+        """
+        Args:
+            root:             Directory tree to index
+            index_dir:        Where the index file is kept (None = not persisted)
+            refresh_interval: Seconds before ensure_fresh() schedules a re-scan
+        """
+        self.root = Path(root).resolve()
+        self.refresh_interval = refresh_interval
+        self.index_path: Optional[Path] = None
+        if index_dir is not None:
+            digest = hashlib.sha1(str(self.root).encode("utf-8")).hexdigest()[:16]
+            self.index_path = Path(index_dir) / f"{digest}.npz"
+
+        self.oversized = False
+        self._snapshot: Optional[_Snapshot] = None
+        self._loaded = False
+        self._stale = True
+        self._last_save = 0.0
+        self._unsaved = False
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+
+    # ── Freshness ──────────────────────────────────────────────────────────────
+
+    @property
+    def ready(self) -> bool:
+        """True once a snapshot is available for queries."""
+        return self._snapshot is not None and not self.oversized
+
+    def ensure_fresh(self, block: bool = False) -> bool:
+        """
+        Make sure a refresh is pending or done if the snapshot is old.
+
+        Args:
+            block: Refresh on this thread instead of in the background
+
+        Returns:
+            True if queries can be answered from the index right now
+        """
+        if self.oversized:
+            return False
+        snapshot = self._snapshot
+        if snapshot is not None and self._stale:
+            # Explicitly invalidated (a known write): answer from a re-scan
+            block = True
+        if (self._stale or snapshot is None
+                or time.monotonic() - snapshot.built_at > self.refresh_interval):
+            if block:
+                self.refresh()
+            else:
+                self._schedule_refresh()
+        return self.ready
+
+    def invalidate(self) -> None:
+        """Mark the snapshot stale; the next ensure_fresh() re-scans."""
+        self._stale = True
+
+    def refresh(self) -> Dict[str, int]:
+        """
+        Bring the index up to date with the filesystem.
+
+        Returns:
+            Counts of added / updated / removed files
+        """
+        with self._refresh_lock:
+            self._stale = False
+            if not self._loaded:
+                self._loaded = True
+                self._load()
+
+            snapshot = self._snapshot
+            try:
+                scan = self._scan(snapshot)
+            except _TooManyFiles:
+                if not self.oversized:
+                    logger.info("Search index: %s has more than %d files, not indexing",
+                                self.root, MAX_INDEXED_FILES)
+                self.oversized = True
+                self._snapshot = None
+                return {"added": 0, "updated": 0, "removed": 0}
+
+            self.oversized = False
+            new = self._apply(snapshot, scan)
+            self._snapshot = new
+
+            added_paths = {rel for rel, _ in scan.added}
+            updated = sum(1 for fid in scan.removed if snapshot.paths[fid] in added_paths)
+            counts = {
+                "added": len(scan.added) - updated,
+                "updated": updated,
+                "removed": len(scan.removed) - updated,
+            }
+            if scan.added or scan.removed:
+                self._unsaved = True
+                logger.debug("Search index %s: %s", self.root, counts)
+            if self._unsaved and time.monotonic() - self._last_save >= SAVE_INTERVAL:
+                self.save()
+            return counts
+
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an in-flight background refresh to finish.
+
+        Returns:
+            True if no refresh is running when this returns
+        """
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+
+    def _schedule_refresh(self) -> None:
+        """Start a single-flight background refresh."""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._background_refresh,
+                daemon=True,
+                name="SearchIndex-Refresh",
+            )
+            self._refresh_thread.start()
+
+    def _background_refresh(self) -> None:
+        try:
+            self.refresh()
+        except Exception as e:
+            logger.warning("Search index refresh failed for %s: %s", self.root, e)
+
+    # ── Queries ────────────────────────────────────────────────────────────────
+
+    def find(
+        self,
+        pattern: str = "*",
+        under: Optional[Union[str, Path]] = None,
+        max_depth: Optional[int] = None,
+        include_dirs: bool = False,
+        ignore_case: bool = False,
+        match_path: bool = True,
+        limit: Optional[int] = None,
+    ) -> List[Tuple[Path, bool]]:
+        """
+        Files (and optionally directories) matching a glob, in os.walk order.
+
+        Files match on their name or full path, directories on their name,
+        as fnmatch does.
+
+        Args:
+            pattern:      Glob pattern
+            under:        Restrict to this directory (default: the index root)
+            max_depth:    Directory depth below `under` (0 = its direct entries)
+            include_dirs: Also return matching directories
+            ignore_case:  Match case-insensitively
+            match_path:   Also match files on their full path
+            limit:        Stop after this many hits
+
+        Returns:
+            [(path, is_dir)]; empty if the snapshot is not ready
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return []
+        located = self._locate(snapshot, under)
+        if located is None:
+            return []
+        prefix, node = located
+        fold = str.lower if ignore_case else (lambda text: text)
+        if ignore_case:
+            pattern = pattern.lower()
+
+        literals = self._name_literals(pattern, fold, match_path)
+        candidates = snapshot.names.candidates(
+            [fold_text(lit).encode("utf-8") for lit in literals], len(snapshot.paths)
+        )
+
+        root = str(self.root)
+        hits: List[Tuple[Path, bool]] = []
+        for rel, is_dir in self._entries(snapshot, node, prefix, max_depth,
+                                         candidates, include_dirs):
+            name = fold(rel.rsplit(os.sep, 1)[-1])
+            if fnmatch.fnmatch(name, pattern) or (
+                    match_path and not is_dir
+                    and fnmatch.fnmatch(fold(root + os.sep + rel), pattern)):
+                hits.append((self.root / rel, is_dir))
+                if limit is not None and len(hits) >= limit:
+                    break
+        return hits
+
+    def content_candidates(
+        self,
+        pattern: str,
+        flags: int = 0,
+        under: Optional[Union[str, Path]] = None,
+        file_pattern: str = "*",
+        max_depth: Optional[int] = None,
+    ) -> Iterator[Path]:
+        """
+        Files that may contain a match for a regex, lazily in os.walk order.
+
+        Binary files are excluded. Files too large to index, or unreadable
+        at index time, are always included.
+
+        Args:
+            pattern:      Regex the caller will search with
+            flags:        Its re flags
+            under:        Restrict to this directory (default: the index root)
+            file_pattern: Glob on file names
+            max_depth:    Directory depth below `under`
+        """
+        snapshot = self._snapshot
+        if snapshot is None:
+            return
+        located = self._locate(snapshot, under)
+        if located is None:
+            return
+        prefix, node = located
+
+        literals = [fold_text(lit).encode("utf-8") for lit in regex_literals(pattern, flags)]
+        candidates = snapshot.content.candidates(literals, len(snapshot.paths))
+        if candidates is not None:
+            # Text that is not content-indexed has to be searched regardless
+            if snapshot.unindexed.size:
+                candidates = np.union1d(candidates, snapshot.unindexed)
+
+        for rel, _ in self._entries(snapshot, node, prefix, max_depth, candidates, False):
+            if snapshot.kinds[snapshot.by_path[rel]] == KIND_BINARY:
+                continue
+            if fnmatch.fnmatch(rel.rsplit(os.sep, 1)[-1], file_pattern):
+                yield self.root / rel
+
+    def stats(self) -> dict:
+        """Size of the current snapshot."""
+        snapshot = self._snapshot
+        if snapshot is None:
+            return {"root": str(self.root), "ready": False, "oversized": self.oversized}
+        return {
+            "root": str(self.root),
+            "ready": True,
+            "files": snapshot.live_files,
+            "dead_ids": len(snapshot.paths) - snapshot.live_files,
+            "content_postings": int(snapshot.content.ids.size + snapshot.content.delta_pairs),
+            "name_postings": int(snapshot.names.ids.size + snapshot.names.delta_pairs),
+            "age_sec": round(time.monotonic() - snapshot.built_at, 2),
+        }
+
+    def _locate(self, snapshot: _Snapshot,
+                under: Optional[Union[str, Path]]) -> Optional[Tuple[str, _DirNode]]:
+        """(relative prefix, trie node) for a directory under the root."""
+        if under is None:
+            return "", snapshot.tree
+        try:
+            rel = Path(under).resolve().relative_to(self.root)
+        except ValueError:
+            return None
+        node = snapshot.tree
+        for part in rel.parts:
+            node = node.dirs.get(part)
+            if node is None:
+                return None
+        return (os.sep.join(rel.parts), node)
+
+    def _name_literals(self, pattern: str, fold, match_path: bool) -> List[str]:
+        """
+        Literals every file-name match of a glob must contain.
+
+        A pattern without a separator can still match a full path when it
+        opens with a wildcard; then only the trailing literal (a suffix of
+        any match, hence of the name) is safe to require.
+        """
+        if os.sep in pattern or "/" in pattern:
+            return []
+        runs = glob_runs(pattern)
+        if not match_path or (runs[0] and not fold(str(self.root)).startswith(runs[0])):
+            literals = runs                 # Full-path match impossible
+        else:
+            literals = runs[-1:] if len(runs) > 1 else []
+        return [lit for lit in literals if len(lit) >= MIN_LITERAL]
+
+    def _entries(self, snapshot: _Snapshot, node: _DirNode, prefix: str,
+                 max_depth: Optional[int], candidates: Optional[np.ndarray],
+                 include_dirs: bool) -> Iterator[Tuple[str, bool]]:
+        """
+        (relative path, is_dir) in os.walk order, files limited to candidates.
+
+        A short candidate list is filtered and sorted directly; otherwise the
+        trie is walked in order, so a caller that stops early does not pay
+        for the whole tree.
+        """
+        if candidates is not None and candidates.size <= SORT_CANDIDATES:
+            found = list(self._filter_fids(snapshot, candidates.tolist(), prefix, max_depth))
+            if include_dirs:
+                found.extend(self._walk_tree(node, prefix, max_depth, files=False))
+            found.sort(key=lambda entry: _walk_key(*entry))
+            return iter(found)
+        wanted = None
+        if candidates is not None and candidates.size * 2 < snapshot.live_files:
+            wanted = set(candidates.tolist())       # Dense sets filter too little to pay off
+        return self._walk_tree(node, prefix, max_depth, dirs=include_dirs, wanted=wanted)
+
+    @staticmethod
+    def _filter_fids(snapshot: _Snapshot, fids: List[int], prefix: str,
+                     max_depth: Optional[int]) -> Iterator[Tuple[str, bool]]:
+        """Live files among fids that lie under prefix within max_depth."""
+        base_depth = prefix.count(os.sep) + 1 if prefix else 0
+        for fid in fids:
+            rel = snapshot.paths[fid]
+            if rel is None:
+                continue
+            if prefix and not rel.startswith(prefix + os.sep):
+                continue
+            if max_depth is not None and rel.count(os.sep) - base_depth > max_depth:
+                continue
+            yield rel, False
+
+    @staticmethod
+    def _walk_tree(node: _DirNode, prefix: str, max_depth: Optional[int],
+                   files: bool = True, dirs: bool = True,
+                   wanted: Optional[set] = None) -> Iterator[Tuple[str, bool]]:
+        """Entries below a trie node in os.walk order: files, dir names, subtrees."""
+        stack = [(node, prefix, 0)]
+        while stack:
+            current, rel, depth = stack.pop()
+            if max_depth is not None and depth > max_depth:
+                continue
+            join = (rel + os.sep) if rel else ""
+            file_items, dir_items = current.order()
+            if files:
+                for name, fid in file_items:
+                    if wanted is None or fid in wanted:
+                        yield join + name, False
+            if dirs:
+                for name, _ in dir_items:
+                    yield join + name, True
+            for name, child in reversed(dir_items):
+                stack.append((child, join + name, depth + 1))
+
+    # ── Refresh internals ──────────────────────────────────────────────────────
+
+    def _skip_dir(self, path: str) -> bool:
+        return self.index_path is not None and path == str(self.index_path.parent)
+
+    def _scan(self, snapshot: Optional[_Snapshot]) -> _ScanResult:
+        """
+        One scandir pass: build the new trie and diff it against the snapshot.
+
+        Unchanged files keep their id. New and changed files are listed in
+        `added` (ids assigned in _apply); replaced or vanished ids in `removed`.
+        """
+        old_paths = snapshot.by_path if snapshot else {}
+        old_stats = snapshot.stats if snapshot else []
+        tree = _DirNode()
+        by_path: Dict[str, int] = {}
+        result = _ScanResult(tree=tree, by_path=by_path)
+        count = 0
+
+        stack = [(tree, str(self.root), "")]
+        while stack:
+            node, abs_dir, rel_dir = stack.pop()
+            try:
+                entries = list(os.scandir(abs_dir))
+            except OSError:
+                continue
+            for entry in entries:
+                rel = (rel_dir + os.sep + entry.name) if rel_dir else entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if self._skip_dir(entry.path):
+                            continue
+                        child = _DirNode()
+                        node.dirs[entry.name] = child
+                        stack.append((child, entry.path, rel))
+                        continue
+                    if not entry.is_file():
+                        continue
+                    st = entry.stat()
+                except OSError:
+                    continue
+
+                count += 1
+                if count > MAX_INDEXED_FILES:
+                    raise _TooManyFiles()
+
+                key = (st.st_ino, st.st_size, st.st_mtime_ns)
+                fid = old_paths.get(rel)
+                if fid is not None and old_stats[fid] == key:
+                    node.files[entry.name] = fid
+                    by_path[rel] = fid
+                else:
+                    node.files[entry.name] = -1            # Filled in by _apply
+                    result.added.append((rel, key))
+
+        result.removed = [fid for rel, fid in old_paths.items() if by_path.get(rel) != fid]
+        return result
+
+    def _read_file(self, rel: str, size: int) -> Tuple[int, np.ndarray]:
+        """(kind, content trigram codes) for one file."""
+        try:
+            with open(self.root / rel, "rb") as f:
+                if size > MAX_CONTENT_BYTES:
+                    head = f.read(BINARY_PROBE_BYTES)
+                    return (KIND_BINARY if b"\0" in head else KIND_LARGE), _EMPTY_IDS
+                data = f.read(MAX_CONTENT_BYTES + 1)
+        except OSError:
+            return KIND_UNREADABLE, _EMPTY_IDS
+        if b"\0" in data[:BINARY_PROBE_BYTES]:
+            return KIND_BINARY, _EMPTY_IDS
+        return KIND_TEXT, trigram_codes(_fold_bytes(data))
+
+    def _apply(self, snapshot: Optional[_Snapshot], scan: _ScanResult) -> _Snapshot:
+        """Read changed files and publish the next snapshot."""
+        if snapshot is None:
+            snapshot = _Snapshot(tree=_DirNode(), paths=[], stats=[], kinds=[],
+                                 alive=np.zeros(0, dtype=bool), by_path={},
+                                 names=_Postings(), content=_Postings(),
+                                 unindexed=_EMPTY_IDS)
+
+        paths = list(snapshot.paths)
+        stats = list(snapshot.stats)
+        kinds = list(snapshot.kinds)
+        new_fids, name_codes, content_codes = [], [], []
+
+        for rel, key in scan.added:
+            fid = len(paths)
+            kind, codes = self._read_file(rel, key[1])
+            paths.append(rel)
+            stats.append(key)
+            kinds.append(kind)
+            new_fids.append(fid)
+            content_codes.append(codes)
+            name = rel.rsplit(os.sep, 1)[-1]
+            name_codes.append(trigram_codes(fold_text(name).encode("utf-8")))
+            scan.by_path[rel] = fid
+            node = scan.tree
+            for part in rel.split(os.sep)[:-1]:
+                node = node.dirs[part]
+            node.files[name] = fid
+
+        alive = np.zeros(len(paths), dtype=bool)
+        alive[:snapshot.alive.size] = snapshot.alive
+        alive[new_fids] = True
+        if scan.removed:
+            alive[scan.removed] = False
+            for fid in scan.removed:
+                paths[fid] = None
+        unindexed = [fid for fid in snapshot.unindexed.tolist() if alive[fid]]
+        unindexed += _unindexed_ids(kinds, new_fids)
+
+        return _Snapshot(
+            tree=scan.tree,
+            paths=paths,
+            stats=stats,
+            kinds=kinds,
+            alive=alive,
+            by_path=scan.by_path,
+            names=snapshot.names.with_added(new_fids, name_codes),
+            content=snapshot.content.with_added(new_fids, content_codes),
+            unindexed=np.asarray(unindexed, dtype=np.uint32),
+        )
+
+    # ── Persistence ────────────────────────────────────────────────────────────
+
+    def save(self) -> bool:
+        """
+        Write the current snapshot to disk, dropping dead ids.
+
+        Returns:
+            True if the index was written
+        """
+        snapshot = self._snapshot
+        if self.index_path is None or snapshot is None:
+            return False
+
+        remap = np.full(len(snapshot.paths), -1, dtype=np.int64)
+        live = np.flatnonzero(snapshot.alive)
+        remap[live] = np.arange(live.size)
+        names = snapshot.names.compacted(remap)
+        content = snapshot.content.compacted(remap)
+        paths = [snapshot.paths[fid] for fid in live.tolist()]
+        stats = np.array([snapshot.stats[fid] for fid in live.tolist()],
+                         dtype=np.int64).reshape(-1, 3)
+
+        try:
+            self.index_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.index_path.with_suffix(".tmp.npz")
+            np.savez(
+                tmp,
+                format=np.array(INDEX_FORMAT),
+                root=np.array(str(self.root)),
+                paths=np.array("\0".join(paths)),
+                stats=stats,
+                kinds=np.array([snapshot.kinds[fid] for fid in live.tolist()], dtype=np.uint8),
+                name_codes=names.codes, name_offsets=names.offsets, name_ids=names.ids,
+                content_codes=content.codes, content_offsets=content.offsets,
+                content_ids=content.ids,
+            )
+            os.replace(tmp, self.index_path)
+        except OSError as e:
+            logger.warning("Could not save search index %s: %s", self.index_path, e)
+            return False
+
+        self._last_save = time.monotonic()
+        self._unsaved = False
+        return True
+
+    def _load(self) -> bool:
+        """Load a saved snapshot; the next scan turns it current."""
+        if self.index_path is None or not self.index_path.exists():
+            return False
+        try:
+            with np.load(self.index_path) as data:
+                # .item(), not str(): ndarray printing breaks if numpy was re-imported
+                if int(data["format"]) != INDEX_FORMAT or data["root"].item() != str(self.root):
+                    return False
+                joined = data["paths"].item()
+                paths = joined.split("\0") if joined else []
+                stats = [tuple(row) for row in data["stats"].tolist()]
+                kinds = data["kinds"].tolist()
+                names = _Postings(data["name_codes"], data["name_offsets"], data["name_ids"])
+                content = _Postings(data["content_codes"], data["content_offsets"],
+                                    data["content_ids"])
+        except (OSError, ValueError, KeyError, EOFError, zipfile.BadZipFile) as e:
+            # Corrupt or truncated snapshot; anything else is a bug and propagates
+            logger.warning("Discarding unreadable search index %s: %s", self.index_path, e)
+            return False
+
+        tree = _DirNode()
+        by_path = {}
+        for fid, rel in enumerate(paths):
+            by_path[rel] = fid
+            node = tree
+            parts = rel.split(os.sep)
+            for part in parts[:-1]:
+                node = node.dirs.setdefault(part, _DirNode())
+            node.files[parts[-1]] = fid
+
+        self._snapshot = _Snapshot(
+            tree=tree, paths=paths, stats=stats, kinds=kinds,
+            alive=np.ones(len(paths), dtype=bool), by_path=by_path,
+            names=names, content=content,
+            unindexed=np.asarray(_unindexed_ids(kinds, range(len(paths))), dtype=np.uint32),
+            built_at=0.0,
+        )
+        self._last_save = time.monotonic()
+        logger.debug("Loaded search index for %s (%d files)", self.root, len(paths))
+        return True
+
+
+# ── Registry ───────────────────────────────────────────────────────────────────
+
+_indexes: Dict[Path, SearchIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_search_index(path: Union[str, Path]) -> SearchIndex:
+    """
+    The shared index covering a directory.
+
+    An existing index whose root contains `path` is reused; otherwise a
+    new index rooted at `path` is created (and persisted under INDEX_DIR).
+    """
+    path = Path(path).resolve()
+    with _indexes_lock:
+        for root, index in _indexes.items():
+            if path == root or root in path.parents:
+                if not index.oversized:
+                    return index
+        index = _indexes.get(path)
+        if index is None:
+            index = SearchIndex(path, index_dir=INDEX_DIR)
+            _indexes[path] = index
+        return index
+
+
+def invalidate_search_indexes(path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Mark indexes stale after a write so the next query re-scans first.
+
+    Args:
+        path: Changed file or directory (None = every index)
+    """
+    target = Path(path).resolve() if path is not None else None
+    with _indexes_lock:
+        indexes = list(_indexes.items())
+    for root, index in indexes:
+        if target is None or target == root or root in target.parents:
+            index.invalidate()
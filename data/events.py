@@ -49,6 +49,8 @@ class EventType(Enum):
     QUANTUM_GATE_APPLIED = auto()
     QUANTUM_MEASUREMENT = auto()
     BLOCH_SPHERE_RENDERED = auto()
+    QUANTUM_ARTIFACT_SAVED = auto()    # Saved state or circuit written
+    QUANTUM_ARTIFACT_DELETED = auto()  # Saved state or circuit removed
     
     # Agent Events
     AGENT_STARTED = auto()
@@ -72,6 +74,9 @@ class EventType(Enum):
     METRICS_SNAPSHOT = auto()
     TELEMETRY_EXPORT = auto()
 
+    # Adaptation Events
+    PROVIDER_DEGRADED = auto()
+
 
 @dataclass
 class Event:
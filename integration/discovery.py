@@ -11,13 +11,20 @@ Detects and fingerprints all available hardware:
 - Network: interfaces, bandwidth estimation
 
 Safety: Read-only operations only - no system modifications
+
+Snapshots: the static fingerprint is persisted to disk keyed by boot id and
+reloaded at startup. discover() always returns the last-known-good snapshot
+immediately; volatile readings (RAM, storage usage, network, GPU load) are
+refreshed on a background thread so slow probes never block a caller.
 """
 
 import os
 import sys
+import copy
 import platform
 import socket
 import json
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, field, asdict
@@ -173,6 +180,25 @@ class HardwareFingerprint:
         """Convert to JSON string"""
         return json.dumps(self.to_dict(), indent=indent)
 
+    @classmethod
+    def from_dict(cls, d: Dict[str, Any]) -> 'HardwareFingerprint':
+        """Rebuild a fingerprint from to_dict() output"""
+        d = dict(d)
+        cpu = CPUInfo(**d.pop('cpu', {}))
+        gpu_data = dict(d.pop('gpu', {}))
+        gpu_data['vendor'] = GPUVendor(gpu_data.get('vendor', GPUVendor.NONE.value))
+        gpu = GPUInfo(**gpu_data)
+        ram = RAMInfo(**d.pop('ram', {}))
+        storage = []
+        for item in d.pop('storage', []):
+            item = dict(item)
+            item['storage_type'] = StorageType(item.get('storage_type', StorageType.UNKNOWN.value))
+            storage.append(StorageInfo(**item))
+        network = NetworkInfo(**d.pop('network', {}))
+        tier = HardwareTier(d.pop('tier', HardwareTier.TIER_1_BASELINE.value))
+        return cls(cpu=cpu, gpu=gpu, ram=ram, storage=storage,
+                   network=network, tier=tier, **d)
+
 
 
 # ============================================================================
@@ -192,28 +218,79 @@ class HardwareDiscovery:
     - Graceful fallback on detection failure
     """
     
-    def __init__(self):
+    def __init__(self, cache_path: Optional[str] = None, persist: bool = True):
+        """
+        Args:
+            cache_path: Snapshot file (default ~/.frankenstein/data/hardware_fingerprint.json)
+            persist: Load/save the snapshot on disk
+        """
         self._fingerprint: Optional[HardwareFingerprint] = None
         self._last_scan: Optional[datetime] = None
         self._cache_timeout_seconds = 60  # Refresh every 60 seconds
+        
+        self._cache_path = Path(cache_path) if cache_path else (
+            Path.home() / ".frankenstein" / "data" / "hardware_fingerprint.json"
+        )
+        self._persist = persist
+        self._lock = threading.Lock()
+        self._refresh_thread: Optional[threading.Thread] = None
+        self._needs_full_scan = False
+        
+        if self._persist:
+            self._load_snapshot()
     
     def discover(self, force_refresh: bool = False) -> HardwareFingerprint:
         """
-        Perform complete hardware discovery scan.
+        Get the hardware fingerprint.
+        
+        Returns the last-known-good snapshot without blocking; if it is
+        older than the cache timeout a background refresh is started.
+        With no snapshot at all, a quick scan (no subprocess or network
+        probes) is returned and the full scan completes in the background.
         
         Args:
-            force_refresh: Bypass cache and force fresh scan
+            force_refresh: Perform a full synchronous scan instead
             
         Returns:
             HardwareFingerprint with all detected hardware
         """
-        # Check cache
-        if not force_refresh and self._fingerprint and self._last_scan:
-            elapsed = (datetime.now() - self._last_scan).total_seconds()
-            if elapsed < self._cache_timeout_seconds:
-                return self._fingerprint
+        if force_refresh:
+            return self._full_scan()
+        
+        with self._lock:
+            fingerprint = self._fingerprint
+            last_scan = self._last_scan
+        
+        if fingerprint is None:
+            fingerprint = self._quick_scan()
+            self._schedule_refresh()
+            return fingerprint
+        
+        elapsed = (datetime.now() - last_scan).total_seconds() if last_scan else float('inf')
+        if elapsed >= self._cache_timeout_seconds:
+            self._schedule_refresh()
+        
+        return fingerprint
+    
+    def wait_for_refresh(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for an in-flight background refresh to finish.
         
-        # Perform fresh scan
+        Returns:
+            True if no refresh is running when this returns
+        """
+        thread = self._refresh_thread
+        if thread is not None:
+            thread.join(timeout)
+            return not thread.is_alive()
+        return True
+    
+    # ========================================================================
+    # SCANNING + SNAPSHOT MANAGEMENT
+    # ========================================================================
+    
+    def _full_scan(self) -> HardwareFingerprint:
+        """Perform a complete synchronous hardware scan"""
         fingerprint = HardwareFingerprint()
         fingerprint.timestamp = datetime.now().isoformat()
         
@@ -227,19 +304,141 @@ class HardwareDiscovery:
         fingerprint.storage = self._detect_storage()
         fingerprint.network = self._detect_network()
         
-        # Classification
-        fingerprint.tier = self._classify_tier(fingerprint)
-        self._set_safety_limits(fingerprint)
+        self._finalize(fingerprint)
+        with self._lock:
+            self._needs_full_scan = False
+        self._publish(fingerprint)
+        return fingerprint
+    
+    def _quick_scan(self) -> HardwareFingerprint:
+        """Scan everything except GPU and connectivity probes"""
+        fingerprint = HardwareFingerprint()
+        fingerprint.timestamp = datetime.now().isoformat()
         
-        # Generate fingerprint ID
-        fingerprint.fingerprint_id = self._generate_fingerprint_id(fingerprint)
+        self._detect_system_info(fingerprint)
+        fingerprint.cpu = self._detect_cpu()
+        fingerprint.ram = self._detect_ram()
+        fingerprint.storage = self._detect_storage()
+        fingerprint.network = self._detect_network(check_internet=False)
+        
+        self._finalize(fingerprint)
+        with self._lock:
+            self._needs_full_scan = True
+        # Quick results are not persisted: the snapshot must stay complete
+        self._publish(fingerprint, persist=False)
+        return fingerprint
+    
+    def _refresh_volatile(self) -> HardwareFingerprint:
+        """Re-read the volatile parts of the current snapshot"""
+        with self._lock:
+            base = self._fingerprint
+        
+        fingerprint = copy.deepcopy(base)
+        fingerprint.timestamp = datetime.now().isoformat()
+        fingerprint.ram = self._detect_ram()
+        fingerprint.storage = self._detect_storage()
+        fingerprint.network = self._detect_network()
+        
+        try:
+            freq = psutil.cpu_freq()
+            if freq:
+                fingerprint.cpu.current_frequency_mhz = freq.current or 0.0
+        except Exception:
+            pass
         
-        # Cache results
-        self._fingerprint = fingerprint
-        self._last_scan = datetime.now()
+        if fingerprint.gpu.vendor == GPUVendor.NVIDIA:
+            live_gpu = self._detect_nvidia_gpu(GPUInfo())
+            if live_gpu.available:
+                fingerprint.gpu.vram_available_mb = live_gpu.vram_available_mb
+                fingerprint.gpu.temperature_c = live_gpu.temperature_c
+                fingerprint.gpu.utilization_percent = live_gpu.utilization_percent
         
+        self._publish(fingerprint)
         return fingerprint
     
+    def _finalize(self, fingerprint: HardwareFingerprint) -> None:
+        """Classify, set limits and ID for a freshly scanned fingerprint"""
+        fingerprint.tier = self._classify_tier(fingerprint)
+        self._set_safety_limits(fingerprint)
+        fingerprint.fingerprint_id = self._generate_fingerprint_id(fingerprint)
+    
+    def _publish(self, fingerprint: HardwareFingerprint, persist: bool = True) -> None:
+        """Swap in a new snapshot and optionally persist it"""
+        with self._lock:
+            self._fingerprint = fingerprint
+            self._last_scan = datetime.now()
+        if persist and self._persist:
+            self._save_snapshot(fingerprint)
+    
+    def _schedule_refresh(self) -> None:
+        """Start a single-flight background refresh"""
+        with self._lock:
+            if self._refresh_thread is not None and self._refresh_thread.is_alive():
+                return
+            self._refresh_thread = threading.Thread(
+                target=self._refresh_worker,
+                daemon=True,
+                name="HardwareDiscovery-Refresh"
+            )
+            self._refresh_thread.start()
+    
+    def _refresh_worker(self) -> None:
+        """Background refresh: full scan if the snapshot is partial"""
+        try:
+            if self._needs_full_scan or self._fingerprint is None:
+                self._full_scan()
+            else:
+                self._refresh_volatile()
+        except Exception:
+            # Keep serving the last-known-good snapshot
+            pass
+    
+    @staticmethod
+    def _get_boot_id() -> str:
+        """Identify the current boot so snapshots don't outlive it"""
+        try:
+            with open('/proc/sys/kernel/random/boot_id', 'r') as f:
+                return f.read().strip()
+        except (OSError, IOError):
+            pass
+        try:
+            return f"boot-{int(psutil.boot_time())}"
+        except Exception:
+            return "unknown"
+    
+    def _load_snapshot(self) -> bool:
+        """Load a persisted snapshot from this boot"""
+        try:
+            if not self._cache_path.exists():
+                return False
+            data = json.loads(self._cache_path.read_text(encoding='utf-8'))
+            if data.get('boot_id') != self._get_boot_id():
+                return False
+            fingerprint = HardwareFingerprint.from_dict(data['fingerprint'])
+        except Exception:
+            return False
+        
+        with self._lock:
+            self._fingerprint = fingerprint
+            # Loaded snapshots are treated as stale so volatile data refreshes
+            self._last_scan = None
+        return True
+    
+    def _save_snapshot(self, fingerprint: HardwareFingerprint) -> None:
+        """Atomically persist a snapshot keyed by boot id"""
+        try:
+            self._cache_path.parent.mkdir(parents=True, exist_ok=True)
+            payload = json.dumps({
+                'boot_id': self._get_boot_id(),
+                'saved_at': datetime.now().isoformat(),
+                'fingerprint': fingerprint.to_dict(),
+            })
+            tmp_path = self._cache_path.with_name(self._cache_path.name + '.tmp')
+            tmp_path.write_text(payload, encoding='utf-8')
+            os.replace(tmp_path, self._cache_path)
+        except Exception:
+            pass
+    
     def _detect_system_info(self, fp: HardwareFingerprint) -> None:
         """Detect basic system information"""
         uname = platform.uname()
@@ -590,7 +789,7 @@ class HardwareDiscovery:
         return StorageType.UNKNOWN
 
 
-    def _detect_network(self) -> NetworkInfo:
+    def _detect_network(self, check_internet: bool = True) -> NetworkInfo:
         """Detect network interfaces and connectivity"""
         network = NetworkInfo()
         
@@ -611,8 +810,9 @@ class HardwareDiscovery:
                     iface_info['addresses'].append(addr_info)
                 network.interfaces[iface_name] = iface_info
             
-            # Check internet connectivity
-            network.has_internet = self._check_internet()
+            # Check internet connectivity (slow: up to 2x timeout)
+            if check_internet:
+                network.has_internet = self._check_internet()
             
         except Exception:
             pass
@@ -1,28 +1,43 @@
 """
-Audit Logger - JSON-based audit logging system for Frankenstein 1.0
+Audit Logger - Append-only audit logging system for Frankenstein 1.0
 
 Tracks all operations, provider access, and resource usage across all 28 providers.
 Supports encryption for sensitive operations and automatic log rotation.
 
+Storage layout (~/.frankenstein/logs/audit/):
+    audit_YYYYMMDD_NNNN.jsonl   One JSON entry per line, rotated per day/size
+    index.json                  Per-segment counts by provider/action/role/result
+
 Author: Frankenstein 1.0 Team
 Phase: 3, Step 6
 """
 
+import copy
 import json
+import logging
 import os
+import queue
 import threading
+import atexit
 from pathlib import Path
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Iterator, Tuple
 from cryptography.fernet import Fernet
 import base64
 import hashlib
+import time
 import psutil
 
+logger = logging.getLogger(__name__)
 
 class AuditLogger:
     """
-    JSON-based audit logger for tracking all system operations.
+    Append-only, segmented audit logger for tracking all system operations.
+
+    Entries are queued by log_action() and appended by a background writer
+    to JSONL segment files (one or more per day, rotated by size). A sidecar
+    index keeps per-segment counts by provider, action, role and result so
+    stats queries and filtered reads skip segments without parsing them.
 
     Supports encryption, log rotation, and provider-specific tracking
     for all 28 quantum and classical providers.
@@ -32,12 +47,18 @@ class AuditLogger:
     _lock = threading.Lock()
     _initialized = False
 
-    # Maximum log file size before rotation (10MB)
+    # Maximum segment file size before rotation (10MB)
     MAX_LOG_SIZE = 10 * 1024 * 1024
 
     # Log retention period (30 days for Tier 1)
     RETENTION_DAYS = 30
 
+    # Entries appended per writer batch
+    WRITE_BATCH_SIZE = 256
+
+    # Seconds a cached CPU/RAM sample is reused for resource_impact
+    RESOURCE_SAMPLE_INTERVAL = 1.0
+
     def __new__(cls):
         """Ensure only one instance exists (singleton pattern)."""
         if cls._instance is None:
@@ -54,18 +75,40 @@ class AuditLogger:
         with self._lock:
             if not self._initialized:
                 self._log_dir = Path.home() / ".frankenstein" / "logs"
-                self._log_file = self._log_dir / "audit_log.json"
+                self._segment_dir = self._log_dir / "audit"
+                self._index_file = self._segment_dir / "index.json"
+                self._legacy_log_file = self._log_dir / "audit_log.json"
                 self._key_file = self._log_dir / "audit.key"
 
-                # Ensure log directory exists
-                self._log_dir.mkdir(parents=True, exist_ok=True)
+                # Ensure log directories exist
+                self._segment_dir.mkdir(parents=True, exist_ok=True)
 
                 # Initialize encryption
                 self._cipher = self._initialize_encryption()
 
-                # Initialize log file if it doesn't exist
-                if not self._log_file.exists():
-                    self._write_logs([])
+                # Segment index (segment name -> summary), guarded by _io_lock
+                self._io_lock = threading.RLock()
+                self._index: Dict[str, Dict[str, Any]] = self._load_index()
+
+                # Cached non-blocking resource samples
+                self._resource_sample = {"cpu_percent": 0.0, "ram_percent": 0.0}
+                self._resource_sample_time = 0.0
+                try:
+                    psutil.cpu_percent(interval=None)  # Prime the CPU counter
+                except Exception:
+                    pass
+
+                self._migrate_legacy_log()
+
+                # Background writer: (entry, serialized line) pairs
+                self._queue: "queue.Queue[Tuple[Dict[str, Any], str]]" = queue.Queue()
+                self._writer = threading.Thread(
+                    target=self._writer_loop,
+                    daemon=True,
+                    name="AuditLogger-Writer"
+                )
+                self._writer.start()
+                atexit.register(self.flush)
 
                 self._initialized = True
 
@@ -91,66 +134,241 @@ class AuditLogger:
 
         return Fernet(key)
 
-    def _read_logs(self) -> List[Dict]:
-        """Read all logs from file."""
-        if not self._log_file.exists():
-            return []
+    # ------------------------------------------------------------------
+    # Segment storage
+    # ------------------------------------------------------------------
 
+    def _load_index(self) -> Dict[str, Dict[str, Any]]:
+        """Load the sidecar index, rebuilding it from segments if needed."""
+        segments = sorted(p.name for p in self._segment_dir.glob("audit_*.jsonl"))
+        index = {}
+        if self._index_file.exists():
+            try:
+                with open(self._index_file, 'r') as f:
+                    index = json.load(f)
+            except (json.JSONDecodeError, OSError):
+                index = {}
+
+        if sorted(index) != segments or not self._index_file.exists():
+            index = {}
+            for name in segments:
+                summary = self._new_summary(name)
+                for entry in self._read_segment(name):
+                    self._summarize(summary, entry)
+                index[name] = summary
+            self._index = index
+            self._save_index()
+        return index
+
+    def _save_index(self):
+        """Atomically persist the sidecar index."""
+        tmp_file = self._index_file.with_name(self._index_file.name + ".tmp")
+        with open(tmp_file, 'w') as f:
+            json.dump(self._index, f)
+        os.replace(tmp_file, self._index_file)
+
+    @staticmethod
+    def _new_summary(name: str) -> Dict[str, Any]:
+        """Create an empty per-segment summary."""
+        return {
+            "date": name[len("audit_"):len("audit_") + 8],
+            "count": 0,
+            "size": 0,
+            "first_ts": None,
+            "last_ts": None,
+            "actions": {},
+            "roles": {},
+            "results": {},
+            "providers": {}
+        }
+
+    @staticmethod
+    def _summarize(summary: Dict[str, Any], entry: Dict[str, Any]):
+        """Fold one entry into a segment summary."""
+        ts = entry["timestamp"]
+        summary["count"] += 1
+        if summary["first_ts"] is None:
+            summary["first_ts"] = ts
+        summary["last_ts"] = ts
+
+        for key, field in (("actions", "action"), ("roles", "user_role"), ("results", "result")):
+            value = entry.get(field)
+            if value is not None:
+                summary[key][value] = summary[key].get(value, 0) + 1
+
+        provider = entry.get("provider_name")
+        if provider:
+            stats = summary["providers"].setdefault(provider, {
+                "total_actions": 0,
+                "successful_actions": 0,
+                "failed_actions": 0,
+                "last_used": None,
+                "actions_by_type": {}
+            })
+            stats["total_actions"] += 1
+            if entry.get("result") == "success":
+                stats["successful_actions"] += 1
+            elif entry.get("result") in ["denied", "error"]:
+                stats["failed_actions"] += 1
+            if stats["last_used"] is None or ts > stats["last_used"]:
+                stats["last_used"] = ts
+            action = entry.get("action", "unknown")
+            stats["actions_by_type"][action] = stats["actions_by_type"].get(action, 0) + 1
+
+    def _read_segment(self, name: str) -> List[Dict]:
+        """Read all entries of one segment."""
+        entries = []
         try:
-            with open(self._log_file, 'r') as f:
-                return json.load(f)
-        except (json.JSONDecodeError, FileNotFoundError):
-            return []
-
-    def _write_logs(self, logs: List[Dict]):
-        """Write logs to file."""
-        with open(self._log_file, 'w') as f:
-            json.dump(logs, f, indent=2)
-
-    def _check_rotation_needed(self) -> bool:
-        """Check if log file needs rotation."""
-        if not self._log_file.exists():
-            return False
-
-        file_size = self._log_file.stat().st_size
-        return file_size > self.MAX_LOG_SIZE
-
-    def _rotate_logs(self):
-        """Rotate log file if it exceeds maximum size."""
-        if not self._check_rotation_needed():
-            return
-
-        # Read existing logs
-        logs = self._read_logs()
-
-        # Create rotated log file with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        rotated_file = self._log_dir / f"audit_log_{timestamp}.json"
+            with open(self._segment_dir / name, 'r') as f:
+                for line in f:
+                    try:
+                        entries.append(json.loads(line))
+                    except json.JSONDecodeError:
+                        continue  # Torn trailing line from an interrupted write
+        except FileNotFoundError:
+            pass
+        return entries
+
+    def _segment_for(self, day: str, size: int, staged: Dict[str, Dict[str, Any]]) -> str:
+        """
+        Pick the segment to append a day's entries to (rotating by size).
 
-        # Move current log to rotated file
-        self._log_file.rename(rotated_file)
+        Summaries in staged (pending index updates) take precedence over the
+        index; a new segment's summary is added to staged only.
+        """
+        day_segments = sorted(n for n in set(self._index) | set(staged)
+                              if staged.get(n, self._index.get(n))["date"] == day)
+        if day_segments:
+            last = day_segments[-1]
+            if staged.get(last, self._index.get(last))["size"] + size <= self.MAX_LOG_SIZE:
+                return last
+            seq = int(last.rsplit("_", 1)[1].split(".")[0]) + 1
+        else:
+            seq = 0
+        name = f"audit_{day}_{seq:04d}.jsonl"
+        staged[name] = self._new_summary(name)
+        return name
 
-        # Keep only recent logs in new file (last 30 days)
-        cutoff_date = datetime.now() - timedelta(days=self.RETENTION_DAYS)
-        recent_logs = [
-            log for log in logs
-            if datetime.fromisoformat(log['timestamp']) > cutoff_date
-        ]
+    def _append_batch(self, items: List[Tuple[Dict[str, Any], str]]):
+        """
+        Append (entry, line) pairs to their day segments.
 
-        # Write recent logs to new file
-        self._write_logs(recent_logs)
+        Summaries are staged on copies and enter the index only once their
+        segment has been written, so a failed write leaves no phantom counts.
+        """
+        with self._io_lock:
+            staged: Dict[str, Dict[str, Any]] = {}
+            pending: Dict[str, List[str]] = {}
+            for entry, line in items:
+                day = entry["timestamp"][:10].replace("-", "")
+                name = self._segment_for(day, len(line), staged)
+                if name not in staged:
+                    staged[name] = copy.deepcopy(self._index[name])
+                pending.setdefault(name, []).append(line)
+                summary = staged[name]
+                summary["size"] += len(line)
+                self._summarize(summary, entry)
+
+            failed = 0
+            for name, lines in pending.items():
+                try:
+                    with open(self._segment_dir / name, 'a') as f:
+                        f.write("".join(lines))
+                except OSError as exc:
+                    failed += len(lines)
+                    logger.error("Audit segment %s write failed, %d entries lost: %s",
+                                 name, len(lines), exc)
+                    continue
+                self._index[name] = staged[name]
+            if failed < len(items):
+                self._save_index()
+
+    def _migrate_legacy_log(self):
+        """Move entries from the old single-file JSON array into segments."""
+        if not self._legacy_log_file.exists():
+            return
+        try:
+            with open(self._legacy_log_file, 'r') as f:
+                legacy = json.load(f)
+        except (json.JSONDecodeError, OSError):
+            legacy = []
+        if legacy:
+            self._append_batch([(entry, json.dumps(entry) + "\n") for entry in legacy])
+        try:
+            self._legacy_log_file.rename(
+                self._legacy_log_file.with_name("audit_log.json.migrated")
+            )
+        except OSError:
+            pass
+
+    def _writer_loop(self):
+        """Background writer: drain the queue and append in batches."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.WRITE_BATCH_SIZE:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._append_batch(batch)
+            except Exception:
+                # Never let audit I/O errors kill the writer
+                logger.exception("Audit log write of %d entries failed", len(batch))
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def flush(self):
+        """Block until all queued entries have been written."""
+        self._queue.join()
+
+    def _iter_segments(
+        self,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+        reverse: bool = False
+    ) -> Iterator[str]:
+        """Yield segment names overlapping a time range, oldest first."""
+        with self._io_lock:
+            names = sorted(self._index)
+            summaries = {n: dict(self._index[n]) for n in names}
+        if reverse:
+            names.reverse()
+        for name in names:
+            summary = summaries[name]
+            if not summary["count"]:
+                continue
+            if start_date and datetime.fromisoformat(summary["last_ts"]) < start_date:
+                continue
+            if end_date and datetime.fromisoformat(summary["first_ts"]) > end_date:
+                continue
+            yield name
+
+    # ------------------------------------------------------------------
+    # Resource sampling
+    # ------------------------------------------------------------------
 
     def _get_resource_usage(self) -> Dict[str, float]:
-        """Get current CPU and RAM usage."""
+        """Get current CPU and RAM usage (cached, non-blocking)."""
+        now = time.monotonic()
+        if now - self._resource_sample_time < self.RESOURCE_SAMPLE_INTERVAL:
+            return dict(self._resource_sample)
         try:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
+            cpu_percent = psutil.cpu_percent(interval=None)
             ram_percent = psutil.virtual_memory().percent
-            return {
+            self._resource_sample = {
                 "cpu_percent": round(cpu_percent, 2),
                 "ram_percent": round(ram_percent, 2)
             }
         except Exception:
-            return {"cpu_percent": 0.0, "ram_percent": 0.0}
+            self._resource_sample = {"cpu_percent": 0.0, "ram_percent": 0.0}
+        self._resource_sample_time = now
+        return dict(self._resource_sample)
+
+    # ------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------
 
     def log_action(
         self,
@@ -178,43 +396,37 @@ class AuditLogger:
             details: Optional additional context
             **kwargs: Additional fields to include in log entry
 
-        Thread-safe operation.
-        """
-        with self._lock:
-            # Check if rotation needed before logging
-            self._rotate_logs()
-
-            # Create log entry
-            log_entry = {
-                "timestamp": datetime.now().isoformat(),
-                "user_role": user_role,
-                "action": action,
-                "resource": resource,
-                "result": result,
-                "resource_impact": self._get_resource_usage()
-            }
-
-            # Add optional fields
-            if agent_name:
-                log_entry["agent_name"] = agent_name
-            if provider_name:
-                log_entry["provider_name"] = provider_name
-            if provider_category:
-                log_entry["provider_category"] = provider_category
-            if details:
-                log_entry["details"] = details
-
-            # Add any additional kwargs
-            log_entry.update(kwargs)
+        Raises:
+            TypeError: an additional field is not JSON-serializable
 
-            # Read existing logs
-            logs = self._read_logs()
-
-            # Append new entry
-            logs.append(log_entry)
-
-            # Write updated logs
-            self._write_logs(logs)
+        Thread-safe, non-blocking: the entry is serialized here and queued
+        for the background writer.
+        """
+        # Create log entry
+        log_entry = {
+            "timestamp": datetime.now().isoformat(),
+            "user_role": user_role,
+            "action": action,
+            "resource": resource,
+            "result": result,
+            "resource_impact": self._get_resource_usage()
+        }
+
+        # Add optional fields
+        if agent_name:
+            log_entry["agent_name"] = agent_name
+        if provider_name:
+            log_entry["provider_name"] = provider_name
+        if provider_category:
+            log_entry["provider_category"] = provider_category
+        if details:
+            log_entry["details"] = details
+
+        # Add any additional kwargs
+        log_entry.update(kwargs)
+
+        # Serialized on the caller's thread, so a bad field fails this call only
+        self._queue.put((log_entry, json.dumps(log_entry) + "\n"))
 
     def get_logs(
         self,
@@ -241,55 +453,102 @@ class AuditLogger:
         Returns:
             List of log entries matching filters
 
-        Thread-safe operation.
+        Thread-safe operation. Segments whose index shows no match are skipped;
+        with a limit, segments are read newest first and reading stops early.
         """
-        with self._lock:
-            logs = self._read_logs()
-
-            # Apply filters
-            filtered_logs = logs
-
-            if start_date:
-                filtered_logs = [
-                    log for log in filtered_logs
-                    if datetime.fromisoformat(log['timestamp']) >= start_date
-                ]
-
-            if end_date:
-                filtered_logs = [
-                    log for log in filtered_logs
-                    if datetime.fromisoformat(log['timestamp']) <= end_date
-                ]
-
-            if action:
-                filtered_logs = [
-                    log for log in filtered_logs
-                    if log.get('action') == action
-                ]
-
-            if provider_name:
-                filtered_logs = [
-                    log for log in filtered_logs
-                    if log.get('provider_name') == provider_name
-                ]
-
-            if user_role:
-                filtered_logs = [
-                    log for log in filtered_logs
-                    if log.get('user_role') == user_role
-                ]
-
-            if result:
-                filtered_logs = [
-                    log for log in filtered_logs
-                    if log.get('result') == result
-                ]
-
-            # Apply limit if specified
-            if limit:
-                filtered_logs = filtered_logs[-limit:]
-
-            return filtered_logs
+        self.flush()
+
+        def segment_may_match(name: str) -> bool:
+            summary = self._index.get(name)
+            if summary is None:
+                return False
+            if action and action not in summary["actions"]:
+                return False
+            if provider_name and provider_name not in summary["providers"]:
+                return False
+            if user_role and user_role not in summary["roles"]:
+                return False
+            if result and result not in summary["results"]:
+                return False
+            return True
+
+        def entry_matches(log: Dict) -> bool:
+            if start_date or end_date:
+                ts = datetime.fromisoformat(log['timestamp'])
+                if start_date and ts < start_date:
+                    return False
+                if end_date and ts > end_date:
+                    return False
+            if action and log.get('action') != action:
+                return False
+            if provider_name and log.get('provider_name') != provider_name:
+                return False
+            if user_role and log.get('user_role') != user_role:
+                return False
+            if result and log.get('result') != result:
+                return False
+            return True
+
+        with self._io_lock:
+            chunks = []
+            collected = 0
+            for name in self._iter_segments(start_date, end_date, reverse=True):
+                if not segment_may_match(name):
+                    continue
+                matches = [log for log in self._read_segment(name) if entry_matches(log)]
+                chunks.append(matches)
+                collected += len(matches)
+                if limit and collected >= limit:
+                    break
+
+        filtered_logs = [log for chunk in reversed(chunks) for log in chunk]
+
+        # Apply limit if specified
+        if limit:
+            filtered_logs = filtered_logs[-limit:]
+
+        return filtered_logs
+
+    def _collect_provider_stats(self, days: int) -> Dict[str, Dict[str, Any]]:
+        """Aggregate provider stats from the index, scanning only boundary segments."""
+        self.flush()
+        cutoff_date = datetime.now() - timedelta(days=days)
+        totals: Dict[str, Dict[str, Any]] = {}
+
+        def merge(provider: str, stats: Dict[str, Any]):
+            target = totals.setdefault(provider, {
+                "total_actions": 0,
+                "successful_actions": 0,
+                "failed_actions": 0,
+                "last_used": None,
+                "actions_by_type": {}
+            })
+            for key in ("total_actions", "successful_actions", "failed_actions"):
+                target[key] += stats[key]
+            if stats["last_used"] and (target["last_used"] is None
+                                       or stats["last_used"] > target["last_used"]):
+                target["last_used"] = stats["last_used"]
+            for action, count in stats["actions_by_type"].items():
+                target["actions_by_type"][action] = target["actions_by_type"].get(action, 0) + count
+
+        with self._io_lock:
+            for name in self._iter_segments(start_date=cutoff_date):
+                summary = self._index[name]
+                if datetime.fromisoformat(summary["first_ts"]) > cutoff_date:
+                    # Whole segment is in range: use the precomputed summary
+                    for provider, stats in summary["providers"].items():
+                        merge(provider, stats)
+                    continue
+
+                # Segment straddles the cutoff: summarize only in-range entries
+                partial = self._new_summary(name)
+                for log in self._read_segment(name):
+                    if datetime.fromisoformat(log['timestamp']) > cutoff_date:
+                        self._summarize(partial, log)
+                for provider, stats in partial["providers"].items():
+                    merge(provider, stats)
+
+        return totals
 
     def get_provider_usage_stats(
         self,
@@ -313,81 +572,68 @@ class AuditLogger:
 
         Thread-safe operation.
         """
-        with self._lock:
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            # Get logs for this provider
-            provider_logs = [
-                log for log in self._read_logs()
-                if log.get('provider_name') == provider_name
-                and datetime.fromisoformat(log['timestamp']) > cutoff_date
-            ]
-
-            if not provider_logs:
-                return {
-                    "total_actions": 0,
-                    "successful_actions": 0,
-                    "failed_actions": 0,
-                    "last_used": None,
-                    "actions_by_type": {}
-                }
-
-            # Calculate statistics
-            total_actions = len(provider_logs)
-            successful_actions = sum(
-                1 for log in provider_logs if log.get('result') == 'success'
-            )
-            failed_actions = sum(
-                1 for log in provider_logs
-                if log.get('result') in ['denied', 'error']
-            )
-
-            # Get last used timestamp
-            last_used = max(
-                log['timestamp'] for log in provider_logs
-            )
-
-            # Get actions by type
-            actions_by_type = {}
-            for log in provider_logs:
-                action = log.get('action', 'unknown')
-                actions_by_type[action] = actions_by_type.get(action, 0) + 1
-
+        stats = self._collect_provider_stats(days).get(provider_name)
+        if not stats:
             return {
-                "total_actions": total_actions,
-                "successful_actions": successful_actions,
-                "failed_actions": failed_actions,
-                "last_used": last_used,
-                "actions_by_type": actions_by_type
+                "total_actions": 0,
+                "successful_actions": 0,
+                "failed_actions": 0,
+                "last_used": None,
+                "actions_by_type": {}
             }
+        return stats
 
     def cleanup_old_logs(self, days: int = 30):
         """
         Remove logs older than specified days.
 
+        Whole segments before the cutoff are deleted; only a segment that
+        straddles the cutoff is rewritten.
+
         Args:
             days: Number of days to retain (default: 30)
 
         Thread-safe operation.
         """
-        with self._lock:
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            # Read existing logs
-            logs = self._read_logs()
+        self.flush()
+        cutoff_date = datetime.now() - timedelta(days=days)
+        removed_count = 0
+
+        with self._io_lock:
+            for name in sorted(self._index):
+                summary = self._index[name]
+                if not summary["count"]:
+                    continue
+                if datetime.fromisoformat(summary["first_ts"]) > cutoff_date:
+                    continue
+
+                if datetime.fromisoformat(summary["last_ts"]) <= cutoff_date:
+                    removed_count += summary["count"]
+                    (self._segment_dir / name).unlink(missing_ok=True)
+                    del self._index[name]
+                    continue
+
+                kept = [
+                    log for log in self._read_segment(name)
+                    if datetime.fromisoformat(log['timestamp']) > cutoff_date
+                ]
+                removed_count += summary["count"] - len(kept)
+                lines = [json.dumps(log) + "\n" for log in kept]
+                tmp_file = self._segment_dir / (name + ".tmp")
+                with open(tmp_file, 'w') as f:
+                    f.write("".join(lines))
+                os.replace(tmp_file, self._segment_dir / name)
 
-            # Keep only recent logs
-            recent_logs = [
-                log for log in logs
-                if datetime.fromisoformat(log['timestamp']) > cutoff_date
-            ]
+                rebuilt = self._new_summary(name)
+                for log in kept:
+                    self._summarize(rebuilt, log)
+                rebuilt["size"] = sum(len(line) for line in lines)
+                self._index[name] = rebuilt
 
-            # Write filtered logs
-            self._write_logs(recent_logs)
+            self._save_index()
 
-            # Return number of logs removed
-            removed_count = len(logs) - len(recent_logs)
-            return removed_count
+        # Return number of logs removed
+        return removed_count
 
     def get_all_providers_stats(self, days: int = 30) -> Dict[str, Dict]:
         """
@@ -401,28 +647,7 @@ class AuditLogger:
 
         Thread-safe operation.
         """
-        with self._lock:
-            cutoff_date = datetime.now() - timedelta(days=days)
-
-            # Get all logs within time range
-            recent_logs = [
-                log for log in self._read_logs()
-                if datetime.fromisoformat(log['timestamp']) > cutoff_date
-            ]
-
-            # Get unique provider names
-            providers = set(
-                log.get('provider_name')
-                for log in recent_logs
-                if log.get('provider_name')
-            )
-
-            # Get stats for each provider
-            stats = {}
-            for provider in providers:
-                stats[provider] = self.get_provider_usage_stats(provider, days)
-
-            return stats
+        return self._collect_provider_stats(days)
 
     def clear_all_logs(self):
         """
@@ -430,8 +655,12 @@ class AuditLogger:
 
         Thread-safe operation.
         """
-        with self._lock:
-            self._write_logs([])
+        self.flush()
+        with self._io_lock:
+            for name in list(self._index):
+                (self._segment_dir / name).unlink(missing_ok=True)
+            self._index = {}
+            self._save_index()
 
 
 # Singleton instance getter
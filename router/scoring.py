@@ -164,6 +164,23 @@ _COST_ESTIMATES: Dict[str, float] = {
 # SCORING FUNCTIONS
 # ============================================================================
 
+def get_provider_estimates(provider_id: str) -> Dict[str, float]:
+    """
+    Static cost/speed/accuracy estimates for a provider.
+
+    Args:
+        provider_id: Provider identifier
+
+    Returns:
+        Dict with 'cost' (0-1), 'speed' (relative, lower is faster) and 'accuracy'
+    """
+    return {
+        "cost": _COST_ESTIMATES.get(provider_id, 0.5),
+        "speed": _SPEED_ESTIMATES.get(provider_id, 5.0),
+        "accuracy": _ACCURACY_ESTIMATES.get(provider_id, 0.5),
+    }
+
+
 def calculate_provider_score(
     provider_id: str,
     workload: 'WorkloadSpec',
@@ -0,0 +1,203 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - FRANK Stream Render Benchmark
+UI-thread cost of rendering streamed FRANK tokens in the terminal, headless.
+
+Usage:
+    python scripts/benchmark_frank_render.py [--tokens N] [--rate TOK_PER_S] [--insert-us US]
+
+Replays a synthetic token stream (with ::EXEC:: / ::QUANTUM:: markers split
+across tokens) on a virtual clock against a fake Tk root and text widget,
+then reports per 1,000 tokens:
+    per-token   — the previous pipeline: one after(0) callback and one
+                  widget insert per token, full buffer re-scan for markers
+    coalesced   — frame batching, incremental marker scan, one insert per frame
+
+--insert-us simulates the cost of one Tk insert + tag + see() call; the fake
+widget busy-waits that long per insert.
+"""
+
+import sys
+import os
+import argparse
+import heapq
+import random
+import time
+
+# Ensure project root is on the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from widget.terminal import FrankensteinTerminal
+
+
+WORDS = (
+    "the state vector after a hadamard gate is an equal superposition so "
+    "measuring gives zero or one with probability one half each time"
+).split()
+
+
+def generate_tokens(n_tokens: int, seed: int = 11) -> list:
+    """Word-piece tokens with a marker command roughly every 200 tokens."""
+    rng = random.Random(seed)
+    tokens = []
+    while len(tokens) < n_tokens:
+        if rng.random() < 0.005:
+            marker = rng.choice(["::EXEC::", "::QUANTUM::"])
+            command = "git status" if marker == "::EXEC::" else "bell|qubits=2"
+            tokens += ["\n", marker[:3], marker[3:], command[:4], command[4:], "\n"]
+        else:
+            word = rng.choice(WORDS)
+            tokens += [" " + word[:3], word[3:]] if len(word) > 5 else [" " + word]
+    return tokens[:n_tokens]
+
+
+# ── Headless Tk stand-ins ──────────────────────────────────────────────────────
+
+class VirtualRoot:
+    """after() on a virtual clock; callbacks run only when the clock passes them."""
+
+    def __init__(self):
+        self.now_ms = 0.0
+        self._queue = []
+        self._seq = 0
+        self.callbacks = 0
+        self.ui_seconds = 0.0
+
+    def after(self, delay_ms, callback):
+        self._seq += 1
+        heapq.heappush(self._queue, (self.now_ms + delay_ms, self._seq, callback))
+
+    def run_until(self, t_ms: float):
+        while self._queue and self._queue[0][0] <= t_ms:
+            due, _, callback = heapq.heappop(self._queue)
+            self.now_ms = max(self.now_ms, due)
+            start = time.perf_counter()
+            callback()
+            self.ui_seconds += time.perf_counter() - start
+            self.callbacks += 1
+        self.now_ms = max(self.now_ms, t_ms)
+
+    def drain(self):
+        while self._queue:
+            self.run_until(self._queue[0][0])
+
+
+class FakeText:
+    """Text widget stub: records inserts, busy-waits insert_us per insert."""
+
+    def __init__(self, insert_us: float):
+        self.insert_s = insert_us / 1e6
+        self.inserts = 0
+        self.chars = 0
+
+    def tag_config(self, *args, **kwargs):
+        pass
+
+    def index(self, _):
+        return f"1.{self.chars}"
+
+    def insert(self, _, text):
+        self.inserts += 1
+        self.chars += len(text)
+        deadline = time.perf_counter() + self.insert_s
+        while time.perf_counter() < deadline:
+            pass
+
+    def tag_add(self, *args):
+        pass
+
+    def see(self, _):
+        pass
+
+
+# ── Previous per-token pipeline ────────────────────────────────────────────────
+
+def _legacy_extract(rest: str):
+    for i, raw_line in enumerate(rest.split('\n')):
+        stripped = raw_line.strip()
+        if stripped:
+            consumed = '\n'.join(rest.split('\n')[:i + 1])
+            return stripped, rest[len(consumed):]
+    return '', ''
+
+
+def legacy_on_token(term, token: str):
+    """The per-token handler this pipeline replaced (one insert per token)."""
+    term._legacy_buffer += token
+    for marker, dispatch in (('::QUANTUM::', term._frank_quantum_dispatch),
+                             ('::EXEC::', term._frank_guard_exec)):
+        if marker in term._legacy_buffer:
+            pre, _, rest = term._legacy_buffer.partition(marker)
+            command, remainder = _legacy_extract(rest)
+            if command:
+                if pre:
+                    term._write_frank(pre)
+                term._legacy_buffer = remainder
+                term._root.after(0, lambda c=command: dispatch(c))
+            return
+    term._write_frank(term._legacy_buffer)
+    term._legacy_buffer = ""
+
+
+# ── Driver ─────────────────────────────────────────────────────────────────────
+
+def make_terminal(insert_us: float):
+    term = FrankensteinTerminal()
+    term._root = VirtualRoot()
+    term._output_text = FakeText(insert_us)
+    term._frank_dispatched = []
+    term._frank_guard_exec = term._frank_dispatched.append
+    term._frank_quantum_dispatch = term._frank_dispatched.append
+    term._legacy_buffer = ""
+    return term
+
+
+def replay(mode: str, tokens: list, rate: float, insert_us: float) -> dict:
+    term = make_terminal(insert_us)
+    root = term._root
+    interval_ms = 1000.0 / rate
+    for i, token in enumerate(tokens):
+        root.run_until(i * interval_ms)
+        # Stream-thread side of the handoff
+        if mode == "per-token":
+            root.after(0, lambda t=token: legacy_on_token(term, t))
+        else:
+            term._on_frank_token(token)
+    if mode == "per-token":
+        root.after(0, lambda: term._write_frank(term._legacy_buffer))
+    else:
+        root.after(0, lambda: (term._frank_render_frame(),
+                               term._frank_render_events(term._frank_scanner.flush())))
+    root.drain()
+    per_k = 1000.0 / len(tokens)
+    return {
+        "ui_ms": root.ui_seconds * 1000 * per_k,
+        "callbacks": root.callbacks * per_k,
+        "inserts": term._output_text.inserts * per_k,
+        "dispatched": len(term._frank_dispatched),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="FRANK stream render benchmark")
+    parser.add_argument("--tokens", type=int, default=5000, help="Tokens in the replayed stream")
+    parser.add_argument("--rate", type=float, default=45.0, help="Stream rate, tokens per second")
+    parser.add_argument("--insert-us", type=float, default=150.0,
+                        help="Simulated cost of one Tk insert, microseconds")
+    args = parser.parse_args()
+
+    tokens = generate_tokens(args.tokens)
+    markers = sum(t in ("::E", "::Q") for t in tokens)
+    print(f"{args.tokens} tokens at {args.rate:.0f} tok/s, {markers} marker commands, "
+          f"{args.insert_us:.0f} us per insert\n")
+    print(f"{'pipeline':<12}{'UI ms/1k tok':>14}{'callbacks/1k':>14}{'inserts/1k':>12}{'dispatched':>12}")
+    for mode in ("per-token", "coalesced"):
+        result = replay(mode, tokens, args.rate, args.insert_us)
+        print(f"{mode:<12}{result['ui_ms']:>14.1f}{result['callbacks']:>14.0f}"
+              f"{result['inserts']:>12.0f}{result['dispatched']:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Numerical Batch Benchmark
+Parameter-sweep throughput of NumericalComputingAgent, per-call vs batch.
+
+Usage:
+    python scripts/benchmark_numerical_batch.py [--ode N] [--quad N] [--optimize N]
+
+Sweeps (problems per second, higher is better):
+    ode       damped oscillators x'' = -k x - 0.1 x' over N stiffness values
+    quad      integral of sin(k x) exp(-x / k) over [0, pi] for N values of k
+    optimize  Rosenbrock minimum for N values of a
+
+each run as N agent calls (integrate_ode / integrate_quad / optimize) and
+as one *_batch call, which reports the strategy it picked.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Ensure project root is on the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+import numpy as np
+
+from agents.builtin.numerical_computing_agent import NumericalComputingAgent
+from agents.builtin.numerical_batch import shutdown_pool
+
+
+# Module level so worker processes can import them
+def oscillator(t, y, k):
+    return [y[1], -k * y[0] - 0.1 * y[1]]
+
+
+def damped_sine(x, k):
+    return np.sin(k * x) * np.exp(-x / k)
+
+
+def rosenbrock(x, a):
+    return (a - x[0]) ** 2 + 100.0 * (x[1] - x[0] ** 2) ** 2
+
+
+def sweep_ode(agent, n):
+    ks = np.linspace(1.0, 5.0, n)
+    t_eval = np.linspace(0.0, 20.0, 50)
+    single = [dict(operation="integrate_ode", func=lambda t, y, k=k: oscillator(t, y, k),
+                   y0=[1.0, 0.0], t_span=(0.0, 20.0), t_eval=t_eval) for k in ks]
+    batch = dict(operation="integrate_ode_batch", func=oscillator, y0s=[[1.0, 0.0]] * n,
+                 t_span=(0.0, 20.0), t_eval=t_eval, args_list=[(k,) for k in ks])
+    return single, batch
+
+
+def sweep_quad(agent, n):
+    ks = np.linspace(1.0, 10.0, n)
+    single = [dict(operation="integrate_quad", func=lambda x, k=k: damped_sine(x, k),
+                   a=0.0, b=np.pi) for k in ks]
+    batch = dict(operation="integrate_quad_batch", func=damped_sine,
+                 limits=[(0.0, np.pi)] * n, args_list=[(k,) for k in ks])
+    return single, batch
+
+
+def sweep_optimize(agent, n):
+    a_values = np.linspace(1.0, 2.0, n)
+    single = [dict(operation="optimize", func=lambda x, a=a: rosenbrock(x, a),
+                   x0=[-1.0, 1.0]) for a in a_values]
+    batch = dict(operation="optimize_batch", func=rosenbrock, x0s=[[-1.0, 1.0]] * n,
+                 args_list=[(a,) for a in a_values])
+    return single, batch
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Numerical batch benchmark")
+    parser.add_argument("--ode", type=int, default=400, help="ODE problems")
+    parser.add_argument("--quad", type=int, default=2000, help="Quadrature problems")
+    parser.add_argument("--optimize", type=int, default=64, help="Optimization problems")
+    args = parser.parse_args()
+
+    agent = NumericalComputingAgent()
+    agent._ensure_loaded()
+    print(f"{'sweep':<10}{'N':>7}{'per-call/s':>13}{'batch/s':>11}{'speedup':>9}  strategy")
+    for name, n, build in (("ode", args.ode, sweep_ode), ("quad", args.quad, sweep_quad),
+                           ("optimize", args.optimize, sweep_optimize)):
+        single, batch = build(agent, n)
+        start = time.perf_counter()
+        for call in single:
+            assert agent.execute(**call).success
+        per_call = n / (time.perf_counter() - start)
+
+        result = agent.execute(**batch)
+        assert result.success, result.error
+        batched = result.data["problems_per_second"]
+        print(f"{name:<10}{n:>7}{per_call:>13,.0f}{batched:>11,.0f}"
+              f"{batched / per_call:>8.1f}x  {result.data['strategy']}")
+    shutdown_pool()
+
+
+if __name__ == "__main__":
+    main()
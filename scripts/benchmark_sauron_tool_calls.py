@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Sauron Multi-Tool-Call Benchmark
+Steps per task and wall time for ActionRouter against a scripted stub model.
+
+Usage:
+    python scripts/benchmark_sauron_tool_calls.py [--inference-ms N] [--tool-ms N]
+
+The stub model replays a fixed script instead of calling Ollama, sleeping
+--inference-ms per inference. Tools are stubbed with --tool-ms latency so
+results are deterministic. Each task runs twice:
+    serial  — one tool call per model reply (the old parser behaviour)
+    batched — every independent call in a single reply
+"""
+
+import sys
+import os
+import argparse
+import time
+from types import SimpleNamespace
+
+# Ensure project root is on the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from agents.sauron.parser import ParsedIntent
+from agents.sauron.permissions import PermissionLevel
+from agents.sauron.router import ActionRouter
+from agents.sauron.tools.base import ToolResult
+
+
+TASKS = {
+    "repo overview": [
+        ("git", {"action": "git_status"}),
+        ("git", {"action": "git_log", "n": 5}),
+        ("git", {"action": "git_branch"}),
+    ],
+    "project survey": [
+        ("dir", {"action": "dir_list", "path": "."}),
+        ("file", {"action": "file_read", "path": "README.md"}),
+        ("search", {"action": "content_search", "pattern": "TODO", "root": "."}),
+        ("memory", {"action": "list_states"}),
+    ],
+    "read, test, read": [
+        ("code", {"action": "code_read", "path": "main.py"}),
+        ("code", {"action": "code_lint", "path": "main.py"}),
+        ("code", {"action": "code_test", "path": "tests"}),   # Ring 2 barrier
+        ("git", {"action": "git_diff"}),
+    ],
+}
+
+
+def _intent(calls):
+    if not calls:
+        return ParsedIntent(tool_name=None, arguments={}, text_response="done", raw_tool_call=None)
+    tool_calls = [{"name": name, "arguments": args} for name, args in calls]
+    return ParsedIntent(
+        tool_name=tool_calls[0]["name"],
+        arguments=tool_calls[0]["arguments"],
+        text_response=None,
+        raw_tool_call=tool_calls[0],
+        tool_calls=tool_calls,
+    )
+
+
+class ScriptedModel:
+    """Stands in for IntentParser: replays replies with a fixed latency."""
+
+    def __init__(self, replies, latency):
+        self._replies = list(replies)
+        self._latency = latency
+        self.inferences = 0
+
+    def parse_from_messages(self, messages):
+        self.inferences += 1
+        time.sleep(self._latency)
+        return self._replies.pop(0) if self._replies else _intent([])
+
+
+class StubRegistry:
+    """Registry with SAFE stub tools that sleep instead of doing work."""
+
+    def __init__(self, names, latency):
+        self._names = names
+        self._latency = latency
+
+    def get(self, name):
+        return SimpleNamespace(permission_level=PermissionLevel.SAFE) if name in self._names else None
+
+    def list_tools(self):
+        return [{"name": name} for name in self._names]
+
+    def execute(self, name, **kwargs):
+        time.sleep(self._latency)
+        return ToolResult(success=True, data={"tool": name, **kwargs})
+
+
+def run_task(calls, batched, inference_s, tool_s):
+    if batched:
+        replies = [_intent(calls), _intent([])]
+    else:
+        replies = [_intent([call]) for call in calls] + [_intent([])]
+
+    router = ActionRouter()
+    router._parser = ScriptedModel(replies, inference_s)
+    router._registry = StubRegistry({name for name, _ in calls}, tool_s)
+
+    start = time.perf_counter()
+    result = router.run("benchmark task", [])
+    return result.steps, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sauron multi-tool-call benchmark")
+    parser.add_argument("--inference-ms", type=float, default=400.0,
+                        help="Simulated LLM inference latency per step")
+    parser.add_argument("--tool-ms", type=float, default=150.0,
+                        help="Simulated latency per tool call")
+    args = parser.parse_args()
+    inference_s, tool_s = args.inference_ms / 1000, args.tool_ms / 1000
+
+    print(f"inference {args.inference_ms:.0f} ms/step, tool {args.tool_ms:.0f} ms/call")
+    print(f"{'task':<20}{'calls':>6}{'serial steps':>14}{'batched steps':>15}"
+          f"{'serial s':>10}{'batched s':>11}{'speedup':>9}")
+
+    for name, calls in TASKS.items():
+        serial_steps, serial_s = run_task(calls, False, inference_s, tool_s)
+        batched_steps, batched_s = run_task(calls, True, inference_s, tool_s)
+        print(f"{name:<20}{len(calls):>6}{serial_steps:>14}{batched_steps:>15}"
+              f"{serial_s:>10.2f}{batched_s:>11.2f}{serial_s / batched_s:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
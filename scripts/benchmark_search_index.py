@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Search Index Benchmark
+Query latency of the Sauron search tools with and without core.search_index.
+
+Usage:
+    python scripts/benchmark_search_index.py [--files N] [--repeat N] [--keep DIR]
+
+Generates a synthetic source tree (--files files, ~2 KB each, nested
+packages), then reports:
+    build    — cold index build, reload from disk, no-op and small-delta refresh
+    queries  — median file_search / content_search time, os.walk vs index
+"""
+
+import sys
+import os
+import argparse
+import random
+import shutil
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+# Ensure project root is on the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from agents.sauron.tools import search_tools
+from agents.sauron.tools.search_tools import SearchTool
+from core.search_index import SearchIndex
+
+
+WORDS = (
+    "quantum state circuit gate qubit measure amplitude phase register "
+    "engine router parser schema tool result action context buffer index "
+    "return self value error config value path file data event "
+).split()
+
+QUERIES = [
+    ("file_search", {"pattern": "*.py"}),
+    ("file_search", {"pattern": "test_module_1*"}),
+    ("content_search", {"pattern": "def handle_request_7"}),
+    ("content_search", {"pattern": "RARE_MARKER_\\d+", "file_pattern": "*.py"}),
+    ("content_search", {"pattern": "circuit gate", "case_sensitive": False}),
+]
+
+
+def generate_corpus(root: Path, n_files: int, seed: int = 7) -> None:
+    rng = random.Random(seed)
+    for i in range(n_files):
+        package = root / f"pkg_{i % 40:02d}" / f"sub_{(i // 40) % 25:02d}"
+        package.mkdir(parents=True, exist_ok=True)
+        kind = rng.random()
+        name = f"test_module_{i}.py" if kind < 0.1 else (
+            f"module_{i}.py" if kind < 0.7 else f"notes_{i}.md")
+        lines = [" ".join(rng.choices(WORDS, k=10)) for _ in range(30)]
+        lines.append(f"def handle_request_{i}(self):")
+        if i % 997 == 0:
+            lines.append(f"RARE_MARKER_{i} = True")
+        (package / name).write_text("\n".join(lines) + "\n")
+
+
+def median_ms(fn, repeat: int) -> float:
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - start) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Search index benchmark")
+    parser.add_argument("--files", type=int, default=20000, help="Files in the generated corpus")
+    parser.add_argument("--repeat", type=int, default=5, help="Runs per query (median reported)")
+    parser.add_argument("--keep", help="Generate the corpus in DIR and keep it")
+    args = parser.parse_args()
+
+    base = Path(args.keep) if args.keep else Path(tempfile.mkdtemp(prefix="frank_search_"))
+    corpus = base / "corpus"
+    index_dir = base / "index"
+    try:
+        if not corpus.exists():
+            print(f"Generating {args.files} files under {corpus} ...")
+            generate_corpus(corpus, args.files)
+
+        # ── Build ─────────────────────────────────────────────────────────────
+        shutil.rmtree(index_dir, ignore_errors=True)
+        index = SearchIndex(corpus, index_dir=index_dir)
+        start = time.perf_counter()
+        index.refresh()
+        build_s = time.perf_counter() - start
+        index.save()
+
+        reloaded = SearchIndex(corpus, index_dir=index_dir)
+        start = time.perf_counter()
+        reloaded.refresh()
+        reload_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        reloaded.refresh()
+        noop_s = time.perf_counter() - start
+
+        for path in sorted(corpus.rglob("module_1?.py")):
+            path.write_text(path.read_text() + "# edited\n")
+        start = time.perf_counter()
+        delta = reloaded.refresh()
+        delta_s = time.perf_counter() - start
+
+        stats = reloaded.stats()
+        print(f"\nindex: {stats['files']} files, {stats['content_postings']} content postings")
+        print(f"{'cold build':<28}{build_s * 1000:>10.0f} ms")
+        print(f"{'reload + delta scan':<28}{reload_s * 1000:>10.0f} ms")
+        print(f"{'no-op refresh':<28}{noop_s * 1000:>10.0f} ms")
+        print(f"{'refresh, ' + str(delta['updated']) + ' files edited':<28}{delta_s * 1000:>10.0f} ms")
+
+        # ── Queries ───────────────────────────────────────────────────────────
+        tool = SearchTool()
+        index_lookup = search_tools._search_index
+        print(f"\n{'query':<52}{'walk ms':>10}{'index ms':>10}{'speedup':>9}")
+        for action, kwargs in QUERIES:
+            call = getattr(tool, f"_{action}")
+            kwargs = dict(kwargs, root=str(corpus))
+
+            search_tools._search_index = lambda root: None
+            walk = call(**kwargs)
+            walk_ms = median_ms(lambda: call(**kwargs), max(1, args.repeat // 2))
+
+            search_tools._search_index = lambda root: reloaded
+            indexed = call(**kwargs)
+            index_ms = median_ms(lambda: call(**kwargs), args.repeat)
+            search_tools._search_index = index_lookup
+
+            key = "matches" if action == "file_search" else "results"
+            same = "" if walk.data[key] == indexed.data[key] else "  (results differ)"
+            label = f"{action} {kwargs['pattern']!r}"
+            print(f"{label:<52}{walk_ms:>10.1f}{index_ms:>10.2f}{walk_ms / index_ms:>8.0f}x{same}")
+    finally:
+        if not args.keep:
+            shutil.rmtree(base, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
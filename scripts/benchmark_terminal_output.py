@@ -0,0 +1,142 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Terminal Output Benchmark
+Write throughput of the terminal output path, headless.
+
+Usage:
+    python scripts/benchmark_terminal_output.py [--lines N] [--insert-us US] [--see-us US]
+
+Replays two workloads against a fake text widget:
+    find  — one _write_output call per line (like `find` over a large tree)
+    cat   — one _write_output call with the whole text (like `cat bigfile`)
+
+and compares:
+    direct    — the previous path: insert("end") + see("end") per write,
+                nothing ever removed from the widget
+    buffered  — TerminalOutputBuffer: per-tick coalescing, scrollback cap,
+                command output past one page spilled to a temp file
+
+--insert-us / --see-us simulate the fixed cost of one Tk insert / see() call
+(busy-wait); the fake widget also stores everything it is given, so
+"widget lines" is what the real widget would have to hold and lay out.
+"""
+
+import sys
+import os
+import argparse
+import time
+
+# Ensure project root is on the path
+project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if project_root not in sys.path:
+    sys.path.insert(0, project_root)
+
+from widget.output_buffer import TerminalOutputBuffer, SCROLLBACK_LINES, PAGE_LINES
+
+
+def _spin(seconds: float) -> None:
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        pass
+
+
+class FakeText:
+    """Text widget stub holding its lines, with a fixed cost per call."""
+
+    def __init__(self, insert_us: float, see_us: float):
+        self.insert_s = insert_us / 1e6
+        self.see_s = see_us / 1e6
+        self.lines = 1
+        self.chars = 0
+        self.inserts = 0
+
+    def insert(self, index, text, *tags):
+        self.inserts += 1
+        self.lines += text.count("\n")
+        self.chars += len(text)
+        _spin(self.insert_s)
+
+    def delete(self, start, end):
+        self.lines -= int(end.split(".")[0]) - 1
+
+    def see(self, index):
+        _spin(self.see_s)
+
+
+class IdleRoot:
+    """after_idle() queue drained between "event-loop ticks"."""
+
+    def __init__(self):
+        self.queue = []
+        self.ui_seconds = 0.0
+
+    def after_idle(self, callback):
+        self.queue.append(callback)
+
+    def run_idle(self):
+        start = time.perf_counter()
+        while self.queue:
+            self.queue.pop(0)()
+        self.ui_seconds += time.perf_counter() - start
+
+
+def workload(kind: str, n_lines: int) -> list:
+    lines = [f"/home/frank/projects/pkg_{i % 40:02d}/sub_{i % 25:02d}/module_{i}.py\n"
+             for i in range(n_lines)]
+    return lines if kind == "find" else ["".join(lines)]
+
+
+def run_direct(writes: list, insert_us: float, see_us: float) -> dict:
+    widget = FakeText(insert_us, see_us)
+    start = time.perf_counter()
+    for text in writes:
+        widget.insert("end", text)
+        widget.see("end")
+    elapsed = time.perf_counter() - start
+    return {"total_s": elapsed, "ui_s": elapsed, "inserts": widget.inserts, "lines": widget.lines - 1}
+
+
+def run_buffered(writes: list, insert_us: float, see_us: float,
+                 scrollback: int, page: int) -> dict:
+    widget = FakeText(insert_us, see_us)
+    root = IdleRoot()
+    buffer = TerminalOutputBuffer(max_lines=scrollback, page_lines=page)
+    buffer.attach(widget, root)
+    start = time.perf_counter()
+    buffer.begin_command()
+    for text in writes:
+        buffer.write(text)
+    buffer.end_command()
+    root.run_idle()
+    elapsed = time.perf_counter() - start
+    spilled = buffer.stats()["spilled_lines"]
+    buffer.close()
+    return {"total_s": elapsed, "ui_s": root.ui_seconds, "inserts": widget.inserts,
+            "lines": widget.lines - 1, "spilled": spilled}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Terminal output benchmark")
+    parser.add_argument("--lines", type=int, default=200_000, help="Output lines per workload")
+    parser.add_argument("--insert-us", type=float, default=20.0, help="Simulated cost of one insert")
+    parser.add_argument("--see-us", type=float, default=20.0, help="Simulated cost of one see()")
+    parser.add_argument("--scrollback", type=int, default=SCROLLBACK_LINES, help="Scrollback line cap")
+    parser.add_argument("--page", type=int, default=PAGE_LINES, help="Lines shown per command page")
+    args = parser.parse_args()
+
+    print(f"{args.lines} lines, {args.insert_us:.0f} us/insert, {args.see_us:.0f} us/see, "
+          f"scrollback {args.scrollback}, page {args.page}\n")
+    print(f"{'workload':<10}{'path':<10}{'lines/s':>12}{'UI ms':>10}{'inserts':>10}"
+          f"{'widget lines':>14}{'spilled':>10}")
+    for kind in ("find", "cat"):
+        writes = workload(kind, args.lines)
+        direct = run_direct(writes, args.insert_us, args.see_us)
+        buffered = run_buffered(writes, args.insert_us, args.see_us, args.scrollback, args.page)
+        for name, result in (("direct", direct), ("buffered", buffered)):
+            print(f"{kind:<10}{name:<10}{args.lines / result['total_s']:>12,.0f}"
+                  f"{result['ui_s'] * 1000:>10.1f}{result['inserts']:>10}"
+                  f"{result['lines']:>14}{result.get('spilled', 0):>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,10 @@ All security events are logged for review
 
 import os
 import json
+import queue
+import atexit
 import threading
+from collections import deque
 from datetime import datetime
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -32,8 +35,14 @@ class AuditLog:
     """
     Thread-safe audit logging for security events.
     Logs to both file and memory (for terminal display).
+
+    log() never touches the disk: events are queued for a background writer
+    that appends them in batches, one open per file per batch. Callbacks run
+    on the caller's thread but outside the lock.
     """
 
+    WRITE_BATCH_SIZE = 256  # Max events appended per writer wakeup
+
     def __init__(self, log_dir: Optional[Path] = None, max_memory: int = 1000):
         self.log_dir = log_dir or Path.home() / ".frankenstein" / "logs"
         self.log_dir.mkdir(parents=True, exist_ok=True)
@@ -42,10 +51,20 @@ class AuditLog:
         self.audit_log = self.log_dir / "audit.log"
 
         self._lock = threading.Lock()
-        self._memory: List[AuditEvent] = []
+        self._memory: deque = deque(maxlen=max_memory)
         self._max_memory = max_memory
         self._callbacks: List[callable] = []
 
+        # Background writer
+        self._queue: "queue.Queue[AuditEvent]" = queue.Queue()
+        self._writer = threading.Thread(
+            target=self._writer_loop,
+            daemon=True,
+            name="FrankensteinAuditWriter"
+        )
+        self._writer.start()
+        atexit.register(self.flush)
+
     def log(self, event_type: str, severity: str, source: str,
             message: str, details: Optional[Dict] = None):
         """Log an audit event"""
@@ -59,41 +78,64 @@ class AuditLog:
         )
 
         with self._lock:
-            # Add to memory
             self._memory.append(event)
-            if len(self._memory) > self._max_memory:
-                self._memory = self._memory[-self._max_memory:]
-
-            # Write to file
-            self._write_to_file(event)
-
-            # Notify callbacks
-            for callback in self._callbacks:
+            callbacks = list(self._callbacks)
+
+        # Queue for the writer thread
+        self._queue.put(event)
+
+        # Notify callbacks
+        for callback in callbacks:
+            try:
+                callback(event)
+            except Exception:
+                pass
+
+    def flush(self):
+        """Block until all queued events have been written."""
+        self._queue.join()
+
+    def _writer_loop(self):
+        """Background writer: drain the queue and append in batches."""
+        while True:
+            batch = [self._queue.get()]
+            while len(batch) < self.WRITE_BATCH_SIZE:
                 try:
-                    callback(event)
-                except:
-                    pass
-
-    def _write_to_file(self, event: AuditEvent):
-        """Write event to log file"""
-        try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            try:
+                self._write_batch(batch)
+            finally:
+                for _ in batch:
+                    self._queue.task_done()
+
+    def _write_batch(self, events: List[AuditEvent]):
+        """Write a batch of events, grouped by log file"""
+        by_file: Dict[Path, List[str]] = {}
+        for event in events:
             log_file = self.security_log if event.severity in ["error", "critical"] else self.audit_log
-            with open(log_file, "a", encoding="utf-8") as f:
-                f.write(event.to_json() + "\n")
-        except Exception as e:
-            print(f"Audit write error: {e}")
+            by_file.setdefault(log_file, []).append(event.to_json() + "\n")
+
+        for log_file, lines in by_file.items():
+            try:
+                with open(log_file, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            except Exception as e:
+                print(f"Audit write error: {e}")
 
     def add_callback(self, callback: callable):
         """Add callback for real-time event notification"""
-        self._callbacks.append(callback)
+        with self._lock:
+            self._callbacks.append(callback)
 
     def get_recent(self, count: int = 50, severity: Optional[str] = None) -> List[AuditEvent]:
         """Get recent events from memory"""
         with self._lock:
-            events = self._memory[-count:]
-            if severity:
-                events = [e for e in events if e.severity == severity]
-            return events
+            events = list(self._memory)[-count:]
+        if severity:
+            events = [e for e in events if e.severity == severity]
+        return events
 
     def log_threat(self, threat_name: str, input_text: str, action: str):
         """Convenience method for logging threats"""
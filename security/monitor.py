@@ -109,6 +109,11 @@ class SecurityMonitor:
         self._max_events = max_events
         self._alert_window = timedelta(minutes=alert_window_minutes)
 
+        # Sliding alert window: (timestamp, severity) in arrival order plus
+        # per-severity counts, so the threat level never rescans events
+        self._window: deque = deque()
+        self._window_counts: Dict[ThreatSeverity, int] = {s: 0 for s in ThreatSeverity}
+
         # Statistics
         self._stats = ThreatStats()
         self._start_time: Optional[datetime] = None
@@ -209,6 +214,13 @@ class SecurityMonitor:
             self._events.append(event)
             self._update_stats(event)
 
+            # Window never holds more than the event feed does
+            self._window.append((event.timestamp, event.severity))
+            self._window_counts[event.severity] += 1
+            if len(self._window) > self._max_events:
+                _, severity = self._window.popleft()
+                self._window_counts[severity] -= 1
+
             # Track active threats
             if event.severity in (ThreatSeverity.HIGH, ThreatSeverity.CRITICAL):
                 self._active_threats.append(event)
@@ -246,35 +258,39 @@ class SecurityMonitor:
         if event.severity.value[0] > self._stats.peak_severity.value[0]:
             self._stats.peak_severity = event.severity
 
+    def _expire_window(self, cutoff: datetime):
+        """Drop events at or before cutoff from the alert window (lock held)"""
+        window = self._window
+        while window and window[0][0] <= cutoff:
+            _, severity = window.popleft()
+            self._window_counts[severity] -= 1
+
     def _update_threat_level(self):
         """Recalculate current threat level based on recent events"""
         cutoff = datetime.now() - self._alert_window
 
         with self._lock:
-            recent_events = [e for e in self._events if e.timestamp > cutoff]
-
-        if not recent_events:
-            new_severity = ThreatSeverity.CLEAR
+            self._expire_window(cutoff)
+            counts = dict(self._window_counts)
+
+        critical_count = counts[ThreatSeverity.CRITICAL]
+        high_count = counts[ThreatSeverity.HIGH]
+        medium_count = counts[ThreatSeverity.MEDIUM]
+
+        if critical_count > 0:
+            new_severity = ThreatSeverity.CRITICAL
+        elif high_count >= 3:
+            new_severity = ThreatSeverity.CRITICAL
+        elif high_count > 0:
+            new_severity = ThreatSeverity.HIGH
+        elif medium_count >= 5:
+            new_severity = ThreatSeverity.HIGH
+        elif medium_count > 0:
+            new_severity = ThreatSeverity.MEDIUM
         else:
-            # Count events by severity
-            critical_count = sum(1 for e in recent_events if e.severity == ThreatSeverity.CRITICAL)
-            high_count = sum(1 for e in recent_events if e.severity == ThreatSeverity.HIGH)
-            medium_count = sum(1 for e in recent_events if e.severity == ThreatSeverity.MEDIUM)
-
-            if critical_count > 0:
-                new_severity = ThreatSeverity.CRITICAL
-            elif high_count >= 3:
-                new_severity = ThreatSeverity.CRITICAL
-            elif high_count > 0:
-                new_severity = ThreatSeverity.HIGH
-            elif medium_count >= 5:
-                new_severity = ThreatSeverity.HIGH
-            elif medium_count > 0:
-                new_severity = ThreatSeverity.MEDIUM
-            else:
-                # Only low/clear events
-                low_count = sum(1 for e in recent_events if e.severity == ThreatSeverity.LOW)
-                new_severity = ThreatSeverity.LOW if low_count > 3 else ThreatSeverity.CLEAR
+            # Only low/clear events (or none at all)
+            low_count = counts[ThreatSeverity.LOW]
+            new_severity = ThreatSeverity.LOW if low_count > 3 else ThreatSeverity.CLEAR
 
         # Notify if changed
         if new_severity != self._current_severity:
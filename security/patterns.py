@@ -1,12 +1,31 @@
 """
 FRANKENSTEIN Security - Threat Detection Patterns
 Detects prompt injection and other malicious inputs
+
+Scanning is done by ThreatScanner: a literal prefilter picks the patterns
+that can possibly match, the candidates are merged into one alternation
+with a named group per pattern, and verdicts are kept in a bounded LRU.
 """
 
 import re
-from typing import List, Tuple
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Dict, FrozenSet, Iterable, List, Optional, Tuple
 from dataclasses import dataclass
 
+try:
+    import ahocorasick  # pyahocorasick: optional C Aho-Corasick automaton
+    HAS_AHOCORASICK = True
+except ImportError:
+    HAS_AHOCORASICK = False
+
+
+# Scanner limits
+VERDICT_CACHE_SIZE = 1024  # Distinct inputs remembered by the verdict cache
+CACHE_KEY_MAX_CHARS = 4096  # Longer inputs are keyed by digest, not by text
+COMBINED_CACHE_SIZE = 256  # Compiled alternations kept per candidate set
+
 
 @dataclass
 class ThreatPattern:
@@ -14,6 +33,9 @@ class ThreatPattern:
     pattern: str
     severity: str  # low, medium, high, critical
     description: str
+    # Lowercase substrings of which every match contains at least one.
+    # Empty means the pattern has no usable literal and is always a candidate.
+    literals: Tuple[str, ...] = ()
 
 
 # Prompt injection patterns
@@ -22,49 +44,57 @@ INJECTION_PATTERNS: List[ThreatPattern] = [
         name="instruction_override",
         pattern=r"ignore\s+(all\s+)?(previous|prior|above)\s+(instructions?|prompts?|rules?)",
         severity="critical",
-        description="Attempt to override system instructions"
+        description="Attempt to override system instructions",
+        literals=("ignore",)
     ),
     ThreatPattern(
         name="role_hijack",
         pattern=r"you\s+are\s+now\s+(a|an|the)",
         severity="high",
-        description="Attempt to change AI role"
+        description="Attempt to change AI role",
+        literals=("now",)
     ),
     ThreatPattern(
         name="system_prompt_leak",
         pattern=r"(show|reveal|display|print|output)\s+(your\s+)?(system\s+)?prompt",
         severity="high",
-        description="Attempt to extract system prompt"
+        description="Attempt to extract system prompt",
+        literals=("prompt",)
     ),
     ThreatPattern(
         name="jailbreak_keyword",
         pattern=r"\b(jailbreak|dan\s+mode|developer\s+mode|no\s+restrictions)\b",
         severity="critical",
-        description="Known jailbreak terminology"
+        description="Known jailbreak terminology",
+        literals=("jailbreak", "dan", "developer", "restrictions")
     ),
     ThreatPattern(
         name="token_manipulation",
         pattern=r"<\|[^|]+\|>",
         severity="high",
-        description="Token boundary manipulation"
+        description="Token boundary manipulation",
+        literals=("<|",)
     ),
     ThreatPattern(
         name="code_injection",
         pattern=r"```\s*(system|exec|eval|import\s+os)",
         severity="high",
-        description="Code injection attempt"
+        description="Code injection attempt",
+        literals=("```",)
     ),
     ThreatPattern(
         name="privilege_escalation",
         pattern=r"\b(admin|root|sudo|administrator)\s+(mode|access|privilege)",
         severity="critical",
-        description="Privilege escalation attempt"
+        description="Privilege escalation attempt",
+        literals=("admin", "root", "sudo")
     ),
     ThreatPattern(
         name="instruction_injection",
         pattern=r"(new\s+instructions?|updated?\s+rules?|override\s+settings?):",
         severity="high",
-        description="Instruction injection attempt"
+        description="Instruction injection attempt",
+        literals=("instruction", "rule", "setting")
     ),
 ]
 
@@ -74,19 +104,22 @@ EXFIL_PATTERNS: List[ThreatPattern] = [
         name="api_key_leak",
         pattern=r"(api[_-]?key|secret[_-]?key|access[_-]?token)\s*[:=]",
         severity="critical",
-        description="API key exposure attempt"
+        description="API key exposure attempt",
+        literals=("api", "secret", "access")
     ),
     ThreatPattern(
         name="credential_request",
         pattern=r"(password|passwd|credentials?|auth\s*token)",
         severity="medium",
-        description="Credential access attempt"
+        description="Credential access attempt",
+        literals=("password", "passwd", "credential", "auth")
     ),
     ThreatPattern(
         name="file_path_probe",
         pattern=r"(\/etc\/passwd|\.env|config\.yaml|secrets?\.)",
         severity="high",
-        description="Sensitive file path probe"
+        description="Sensitive file path probe",
+        literals=("/etc/passwd", ".env", "config.yaml", "secret")
     ),
 ]
 
@@ -105,17 +138,209 @@ def compile_patterns() -> List[Tuple[ThreatPattern, re.Pattern]]:
 
 COMPILED_PATTERNS = compile_patterns()
 
+# Characters that IGNORECASE matching folds onto ASCII letters after lower();
+# the literal prefilter must see them the way the regexes do.
+_PREFILTER_FOLD = str.maketrans({"\u0131": "i", "\u017f": "s"})
 
-def check_threats(text: str) -> List[ThreatPattern]:
-    """Check text for threat patterns, return list of matches"""
-    threats = []
-    text_lower = text.lower()
 
-    for pattern, regex in COMPILED_PATTERNS:
-        if regex.search(text_lower):
-            threats.append(pattern)
+class ThreatScanner:
+    """
+    Multi-pattern threat scanner.
+
+    A literal prefilter (Aho-Corasick when pyahocorasick is installed,
+    otherwise one compiled alternation of all literals) finds the patterns
+    whose required substrings occur in the input. Only those candidates are
+    merged into a single regex with one named group per pattern, so a
+    benign input costs one literal pass and no regex work. Verdicts for
+    repeated inputs come from a bounded LRU cache.
+    """
+
+    def __init__(
+        self,
+        compiled: Iterable[Tuple[ThreatPattern, re.Pattern]],
+        cache_size: int = VERDICT_CACHE_SIZE
+    ):
+        """
+        Initialize scanner.
+
+        Args:
+            compiled: (pattern, regex) pairs as produced by compile_patterns()
+            cache_size: Maximum number of cached verdicts (0 disables caching)
+        """
+        self.patterns: List[ThreatPattern] = [pattern for pattern, _ in compiled]
+        self.cache_size = cache_size
+
+        # Literal -> indices of the patterns it makes candidates
+        owners: Dict[str, set] = {}
+        always = set()
+        for index, pattern in enumerate(self.patterns):
+            if not pattern.literals:
+                always.add(index)
+            for literal in pattern.literals:
+                owners.setdefault(literal.lower(), set()).add(index)
+
+        # A hit on a literal implies a hit on every literal it contains, which
+        # keeps the leftmost-longest fallback prefilter exact
+        self._literal_owners: Dict[str, FrozenSet[int]] = {
+            literal: frozenset().union(*(
+                owners[other] for other in owners if other in literal
+            ))
+            for literal in owners
+        }
+        self._always: FrozenSet[int] = frozenset(always)
+
+        self._automaton = None
+        self._literal_regex: Optional[re.Pattern] = None
+        if HAS_AHOCORASICK and owners:
+            self._automaton = ahocorasick.Automaton()
+            for literal in owners:
+                self._automaton.add_word(literal, literal)
+            self._automaton.make_automaton()
+        elif owners:
+            alternation = "|".join(
+                re.escape(literal) for literal in sorted(owners, key=len, reverse=True)
+            )
+            self._literal_regex = re.compile(f"(?=({alternation}))")
+
+        self._combined: "OrderedDict[FrozenSet[int], re.Pattern]" = OrderedDict()
+        self._cache: "OrderedDict[object, Tuple[int, ...]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def scan(self, text: str) -> List[ThreatPattern]:
+        """
+        Scan text and return matching patterns in declaration order.
+
+        Args:
+            text: Input to scan
+
+        Returns:
+            List of matched ThreatPatterns
+        """
+        text_lower = text.lower()
+        key = self._cache_key(text_lower)
+
+        with self._lock:
+            verdict = self._cache.get(key)
+            if verdict is not None:
+                self._cache.move_to_end(key)
+                self.hits += 1
+                return [self.patterns[i] for i in verdict]
+            self.misses += 1
+
+        verdict = self._match(text_lower)
+
+        if self.cache_size > 0:
+            with self._lock:
+                self._cache[key] = verdict
+                self._cache.move_to_end(key)
+                while len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+
+        return [self.patterns[i] for i in verdict]
 
-    return threats
+    def candidates(self, text_lower: str) -> FrozenSet[int]:
+        """Indices of patterns whose required literals occur in the text."""
+        folded = text_lower.translate(_PREFILTER_FOLD)
+        found = set(self._always)
+        owners = self._literal_owners
+
+        if self._automaton is not None:
+            for _, literal in self._automaton.iter(folded):
+                found.update(owners[literal])
+        elif self._literal_regex is not None:
+            seen = set()
+            for match in self._literal_regex.finditer(folded):
+                literal = match.group(1)
+                if literal not in seen:
+                    seen.add(literal)
+                    found.update(owners[literal])
+                    if len(found) == len(self.patterns):
+                        break
+
+        return frozenset(found)
+
+    def cache_info(self) -> Dict[str, int]:
+        """Verdict cache statistics."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "size": len(self._cache),
+                "max_size": self.cache_size,
+            }
+
+    def clear_cache(self):
+        """Drop all cached verdicts."""
+        with self._lock:
+            self._cache.clear()
+            self.hits = 0
+            self.misses = 0
+
+    # Private methods
+
+    def _match(self, text_lower: str) -> Tuple[int, ...]:
+        """Run the combined regex over the prefilter candidates."""
+        remaining = set(self.candidates(text_lower))
+        matched = []
+        pos = 0
+
+        # Each search reports the leftmost match among the remaining
+        # patterns; none of them can match before that point, so the next
+        # search resumes there with the matched pattern removed.
+        while remaining:
+            match = self._combined_regex(frozenset(remaining)).search(text_lower, pos)
+            if match is None:
+                break
+            index = int(match.lastgroup[1:])
+            matched.append(index)
+            remaining.discard(index)
+            pos = match.start()
+
+        return tuple(sorted(matched))
+
+    def _combined_regex(self, indices: FrozenSet[int]) -> re.Pattern:
+        """Compiled alternation with a named group per candidate pattern."""
+        with self._lock:
+            regex = self._combined.get(indices)
+            if regex is not None:
+                self._combined.move_to_end(indices)
+                return regex
+
+        regex = re.compile(
+            "|".join(f"(?P<p{i}>{self.patterns[i].pattern})" for i in sorted(indices)),
+            re.IGNORECASE
+        )
+
+        with self._lock:
+            self._combined[indices] = regex
+            while len(self._combined) > COMBINED_CACHE_SIZE:
+                self._combined.popitem(last=False)
+        return regex
+
+    @staticmethod
+    def _cache_key(text_lower: str) -> object:
+        """Short inputs key the cache directly; long ones by digest."""
+        if len(text_lower) <= CACHE_KEY_MAX_CHARS:
+            return text_lower
+        digest = hashlib.blake2b(
+            text_lower.encode("utf-8", "surrogatepass"), digest_size=16
+        ).digest()
+        return (len(text_lower), digest)
+
+
+_SCANNER = ThreatScanner(COMPILED_PATTERNS)
+
+
+def get_scanner() -> ThreatScanner:
+    """Get the shared threat scanner"""
+    return _SCANNER
+
+
+def check_threats(text: str) -> List[ThreatPattern]:
+    """Check text for threat patterns, return list of matches"""
+    return _SCANNER.scan(text)
 
 
 def get_threat_level(threats: List[ThreatPattern]) -> str:
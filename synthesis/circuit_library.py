@@ -179,6 +179,16 @@ class CircuitDefinition:
         return len(self.gates)
 
 
+def _notify_artifact(event_name: str, name: str) -> None:
+    """Publish a circuit save/delete on the EventBus (non-fatal)."""
+    try:
+        from data.events import EventBus, EventType
+        EventBus().emit(EventType[event_name], source="circuit_library",
+                        kind="circuit", name=name)
+    except Exception as e:
+        logger.debug(f"Circuit event not published: {e}")
+
+
 class CircuitLibrary:
     """
     Persistent circuit library stored at ~/.frankenstein/synthesis_data/circuits/
@@ -207,6 +217,7 @@ class CircuitLibrary:
 
         filepath.write_text(json.dumps(circuit.to_dict(), indent=2))
         logger.info(f"Circuit saved: {circuit.name} (v{circuit.version})")
+        _notify_artifact("QUANTUM_ARTIFACT_SAVED", circuit.name)
         return filepath
 
     def load(self, name: str) -> Optional[CircuitDefinition]:
@@ -256,6 +267,7 @@ class CircuitLibrary:
 
         if deleted:
             logger.info(f"Circuit deleted: {name}")
+            _notify_artifact("QUANTUM_ARTIFACT_DELETED", name)
         return deleted
 
     def export_qasm(self, name: str) -> Optional[Path]:
@@ -4,6 +4,9 @@ Phase 2 Step 3: Real Computational Backend
 
 The heart of FRANKENSTEIN's computational capabilities.
 Provides actual mathematical and physics calculations.
+
+Expressions are parsed once and kept compiled (see expressions.py);
+results are memoized in a bounded LRU and history is capped.
 """
 
 # Phase 3.5: Load numpy via integration layer, fall back to pip
@@ -18,9 +21,13 @@ from typing import Dict, Any, Optional, List, Callable, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+from collections import deque
 import logging
 import time
-import json
+
+from .expressions import (
+    ResultCache, get_expression_cache, variables_key, RESULT_MAX_ELEMENTS,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -86,11 +93,13 @@ class ComputeEngine:
     MAX_MATRIX_DIM = 2048
     MAX_ITERATIONS = 100000
     COMPUTATION_TIMEOUT = 30.0
+    HISTORY_SIZE = 1000
     
     def __init__(self):
         self._mode = ComputeMode.HYBRID
-        self._history: List[ComputeResult] = []
-        self._cache: Dict[str, ComputeResult] = {}
+        self._history: deque = deque(maxlen=self.HISTORY_SIZE)
+        self._cache = ResultCache()
+        self._expressions = get_expression_cache()
         self._sympy_available = self._check_sympy()
         self._scipy_available = self._check_scipy()
         logger.info(f"ComputeEngine initialized. SymPy: {self._sympy_available}, SciPy: {self._scipy_available}")
@@ -127,9 +136,9 @@ class ComputeEngine:
         variables = variables or {}
         
         # Check cache
-        cache_key = f"{expression}:{mode.value}:{json.dumps(variables, sort_keys=True)}"
-        if cache_key in self._cache:
-            cached = self._cache[cache_key]
+        cache_key = self._cache_key(expression, mode, variables)
+        cached = self._cache.get(cache_key) if cache_key is not None else None
+        if cached is not None:
             cached.metadata["from_cache"] = True
             return cached
         
@@ -146,7 +155,8 @@ class ComputeEngine:
             
             result.computation_time = time.time() - start_time
             self._history.append(result)
-            self._cache[cache_key] = result
+            if cache_key is not None and np.size(result.result) <= RESULT_MAX_ELEMENTS:
+                self._cache.put(cache_key, result)
             return result
             
         except Exception as e:
@@ -159,16 +169,24 @@ class ComputeEngine:
                 computation_time=time.time() - start_time
             )
 
+    def _cache_key(self, expression: str, mode: ComputeMode,
+                   variables: Dict[str, Any]) -> Optional[tuple]:
+        """Result-cache key, or None if the variables cannot be keyed."""
+        try:
+            return self._expressions.get(expression).text, mode.value, variables_key(variables)
+        except TypeError:
+            return None
+
     def _compute_symbolic(self, expression: str, variables: Dict[str, Any]) -> ComputeResult:
         """Symbolic computation using SymPy"""
         import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
-        
-        # Parse expression
-        expr = parse_expr(expression, local_dict=variables)
         
-        # Simplify
-        simplified = sp.simplify(expr)
+        # Parsed once per expression; variables are substituted afterwards
+        compiled = self._expressions.get(expression)
+        if variables:
+            simplified = sp.simplify(compiled.substituted(variables))
+        else:
+            simplified = compiled.simplified()
         
         # Try to evaluate numerically
         numeric = None
@@ -189,19 +207,8 @@ class ComputeEngine:
     
     def _compute_numeric(self, expression: str, variables: Dict[str, Any]) -> ComputeResult:
         """Numeric computation using NumPy"""
-        # Create safe evaluation context
-        safe_dict = {
-            "np": np, "numpy": np,
-            "sin": np.sin, "cos": np.cos, "tan": np.tan,
-            "exp": np.exp, "log": np.log, "sqrt": np.sqrt,
-            "pi": np.pi, "e": np.e,
-            "abs": np.abs, "sum": np.sum, "mean": np.mean,
-            "array": np.array, "linspace": np.linspace,
-            "arange": np.arange, "zeros": np.zeros, "ones": np.ones,
-        }
-        safe_dict.update(variables)
-        
-        result = eval(expression, {"__builtins__": {}}, safe_dict)
+        # Compiled once; evaluated against the safe numpy namespace
+        result = self._expressions.get(expression).eval_numeric(variables)
         
         numeric = None
         if isinstance(result, (int, float, np.number)):
@@ -233,6 +240,10 @@ class ComputeEngine:
     
     def _compute_hybrid(self, expression: str, variables: Dict[str, Any]) -> ComputeResult:
         """Hybrid symbolic+numeric computation"""
+        # Array inputs: one vectorized evaluation instead of symbolic work
+        if any(isinstance(v, (np.ndarray, list, tuple)) for v in variables.values()):
+            return self.evaluate(expression, variables)
+        
         # Try symbolic first
         if self._sympy_available:
             try:
@@ -330,16 +341,61 @@ class ComputeEngine:
             metadata={"operator_shape": A.shape}
         )
     
+    def evaluate(self, expression: str, variables: Dict[str, Any] = None) -> ComputeResult:
+        """
+        Evaluate an expression over scalar or array variables.
+        
+        The expression is compiled once (lambdified to NumPy when SymPy can
+        parse it), so evaluating it over 10^6 parameter points is a single
+        vectorized call.
+        
+        Args:
+            expression: Expression in the variables, e.g. "sin(x)*exp(-y)"
+            variables: Variable values; arrays broadcast element-wise
+        
+        Returns:
+            ComputeResult whose result is the value (an ndarray for array inputs)
+        """
+        start_time = time.time()
+        variables = {k: np.asarray(v) if isinstance(v, (list, tuple)) else v
+                     for k, v in (variables or {}).items()}
+        try:
+            result = self._expressions.get(expression).evaluate(variables)
+        except Exception as e:
+            return ComputeResult(
+                success=False,
+                mode=ComputeMode.NUMERIC,
+                expression=expression,
+                error=str(e),
+                computation_time=time.time() - start_time
+            )
+        
+        numeric = None
+        if np.size(result) == 1:
+            try:
+                numeric = float(np.real_if_close(np.asarray(result)).flat[0])
+            except (TypeError, ValueError):
+                pass
+        
+        return ComputeResult(
+            success=True,
+            mode=ComputeMode.NUMERIC,
+            expression=expression,
+            result=result,
+            numeric_value=numeric,
+            computation_time=time.time() - start_time,
+            metadata={"type": "vectorized", "points": int(np.size(result))}
+        )
+    
     def differentiate(self, expression: str, variable: str = "x") -> ComputeResult:
         """Compute derivative symbolically"""
         if not self._sympy_available:
             return ComputeResult(success=False, mode=ComputeMode.SYMBOLIC, error="SymPy not available")
         
         import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
         
         x = sp.Symbol(variable)
-        expr = parse_expr(expression, local_dict={variable: x})
+        expr = self._expressions.get(expression).parsed((variable,))
         derivative = sp.diff(expr, x)
         
         return ComputeResult(
@@ -357,10 +413,9 @@ class ComputeEngine:
             return ComputeResult(success=False, mode=ComputeMode.SYMBOLIC, error="SymPy not available")
         
         import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
         
         x = sp.Symbol(variable)
-        expr = parse_expr(expression, local_dict={variable: x})
+        expr = self._expressions.get(expression).parsed((variable,))
         
         if limits:
             integral = sp.integrate(expr, (x, limits[0], limits[1]))
@@ -442,11 +497,16 @@ class ComputeEngine:
     
     def get_history(self, limit: int = 10) -> List[ComputeResult]:
         """Get computation history"""
-        return self._history[-limit:]
+        return list(self._history)[-limit:]
     
     def clear_cache(self):
         """Clear computation cache"""
         self._cache.clear()
+        self._expressions.clear()
+    
+    def cache_stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for the result and compiled-expression caches"""
+        return {"results": self._cache.stats(), "expressions": self._expressions.stats()}
 
 
 # Singleton instance
@@ -0,0 +1,316 @@
+"""
+FRANKENSTEIN 1.0 - Compiled Expressions
+Parse-once expression layer for the compute engine
+
+ComputeEngine.compute() used to re-parse its expression on every call
+(parse_expr for symbolic, eval() of the source text for numeric), memoized
+results in an unbounded dict keyed by json.dumps(variables) - which cannot
+hold a NumPy array - and appended every result to an unbounded history.
+
+This module provides:
+
+    CompiledExpression  one expression, parsed at most once per form:
+                          code      Python code object for numeric eval
+                          parsed    sympy expression (symbolic semantics),
+                                    one per set of caller variable names
+                          vectorized  sympy.lambdify'd NumPy callable, so an
+                                    expression over 10^6 points is one call
+    ExpressionCache     thread-safe LRU of CompiledExpression keyed by the
+                        normalized expression text
+    ResultCache         thread-safe LRU of results, keyed by variables_key()
+    variables_key       hashable key for a variables dict; arrays are keyed
+                        by dtype, shape and a content digest
+
+Usage:
+    compiled = get_expression_cache().get("sin(x)**2 + cos(y)")
+    values = compiled.evaluate({"x": xs, "y": ys})     # one vectorized call
+"""
+
+import ast
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+EXPRESSION_CACHE_SIZE = 512     # Compiled expressions kept (LRU)
+RESULT_CACHE_SIZE = 256         # Memoized compute() results (LRU)
+RESULT_MAX_ELEMENTS = 65536     # Larger array inputs/results are not memoized
+SYMBOL_FORMS_MAX = 8            # Parsed forms kept per expression (one per name set)
+
+
+# Names visible to numeric evaluation (the engine's former safe_dict)
+NUMERIC_NAMESPACE: Dict[str, Any] = {
+    "np": np, "numpy": np,
+    "sin": np.sin, "cos": np.cos, "tan": np.tan,
+    "exp": np.exp, "log": np.log, "sqrt": np.sqrt,
+    "pi": np.pi, "e": np.e,
+    "abs": np.abs, "sum": np.sum, "mean": np.mean,
+    "array": np.array, "linspace": np.linspace,
+    "arange": np.arange, "zeros": np.zeros, "ones": np.ones,
+}
+
+# Free symbols the vectorized form fills in when the caller does not
+_NUMERIC_CONSTANTS = {"pi": np.pi, "e": np.e}
+
+
+def normalize_expression(expression: str) -> str:
+    """
+    Canonical text for an expression, used as the cache key.
+
+    Python-parsable text is round-tripped through ast so spacing and
+    redundant parentheses do not matter ("x+1" and "(x + 1)" share an
+    entry); anything else only has its whitespace collapsed.
+    """
+    text = " ".join(expression.split())
+    try:
+        return ast.unparse(ast.parse(text, mode="eval"))
+    except (SyntaxError, ValueError):
+        return text
+
+
+def _array_size(value: Any) -> int:
+    return int(getattr(value, "size", 1))
+
+
+def _value_key(value: Any) -> Hashable:
+    if value is None or isinstance(value, (bool, int, float, complex, str)):
+        return type(value).__name__, value
+    if isinstance(value, np.generic):
+        return type(value).__name__, value.item()
+    if isinstance(value, dict):
+        return "dict", tuple(sorted((str(k), _value_key(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return type(value).__name__, tuple(_value_key(v) for v in value)
+    if isinstance(value, np.ndarray):
+        if value.size > RESULT_MAX_ELEMENTS:
+            raise TypeError("array too large to memoize")
+        data = np.ascontiguousarray(value)
+        digest = hashlib.blake2b(data.view(np.uint8), digest_size=16).hexdigest()
+        return "ndarray", str(value.dtype), value.shape, digest
+    # sympy objects are immutable and hashable
+    try:
+        hash(value)
+    except TypeError:
+        raise TypeError(f"cannot memoize variable of type {type(value).__name__}")
+    return type(value).__name__, value
+
+
+def variables_key(variables: Dict[str, Any]) -> Hashable:
+    """
+    Hashable, order-independent key for a variables dict.
+
+    Arrays are keyed by dtype, shape and a content digest. Raises TypeError
+    for values that cannot be keyed, or arrays over RESULT_MAX_ELEMENTS.
+    """
+    return tuple(sorted((str(k), _value_key(v)) for k, v in variables.items()))
+
+
+# ── Compiled expression ────────────────────────────────────────────────────────
+
+class CompiledExpression:
+    """
+    One expression, with each parsed form built on first use and kept.
+
+    Thread-safe: forms are immutable once built; two threads racing to
+    build the same form both produce an equivalent object.
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self._code = None
+        self._parsed: Dict[Tuple[str, ...], Any] = {}
+        self._simplified = None
+        self._vectorized: Dict[Tuple[str, ...], Tuple[Callable, Tuple[str, ...]]] = {}
+
+    @property
+    def code(self):
+        """Python code object for numeric evaluation."""
+        if self._code is None:
+            self._code = compile(self.text, "<expression>", "eval")
+        return self._code
+
+    @staticmethod
+    def _names_key(names: Iterable[str]) -> Tuple[str, ...]:
+        return tuple(sorted(names))
+
+    @staticmethod
+    def _remember(forms: dict, key: Tuple[str, ...], value: Any) -> Any:
+        if len(forms) >= SYMBOL_FORMS_MAX:
+            forms.clear()
+        forms[key] = value
+        return value
+
+    def parsed(self, names: Iterable[str] = ()):
+        """
+        The expression parsed by sympy with names bound to plain Symbols.
+
+        Binding the caller's variable names keeps sympy's reserved names
+        (E, I, N, S, Q, ...) usable as variables - "E*2" with E given is
+        2*E, not 2e - as parsing with local_dict per call did.
+
+        Raises:
+            Whatever parse_expr raises if the text does not parse
+        """
+        key = self._names_key(names)
+        expr = self._parsed.get(key)
+        if expr is None:
+            from sympy import Symbol
+            from sympy.parsing.sympy_parser import parse_expr
+            expr = parse_expr(self.text, local_dict={name: Symbol(name) for name in key})
+            self._remember(self._parsed, key, expr)
+        return expr
+
+    @property
+    def sympy(self):
+        """The expression parsed by sympy with no names bound."""
+        return self.parsed()
+
+    def simplified(self):
+        """sympy.simplify of the parsed expression, computed once."""
+        if self._simplified is None:
+            import sympy as sp
+            self._simplified = sp.simplify(self.sympy)
+        return self._simplified
+
+    def substituted(self, variables: Dict[str, Any]):
+        """The sympy expression with variables substituted."""
+        if not variables:
+            return self.sympy
+        import sympy as sp
+        return self.parsed(variables).subs(
+            {sp.Symbol(name): value for name, value in variables.items()}
+        )
+
+    def vectorized(self, names: Iterable[str] = ()) -> Tuple[Callable, Tuple[str, ...]]:
+        """
+        NumPy callable for the expression and its argument names.
+
+        Built with sympy.lambdify over the sorted free symbols of
+        parsed(names), so array arguments are evaluated element-wise in
+        one call.
+        """
+        key = self._names_key(names)
+        form = self._vectorized.get(key)
+        if form is None:
+            import sympy as sp
+            expr = self.parsed(key)
+            symbols = sorted(expr.free_symbols, key=lambda s: s.name)
+            fn = sp.lambdify(symbols, expr)
+            form = self._remember(self._vectorized, key, (fn, tuple(s.name for s in symbols)))
+        return form
+
+    def eval_numeric(self, variables: Dict[str, Any]) -> Any:
+        """Evaluate the code object against NUMERIC_NAMESPACE plus variables."""
+        namespace = dict(NUMERIC_NAMESPACE)
+        namespace.update(variables)
+        return eval(self.code, {"__builtins__": {}}, namespace)
+
+    def evaluate(self, variables: Dict[str, Any]) -> Any:
+        """
+        Evaluate over scalar or array variables in one vectorized call.
+
+        Uses the lambdified form when sympy can parse the expression, the
+        numeric code object otherwise (e.g. expressions calling np.*).
+        An expression that uses none of the array variables is broadcast
+        to their shape; one that reduces them (mean(x)) is returned as is.
+
+        Raises:
+            ValueError: a free symbol has no value
+        """
+        try:
+            fn, names = self.vectorized(variables)
+        except Exception:
+            return self.eval_numeric(variables)
+        args = []
+        for name in names:
+            if name in variables:
+                args.append(variables[name])
+            elif name in _NUMERIC_CONSTANTS:
+                args.append(_NUMERIC_CONSTANTS[name])
+            else:
+                raise ValueError(f"No value for variable '{name}' in {self.text}")
+        result = fn(*args)
+        arrays = [v for v in variables.values() if isinstance(v, np.ndarray)]
+        if (arrays and np.ndim(result) == 0
+                and not any(isinstance(variables.get(name), np.ndarray) for name in names)):
+            result = np.broadcast_to(result, np.broadcast_shapes(*(a.shape for a in arrays)))
+        return result
+
+
+# ── Caches ─────────────────────────────────────────────────────────────────────
+
+class ResultCache:
+    """Thread-safe LRU with hit/miss counters."""
+
+    _MISS = object()
+
+    def __init__(self, max_entries: int = RESULT_CACHE_SIZE):
+        self._max_entries = max_entries
+        self._entries: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            value = self._entries.get(key, self._MISS)
+            if value is self._MISS:
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = value
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {"entries": len(self._entries), "max_entries": self._max_entries,
+                    "hits": self.hits, "misses": self.misses}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class ExpressionCache(ResultCache):
+    """LRU of CompiledExpression keyed by normalized expression text."""
+
+    def __init__(self, max_entries: int = EXPRESSION_CACHE_SIZE):
+        super().__init__(max_entries)
+
+    def get(self, expression: str) -> CompiledExpression:  # type: ignore[override]
+        """The compiled form of expression, created on a miss."""
+        text = normalize_expression(expression)
+        compiled = super().get(text)
+        if compiled is None:
+            compiled = CompiledExpression(text)
+            self.put(text, compiled)
+        return compiled
+
+
+_expression_cache: Optional[ExpressionCache] = None
+
+
+def get_expression_cache() -> ExpressionCache:
+    """Get or create the process-wide ExpressionCache."""
+    global _expression_cache
+    if _expression_cache is None:
+        _expression_cache = ExpressionCache()
+    return _expression_cache
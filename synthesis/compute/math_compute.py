@@ -7,12 +7,17 @@ Provides actual mathematical calculations:
 - Numerical analysis
 - Linear algebra
 - Optimization
+
+Symbolic operations go through SymbolicService (symbolic.py): memoized,
+and run in a worker subprocess with a wall-clock budget.
 """
 
 import numpy as np
 from typing import Dict, Any, Optional, List, Callable, Union
 import logging
 
+from .symbolic import get_symbolic_service
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,6 +27,7 @@ class MathCompute:
     def __init__(self):
         self._sympy_available = self._check_sympy()
         self._scipy_available = self._check_scipy()
+        self._symbolic = get_symbolic_service()
     
     def _check_sympy(self) -> bool:
         try:
@@ -48,91 +54,55 @@ class MathCompute:
         }
         return eval(expression, {"__builtins__": {}}, safe_dict)
     
-    def differentiate(self, expression: str, variable: str = "x", order: int = 1) -> str:
+    def differentiate(self, expression: str, variable: str = "x", order: int = 1,
+                      timeout: Optional[float] = None) -> str:
         """Symbolic differentiation"""
         if not self._sympy_available:
             raise ImportError("SymPy required for symbolic differentiation")
-        
-        import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
-        
-        x = sp.Symbol(variable)
-        expr = parse_expr(expression, local_dict={variable: x})
-        for _ in range(order):
-            expr = sp.diff(expr, x)
-        return str(sp.simplify(expr))
+        return self._symbolic.run("differentiate", expression, variable, timeout, order=order)
 
     def integrate(self, expression: str, variable: str = "x", 
-                  limits: Optional[tuple] = None) -> Union[str, float]:
-        """Symbolic or definite integration"""
+                  limits: Optional[tuple] = None,
+                  timeout: Optional[float] = None) -> Union[str, float]:
+        """
+        Symbolic or definite integration.
+        
+        A definite integral that exceeds the time budget is computed by
+        numeric quadrature instead.
+        """
         if not self._sympy_available:
             raise ImportError("SymPy required")
-        
-        import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
-        
-        x = sp.Symbol(variable)
-        expr = parse_expr(expression, local_dict={variable: x})
-        
         if limits:
-            result = sp.integrate(expr, (x, limits[0], limits[1]))
-            try:
-                return float(result.evalf())
-            except (TypeError, ValueError):
-                return str(result)
-        return str(sp.integrate(expr, x))
-    
-    def solve(self, equation: str, variable: str = "x") -> List[str]:
+            return self._symbolic.run("integrate", expression, variable, timeout,
+                                      limits=[str(limits[0]), str(limits[1])])
+        return self._symbolic.run("integrate", expression, variable, timeout)
+    
+    def solve(self, equation: str, variable: str = "x",
+              timeout: Optional[float] = None) -> List[str]:
         """Solve equation symbolically"""
         if not self._sympy_available:
             raise ImportError("SymPy required")
-        
-        import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
-        
-        x = sp.Symbol(variable)
-        
-        if "=" in equation and "==" not in equation:
-            left, right = equation.split("=", 1)
-            expr = parse_expr(left, local_dict={variable: x}) - parse_expr(right, local_dict={variable: x})
-        else:
-            expr = parse_expr(equation, local_dict={variable: x})
-        
-        solutions = sp.solve(expr, x)
-        return [str(s) for s in solutions]
+        return self._symbolic.run("solve", equation, variable, timeout)
     
     def taylor_series(self, expression: str, variable: str = "x", 
-                      point: float = 0, order: int = 5) -> str:
+                      point: float = 0, order: int = 5,
+                      timeout: Optional[float] = None) -> str:
         """Compute Taylor series expansion"""
         if not self._sympy_available:
             raise ImportError("SymPy required")
-        
-        import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
-        
-        x = sp.Symbol(variable)
-        expr = parse_expr(expression, local_dict={variable: x})
-        series = sp.series(expr, x, point, order + 1).removeO()
-        return str(series)
+        return self._symbolic.run("taylor_series", expression, variable, timeout,
+                                  point=str(point), order=order)
     
-    def limit(self, expression: str, variable: str = "x", point: Any = 0) -> str:
+    def limit(self, expression: str, variable: str = "x", point: Any = 0,
+              timeout: Optional[float] = None) -> str:
         """Compute limit"""
         if not self._sympy_available:
             raise ImportError("SymPy required")
-        
-        import sympy as sp
-        from sympy.parsing.sympy_parser import parse_expr
-        
-        x = sp.Symbol(variable)
-        expr = parse_expr(expression, local_dict={variable: x})
-        
-        if point == "inf":
-            point = sp.oo
-        elif point == "-inf":
-            point = -sp.oo
-        
-        result = sp.limit(expr, x, point)
-        return str(result)
+        return self._symbolic.run("limit", expression, variable, timeout, point=str(point))
+
+    def symbolic_stats(self) -> Dict[str, Any]:
+        """Per-operation latency, cache and timeout metrics for symbolic work"""
+        return self._symbolic.stats()
 
     def matrix_inverse(self, matrix: np.ndarray) -> np.ndarray:
         """Matrix inverse"""
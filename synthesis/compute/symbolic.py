@@ -0,0 +1,330 @@
+"""
+FRANKENSTEIN 1.0 - Symbolic Work Service
+Memoized, time-boxed SymPy operations for MathCompute
+
+MathCompute's differentiate / integrate / solve / taylor_series / limit
+used to parse their input and run SymPy on the caller's thread with no
+bound: one pathological integral hung the agent or terminal that asked.
+
+SymbolicService runs them in a persistent worker subprocess
+(symbolic_worker.py):
+
+    budget      each call gets a wall-clock budget; on overrun the worker is
+                killed (a fresh one starts on the next call) and
+                SymbolicTimeout is raised - a definite integral falls back
+                to numeric quadrature instead
+    interning   the worker keeps parsed expressions, so repeated work on the
+                same expression skips parse_expr
+    memo        results are memoized in an LRU keyed by the operation and
+                the normalized expression text (see expressions.py)
+    metrics     per-operation call counts, cache hits, timeouts, fallbacks
+                and latency percentiles: stats()
+
+Workers are started lazily, up to MAX_WORKERS at a time. If no worker can
+be started the operation runs in-process, without a budget.
+"""
+
+import json
+import logging
+import os
+import queue
+import subprocess
+import sys
+import threading
+import time
+from collections import deque
+from typing import Any, Dict, Optional
+
+from .expressions import ResultCache, get_expression_cache, normalize_expression
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+SYMBOLIC_TIMEOUT = 10.0         # Default wall-clock budget per operation, seconds
+WORKER_START_TIMEOUT = 30.0     # Time allowed for a worker to import sympy
+MAX_WORKERS = 2                 # Concurrent worker processes
+RESULT_CACHE_SIZE = 512         # Memoized symbolic results (LRU)
+LATENCY_SAMPLES = 256           # Recent latencies kept per operation
+
+_WORKER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "symbolic_worker.py")
+
+
+class SymbolicError(ValueError):
+    """SymPy raised while performing the operation."""
+
+
+class SymbolicTimeout(TimeoutError):
+    """The operation exceeded its wall-clock budget."""
+
+
+# ── Worker process ─────────────────────────────────────────────────────────────
+
+class _Worker:
+    """One symbolic_worker.py subprocess and the thread reading its replies."""
+
+    def __init__(self):
+        self._proc = subprocess.Popen(
+            [sys.executable, _WORKER_SCRIPT],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            text=True, bufsize=1,
+        )
+        self._replies: "queue.Queue[dict]" = queue.Queue()
+        self._next_id = 1
+        threading.Thread(target=self._read_loop, daemon=True,
+                         name="SymbolicWorker-Reader").start()
+        self._await(0, WORKER_START_TIMEOUT)
+
+    def _read_loop(self) -> None:
+        for line in self._proc.stdout:
+            try:
+                self._replies.put(json.loads(line))
+            except ValueError:
+                continue
+        self._replies.put({"id": None, "ok": False, "error": "worker exited"})
+
+    def _await(self, request_id: int, timeout: float) -> dict:
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise SymbolicTimeout(f"no reply within {timeout:.1f}s")
+            try:
+                reply = self._replies.get(timeout=remaining)
+            except queue.Empty:
+                continue
+            if reply.get("id") is None:
+                raise RuntimeError(reply.get("error", "worker exited"))
+            if reply["id"] == request_id:
+                return reply
+
+    @property
+    def alive(self) -> bool:
+        return self._proc.poll() is None
+
+    def call(self, op: str, expression: str, variable: str, args: dict, timeout: float) -> dict:
+        request_id, self._next_id = self._next_id, self._next_id + 1
+        request = {"id": request_id, "op": op, "expression": expression,
+                   "variable": variable, "args": args}
+        self._proc.stdin.write(json.dumps(request) + "\n")
+        self._proc.stdin.flush()
+        return self._await(request_id, timeout)
+
+    def kill(self) -> None:
+        try:
+            self._proc.kill()
+            self._proc.wait(timeout=2.0)
+        except Exception:
+            pass
+
+
+# ── Metrics ────────────────────────────────────────────────────────────────────
+
+class _OpStats:
+    """Counters and recent latencies for one operation."""
+
+    def __init__(self):
+        self.calls = 0
+        self.cache_hits = 0
+        self.timeouts = 0
+        self.fallbacks = 0
+        self.errors = 0
+        self.max_ms = 0.0
+        self._latencies: deque = deque(maxlen=LATENCY_SAMPLES)
+
+    def record(self, ms: float) -> None:
+        self._latencies.append(ms)
+        self.max_ms = max(self.max_ms, ms)
+
+    def summary(self) -> Dict[str, Any]:
+        samples = sorted(self._latencies)
+
+        def pct(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(p * len(samples)))], 2) if samples else 0.0
+
+        return {
+            "calls": self.calls, "cache_hits": self.cache_hits, "timeouts": self.timeouts,
+            "fallbacks": self.fallbacks, "errors": self.errors,
+            "p50_ms": pct(0.50), "p95_ms": pct(0.95), "max_ms": round(self.max_ms, 2),
+        }
+
+
+# ── Service ────────────────────────────────────────────────────────────────────
+
+class SymbolicService:
+    """
+    Time-boxed, memoized SymPy operations.
+
+    Thread-safe: each call checks a worker out of the idle pool, so up to
+    max_workers operations run in parallel.
+    """
+
+    def __init__(self, timeout: float = SYMBOLIC_TIMEOUT, max_workers: int = MAX_WORKERS,
+                 inline: bool = False):
+        """
+        Args:
+            timeout:     Default budget per operation, seconds
+            max_workers: Worker subprocesses allowed at once
+            inline:      Run in-process (no subprocess, no budget)
+        """
+        self.timeout = timeout
+        self.max_workers = max(1, max_workers)
+        self.inline = inline
+        self._idle: "queue.LifoQueue[_Worker]" = queue.LifoQueue()
+        self._slots = threading.Semaphore(self.max_workers)
+        self._inline_lock = threading.Lock()
+        self._cache = ResultCache(RESULT_CACHE_SIZE)
+        self._stats: Dict[str, _OpStats] = {}
+        self._stats_lock = threading.Lock()
+
+    def run(self, op: str, expression: str, variable: str = "x",
+            timeout: Optional[float] = None, **args) -> Any:
+        """
+        Perform a symbolic operation.
+
+        Args:
+            op:         differentiate, integrate, solve, taylor_series or limit
+            expression: Expression (or equation, for solve) text
+            variable:   Symbol the operation is with respect to
+            timeout:    Budget in seconds (default: the service timeout)
+            **args:     Operation arguments (order, limits, point)
+
+        Raises:
+            SymbolicTimeout: the budget ran out and there is no fallback
+            SymbolicError:   SymPy failed on the input
+        """
+        stats = self._op_stats(op)
+        text = normalize_expression(expression)
+        key = (op, text, variable, json.dumps(args, sort_keys=True, default=str))
+        cached = self._cache.get(key)
+        if cached is not None:
+            stats.cache_hits += 1
+            return cached
+
+        budget = self.timeout if timeout is None else timeout
+        start = time.perf_counter()
+        stats.calls += 1
+        try:
+            result = self._execute(op, text, variable, args, budget)
+        except SymbolicTimeout:
+            stats.timeouts += 1
+            fallback = self._fallback(op, text, variable, args)
+            if fallback is None:
+                raise SymbolicTimeout(f"{op}({expression}) exceeded {budget:.1f}s")
+            stats.fallbacks += 1
+            logger.info("Symbolic %s timed out after %.1fs; used numeric fallback", op, budget)
+            return fallback
+        except SymbolicError:
+            stats.errors += 1
+            raise
+        finally:
+            stats.record((time.perf_counter() - start) * 1000)
+        self._cache.put(key, result)
+        return result
+
+    def _execute(self, op: str, text: str, variable: str, args: dict, budget: float) -> Any:
+        if not self.inline:
+            self._slots.acquire()
+            try:
+                worker = self._checkout()
+            except Exception as e:
+                self._slots.release()
+                logger.warning("Symbolic worker unavailable (%s); running in-process", e)
+                self.inline = True
+            else:
+                return self._call_worker(worker, op, text, variable, args, budget)
+
+        from .symbolic_worker import run_operation
+        with self._inline_lock:
+            try:
+                return run_operation(op, text, variable, args)
+            except Exception as e:
+                raise SymbolicError(f"{type(e).__name__}: {e}") from e
+
+    def _call_worker(self, worker: _Worker, op: str, text: str, variable: str,
+                     args: dict, budget: float) -> Any:
+        healthy = False
+        try:
+            reply = worker.call(op, text, variable, args, budget)
+            healthy = True
+        except SymbolicTimeout:
+            raise
+        except (OSError, RuntimeError) as e:
+            # Worker died or its pipe broke
+            raise SymbolicError(f"symbolic worker failed: {e}") from e
+        finally:
+            if healthy:
+                self._idle.put(worker)
+            else:
+                worker.kill()       # Mid-computation: the only way to stop it
+            self._slots.release()
+        if not reply["ok"]:
+            raise SymbolicError(reply["error"])
+        return reply["result"]
+
+    def _checkout(self) -> _Worker:
+        while True:
+            try:
+                worker = self._idle.get_nowait()
+            except queue.Empty:
+                return _Worker()
+            if worker.alive:
+                return worker
+
+    def _fallback(self, op: str, text: str, variable: str, args: dict) -> Optional[float]:
+        """Numeric quadrature for a definite integral; None for anything else."""
+        limits = args.get("limits")
+        if op != "integrate" or not limits:
+            return None
+        try:
+            from scipy.integrate import quad
+        except ImportError:
+            return None
+        compiled = get_expression_cache().get(text)
+        bounds = []
+        for limit in limits:
+            token = str(limit).strip().lower()
+            bounds.append(float("inf") if token in ("inf", "oo", "+inf")
+                          else float("-inf") if token in ("-inf", "-oo") else float(limit))
+        try:
+            value, _ = quad(lambda v: float(compiled.eval_numeric({variable: v})), *bounds)
+        except Exception as e:
+            logger.debug("Numeric fallback failed for %s: %s", text, e)
+            return None
+        return float(value)
+
+    def _op_stats(self, op: str) -> _OpStats:
+        with self._stats_lock:
+            if op not in self._stats:
+                self._stats[op] = _OpStats()
+            return self._stats[op]
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-operation metrics plus result-cache counters."""
+        with self._stats_lock:
+            ops = {op: s.summary() for op, s in self._stats.items()}
+        return {"operations": ops, "cache": self._cache.stats(),
+                "workers_idle": self._idle.qsize(), "inline": self.inline}
+
+    def clear_cache(self) -> None:
+        self._cache.clear()
+
+    def shutdown(self) -> None:
+        """Stop idle workers."""
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                return
+
+
+_symbolic_service: Optional[SymbolicService] = None
+
+
+def get_symbolic_service() -> SymbolicService:
+    """Get or create the global SymbolicService singleton."""
+    global _symbolic_service
+    if _symbolic_service is None:
+        _symbolic_service = SymbolicService()
+    return _symbolic_service
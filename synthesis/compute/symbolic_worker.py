@@ -0,0 +1,106 @@
+"""
+FRANKENSTEIN 1.0 - Symbolic Worker
+Runs SymPy operations for SymbolicService (symbolic.py)
+
+Started as a standalone script (python symbolic_worker.py), so it imports
+only the standard library and sympy - not the synthesis package. Protocol:
+one JSON object per line on stdin, one reply per line on stdout:
+
+    {"id": 7, "op": "integrate", "expression": "x**2", "variable": "x",
+     "args": {"limits": [0, 1]}}
+    {"id": 7, "ok": true, "result": 0.333...}
+    {"id": 7, "ok": false, "error": "SympifyError: ..."}
+
+run_operation() is also called in-process when no worker can be started.
+"""
+
+import json
+import sys
+from collections import OrderedDict
+
+
+PARSE_CACHE_SIZE = 256          # Interned parsed expressions in this process
+
+_parsed: "OrderedDict[tuple, object]" = OrderedDict()
+
+
+def _parse(expression: str, variable: str, equation: bool = False):
+    """Parse once per (expression, variable); later calls reuse the object."""
+    key = (expression, variable, equation)
+    expr = _parsed.get(key)
+    if expr is not None:
+        _parsed.move_to_end(key)
+        return expr
+    import sympy as sp
+    from sympy.parsing.sympy_parser import parse_expr
+    x = sp.Symbol(variable)
+    if equation and "=" in expression and "==" not in expression:
+        left, right = expression.split("=", 1)
+        expr = parse_expr(left, local_dict={variable: x}) - parse_expr(right, local_dict={variable: x})
+    else:
+        expr = parse_expr(expression, local_dict={variable: x})
+    _parsed[key] = expr
+    while len(_parsed) > PARSE_CACHE_SIZE:
+        _parsed.popitem(last=False)
+    return expr
+
+
+def _point(value):
+    import sympy as sp
+    if value in ("inf", "oo", "+inf"):
+        return sp.oo
+    if value in ("-inf", "-oo"):
+        return -sp.oo
+    return sp.sympify(value)
+
+
+def run_operation(op: str, expression: str, variable: str, args: dict):
+    """Execute one symbolic operation; returns a JSON-serializable result."""
+    import sympy as sp
+    x = sp.Symbol(variable)
+    expr = _parse(expression, variable, equation=(op == "solve"))
+
+    if op == "differentiate":
+        for _ in range(int(args.get("order", 1))):
+            expr = sp.diff(expr, x)
+        return str(sp.simplify(expr))
+    if op == "integrate":
+        limits = args.get("limits")
+        if limits:
+            result = sp.integrate(expr, (x, _point(limits[0]), _point(limits[1])))
+            try:
+                return float(result.evalf())
+            except (TypeError, ValueError):
+                return str(result)
+        return str(sp.integrate(expr, x))
+    if op == "solve":
+        return [str(s) for s in sp.solve(expr, x)]
+    if op == "taylor_series":
+        order = int(args.get("order", 5))
+        return str(sp.series(expr, x, _point(args.get("point", 0)), order + 1).removeO())
+    if op == "limit":
+        return str(sp.limit(expr, x, _point(args.get("point", 0))))
+    raise ValueError(f"Unknown symbolic operation: {op}")
+
+
+def serve(stdin=sys.stdin, stdout=sys.stdout) -> None:
+    """Answer requests until stdin closes."""
+    import sympy    # noqa: F401 - pay the import before reporting ready
+    stdout.write(json.dumps({"id": 0, "ok": True, "result": "ready"}) + "\n")
+    stdout.flush()
+    for line in stdin:
+        if not line.strip():
+            continue
+        request = json.loads(line)
+        try:
+            result = run_operation(request["op"], request["expression"],
+                                   request.get("variable", "x"), request.get("args") or {})
+            reply = {"id": request["id"], "ok": True, "result": result}
+        except Exception as e:
+            reply = {"id": request["id"], "ok": False, "error": f"{type(e).__name__}: {e}"}
+        stdout.write(json.dumps(reply) + "\n")
+        stdout.flush()
+
+
+if __name__ == "__main__":
+    serve()
@@ -229,6 +229,15 @@ class QuantumState:
             self._mmap_file.unlink()
 
 
+def _notify_artifact(event_name: str, name: str) -> None:
+    """Publish a saved-state change on the EventBus (non-fatal)."""
+    try:
+        from data.events import EventBus, EventType
+        EventBus().emit(EventType[event_name], source="true_engine", kind="state", name=name)
+    except Exception as e:
+        logger.debug(f"State event not published: {e}")
+
+
 class TrueSynthesisEngine:
     """
     TRUE Synthesis Engine - Classical Quantum Simulation
@@ -887,6 +896,7 @@ class TrueSynthesisEngine:
         if log:
             log.log_state_saved(name, str(filepath))
         logger.info(f"State saved: {filepath}")
+        _notify_artifact("QUANTUM_ARTIFACT_SAVED", name)
         return filepath
 
     def load_state(self, name: str) -> QuantumState:
@@ -932,6 +942,7 @@ class TrueSynthesisEngine:
         if filepath.exists():
             filepath.unlink()
             logger.info(f"State deleted: {name}")
+            _notify_artifact("QUANTUM_ARTIFACT_DELETED", name)
             return True
         return False
 
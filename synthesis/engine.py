@@ -224,6 +224,8 @@ class SynthesisEngine:
         # Circuit tracking (with memory limits to prevent RAM buildup)
         self._gate_log: List[Dict[str, Any]] = []
         self._max_gate_log = 100  # Keep last 100 gates for debugging
+        self._gate_count = 0      # Gates applied since last reset (not capped)
+        self._state_version = 0   # Bumped on every statevector change
         self._result_history: List[ComputeResult] = []
         self._max_results = 50  # Keep last 50 results to prevent RAM overflow
 
@@ -291,6 +293,26 @@ class SynthesisEngine:
         
         self._density_matrix = None
         self._gate_log = []
+        self._gate_count = 0
+        self._state_version += 1
+
+    @property
+    def gate_count(self) -> int:
+        """Gates applied since the last reset."""
+        return self._gate_count
+
+    @property
+    def state_version(self) -> int:
+        """Monotonic counter that changes whenever the statevector does."""
+        return self._state_version
+
+    def _log_gate(self, entry: Dict[str, Any]):
+        """Record an applied gate (bounded log) and advance the counters."""
+        self._gate_log.append(entry)
+        if len(self._gate_log) > self._max_gate_log:
+            self._gate_log.pop(0)
+        self._gate_count += 1
+        self._state_version += 1
     
     def set_state(self, state: np.ndarray):
         """
@@ -305,6 +327,7 @@ class SynthesisEngine:
             raise ValueError("State vector has zero norm")
         
         self._statevector = state / norm
+        self._state_version += 1
         self._num_qubits = int(np.log2(len(state)))
     
     # ==================== QUANTUM GATES ====================
@@ -343,14 +366,12 @@ class SynthesisEngine:
             else:
                 self._tensor_apply_controlled(gate, control, target)
 
-        self._gate_log.append({
+        self._log_gate({
             "gate": gate.tolist(),
             "target": target,
             "control": control,
             "timestamp": time.time()
         })
-        if len(self._gate_log) > self._max_gate_log:
-            self._gate_log.pop(0)
 
     def _tensor_apply_single(self, gate: np.ndarray, target: int):
         """
@@ -433,12 +454,10 @@ class SynthesisEngine:
                     j = i | tgt_mask
                     sv[i], sv[j] = sv[j], sv[i]
 
-        self._gate_log.append({
+        self._log_gate({
             "gate": "MCX", "controls": list(controls),
             "target": target, "timestamp": time.time()
         })
-        if len(self._gate_log) > self._max_gate_log:
-            self._gate_log.pop(0)
 
     # ── Legacy stubs — kept so any external caller gets a clear error ──────────
     def _expand_gate(self, gate: np.ndarray, target: int, n: int) -> np.ndarray:
@@ -620,12 +639,10 @@ class SynthesisEngine:
                 j = i ^ (1 << qubit1) ^ (1 << qubit2)
                 new_state[i] = state[j]
         self._statevector = new_state
-        self._gate_log.append({
+        self._log_gate({
             "gate": "SWAP", "target": [qubit1, qubit2],
             "control": None, "timestamp": time.time()
         })
-        if len(self._gate_log) > self._max_gate_log:
-            self._gate_log.pop(0)
 
     def cswap(self, control: int, qubit1: int, qubit2: int):
         """Apply controlled-SWAP (Fredkin) gate"""
@@ -641,12 +658,10 @@ class SynthesisEngine:
                     j = i ^ (1 << qubit1) ^ (1 << qubit2)
                     new_state[i] = state[j]
         self._statevector = new_state
-        self._gate_log.append({
+        self._log_gate({
             "gate": "CSWAP", "target": [qubit1, qubit2],
             "control": control, "timestamp": time.time()
         })
-        if len(self._gate_log) > self._max_gate_log:
-            self._gate_log.pop(0)
 
     def increment(self, qubits: list):
         """Increment a register of qubits: |n> -> |n+1 mod 2^k>"""
@@ -669,12 +684,10 @@ class SynthesisEngine:
                     j ^= (1 << q)
             new_state[j] += state[i]
         self._statevector = new_state
-        self._gate_log.append({
+        self._log_gate({
             "gate": "INC", "target": qubits,
             "control": None, "timestamp": time.time()
         })
-        if len(self._gate_log) > self._max_gate_log:
-            self._gate_log.pop(0)
 
     def decrement(self, qubits: list):
         """Decrement a register of qubits: |n> -> |n-1 mod 2^k>"""
@@ -697,12 +710,10 @@ class SynthesisEngine:
                     j ^= (1 << q)
             new_state[j] += state[i]
         self._statevector = new_state
-        self._gate_log.append({
+        self._log_gate({
             "gate": "DEC", "target": qubits,
             "control": None, "timestamp": time.time()
         })
-        if len(self._gate_log) > self._max_gate_log:
-            self._gate_log.pop(0)
 
     def reverse_bits(self, qubits: list):
         """Reverse bit order of a qubit register"""
@@ -839,6 +850,7 @@ class SynthesisEngine:
         
         norm = np.linalg.norm(new_state)
         self._statevector = new_state / norm
+        self._state_version += 1
         
         return outcome
     
@@ -1161,6 +1173,7 @@ class SynthesisEngine:
         
         self._statevector = U @ self._statevector
         self._statevector = self._statevector / np.linalg.norm(self._statevector)
+        self._state_version += 1
     
     # ==================== LORENTZ TRANSFORMATIONS ====================
     
@@ -1190,6 +1203,7 @@ class SynthesisEngine:
         phase = gamma * velocity * position
         
         self._statevector = self._statevector * exp(1j * phase)
+        self._state_version += 1
     
     def apply_time_dilation(self, proper_time: float, velocity: float, c: float = 1.0) -> float:
         """
@@ -1248,7 +1262,7 @@ class SynthesisEngine:
                 measurements=measurements,
                 bloch_coords=bloch,
                 num_qubits=self._num_qubits,
-                gate_count=len(self._gate_log),
+                gate_count=self.gate_count,
                 compute_time_ms=(time.time() - start_time) * 1000
             )
             
@@ -1259,7 +1273,7 @@ class SynthesisEngine:
                 success=False,
                 error=str(e),
                 num_qubits=self._num_qubits,
-                gate_count=len(self._gate_log),
+                gate_count=self.gate_count,
                 compute_time_ms=(time.time() - start_time) * 1000
             )
         
@@ -1447,8 +1461,8 @@ class SynthesisEngine:
         return self._num_qubits
     
     def get_gate_count(self) -> int:
-        """Get number of gates applied"""
-        return len(self._gate_log)
+        """Get number of gates applied since the last reset"""
+        return self.gate_count
     
     def get_result_history(self) -> List[ComputeResult]:
         """Get history of computation results"""
@@ -1461,7 +1475,7 @@ class SynthesisEngine:
             return
         
         self._output(f"\n|ψ⟩ = {self._format_state()}\n")
-        self._output(f"Qubits: {self._num_qubits}, Gates: {len(self._gate_log)}\n\n")
+        self._output(f"Qubits: {self._num_qubits}, Gates: {self.gate_count}\n\n")
 
 
 # ==================== NUMBA JIT SAMPLING ====================
@@ -173,6 +173,26 @@ class TestQuantumDynamicsSmoke:
         assert r.success is True
         assert abs(r.data["entropy"]) < 1e-10
 
+    def test_decoherence_sweep_reuses_solver(self):
+        agent = QuantumDynamicsAgent()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            agent._ensure_loaded()
+        qt = agent._qutip
+
+        psi0 = (qt.basis(2, 0) + qt.basis(2, 1)).unit()
+        tlist = np.linspace(0, 5, 50)
+        r = agent.execute(operation="decoherence", state=psi0, tlist=tlist,
+                          decoherence_type="dephasing", gammas=[0.1, 0.5, 1.0])
+        assert r.success is True
+        sweep = r.data["sweep"]
+        assert [run["states"] for run in sweep] == [None, None, None]
+        # Dephasing: purity = (1 + exp(-2 gamma t)) / 2 for |+>
+        for run in sweep:
+            expected = (1 + np.exp(-2 * run["gamma"] * tlist)) / 2
+            assert np.allclose(run["purities"], expected, atol=1e-4)
+        assert agent.solver_stats()["solvers"] == 1
+
     def test_missing_params(self):
         agent = QuantumDynamicsAgent()
         r = agent.execute(operation="mesolve")
@@ -228,6 +248,65 @@ class TestQuantumHardwareSmoke:
         assert r.data["num_qubits"] == 3
         assert r.data["total_gates"] == 3
 
+    def test_transpile_cache_binds_new_angles(self):
+        from qiskit.quantum_info import Operator
+
+        agent = QuantumHardwareAgent()
+        agent._ensure_loaded()
+        qk = agent._qiskit
+
+        def ansatz(theta):
+            qc = qk.QuantumCircuit(2)
+            qc.ry(theta, 0)
+            qc.cx(0, 1)
+            qc.rz(2 * theta, 1)
+            return qc
+
+        first = agent.execute(operation="transpile", circuit=ansatz(0.3), num_qubits=2)
+        second = agent.execute(operation="transpile", circuit=ansatz(1.1), num_qubits=2)
+        assert first.success is True and second.success is True
+        assert first.data["cache_hit"] is False
+        assert second.data["cache_hit"] is True
+        transpiled = second.data["transpiled_circuit"]
+        assert transpiled.num_parameters == 0
+        assert Operator.from_circuit(transpiled).equiv(Operator(ansatz(1.1)))
+        assert agent.transpile_stats()["targets"] == 1
+
+    def test_optimize_keeps_angle_specific_simplification(self):
+        agent = QuantumHardwareAgent()
+        agent._ensure_loaded()
+        qc = agent._qiskit.QuantumCircuit(1)
+        qc.rz(0.4, 0)
+        qc.rz(-0.4, 0)
+        qc.h(0)
+
+        r = agent.execute(operation="optimize", circuit=qc)
+        assert r.success is True
+        assert r.data["cache_hit"] is False
+        assert r.data["optimized_gates"] == 1
+
+    def test_transpile_miss_is_exact(self):
+        agent = QuantumHardwareAgent()
+        agent._ensure_loaded()
+
+        def cancelling(theta):
+            qc = agent._qiskit.QuantumCircuit(1)
+            qc.rz(theta, 0)
+            qc.rz(-theta, 0)
+            qc.x(0)
+            return qc
+
+        exact = agent.execute(operation="transpile", circuit=cancelling(0.4), num_qubits=2,
+                              optimization_level=3, cache=False)
+        first = agent.execute(operation="transpile", circuit=cancelling(0.4), num_qubits=2,
+                              optimization_level=3)
+        assert first.data["cache_hit"] is False
+        assert first.data["transpiled_gates"] == exact.data["transpiled_gates"] == 1
+
+        again = agent.execute(operation="transpile", circuit=cancelling(0.9), num_qubits=2,
+                              optimization_level=3)
+        assert again.data["cache_hit"] is True
+
 
 class TestQuantumCryptoSmoke:
     """Smoke tests for QuantumCryptoAgent with real qencrypt calls."""
@@ -277,6 +356,79 @@ class TestQuantumCryptoSmoke:
         assert r_insp.success is True
         assert r_insp.data["has_ciphertext"] is True
 
+    def test_generate_entropy_from_pool(self):
+        agent = QuantumCryptoAgent()
+        try:
+            draws = [agent.execute(operation="generate_entropy", n_bytes=32, source="local")
+                     for _ in range(20)]
+            assert all(r.success for r in draws)
+            assert all(r.data["n_bytes"] == 32 for r in draws)
+            assert len({r.data["entropy_hex"] for r in draws}) == 20
+            chunks = draws[0].data["meta"]["chunks"]
+            assert sum(c["bytes"] for c in chunks) == 32
+
+            stats = agent.entropy_stats()["local"]
+            assert stats["healthy"] is True
+            assert stats["bytes_served"] == 640
+            assert stats["health_failures"] == 0
+        finally:
+            agent.close()
+
+    def test_generate_entropy_rejects_unknown_source(self):
+        agent = QuantumCryptoAgent()
+        r = agent.execute(operation="generate_entropy", n_bytes=32, source="nonexistent")
+        assert r.success is False
+        assert "nonexistent" in r.error
+        assert agent.entropy_stats() == {}
+
+
+class TestEntropyPool:
+    """EntropyPool with a stand-in generator; no qencrypt needed."""
+
+    @staticmethod
+    def _urandom(n_bytes, source):
+        return os.urandom(n_bytes), {"source": source}
+
+    def test_generator_error_fails_take_without_waiting(self, monkeypatch):
+        import time
+        from agents.builtin import entropy_pool
+
+        monkeypatch.setattr(entropy_pool, "REFILL_RETRY_DELAY", 0.01)
+        calls = []
+
+        def broken(n_bytes, source):
+            calls.append(source)
+            raise ValueError(f"unknown source {source!r}")
+
+        pool = entropy_pool.EntropyPool("bogus", generator=broken)
+        try:
+            started = time.monotonic()
+            with pytest.raises(entropy_pool.EntropyUnavailable, match="unknown source"):
+                pool.take(32, timeout=30.0)
+            assert time.monotonic() - started < 5.0
+
+            pool._thread.join(timeout=5.0)
+            assert not pool._thread.is_alive()
+            assert len(calls) == entropy_pool.MAX_GENERATOR_ERRORS
+            stats = pool.stats()
+            assert stats["healthy"] is False
+            assert stats["generator_errors"] == entropy_pool.MAX_GENERATOR_ERRORS
+            with pytest.raises(entropy_pool.EntropyUnavailable, match="generator errors"):
+                pool.take(1)
+        finally:
+            pool.close()
+
+    def test_refill_after_close_is_dropped(self):
+        from agents.builtin.entropy_pool import EntropyPool
+
+        pool = EntropyPool("local", high_water=64, low_water=16, chunk_size=16,
+                           generator=self._urandom)
+        pool.close()
+        pool._admit(os.urandom(16), {"source": "local"})
+        assert pool.stats()["available"] == 0
+        assert pool.stats()["chunks"] == 0
+        assert not any(pool._ring)
+
 
 class TestNumericalComputingSmoke:
     """Smoke tests for NumericalComputingAgent with real NumPy/SciPy calls."""
@@ -327,6 +479,80 @@ class TestNumericalComputingSmoke:
         assert r.data["is_unitary"] is True
         assert r.data["is_hermitian"] is True
 
+    def test_matrix_analysis_matches_numpy(self):
+        agent = NumericalComputingAgent()
+        rng = np.random.default_rng(3)
+        M = rng.normal(size=(8, 8)) + 1j * rng.normal(size=(8, 8))
+        M[:, -1] = M[:, 0]      # rank 7
+        r = agent.execute(operation="matrix_analysis", matrix=M)
+        assert r.success is True
+        assert r.data["rank"] == np.linalg.matrix_rank(M) == 7
+        assert np.isclose(r.data["spectral_norm"], np.linalg.norm(M, 2))
+        assert np.isclose(r.data["frobenius_norm"], np.linalg.norm(M, "fro"))
+        assert np.isclose(r.data["determinant"], np.linalg.det(M), atol=1e-8)
+        assert r.data["is_unitary"] is False
+
+    def test_factorizations_reused_across_calls(self):
+        agent = NumericalComputingAgent()
+        M = [[2, 1], [1, 3]]
+        agent.execute(operation="svd", matrix=M)
+        agent.execute(operation="matrix_analysis", matrix=M)
+        agent.execute(operation="eigenvalues", matrix=M, hermitian=True)
+        stats = agent.factorization_stats()
+        assert stats["entries"] == 1
+        assert stats["hits"] == 2
+
+    def test_ode_batch_stacked_matches_single(self):
+        agent = NumericalComputingAgent()
+        ks = [1.0, 2.0, 3.0, 4.0]
+        t_eval = np.linspace(0, 5, 6)
+        r = agent.execute(operation="integrate_ode_batch",
+                          func=lambda t, y, k: [y[1], -k * y[0]],
+                          y0s=[[1.0, 0.0]] * 4, t_span=(0, 5), t_eval=t_eval,
+                          args_list=[(k,) for k in ks])
+        assert r.success is True
+        assert r.data["strategy"] == "stacked"
+        assert r.data["problems"] == 4 and r.data["problems_per_second"] > 0
+        for k, res in zip(ks, r.data["results"]):
+            # x(t) = cos(sqrt(k) t)
+            assert np.allclose(res["y"][0], np.cos(np.sqrt(k) * t_eval), atol=1e-2)
+
+    def test_ode_batch_coupled_func_not_stacked(self):
+        agent = NumericalComputingAgent()
+        r = agent.execute(operation="integrate_ode_batch",
+                          func=lambda t, y: -y * np.sum(y),
+                          y0s=[[1.0], [2.0]], t_span=(0, 1))
+        assert r.success is True
+        assert r.data["strategy"] in ("process", "serial")
+
+    def test_ode_batch_shared_y0_reducing_func_not_stacked(self):
+        agent = NumericalComputingAgent()
+        ks = [0.1, 1.0, 5.0]
+        r = agent.execute(operation="integrate_ode_batch",
+                          func=lambda t, y, k: -k * y * np.mean(y),
+                          y0s=[[1.0]] * 3, t_span=(0, 2), t_eval=[2.0],
+                          args_list=[(k,) for k in ks])
+        assert r.success is True
+        assert r.data["strategy"] in ("process", "serial")
+        # y' = -k y^2, y(0) = 1  =>  y(t) = 1 / (1 + k t)
+        finals = [res["y"][0][-1] for res in r.data["results"]]
+        assert np.allclose(finals, [1 / (1 + 2 * k) for k in ks], rtol=1e-2)
+
+    def test_quad_and_optimize_batch(self):
+        agent = NumericalComputingAgent()
+        r = agent.execute(operation="integrate_quad_batch",
+                          func=lambda x, k: np.sin(k * x),
+                          limits=[(0, np.pi)] * 3, args_list=[(1,), (2,), (3,)])
+        assert r.success is True
+        assert r.data["strategy"] == "vectorized"
+        assert np.allclose([res["value"] for res in r.data["results"]], [2, 0, 2 / 3])
+
+        r = agent.execute(operation="optimize_batch",
+                          func=lambda x, a: (x[0] - a) ** 2,
+                          x0s=[[0.0], [0.0]], args_list=[(1.0,), (-2.0,)])
+        assert r.success is True
+        assert np.allclose([res["x_optimal"][0] for res in r.data["results"]], [1.0, -2.0], atol=1e-3)
+
     def test_missing_params(self):
         agent = NumericalComputingAgent()
         r = agent.execute(operation="solve_linear")
@@ -97,6 +97,13 @@ class TestSynthesisEngineGates:
         assert probs.get("01", 0) < 0.01
         assert probs.get("10", 0) < 0.01
 
+    def test_gate_count_not_capped_by_gate_log(self):
+        se = self._make_engine()
+        for _ in range(150):
+            se.x(0)
+        assert len(se._gate_log) == 100
+        assert se.get_gate_count() == se.gate_count == 150
+
 
 # ── 4. SynthesisEngine time evolution (scipy-dependent) ───────────────────
 
@@ -186,3 +193,93 @@ class TestComputeEngineIntegration:
         assert r.success is True
         # <0|Z|0> = 1
         assert abs(r.numeric_value - 1.0) < 1e-10
+
+    def test_expression_compiled_once(self):
+        from synthesis.compute.engine import ComputeEngine, ComputeMode
+        ce = ComputeEngine()
+        ce.clear_cache()
+        for x in range(20):
+            r = ce.compute("x**2 + 1", mode=ComputeMode.NUMERIC, variables={"x": x})
+            assert r.numeric_value == x ** 2 + 1
+        # "x ** 2+1" normalizes to the same compiled entry
+        first = ce._expressions.get("x**2 + 1")
+        assert ce._expressions.get("x ** 2+1") is first
+        assert ce.cache_stats()["expressions"]["entries"] == 1
+
+    def test_array_variables_memoized_by_content(self):
+        from synthesis.compute.engine import ComputeEngine
+        ce = ComputeEngine()
+        x = np.arange(6.0)
+        r = ce.compute("x**2", variables={"x": x})
+        assert r.success is True
+        np.testing.assert_allclose(r.result, x ** 2)
+        again = ce.compute("x**2", variables={"x": x.copy()})
+        assert again.metadata.get("from_cache") is True
+        other = ce.compute("x**2", variables={"x": x + 1})
+        np.testing.assert_allclose(other.result, (x + 1) ** 2)
+
+    def test_vectorized_evaluate(self):
+        from synthesis.compute.engine import ComputeEngine
+        ce = ComputeEngine()
+        xs = np.linspace(0, 1, 100_000)
+        r = ce.evaluate("sin(x)**2 + cos(x)**2 + y", {"x": xs, "y": 1.0})
+        assert r.success is True
+        assert r.result.shape == xs.shape
+        np.testing.assert_allclose(r.result, 2.0)
+        assert ce.evaluate("x + z", {"x": xs}).success is False
+
+    def test_reduction_over_array_variable_not_broadcast(self):
+        from synthesis.compute.engine import ComputeEngine
+        ce = ComputeEngine()
+        r = ce.compute("mean(x)", variables={"x": [1, 2, 3]})
+        assert r.success is True
+        assert np.ndim(r.result) == 0
+        assert r.numeric_value == 2.0
+        # Constant in the arrays: still broadcast to their shape
+        r = ce.evaluate("2*y", {"x": np.arange(4.0), "y": 1.5})
+        np.testing.assert_allclose(r.result, np.full(4, 3.0))
+
+    def test_reserved_sympy_names_bind_as_variables(self):
+        from synthesis.compute.engine import ComputeEngine, ComputeMode
+        ce = ComputeEngine()
+        r = ce.compute("E*2", mode=ComputeMode.SYMBOLIC, variables={"E": 3})
+        assert r.numeric_value == 6.0
+        assert str(ce.differentiate("E**2", "E").result) == "2*E"
+        assert str(ce.integrate("I", "I").result) == "I**2/2"
+        # Without variables E is still Euler's number
+        assert abs(ce.compute("E*2", mode=ComputeMode.SYMBOLIC).numeric_value - 2 * np.e) < 1e-12
+
+
+# ── 6. MathCompute symbolic service ───────────────────────────────────────
+
+class TestMathComputeSymbolic:
+    def test_symbolic_results_memoized(self):
+        from synthesis.compute.symbolic import SymbolicService
+        service = SymbolicService()
+        try:
+            assert service.run("differentiate", "x**3") == "3*x**2"
+            assert service.run("differentiate", "x ** 3") == "3*x**2"
+            stats = service.stats()["operations"]["differentiate"]
+            assert stats["calls"] == 1 and stats["cache_hits"] == 1
+        finally:
+            service.shutdown()
+
+    def test_definite_integral_timeout_falls_back_to_quadrature(self):
+        from synthesis.compute.symbolic import SymbolicService, SymbolicTimeout
+        service = SymbolicService()
+        hard = "exp(-x**2)*sin(x**3)*log(1+x)**2/(1+x**5)"
+        try:
+            value = service.run("integrate", hard, limits=["0", "1"], timeout=0.2)
+            assert abs(value - 0.0285728) < 1e-5
+            with pytest.raises(SymbolicTimeout):
+                service.run("integrate", hard, timeout=0.2)
+            assert service.stats()["operations"]["integrate"]["fallbacks"] == 1
+        finally:
+            service.shutdown()
+
+    def test_math_compute_uses_service(self):
+        from synthesis.compute.math_compute import MathCompute
+        mc = MathCompute()
+        assert mc.solve("x**2=4") == ["-2", "2"]
+        assert abs(mc.integrate("x**2", limits=(0, 1)) - 1 / 3) < 1e-12
+        assert "solve" in mc.symbolic_stats()["operations"]
@@ -0,0 +1 @@
+"""FRANKENSTEIN 1.0 — Eye of Sauron test suite"""
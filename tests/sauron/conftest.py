@@ -0,0 +1,15 @@
+"""
+Shared fixtures for the Eye of Sauron tests.
+
+The Sauron modules import ollama at module level. These tests never reach
+the model, so a bare stand-in module is registered when the client is not
+installed.
+"""
+
+import sys
+import types
+
+try:
+    import ollama  # noqa: F401
+except ImportError:
+    sys.modules["ollama"] = types.ModuleType("ollama")
@@ -0,0 +1,153 @@
+"""
+FRANKENSTEIN 1.0 - Audit Sink Tests
+Unit tests for agents/sauron/audit_sink.py
+"""
+
+import gzip
+import json
+import time
+
+import pytest
+
+from agents.sauron.audit_sink import AuditSink, read_tail_lines
+
+
+@pytest.fixture
+def make_sink(tmp_path):
+    sinks = []
+
+    def make(**kwargs):
+        sink = AuditSink(tmp_path / "audit.log", **kwargs)
+        sinks.append(sink)
+        return sink
+
+    yield make
+    for sink in sinks:
+        sink.close()
+
+
+def _lines(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+class TestFlush:
+    """flush() waits for queued records without consuming record ids."""
+
+    def test_flush_writes_records(self, make_sink):
+        sink = make_sink()
+        for i in range(5):
+            sink.write({"i": i})
+
+        assert sink.flush(timeout=2.0)
+        assert [r["i"] for r in _lines(sink.path)] == [0, 1, 2, 3, 4]
+
+    def test_repeated_flush_does_not_stall(self, make_sink):
+        sink = make_sink()
+        sink.write({"i": 0})
+        assert sink.flush(timeout=2.0)
+
+        start = time.monotonic()
+        assert sink.flush(timeout=2.0)
+        assert sink.flush(timeout=2.0)
+        assert time.monotonic() - start < 1.0
+
+    def test_flush_with_no_writes(self, make_sink):
+        sink = make_sink()
+
+        start = time.monotonic()
+        assert sink.flush(timeout=2.0)
+        assert time.monotonic() - start < 1.0
+
+    def test_close_is_prompt_and_idempotent(self, make_sink):
+        sink = make_sink()
+        sink.write({"i": 0})
+        sink.flush(timeout=2.0)
+
+        start = time.monotonic()
+        sink.close()
+        sink.close()
+        assert time.monotonic() - start < 1.0
+        assert sink.flush(timeout=2.0)
+        assert len(_lines(sink.path)) == 1
+
+
+class TestRotation:
+    """Size-based rotation into gzip archives."""
+
+    def test_rotates_and_compresses(self, make_sink, tmp_path):
+        sink = make_sink(max_bytes=200, rotate_daily=False)
+        for i in range(20):
+            sink.write({"i": i, "pad": "x" * 40})
+            sink.flush(timeout=2.0)
+
+        archives = sorted(tmp_path.glob("audit.*.log.gz"))
+        assert archives
+        assert sink.stats()["rotations"] == len(archives)
+
+        records = []
+        for archive in archives:
+            with gzip.open(archive, "rt") as f:
+                records += [json.loads(line) for line in f]
+        records += _lines(sink.path)
+        assert sorted(r["i"] for r in records) == list(range(20))
+
+    def test_prunes_to_backup_count(self, make_sink, tmp_path):
+        sink = make_sink(max_bytes=50, backup_count=2, rotate_daily=False)
+        for i in range(10):
+            sink.write({"i": i, "pad": "x" * 40})
+            sink.flush(timeout=2.0)
+
+        assert len(list(tmp_path.glob("audit.*.log.gz"))) == 2
+
+
+class TestFsyncPolicy:
+    """fsync frequency follows the configured policy."""
+
+    def test_invalid_policy(self, tmp_path):
+        with pytest.raises(ValueError):
+            AuditSink(tmp_path / "audit.log", fsync_policy="sometimes")
+
+    def test_always_syncs_every_batch(self, make_sink):
+        sink = make_sink(fsync_policy="always")
+        for i in range(3):
+            sink.write({"i": i})
+            sink.flush(timeout=2.0)
+
+        stats = sink.stats()
+        assert stats["fsyncs"] >= stats["batches"] == 3
+
+    def test_never_skips_plain_records(self, make_sink):
+        sink = make_sink(fsync_policy="never")
+        sink.write({"i": 0})
+        time.sleep(0.5)
+
+        assert sink.stats()["records"] == 1
+        assert sink.stats()["fsyncs"] == 0
+
+    def test_durable_record_forces_fsync(self, make_sink):
+        sink = make_sink(fsync_policy="never")
+        sink.write({"i": 0}, durable=True)
+        time.sleep(0.5)
+
+        assert sink.stats()["fsyncs"] == 1
+
+
+class TestTail:
+    """In-memory ring and backwards file reads."""
+
+    def test_recent_is_oldest_first_and_bounded(self, make_sink):
+        sink = make_sink(tail_size=10)
+        for i in range(25):
+            sink.write({"i": i})
+
+        assert [r["i"] for r in sink.recent(3)] == [22, 23, 24]
+        assert [r["i"] for r in sink.recent(100)] == list(range(15, 25))
+        assert sink.recent(0) == []
+
+    def test_read_tail_lines(self, tmp_path):
+        path = tmp_path / "big.log"
+        path.write_text("".join(f"line {i}\n" for i in range(20000)))
+
+        assert read_tail_lines(path, 3) == ["line 19997", "line 19998", "line 19999"]
+        assert read_tail_lines(path, 0) == []
+        assert read_tail_lines(tmp_path / "missing.log", 3) == []
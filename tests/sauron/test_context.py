@@ -0,0 +1,130 @@
+"""
+FRANKENSTEIN 1.0 - Context Snapshot Tests
+Unit tests for agents/sauron/context.py
+"""
+
+import os
+import types
+
+import numpy as np
+import pytest
+
+from agents.sauron import context as context_module
+from agents.sauron.context import ContextSnapshot, top_basis_states
+
+
+class _FakeEngine:
+    """Just the SynthesisEngine surface ContextSnapshot reads."""
+
+    def __init__(self, statevector):
+        self._statevector = np.asarray(statevector, dtype=complex)
+        self.gate_count = 0
+        self.state_version = 0
+
+    def get_num_qubits(self):
+        return int(np.log2(self._statevector.size))
+
+    def apply(self, statevector):
+        self._statevector = np.asarray(statevector, dtype=complex)
+        self.gate_count += 1
+        self.state_version += 1
+
+
+@pytest.fixture
+def engine(monkeypatch):
+    engine = _FakeEngine([1, 0, 0, 0])
+    monkeypatch.setitem(context_module.sys.modules, "synthesis.engine",
+                        types.SimpleNamespace(_engine=engine))
+    return engine
+
+
+@pytest.fixture
+def top_calls(monkeypatch):
+    """Count statevector scans made by quantum refreshes"""
+    calls = []
+
+    def counted(statevector, n_qubits, k=context_module.TOP_STATES):
+        calls.append(n_qubits)
+        return top_basis_states(statevector, n_qubits, k)
+
+    monkeypatch.setattr(context_module, "top_basis_states", counted)
+    return calls
+
+
+@pytest.fixture
+def snapshot(tmp_path, monkeypatch):
+    monkeypatch.setattr(ContextSnapshot, "_refresh_storage", lambda self, forced: None)
+    monkeypatch.setattr(ContextSnapshot, "_session_line", staticmethod(lambda: ""))
+    monkeypatch.setattr(ContextSnapshot, "_resource_lines", staticmethod(lambda: []))
+    (tmp_path / "states").mkdir()
+    (tmp_path / "circuits").mkdir()
+    return ContextSnapshot(data_dir=tmp_path, subscribe=False)
+
+
+def _settled(snapshot):
+    """Render once fully refreshed, with no refresh pending"""
+    snapshot.refresh()
+    snapshot.wait_for_refresh()
+    return snapshot.render()
+
+
+class TestTopBasisStates:
+    """Top-k selection without the full probability dict."""
+
+    def test_most_probable_first(self):
+        amplitudes = np.sqrt([0.1, 0.6, 0.0, 0.3])
+        assert top_basis_states(amplitudes, 2) == [
+            ("01", pytest.approx(0.6)), ("11", pytest.approx(0.3)), ("00", pytest.approx(0.1)),
+        ]
+
+    def test_negligible_states_dropped(self):
+        assert top_basis_states(np.array([1, 0, 0, 0], dtype=complex), 2, k=3) == [("00", 1.0)]
+
+    def test_k_larger_than_register(self):
+        assert [s for s, _ in top_basis_states(np.sqrt([0.5, 0.5]), 1, k=8)] == ["0", "1"]
+
+
+class TestRenderCaching:
+    """render() reuses cached sections and picks up changes."""
+
+    def test_unchanged_engine_reuses_render(self, snapshot, engine, top_calls):
+        first = _settled(snapshot)
+        assert "|00⟩=1.000" in first
+        scans = len(top_calls)
+
+        for _ in range(5):
+            assert snapshot.render() == first
+        assert len(top_calls) == scans
+        assert snapshot.wait_for_refresh()
+
+    def test_state_change_refreshes_top_states(self, snapshot, engine):
+        _settled(snapshot)
+        engine.apply([0, 0, 0, 1])
+
+        pending = snapshot.render()
+        assert "1 gates applied" in pending
+        assert "(updating)" in pending
+
+        assert snapshot.wait_for_refresh(timeout=5)
+        current = snapshot.render()
+        assert "|11⟩=1.000" in current
+        assert "(updating)" not in current
+
+    def test_gate_count_from_engine_counter(self, snapshot, engine):
+        engine.gate_count = 250
+        assert "250 gates applied" in _settled(snapshot)
+
+    def test_invalidate_rescans_artifacts(self, snapshot):
+        states = snapshot.states_dir
+        (states / "alpha.npz").touch()
+        assert "Saved states: alpha" in _settled(snapshot)
+
+        # Same directory mtime: only an invalidation shows the new file
+        mtime = os.stat(states).st_mtime_ns
+        (states / "beta.npz").touch()
+        os.utime(states, ns=(mtime, mtime))
+        snapshot.refresh()
+        assert "beta" not in snapshot.render()
+
+        snapshot.invalidate("states")
+        assert "beta" in _settled(snapshot)
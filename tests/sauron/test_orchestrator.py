@@ -0,0 +1,183 @@
+"""
+FRANKENSTEIN 1.0 - Sauron Orchestrator Tests
+Unit tests for the dispatch runtime in agents/sauron/orchestrator.py
+"""
+
+import threading
+import time
+from concurrent.futures import Future
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+from agents.base import AgentResult
+from agents.sauron import orchestrator as orchestrator_module
+from agents.sauron.orchestrator import SauronOrchestrator
+
+
+class FakeAgent:
+    """Registry agent stand-in that counts calls per action."""
+
+    pure_actions = {"square", "fail"}
+    cpu_bound_actions = {"square", "fail"}
+
+    def __init__(self, delay=0.0):
+        self.delay = delay
+        self.calls = []
+        self._lock = threading.Lock()
+
+    def execute(self, action, **kwargs):
+        with self._lock:
+            self.calls.append((action, kwargs))
+        time.sleep(kwargs.get("sleep", self.delay))
+        if action == "fail":
+            raise TypeError("agent bug")
+        return AgentResult(success=True, data=kwargs.get("x", 0) ** 2)
+
+
+class FakePool:
+    """Process pool stand-in: submit raises or returns a preset future."""
+
+    def __init__(self, submit_error=None, result_error=None):
+        self.submit_error = submit_error
+        self.result_error = result_error
+        self.submitted = 0
+
+    def submit(self, fn, *args):
+        self.submitted += 1
+        if self.submit_error is not None:
+            raise self.submit_error
+        future = Future()
+        future.set_exception(self.result_error)
+        return future
+
+
+@pytest.fixture
+def agent():
+    return FakeAgent()
+
+
+@pytest.fixture
+def orchestrator(agent):
+    orch = SauronOrchestrator()
+    orch._targets["fake"] = agent
+    yield orch
+    orch.shutdown()
+
+
+class TestMemoization:
+    """Pure actions are memoized and deduplicated."""
+
+    def test_memo_hit(self, orchestrator, agent):
+        first = orchestrator.dispatch("fake", "square", x=3)
+        second = orchestrator.dispatch("fake", "square", x=3)
+
+        assert (first.data, second.data) == (9, 9)
+        assert not first.cached and second.cached
+        assert len(agent.calls) == 1
+        assert orchestrator.get_stats()["memo_hits"] == 1
+
+    def test_different_kwargs_miss(self, orchestrator, agent):
+        orchestrator.dispatch("fake", "square", x=3)
+        orchestrator.dispatch("fake", "square", x=4)
+
+        assert len(agent.calls) == 2
+
+    def test_identical_calls_in_fan_out_run_once(self, orchestrator, agent):
+        agent.delay = 0.05
+        calls = [{"agent": "fake", "action": "square", "x": 5}] * 3
+
+        multi = orchestrator.multi_dispatch(calls)
+
+        assert [r.data for r in multi.results] == [25, 25, 25]
+        assert len(agent.calls) == 1
+
+
+class TestMultiDispatch:
+    """Fan-out ordering and admission control."""
+
+    def test_results_in_call_order(self, orchestrator):
+        calls = [
+            {"agent": "fake", "action": "square", "x": 1, "sleep": 0.15},
+            {"agent": "fake", "action": "square", "x": 2, "sleep": 0.0},
+            {"agent": "fake", "action": "square", "x": 3, "sleep": 0.05},
+        ]
+
+        multi = orchestrator.multi_dispatch(calls)
+
+        assert [r.data for r in multi.results] == [1, 4, 9]
+        assert multi.all_success
+
+    def test_admission_timeout(self, orchestrator, monkeypatch):
+        monkeypatch.setattr(orchestrator_module, "ADMISSION_TIMEOUT_SEC", 0.05)
+        held = [orchestrator._slots.acquire(timeout=1) for _ in range(orchestrator._max_workers)]
+        try:
+            multi = orchestrator.multi_dispatch([{"agent": "fake", "action": "square", "x": 2}])
+        finally:
+            for _ in held:
+                orchestrator._slots.release()
+
+        result = multi.results[0]
+        assert not result.success
+        assert "Admission timeout" in result.error
+        assert orchestrator.get_stats()["admission_rejected"] == 1
+
+    def test_slots_released_after_calls(self, orchestrator):
+        calls = [{"agent": "fake", "action": "square", "x": i} for i in range(6)]
+
+        orchestrator.multi_dispatch(calls)
+        time.sleep(0.05)
+
+        held = [orchestrator._slots.acquire(timeout=0.5) for _ in range(orchestrator._max_workers)]
+        assert all(held)
+        for _ in held:
+            orchestrator._slots.release()
+
+
+class TestProcessPoolFallback:
+    """Only pool failures at submit time fall back to in-process execution."""
+
+    @pytest.fixture
+    def pooled(self, agent):
+        orch = SauronOrchestrator(process_pool=True)
+        orch._targets["fake"] = agent
+        return orch
+
+    def test_broken_pool_at_submit_runs_in_process(self, pooled, agent):
+        pool = FakePool(submit_error=BrokenProcessPool("worker died"))
+        pooled._process_pool = pool
+
+        result = pooled.dispatch("fake", "square", x=4)
+
+        assert result.success and result.data == 16
+        assert len(agent.calls) == 1
+        assert pooled._process_pool is None
+
+    def test_unpicklable_arguments_run_in_process(self, pooled, agent):
+        pool = FakePool()
+        pooled._process_pool = pool
+
+        result = pooled.dispatch("fake", "square", x=2, callback=threading.Lock())
+
+        assert result.success and result.data == 4
+        assert pool.submitted == 0
+        assert len(agent.calls) == 1
+
+    def test_agent_error_is_not_rerun(self, pooled, agent):
+        pooled._process_pool = FakePool(result_error=TypeError("agent bug"))
+
+        result = pooled.dispatch("fake", "fail")
+
+        assert not result.success
+        assert "agent bug" in result.error
+        assert agent.calls == []
+
+    def test_worker_death_while_running_is_reported(self, pooled, agent):
+        pool = FakePool(result_error=BrokenProcessPool("worker died"))
+        pooled._process_pool = pool
+
+        result = pooled.dispatch("fake", "square", x=3)
+
+        assert not result.success
+        assert agent.calls == []
+        assert pooled._process_pool is None
@@ -0,0 +1,146 @@
+"""
+FRANKENSTEIN 1.0 - Prompt Assembly Tests
+Unit tests for agents/sauron/prompt.py and the parser's use of it
+"""
+
+import pytest
+
+from agents.sauron import parser as parser_module
+from agents.sauron.prompt import (
+    MIN_HISTORY_TURNS,
+    TRIM_LOW_WATER,
+    PromptAssembler,
+    estimate_message_tokens,
+)
+
+
+def _turns(count, words=40):
+    """count user/assistant pairs of roughly equal size"""
+    history = []
+    for i in range(count):
+        history.append({"role": "user", "content": f"question {i} " + "word " * words})
+        history.append({"role": "assistant", "content": f"answer {i} " + "word " * words})
+    return history
+
+
+def _cost(messages):
+    return sum(estimate_message_tokens(m) for m in messages)
+
+
+@pytest.fixture
+def assembler():
+    return PromptAssembler("You are a test system prompt.")
+
+
+class TestFitHistory:
+    """Token-budget trimming of conversation history."""
+
+    def test_under_budget_keeps_everything(self, assembler):
+        history = _turns(3)
+
+        kept, dropped = assembler.fit_history(history, _cost(history))
+
+        assert kept == history
+        assert dropped == []
+
+    def test_over_budget_trims_to_low_water_on_user_boundary(self, assembler):
+        history = _turns(10)
+        budget = _cost(history) // 2
+
+        kept, dropped = assembler.fit_history(history, budget)
+
+        assert dropped + kept == history
+        assert kept[0]["role"] == "user"
+        assert _cost(kept) <= int(budget * TRIM_LOW_WATER) + _cost(history[:2])
+
+    def test_zero_budget_keeps_last_turn(self, assembler):
+        history = _turns(5) + [{"role": "user", "content": "current"}]
+
+        kept, _ = assembler.fit_history(history, 0)
+
+        assert kept == [{"role": "user", "content": "current"}]
+
+    def test_min_turns_floor(self, assembler):
+        history = _turns(6)
+
+        kept, dropped = assembler.fit_history(history, 0, min_turns=3)
+
+        assert kept == history[-6:]
+        assert dropped == history[:-6]
+
+    def test_max_messages(self, assembler):
+        history = _turns(10, words=1)
+
+        kept, _ = assembler.fit_history(history, 10_000, max_messages=10)
+
+        assert len(kept) <= int(10 * TRIM_LOW_WATER)
+        assert kept[0]["role"] == "user"
+
+    def test_input_not_modified(self, assembler):
+        history = _turns(6)
+        snapshot = list(history)
+
+        assembler.fit_history(history, 0)
+
+        assert history == snapshot
+
+
+class TestAssemble:
+    """Request layout: prefix, history, volatile context, current turn."""
+
+    def test_prefix_then_history(self, assembler):
+        history = _turns(2)
+
+        messages = assembler.assemble(history)
+
+        assert messages[0] == {"role": "system", "content": "You are a test system prompt."}
+        assert messages[1:] == history
+
+    def test_context_before_current_turn(self, assembler):
+        history = _turns(1) + [
+            {"role": "user", "content": "now"},
+            {"role": "assistant", "content": None, "tool_calls": [{"function": {"name": "git"}}]},
+            {"role": "tool", "content": "clean"},
+        ]
+
+        messages = assembler.assemble(history, context="LIVE")
+
+        index = messages.index({"role": "system", "content": "LIVE"})
+        assert messages[index + 1] == {"role": "user", "content": "now"}
+        assert messages[-1] == {"role": "tool", "content": "clean"}
+
+    def test_budget_exhausted_keeps_min_turns(self, assembler):
+        history = _turns(6)
+        options = {"num_ctx": 10, "num_predict": 10}
+
+        messages = assembler.assemble(history, options=options, min_turns=2)
+
+        assert messages[1:] == history[-4:]
+
+
+class TestParserHistory:
+    """The tool parser never trims the router's shared message list."""
+
+    def test_parse_keeps_shared_history(self, monkeypatch):
+        sent = {}
+
+        class Reply:
+            message = type("Message", (), {"tool_calls": None, "content": "done"})()
+
+        def chat(**kwargs):
+            sent["messages"] = kwargs["messages"]
+            return Reply()
+
+        monkeypatch.setattr(parser_module.ollama, "chat", chat, raising=False)
+        monkeypatch.setattr(parser_module, "get_prompt_metrics",
+                            lambda: type("Metrics", (), {"record": lambda *a, **k: None})())
+        intent_parser = parser_module.IntentParser()
+        history = _turns(8)
+        snapshot = list(history)
+
+        intent = intent_parser.parse_from_messages(history)
+
+        assert intent.text_response == "done"
+        assert history == snapshot
+        request_turns = [m for m in sent["messages"] if m["role"] == "user"]
+        assert len(request_turns) >= MIN_HISTORY_TURNS
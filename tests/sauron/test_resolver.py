@@ -0,0 +1,89 @@
+"""
+FRANKENSTEIN 1.0 - Fast-Path Resolver Tests
+Unit tests for agents/sauron/resolver.py
+"""
+
+import pytest
+
+from agents.sauron.resolver import FastIntentResolver, is_read_only_action
+
+
+@pytest.fixture
+def resolver():
+    return FastIntentResolver()
+
+
+class TestAccept:
+    """Literal read-only requests resolve above the threshold."""
+
+    @pytest.mark.parametrize("text, tool, action, args", [
+        ("git status", "git", "git_status", {}),
+        ("please git log -n 5", "git", "git_log", {"n": 5}),
+        ("ls", "dir", "dir_list", {"path": "."}),
+        ("ls ./agents", "dir", "dir_list", {"path": "./agents"}),
+        ("tree ~/project", "dir", "dir_tree", {"path": "~/project"}),
+        ("cat src/main.py", "file", "file_read", {"path": "src/main.py"}),
+        ("search for 'TODO' in ./agents", "search", "content_search",
+         {"pattern": "TODO", "root": "./agents"}),
+        ("list states", "memory", "list_states", {}),
+        ("get state info", "quantum", "get_state_info", {}),
+    ])
+    def test_accepted(self, resolver, text, tool, action, args):
+        intent = resolver.resolve(text)
+
+        assert intent is not None
+        assert (intent.tool_name, intent.action) == (tool, action)
+        assert {k: v for k, v in intent.arguments.items() if k != "action"} == args
+        assert resolver.accepts(intent)
+
+
+class TestAmbiguous:
+    """Matches the resolver is unsure of are left to the LLM."""
+
+    def test_phrase_shared_by_two_tools(self, resolver):
+        intent = resolver.resolve("list circuits")
+
+        assert intent is not None
+        assert not resolver.accepts(intent)
+
+    def test_alias_without_tool_prefix(self, resolver):
+        intent = resolver.resolve("status")
+
+        assert intent is not None
+        assert intent.confidence < resolver.threshold
+        assert not resolver.accepts(intent)
+
+    def test_shadow_mode_never_accepts(self):
+        resolver = FastIntentResolver(shadow=True)
+
+        assert not resolver.accepts(resolver.resolve("git status"))
+
+
+class TestReject:
+    """Stateful actions and non-path arguments never take the fast path."""
+
+    @pytest.mark.parametrize("text", [
+        "ls -la",
+        "tree view",
+        "ls everything",
+        "read this.pdf",
+        "git show --stat",
+        "search for TODO in everything",
+        "load state bell",
+        "run preset",
+        "git commit",
+        "tell me a story about qubits",
+    ])
+    def test_rejected(self, resolver, text):
+        assert resolver.resolve(text) is None
+
+    @pytest.mark.parametrize("tool, action", [
+        ("quantum", "run_preset"),
+        ("quantum", "init_qubits"),
+        ("memory", "load_state"),
+        ("memory", "load_circuit"),
+        ("file", "file_copy"),
+    ])
+    def test_stateful_ring3_actions_not_read_only(self, resolver, tool, action):
+        assert not is_read_only_action(tool, action)
+        assert not resolver.is_read_only(tool, action)
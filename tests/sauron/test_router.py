@@ -0,0 +1,120 @@
+"""
+FRANKENSTEIN 1.0 - Action Router Tests
+Unit tests for parallel tool dispatch in agents/sauron/router.py
+"""
+
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from agents.sauron import router as router_module
+from agents.sauron.parser import ParsedIntent
+from agents.sauron.router import ActionRouter
+from agents.sauron.tools.base import ToolResult
+
+
+class RecordingRegistry:
+    """Registry stand-in that logs start/end of each call."""
+
+    def __init__(self, delay=0.05):
+        self.delay = delay
+        self.events = []
+        self._lock = threading.Lock()
+        self.hooks = {}
+
+    def list_tools(self):
+        return [{"name": name} for name in ("git", "quantum", "file", "memory")]
+
+    def execute(self, tool_name, **kwargs):
+        label = f"{tool_name}.{kwargs['action']}"
+        with self._lock:
+            self.events.append(("start", label))
+        hook = self.hooks.get(label)
+        if hook is not None:
+            hook()
+        time.sleep(self.delay)
+        with self._lock:
+            self.events.append(("end", label))
+        return ToolResult(success=True, data=label)
+
+
+def _call(tool, action):
+    return ParsedIntent(tool_name=tool, arguments={"action": action},
+                        text_response=None, raw_tool_call=None)
+
+
+@pytest.fixture
+def registry():
+    return RecordingRegistry()
+
+
+@pytest.fixture
+def router(monkeypatch, registry):
+    monkeypatch.setattr(router_module, "get_parser", MagicMock)
+    monkeypatch.setattr(router_module, "get_registry", lambda: registry)
+    return ActionRouter()
+
+
+class TestParallelSafety:
+    """Parallel safety comes from the static (tool, action) table."""
+
+    @pytest.mark.parametrize("tool, action, expected", [
+        ("git", "git_status", True),
+        ("quantum", "get_state_info", True),
+        ("quantum", "run_preset", False),
+        ("quantum", "measure", False),
+        ("memory", "load_state", False),
+        ("file", "file_copy", False),
+        (None, "", False),
+    ])
+    def test_static_table(self, router, tool, action, expected):
+        assert router._is_parallel_safe(_call(tool, action)) is expected
+
+    def test_ignores_mutated_permission_level(self, router, registry):
+        from agents.sauron.permissions import PermissionLevel
+
+        tool = MagicMock(permission_level=PermissionLevel.SENSITIVE)
+        registry.get = lambda name: tool
+
+        assert router._is_parallel_safe(_call("quantum", "get_state_info"))
+        tool.permission_level = PermissionLevel.SAFE
+        assert not router._is_parallel_safe(_call("quantum", "run_preset"))
+
+
+class TestExecuteAll:
+    """Results keep request order; stateful calls are barriers."""
+
+    def test_results_in_request_order(self, router):
+        calls = [_call("git", "git_status"), _call("quantum", "run_preset"),
+                 _call("git", "git_log"), _call("git", "git_diff")]
+
+        results = router._execute_all(calls)
+
+        assert [r.data for r in results] == [
+            "git.git_status", "quantum.run_preset", "git.git_log", "git.git_diff",
+        ]
+
+    def test_consecutive_reads_overlap(self, router, registry):
+        both_started = threading.Barrier(2, timeout=2)
+        registry.hooks["git.git_status"] = both_started.wait
+        registry.hooks["git.git_log"] = both_started.wait
+
+        results = router._execute_all([_call("git", "git_status"), _call("git", "git_log")])
+
+        assert all(r.success for r in results)
+
+    def test_stateful_call_is_serialized(self, router, registry):
+        calls = [_call("git", "git_status"), _call("git", "git_log"),
+                 _call("quantum", "run_preset"), _call("quantum", "get_state_info")]
+
+        router._execute_all(calls)
+
+        events = registry.events
+        preset_start = events.index(("start", "quantum.run_preset"))
+        preset_end = events.index(("end", "quantum.run_preset"))
+        assert events.index(("end", "git.git_status")) < preset_start
+        assert events.index(("end", "git.git_log")) < preset_start
+        assert preset_end == preset_start + 1
+        assert events.index(("start", "quantum.get_state_info")) > preset_end
@@ -419,6 +419,7 @@ def test_knowledge_persistence():
                 metrics={'cpu_usage': 0.4, 'ram_usage': 200, 'duration': 10.0},
                 success=True
             )
+        learner1.close()  # End of session flushes debounced writes
 
         # Session 2: Reload knowledge
         learner2 = ContextLearner(knowledge_path)
@@ -347,5 +347,127 @@ def test_database_schema():
         conn.close()
 
 
+def test_streaming_detector_latency_shift():
+    """Test that a latency step change raises an alert immediately."""
+    from agents.adaptation import StreamingDegradationDetector
+    import random
+
+    alerts_seen = []
+    detector = StreamingDegradationDetector(publish_events=False, on_alert=alerts_seen.append)
+    rng = random.Random(7)
+
+    # Stable baseline around 10ms
+    for _ in range(100):
+        detector.update({'provider_id': 'p1', 'latency': 0.010 + rng.uniform(-0.001, 0.001)})
+    assert detector.get_active_alerts() == []
+    assert detector.get_trend('p1', 'latency').direction == 'stable'
+
+    # Step to 50ms should trip the CUSUM within a few samples
+    raised_at = None
+    for i in range(20):
+        new = detector.update({'provider_id': 'p1', 'latency': 0.050})
+        if new:
+            raised_at = i
+            break
+
+    assert raised_at is not None and raised_at < 5
+    assert alerts_seen[0].metric == 'latency'
+    assert alerts_seen[0].severity == 'high'
+    assert alerts_seen[0].details['baseline_avg'] < 0.012
+
+    # Alert stays active (edge-triggered, not re-raised) until recovery
+    assert detector.update({'provider_id': 'p1', 'latency': 0.050}) == []
+    assert len(detector.get_active_alerts('p1')) == 1
+    for _ in range(20):
+        detector.update({'provider_id': 'p1', 'latency': 0.010})
+    assert detector.get_active_alerts('p1') == []
+
+
+def test_streaming_detector_publishes_event():
+    """Test that new alerts are published on the event bus."""
+    from agents.adaptation import StreamingDegradationDetector
+    from data.events import EventBus, EventType
+
+    bus = EventBus()
+    detector = StreamingDegradationDetector()
+    for _ in range(20):
+        detector.update({'provider_id': 'flaky', 'error_rate': 0.6})
+
+    events = bus.get_history(event_type=EventType.PROVIDER_DEGRADED)
+    assert any(e.data['provider_id'] == 'flaky' and e.data['metric'] == 'error_rate'
+               and e.data['severity'] == 'critical' for e in events)
+
+
+def test_detect_all_degradations_streaming():
+    """Test that detect_all_degradations reflects streaming alerts."""
+    from agents.adaptation import PerformanceTracker
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, 'test_metrics.db')
+        tracker = PerformanceTracker(db_path)
+        tracker.degradation_detector.publish_events = False
+
+        for i in range(40):
+            tracker.degradation_detector.update({'provider_id': 'slow', 'latency': 0.01})
+        for i in range(5):
+            tracker.degradation_detector.update({'provider_id': 'slow', 'latency': 0.1})
+
+        alerts = tracker.detect_all_degradations()
+        assert [a.provider_id for a in alerts] == ['slow']
+        assert tracker.detect_degradation('slow').metric == 'latency'
+
+
+def test_detect_all_degradations_after_restart():
+    """Test that untracked providers fall back to the history scan."""
+    from agents.adaptation import PerformanceTracker
+    from datetime import datetime, timedelta
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        db_path = os.path.join(tmpdir, 'test_metrics.db')
+        tracker = PerformanceTracker(db_path)
+        tracker._initialize_storage()
+        start = datetime.now() - timedelta(minutes=30)
+        tracker.metrics_store.store_metrics([{
+            'task_id': f'task{i}', 'provider_id': 'restarted',
+            'timestamp': start + timedelta(seconds=i),
+            'latency': 0.1 + 0.02 * i, 'cpu_usage': 0.1, 'ram_usage': 0.1,
+            'throughput': 1.0, 'error_rate': 0.0, 'queue_depth': 0,
+        } for i in range(60)])
+
+        # Fresh tracker: the streaming detector has no state for the provider
+        restarted = PerformanceTracker(db_path)
+        alerts = restarted.detect_all_degradations()
+        assert [(a.provider_id, a.metric) for a in alerts] == [('restarted', 'latency')]
+        assert restarted.detect_all_degradations(threshold=100.0) == []
+
+
+def test_streaming_degradation_threshold_and_zero_baseline():
+    """Test that the threshold is honored and untimed latencies are ignored."""
+    from agents.adaptation import PerformanceTracker
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        tracker = PerformanceTracker(os.path.join(tmpdir, 'test_metrics.db'))
+        detector = tracker.degradation_detector
+        detector.publish_events = False
+
+        for _ in range(40):
+            detector.update({'provider_id': 'slow', 'latency': 0.01})
+        for _ in range(5):
+            detector.update({'provider_id': 'slow', 'latency': 0.1})
+        assert tracker.detect_degradation('slow', threshold=0.2).metric == 'latency'
+        assert tracker.detect_degradation('slow', threshold=100.0) is None
+        assert tracker.detect_all_degradations(threshold=100.0) == []
+
+        # Untimed tasks report latency 0.0; they must not form a baseline
+        for _ in range(40):
+            detector.update({'provider_id': 'untimed', 'latency': 0.0})
+        for _ in range(5):
+            detector.update({'provider_id': 'untimed', 'latency': 0.05})
+        assert detector.get_active_alerts('untimed') == []
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -393,6 +393,9 @@ def test_json_persistence():
                 success=True
             )
 
+        # Writes are debounced; force pending updates to disk
+        learner1.flush()
+
         # Verify JSON file exists
         assert os.path.exists(storage_path)
 
@@ -464,5 +467,131 @@ def test_recency_factor():
         assert confidence_old < confidence_recent
 
 
+def test_journal_incremental_persistence():
+    """Test that flushes append to the journal and replay on load."""
+    from agents.adaptation import ContextLearner
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, 'knowledge.json')
+        learner1 = ContextLearner(storage_path, flush_interval=60.0)
+
+        learner1.record_execution(
+            task_type='journal_task',
+            provider_id='provider_j',
+            metrics={'cpu_usage': 0.2, 'ram_usage': 50, 'duration': 1.0},
+            success=True
+        )
+        learner1.flush()  # First flush writes the snapshot
+
+        for _ in range(4):
+            learner1.record_execution(
+                task_type='journal_task',
+                provider_id='provider_j',
+                metrics={'cpu_usage': 0.2, 'ram_usage': 50, 'duration': 1.0},
+                success=True
+            )
+        learner1.flush()
+        learner1.close()
+
+        # Subsequent flushes append rows instead of rewriting the snapshot
+        assert os.path.exists(learner1.journal_path)
+        with open(storage_path) as f:
+            snapshot = json.load(f)
+        assert snapshot['patterns']['journal_task::provider_j']['execution_count'] == 1
+
+        learner2 = ContextLearner(storage_path)
+        assert learner2.knowledge_base['journal_task::provider_j']['execution_count'] == 5
+
+        # Compaction folds the journal back into the snapshot
+        learner2._save_knowledge()
+        assert not os.path.exists(learner2.journal_path)
+        learner3 = ContextLearner(storage_path)
+        assert learner3.knowledge_base['journal_task::provider_j']['execution_count'] == 5
+
+
+def test_count_debounced_flush():
+    """Test that enough dirty patterns wake the background flusher early."""
+    from agents.adaptation import ContextLearner
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, 'knowledge.json')
+        learner = ContextLearner(storage_path, flush_interval=60.0, flush_max_pending=3)
+
+        for i in range(3):
+            learner.record_execution(
+                task_type='burst_task',
+                provider_id=f'provider_{i}',
+                metrics={'cpu_usage': 0.1, 'ram_usage': 10, 'duration': 0.5},
+                success=True
+            )
+
+        deadline = time.time() + 5.0
+        while not os.path.exists(storage_path) and time.time() < deadline:
+            time.sleep(0.01)
+        learner.close()
+
+        assert os.path.exists(storage_path)
+        assert len(ContextLearner(storage_path).get_patterns_for_task('burst_task')) == 3
+
+
+def test_stale_journal_skipped_after_interrupted_compaction():
+    """Test that journal rows already in the snapshot are not replayed again."""
+    from agents.adaptation import ContextLearner, AdaptationResult
+    import tempfile
+    import shutil
+
+    metrics = {'cpu_usage': 0.2, 'ram_usage': 50, 'duration': 1.0}
+    with tempfile.TemporaryDirectory() as tmpdir:
+        storage_path = os.path.join(tmpdir, 'knowledge.json')
+        learner = ContextLearner(storage_path, flush_interval=60.0)
+        learner.record_execution('crash_task', 'provider_c', metrics, success=True)
+        learner.flush()
+        for _ in range(3):
+            learner.record_execution('crash_task', 'provider_c', metrics, success=True)
+        learner.record_adaptation('task-1', AdaptationResult(
+            success=True, reason='latency_spike', details={'new_provider': 'provider_d'}))
+        learner.flush()
+
+        # Crash after os.replace(snapshot) but before os.remove(journal)
+        stale_journal = os.path.join(tmpdir, 'stale.journal')
+        shutil.copy(learner.journal_path, stale_journal)
+        learner.record_execution('crash_task', 'provider_c', metrics, success=True)
+        learner._save_knowledge()
+        learner.close()
+        shutil.copy(stale_journal, learner.journal_path)
+
+        reloaded = ContextLearner(storage_path, flush_interval=60.0)
+        assert reloaded.knowledge_base['crash_task::provider_c']['execution_count'] == 5
+        assert len(reloaded.adaptation_history) == 1
+
+        # New rows journaled after the reload still replay
+        reloaded.record_execution('crash_task', 'provider_c', metrics, success=True)
+        reloaded.flush()
+        reloaded.close()
+        assert ContextLearner(storage_path).knowledge_base[
+            'crash_task::provider_c']['execution_count'] == 6
+
+
+def test_flusher_does_not_keep_learner_alive():
+    """Test that the background flusher holds the learner only weakly."""
+    from agents.adaptation import ContextLearner
+    import tempfile
+    import gc
+    import weakref
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        learner = ContextLearner(os.path.join(tmpdir, 'knowledge.json'), flush_interval=60.0)
+        learner.record_execution('weak_task', 'provider_w',
+                                 {'cpu_usage': 0.1, 'ram_usage': 10, 'duration': 0.5},
+                                 success=True)
+        assert learner._flush_thread.is_alive()
+        ref = weakref.ref(learner)
+        del learner
+        gc.collect()
+        assert ref() is None
+
+
 if __name__ == '__main__':
     pytest.main([__file__, '-v'])
@@ -81,9 +81,10 @@ class TestLogFileCreation:
         assert temp_log_dir.is_dir()
 
     def test_log_file_created(self, fresh_logger, temp_log_dir):
-        """Log file should be created on first run."""
-        log_file = temp_log_dir / "audit_log.json"
-        assert log_file.exists()
+        """Segment directory and index should be created on first run."""
+        segment_dir = temp_log_dir / "audit"
+        assert segment_dir.is_dir()
+        assert (segment_dir / "index.json").exists()
 
     def test_key_file_created(self, fresh_logger, temp_log_dir):
         """Encryption key file should be created."""
@@ -91,11 +92,9 @@ class TestLogFileCreation:
         assert key_file.exists()
 
     def test_initial_log_file_empty(self, fresh_logger, temp_log_dir):
-        """Initial log file should be empty JSON array."""
-        log_file = temp_log_dir / "audit_log.json"
-        with open(log_file, 'r') as f:
-            logs = json.load(f)
-        assert logs == []
+        """Initial audit trail should have no segments or entries."""
+        assert list((temp_log_dir / "audit").glob("audit_*.jsonl")) == []
+        assert fresh_logger.get_logs() == []
 
 
 class TestLogAction:
@@ -573,5 +572,155 @@ class TestThreadSafety:
         assert len(logs) == 30
 
 
+class TestSegmentedStorage:
+    """Test append-only segments and the sidecar index."""
+
+    def test_entries_appended_as_jsonl(self, fresh_logger, temp_log_dir):
+        """Each entry is one JSON line in today's segment."""
+        for i in range(3):
+            fresh_logger.log_action(
+                user_role="Admin",
+                action=f"action_{i}",
+                resource="test",
+                result="success"
+            )
+        fresh_logger.flush()
+
+        segments = list((temp_log_dir / "audit").glob("audit_*.jsonl"))
+        assert len(segments) == 1
+        lines = segments[0].read_text().splitlines()
+        assert [json.loads(line)["action"] for line in lines] == ["action_0", "action_1", "action_2"]
+
+    def test_index_tracks_provider_counts(self, fresh_logger, temp_log_dir):
+        """Index summarizes providers so stats don't need a full scan."""
+        fresh_logger.log_action(
+            user_role="Admin",
+            action="quantum_job_submit",
+            resource="test",
+            result="success",
+            provider_name="IBM Quantum"
+        )
+        fresh_logger.flush()
+
+        with open(temp_log_dir / "audit" / "index.json") as f:
+            index = json.load(f)
+        (summary,) = index.values()
+        assert summary["count"] == 1
+        assert summary["providers"]["IBM Quantum"]["total_actions"] == 1
+        assert summary["actions"] == {"quantum_job_submit": 1}
+
+    def test_segment_rotates_by_size(self, fresh_logger, temp_log_dir, monkeypatch):
+        """A full segment rolls over to the next sequence number."""
+        monkeypatch.setattr(AuditLogger, "MAX_LOG_SIZE", 600)
+        for i in range(10):
+            fresh_logger.log_action(
+                user_role="Admin",
+                action="test",
+                resource="test",
+                result="success"
+            )
+        fresh_logger.flush()
+
+        segments = sorted((temp_log_dir / "audit").glob("audit_*.jsonl"))
+        assert len(segments) > 1
+        assert len(fresh_logger.get_logs()) == 10
+        assert len(fresh_logger.get_logs(limit=3)) == 3
+
+    def test_index_rebuilt_when_missing(self, fresh_logger, temp_log_dir):
+        """A lost index is rebuilt from the segments on startup."""
+        fresh_logger.log_action(
+            user_role="Admin",
+            action="test",
+            resource="test",
+            result="success",
+            provider_name="AWS Braket"
+        )
+        fresh_logger.flush()
+        (temp_log_dir / "audit" / "index.json").unlink()
+
+        AuditLogger._instance = None
+        AuditLogger._initialized = False
+        reloaded = AuditLogger()
+        assert reloaded.get_provider_usage_stats("AWS Braket")["total_actions"] == 1
+
+    def test_legacy_json_log_migrated(self, temp_log_dir):
+        """Entries from the old single-file JSON array are migrated."""
+        legacy = [{
+            "timestamp": datetime.now().isoformat(),
+            "user_role": "Admin",
+            "action": "legacy_action",
+            "resource": "test",
+            "result": "success"
+        }]
+        with open(temp_log_dir / "audit_log.json", "w") as f:
+            json.dump(legacy, f)
+
+        AuditLogger._instance = None
+        AuditLogger._initialized = False
+        logger = AuditLogger()
+        try:
+            assert logger.get_logs(action="legacy_action")[0]["resource"] == "test"
+            assert not (temp_log_dir / "audit_log.json").exists()
+        finally:
+            AuditLogger._instance = None
+            AuditLogger._initialized = False
+
+    def test_unserializable_field_rejected_without_dropping_batch(self, fresh_logger):
+        """A bad field fails its own log_action call; queued entries are kept."""
+        fresh_logger.log_action(
+            user_role="Admin",
+            action="before",
+            resource="test",
+            result="success"
+        )
+        with pytest.raises(TypeError):
+            fresh_logger.log_action(
+                user_role="Admin",
+                action="bad",
+                resource="test",
+                result="success",
+                payload=object()
+            )
+        fresh_logger.log_action(
+            user_role="Admin",
+            action="after",
+            resource="test",
+            result="success"
+        )
+
+        assert [log["action"] for log in fresh_logger.get_logs()] == ["before", "after"]
+        (summary,) = fresh_logger._index.values()
+        assert summary["count"] == 2
+
+    def test_failed_write_not_counted_in_index(self, fresh_logger, temp_log_dir, caplog):
+        """Entries whose segment cannot be written are logged, not indexed."""
+        day = datetime.now().strftime("%Y%m%d")
+        (temp_log_dir / "audit" / f"audit_{day}_0000.jsonl").mkdir()
+        fresh_logger.log_action(
+            user_role="Admin",
+            action="test",
+            resource="test",
+            result="success",
+            provider_name="IBM Quantum"
+        )
+        fresh_logger.flush()
+
+        assert fresh_logger.get_logs() == []
+        assert fresh_logger.get_provider_usage_stats("IBM Quantum")["total_actions"] == 0
+        assert "write failed" in caplog.text
+
+    def test_log_action_does_not_block_on_cpu_sampling(self, fresh_logger):
+        """Resource impact uses a cached, non-blocking sample."""
+        start = time.perf_counter()
+        for _ in range(50):
+            fresh_logger.log_action(
+                user_role="Admin",
+                action="test",
+                resource="test",
+                result="success"
+            )
+        assert time.perf_counter() - start < 1.0
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
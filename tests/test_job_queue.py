@@ -0,0 +1,171 @@
+"""
+Unit tests for the persistent Job Queue.
+
+Tests leases, lane ordering, batching and fallback retries.
+
+Author: Frankenstein 1.0 Team
+Phase: 3, Step 6
+"""
+
+import time
+
+import pytest
+
+from automation.job_queue import (
+    JobQueue,
+    JobStatus,
+    LocalStandInProvider,
+)
+
+
+@pytest.fixture
+def queue(tmp_path):
+    """Create a JobQueue backed by a temporary database."""
+    return JobQueue(str(tmp_path / "job_queue.db"))
+
+
+class TestEnqueueDequeue:
+    """Test basic queue operations."""
+
+    def test_enqueue_and_dequeue(self, queue):
+        job = queue.enqueue("quantum", "local_simulator", {"circuit": "bell"})
+
+        taken = queue.dequeue()
+        assert taken.job_id == job.job_id
+        assert taken.payload == {"circuit": "bell"}
+        assert queue.dequeue() is None
+
+    def test_invalid_kind(self, queue):
+        with pytest.raises(ValueError, match="Invalid job kind"):
+            queue.enqueue("analog", "local_cpu")
+
+    def test_queue_persists_across_instances(self, tmp_path):
+        path = str(tmp_path / "job_queue.db")
+        job = JobQueue(path).enqueue("classical", "local_cpu", {"n": 1})
+
+        reopened = JobQueue(path)
+        assert reopened.get_job(job.job_id).status == JobStatus.QUEUED
+
+
+class TestLeases:
+    """Test lease semantics."""
+
+    def test_leased_job_not_handed_out_twice(self, queue):
+        queue.enqueue("classical", "local_cpu")
+
+        assert len(queue.lease("worker-a")) == 1
+        assert queue.lease("worker-b") == []
+
+    def test_expired_lease_is_reclaimed(self, queue):
+        job = queue.enqueue("classical", "local_cpu")
+        queue.lease("worker-a", lease_seconds=0.05)
+        time.sleep(0.1)
+
+        leased = queue.lease("worker-b")
+        assert [j.job_id for j in leased] == [job.job_id]
+        # The original owner lost the lease
+        assert queue.complete(job.job_id, "worker-a") is False
+        assert queue.complete(job.job_id, "worker-b") is True
+
+
+class TestOrdering:
+    """Test cost/ETA-aware reordering."""
+
+    def test_reorder_by_priority_then_eta(self, queue):
+        big = queue.enqueue("quantum", "ibm_quantum", size=10)
+        small = queue.enqueue("quantum", "ibm_quantum", size=1)
+        urgent = queue.enqueue("quantum", "ibm_quantum", size=10, priority=5)
+
+        moved = queue.reorder(kind="quantum")
+
+        assert moved == 2  # small keeps its middle slot
+        assert [j.job_id for j in queue.get_lane("ibm_quantum")] == \
+            [urgent.job_id, small.job_id, big.job_id]
+
+    def test_shortest_backlog_lane_leased_first(self, queue):
+        queue.enqueue("quantum", "ibm_quantum")
+        fast = queue.enqueue("quantum", "qiskit_aer")
+
+        assert queue.lease("worker")[0].job_id == fast.job_id
+
+
+class TestBatching:
+    """Test batching of small compatible jobs."""
+
+    def test_small_jobs_with_same_key_batched(self, queue):
+        for _ in range(3):
+            queue.enqueue("quantum", "local_simulator", batch_key="bell-1024")
+        queue.enqueue("quantum", "local_simulator", batch_key="ghz-1024")
+        queue.enqueue("quantum", "local_simulator", batch_key="bell-1024", size=10)
+
+        batch = queue.lease_batch("worker", provider_id="local_simulator")
+
+        assert len(batch) == 3
+        assert {j.batch_key for j in batch} == {"bell-1024"}
+
+    def test_process_submits_one_batch(self, queue):
+        backend = LocalStandInProvider("local_simulator")
+        for _ in range(4):
+            queue.enqueue("quantum", "local_simulator", batch_key="bell")
+
+        counts = queue.process({"local_simulator": backend})
+
+        assert counts["batches"] == 1
+        assert counts["completed"] == 4
+        assert len(backend.submissions) == 1
+        assert queue.stats()["by_status"]["completed"] == 4
+
+    def test_batch_respects_kind(self, queue):
+        queue.enqueue("quantum", "local_simulator", batch_key="shared")
+        queue.enqueue("classical", "local_simulator", batch_key="shared")
+
+        batch = queue.lease_batch("worker", provider_id="local_simulator", kind="quantum")
+
+        assert [j.kind for j in batch] == ["quantum"]
+
+    def test_short_result_list_releases_jobs(self, queue):
+        class DropsLast(LocalStandInProvider):
+            def submit(self, jobs):
+                return super().submit(jobs)[:-1]
+
+        for _ in range(3):
+            queue.enqueue("quantum", "local_simulator", batch_key="bell", max_attempts=1)
+
+        counts = queue.process({"local_simulator": DropsLast("local_simulator")}, max_batches=1)
+
+        assert counts["completed"] == 2
+        assert counts["failed"] == 1
+        assert queue.stats()["by_status"]["leased"] == 0
+
+
+class TestFallback:
+    """Test retries onto the router fallback chain."""
+
+    def test_failed_job_moves_to_fallback_provider(self, queue):
+        job = queue.enqueue("quantum", "ibm_quantum")
+        backends = {
+            "ibm_quantum": LocalStandInProvider("ibm_quantum", fail_with="503 unavailable"),
+            "qiskit_aer": LocalStandInProvider("qiskit_aer"),
+        }
+
+        counts = queue.process(backends)
+
+        assert counts["retried"] == 1
+        assert counts["completed"] == 1
+        done = queue.get_job(job.job_id)
+        assert done.status == JobStatus.COMPLETED
+        assert done.provider_id == "qiskit_aer"
+        assert done.tried_providers == ["ibm_quantum"]
+        assert done.result["provider_id"] == "qiskit_aer"
+
+    def test_job_fails_after_max_attempts(self, queue):
+        job = queue.enqueue("classical", "local_cpu", max_attempts=2)
+        backends = {"local_cpu": LocalStandInProvider(fail_with="boom")}
+
+        counts = queue.process(backends)
+
+        assert counts["retried"] == 1
+        assert counts["failed"] == 1
+        failed = queue.get_job(job.job_id)
+        assert failed.status == JobStatus.FAILED
+        assert failed.error == "boom"
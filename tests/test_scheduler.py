@@ -317,6 +317,33 @@ class TestTaskPauseResume:
         task = fresh_scheduler.get_task("resume_test")
         assert task.status == TaskStatus.PENDING
 
+    def test_resume_during_run_keeps_one_schedule(self, fresh_scheduler, mock_resources):
+        """Pause/resume while a run is in flight leaves a single schedule chain."""
+        task = fresh_scheduler.register_task(
+            task_id="in_flight",
+            task_func=lambda: time.sleep(0.5),
+            schedule_type="recurring",
+            interval_seconds=1
+        )
+
+        fresh_scheduler.start()
+        time.sleep(1.2)
+        assert "in_flight" in fresh_scheduler._running_tasks
+
+        fresh_scheduler.pause_task("in_flight")
+        fresh_scheduler.resume_task("in_flight")
+        assert task.status == TaskStatus.RUNNING
+        time.sleep(0.6)
+
+        with fresh_scheduler._lock:
+            generation = fresh_scheduler._generations.get("in_flight", 0)
+            pending = [
+                entry for entry in fresh_scheduler._heap
+                if entry[2] == "run" and entry[3] == "in_flight" and entry[4] == generation
+            ]
+        assert len(pending) == 1
+        assert task.run_count == 1
+
     def test_pause_nonexistent_task(self, fresh_scheduler, mock_resources):
         """Test that pausing nonexistent task raises KeyError."""
         with pytest.raises(KeyError):
@@ -504,5 +531,97 @@ class TestEventTriggeredTasks:
         task_func.assert_called()
 
 
+class TestEventDrivenScheduling:
+    """Test heap scheduling, worker pool, timeouts and EventBus triggers."""
+
+    def test_slow_task_does_not_delay_others(self, fresh_scheduler, mock_resources):
+        """A long-running task runs on the pool, not the scheduler thread."""
+        fast_func = Mock()
+
+        fresh_scheduler.register_task(
+            task_id="slow",
+            task_func=lambda: time.sleep(1.5),
+            schedule_type="one_time"
+        )
+        fresh_scheduler.register_task(
+            task_id="fast",
+            task_func=fast_func,
+            schedule_type="one_time"
+        )
+
+        fresh_scheduler.start()
+        time.sleep(0.3)
+
+        fast_func.assert_called_once()
+
+    def test_registration_wakes_scheduler(self, fresh_scheduler, mock_resources):
+        """A task registered while idle runs without waiting for a poll tick."""
+        task_func = Mock()
+        fresh_scheduler.start()
+        time.sleep(0.1)
+
+        fresh_scheduler.register_task(
+            task_id="late",
+            task_func=task_func,
+            schedule_type="one_time"
+        )
+        time.sleep(0.1)
+
+        task_func.assert_called_once()
+
+    def test_task_timeout_marks_failed(self, fresh_scheduler, mock_resources):
+        """Tasks exceeding their timeout are failed and free their slot."""
+        task = fresh_scheduler.register_task(
+            task_id="hangs",
+            task_func=lambda: time.sleep(1.0),
+            schedule_type="one_time",
+            timeout_seconds=0.2
+        )
+
+        fresh_scheduler.start()
+        time.sleep(0.5)
+
+        assert task.status == TaskStatus.FAILED
+        assert "Timed out" in task.last_error
+        assert "hangs" not in fresh_scheduler._running_tasks
+
+    def test_event_bound_trigger_runs_on_event(self, fresh_scheduler, mock_resources):
+        """Triggers bound to EventBus events are checked when the event fires."""
+        from data.events import EventBus, Event, EventType
+
+        task_func = Mock()
+        fresh_scheduler.register_task(
+            task_id="on_threat",
+            task_func=task_func,
+            schedule_type="event_triggered",
+            trigger_condition=lambda: True,
+            trigger_events=[EventType.SECURITY_THREAT]
+        )
+        fresh_scheduler.start()
+        time.sleep(0.1)
+        task_func.assert_not_called()
+
+        EventBus().publish_sync(Event(event_type=EventType.SECURITY_THREAT))
+        time.sleep(0.2)
+
+        task_func.assert_called_once()
+
+    def test_cancel_task(self, fresh_scheduler, mock_resources):
+        """Cancelled tasks are removed and never run."""
+        task_func = Mock()
+        fresh_scheduler.register_task(
+            task_id="cancel_me",
+            task_func=task_func,
+            schedule_type="recurring",
+            interval_seconds=1
+        )
+        fresh_scheduler.start()
+        fresh_scheduler.cancel_task("cancel_me")
+        time.sleep(1.3)
+
+        task_func.assert_not_called()
+        assert fresh_scheduler.get_task("cancel_me") is None
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -48,9 +48,11 @@ def mock_resources():
 @pytest.fixture
 def workflow_engine(temp_report_dir, mock_resources):
     """Create a fresh WorkflowEngine instance for each test."""
-    # Reset singleton
+    # Reset singletons
+    import automation.job_queue
     import automation.workflow_engine
     automation.workflow_engine._workflow_engine = None
+    automation.job_queue._job_queue = None
 
     # Mock permission manager and audit logger
     with patch('automation.workflow_engine.get_permission_manager') as mock_pm, \
@@ -119,6 +121,22 @@ class TestWorkflow1QuantumQueueOptimization:
         # Verify audit logger was called
         workflow_engine.audit_logger.log_action.assert_called()
 
+    def test_optimize_quantum_queue_processes_jobs(self, workflow_engine):
+        """Test that queued jobs are batched and submitted to registered backends."""
+        from automation.job_queue import LocalStandInProvider
+
+        backend = LocalStandInProvider("local_simulator")
+        workflow_engine.register_job_backend("local_simulator", backend)
+        queue = workflow_engine._get_job_queue()
+        for _ in range(3):
+            queue.enqueue("quantum", "local_simulator", batch_key="bell")
+
+        result = workflow_engine.optimize_quantum_queue()
+
+        assert result["jobs_completed"] == 3
+        assert result["batches_submitted"] == 1
+        assert result["queue_depth"] == 0
+
 
 class TestWorkflow2ClassicalQueueOptimization:
     """Test classical compute queue optimization workflow."""
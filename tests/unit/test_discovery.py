@@ -0,0 +1,92 @@
+"""
+FRANKENSTEIN 1.0 - Hardware Discovery Tests
+Unit tests for integration/discovery.py snapshot caching
+"""
+
+import json
+import time
+from datetime import datetime, timedelta
+
+import pytest
+from integration.discovery import (
+    HardwareDiscovery,
+    HardwareFingerprint,
+    GPUVendor,
+    HardwareTier,
+)
+
+
+@pytest.fixture
+def cache_path(tmp_path):
+    return str(tmp_path / "hardware_fingerprint.json")
+
+
+@pytest.fixture
+def no_slow_probes(monkeypatch):
+    """Keep subprocess and network probes out of unit tests"""
+    monkeypatch.setattr(HardwareDiscovery, "_check_internet", lambda self, timeout=3.0: False)
+    monkeypatch.setattr(HardwareDiscovery, "_detect_gpu", lambda self: HardwareFingerprint().gpu)
+
+
+class TestFingerprintSerialization:
+    """Test fingerprint round-trip through to_dict/from_dict"""
+
+    def test_round_trip(self, no_slow_probes):
+        fp = HardwareDiscovery(persist=False).discover(force_refresh=True)
+        restored = HardwareFingerprint.from_dict(json.loads(fp.to_json()))
+        assert restored.fingerprint_id == fp.fingerprint_id
+        assert restored.tier == fp.tier
+        assert restored.gpu.vendor == GPUVendor.NONE
+        assert restored.cpu.logical_cores == fp.cpu.logical_cores
+        assert [s.storage_type for s in restored.storage] == [s.storage_type for s in fp.storage]
+
+
+class TestSnapshotCache:
+    """Test persisted, non-blocking snapshots"""
+
+    def test_full_scan_is_persisted_and_reloaded(self, cache_path, no_slow_probes):
+        first = HardwareDiscovery(cache_path=cache_path)
+        fp = first.discover(force_refresh=True)
+
+        second = HardwareDiscovery(cache_path=cache_path)
+        assert second._fingerprint is not None
+        assert second._fingerprint.fingerprint_id == fp.fingerprint_id
+
+    def test_snapshot_from_other_boot_is_ignored(self, cache_path, no_slow_probes):
+        HardwareDiscovery(cache_path=cache_path).discover(force_refresh=True)
+        with open(cache_path) as f:
+            data = json.load(f)
+        data["boot_id"] = "some-earlier-boot"
+        with open(cache_path, "w") as f:
+            json.dump(data, f)
+
+        assert HardwareDiscovery(cache_path=cache_path)._fingerprint is None
+
+    def test_stale_snapshot_returned_without_blocking(self, cache_path, monkeypatch):
+        discovery = HardwareDiscovery(cache_path=cache_path, persist=False)
+        discovery._fingerprint = HardwareFingerprint(fingerprint_id="cached",
+                                                     tier=HardwareTier.TIER_2_WORKSTATION)
+        discovery._last_scan = datetime.now() - timedelta(hours=1)
+
+        def slow_network(self, check_internet=True):
+            time.sleep(0.5)
+            return HardwareFingerprint().network
+        monkeypatch.setattr(HardwareDiscovery, "_detect_network", slow_network)
+
+        start = time.perf_counter()
+        fp = discovery.discover()
+        elapsed = time.perf_counter() - start
+
+        assert fp.fingerprint_id == "cached"
+        assert elapsed < 0.2
+        assert discovery.wait_for_refresh(timeout=5.0)
+        # Volatile refresh swaps in a new snapshot but keeps static identity
+        assert discovery._fingerprint is not fp
+        assert discovery._fingerprint.fingerprint_id == "cached"
+
+    def test_cold_start_returns_quick_scan(self, cache_path, no_slow_probes):
+        discovery = HardwareDiscovery(cache_path=cache_path)
+        fp = discovery.discover()
+        assert fp.cpu.logical_cores >= 1
+        assert discovery.wait_for_refresh(timeout=10.0)
+        assert discovery._needs_full_scan is False
@@ -0,0 +1,172 @@
+"""
+FRANKENSTEIN 1.0 - Search Index Tests
+Unit tests for core/search_index.py
+"""
+
+import os
+import re
+
+import pytest
+
+from core.search_index import (
+    SearchIndex,
+    glob_runs,
+    regex_literals,
+)
+
+
+@pytest.fixture
+def tree(tmp_path):
+    """Small project tree with text and binary files"""
+    root = tmp_path / "project"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "docs").mkdir()
+    (root / "README.md").write_text("Frankenstein project\nTODO: docs\n")
+    (root / "src" / "main.py").write_text("def main():\n    return search_files()\n")
+    (root / "src" / "pkg" / "search.py").write_text("def search_files():\n    pass  # TODO\n")
+    (root / "src" / "pkg" / "test_search.py").write_text("import search\n")
+    (root / "docs" / "guide.md").write_text("Use the STRASSE module\n")
+    (root / "docs" / "blob.bin").write_bytes(b"\0\0TODO\0")
+    return root
+
+
+@pytest.fixture
+def index(tree, tmp_path):
+    idx = SearchIndex(tree, index_dir=tmp_path / "index")
+    idx.refresh()
+    return idx
+
+
+def _rel(paths, root):
+    return [os.path.relpath(p[0] if isinstance(p, tuple) else p, root) for p in paths]
+
+
+class TestLiteralExtraction:
+    """Test regex and glob literal extraction"""
+
+    def test_regex_literals_mandatory_only(self):
+        assert regex_literals(r"def \w+_search\(") == ["def ", "_search("]
+        assert regex_literals("foo|barbaz") == []
+        assert regex_literals("Hello(World)?") == ["Hello"]
+        assert regex_literals("(abc)+xyz") == ["abc", "xyz"]
+
+    def test_regex_literals_invalid_pattern(self):
+        assert regex_literals("([unclosed") == []
+
+    def test_glob_runs(self):
+        assert glob_runs("*.py") == ["", ".py"]
+        assert glob_runs("test_*") == ["test_", ""]
+        assert glob_runs("a[bc]def?g") == ["a", "def", "g"]
+
+
+class TestFind:
+    """Test glob queries against the path trie and name trigrams"""
+
+    def test_find_by_extension_in_walk_order(self, index, tree):
+        hits = index.find("*.py")
+        assert _rel(hits, tree) == [
+            os.path.join("src", "main.py"),
+            os.path.join("src", "pkg", "search.py"),
+            os.path.join("src", "pkg", "test_search.py"),
+        ]
+
+    def test_find_prefix_and_dirs(self, index, tree):
+        assert _rel(index.find("test_*"), tree) == [os.path.join("src", "pkg", "test_search.py")]
+        dirs = [p for p, is_dir in index.find("pkg", include_dirs=True) if is_dir]
+        assert dirs == [tree / "src" / "pkg"]
+
+    def test_find_full_path_match(self, index, tree):
+        # fnmatch semantics: a leading wildcard may match directory names
+        assert _rel(index.find("*src*"), tree) == _rel(index.find("*.py"), tree)
+
+    def test_find_under_and_depth(self, index, tree):
+        assert _rel(index.find("*.py", under=tree / "src", max_depth=0), tree) == [
+            os.path.join("src", "main.py")
+        ]
+        assert index.find("*.py", under=tree / "missing") == []
+
+    def test_find_ignore_case(self, index, tree):
+        assert _rel(index.find("readme*", ignore_case=True), tree) == ["README.md"]
+        assert index.find("readme*") == []
+
+
+class TestContentCandidates:
+    """Test trigram content candidates"""
+
+    def _grep(self, index, pattern, flags=0, **kwargs):
+        compiled = re.compile(pattern, flags)
+        return [p for p in index.content_candidates(pattern, flags, **kwargs)
+                if compiled.search(p.read_text(errors="replace"))]
+
+    def test_candidates_are_narrowed(self, index, tree):
+        candidates = index.content_candidates("search_files")
+        assert _rel(candidates, tree) == [
+            os.path.join("src", "main.py"),
+            os.path.join("src", "pkg", "search.py"),
+        ]
+
+    def test_binary_files_excluded(self, index, tree):
+        assert _rel(self._grep(index, "TODO"), tree) == [
+            "README.md", os.path.join("src", "pkg", "search.py")
+        ]
+
+    def test_case_insensitive_and_file_pattern(self, index, tree):
+        assert _rel(self._grep(index, "strasse", re.IGNORECASE), tree) == [
+            os.path.join("docs", "guide.md")
+        ]
+        assert self._grep(index, "TODO", file_pattern="*.py", under=tree / "src") == [
+            tree / "src" / "pkg" / "search.py"
+        ]
+
+    def test_pattern_without_literals_scans_all_text(self, index):
+        assert len(list(index.content_candidates(r"\w"))) == 5
+
+
+class TestRefresh:
+    """Test incremental refresh and persistence"""
+
+    def test_incremental_changes(self, index, tree):
+        (tree / "src" / "main.py").write_text("def main():\n    return 42\n")
+        (tree / "README.md").unlink()
+        (tree / "notes.txt").write_text("search_files later\n")
+
+        counts = index.refresh()
+        assert counts == {"added": 1, "updated": 1, "removed": 1}
+        assert _rel(index.content_candidates("search_files"), tree) == [
+            "notes.txt", os.path.join("src", "pkg", "search.py")
+        ]
+        assert index.refresh() == {"added": 0, "updated": 0, "removed": 0}
+
+    def test_save_and_reload(self, index, tree, tmp_path):
+        (tree / "README.md").unlink()
+        index.refresh()
+        assert index.save()
+
+        reloaded = SearchIndex(tree, index_dir=tmp_path / "index")
+        assert reloaded.refresh() == {"added": 0, "updated": 0, "removed": 0}
+        assert reloaded.stats()["files"] == 5
+        assert reloaded.find("*.md") == [(tree / "docs" / "guide.md", False)]
+
+    def test_corrupt_snapshot_is_rebuilt(self, index, tree, tmp_path):
+        assert index.save()
+        index.index_path.write_bytes(b"not an npz archive")
+
+        reloaded = SearchIndex(tree, index_dir=tmp_path / "index")
+        assert reloaded.refresh()["added"] == 6
+
+    def test_unexpected_load_error_propagates(self, index, tree, tmp_path, monkeypatch):
+        assert index.save()
+
+        def broken(*args, **kwargs):
+            raise RuntimeError("bug, not corruption")
+
+        monkeypatch.setattr("core.search_index.np.load", broken)
+        reloaded = SearchIndex(tree, index_dir=tmp_path / "index")
+        with pytest.raises(RuntimeError):
+            reloaded.refresh()
+
+    def test_invalidate_forces_blocking_refresh(self, index, tree):
+        (tree / "late.py").write_text("x = 1\n")
+        index.invalidate()
+        assert index.ensure_fresh()
+        assert tree / "late.py" in [p for p, _ in index.find("*.py")]
@@ -242,6 +242,33 @@ def test_compute_result():
     return True
 
 
+def test_gate_counter():
+    """Test gate_count / state_version change tracking"""
+    print("\nTesting gate counter...")
+
+    from synthesis import get_synthesis_engine
+
+    engine = get_synthesis_engine()
+    engine.auto_visualize = False
+
+    engine.reset(1)
+    version = engine.state_version
+    assert engine.gate_count == 0, "Reset should clear the gate count"
+
+    for _ in range(engine._max_gate_log + 5):
+        engine.x(0)
+    assert engine.gate_count == engine._max_gate_log + 5, "Gate count is not capped by the log"
+    assert len(engine._gate_log) == engine._max_gate_log, "Gate log stays bounded"
+    assert engine.state_version > version, "Gates should bump the state version"
+
+    version = engine.state_version
+    engine.measure_single(0)
+    assert engine.state_version > version, "Collapse should bump the state version"
+    print("  ✅ Gate counter works")
+
+    return True
+
+
 def run_all_tests():
     """Run all tests"""
     print("=" * 60)
@@ -257,6 +284,7 @@ def run_all_tests():
         test_circuit_library,
         test_measurement,
         test_compute_result,
+        test_gate_counter,
     ]
     
     passed = 0
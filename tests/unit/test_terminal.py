@@ -301,6 +301,72 @@ class TestTextCommands:
         terminal._cmd_wc(["wc_test.txt"])
 
 
+class TestIndexedSearchCommands:
+    """find/grep answered from the search index stay in step with file commands"""
+
+    @pytest.fixture
+    def temp_dir(self, monkeypatch):
+        """Temporary directory with an isolated search index registry"""
+        import core.search_index as search_index
+        temp = Path(tempfile.mkdtemp())
+        monkeypatch.setattr(search_index, "INDEX_DIR", temp / ".index")
+        monkeypatch.setattr(search_index, "_indexes", {})
+        (temp / "tree").mkdir()
+        (temp / "tree" / "old.txt").write_text("needle\n")
+        yield temp / "tree"
+        shutil.rmtree(temp, ignore_errors=True)
+
+    @pytest.fixture
+    def terminal(self, temp_dir, monkeypatch):
+        """Terminal whose output is captured in terminal.output"""
+        from widget.terminal import FrankensteinTerminal
+        t = FrankensteinTerminal()
+        t._cwd = temp_dir
+        t.output = []
+        monkeypatch.setattr(t, "_write_output", t.output.append)
+        return t
+
+    @staticmethod
+    def _indexed(temp_dir):
+        from core.search_index import get_search_index
+        index = get_search_index(temp_dir)
+        index.refresh()
+        return index
+
+    def test_find_sees_terminal_writes(self, terminal, temp_dir):
+        """rm and touch invalidate the index, so find re-scans"""
+        self._indexed(temp_dir)
+        terminal._cmd_rm(["old.txt"])
+        terminal._cmd_touch(["new.txt"])
+        terminal.output.clear()
+
+        terminal._cmd_find([str(temp_dir), "-name", "*.txt"])
+        found = "".join(terminal.output)
+        assert "new.txt" in found
+        assert "old.txt" not in found
+
+    def test_find_skips_hits_removed_since_snapshot(self, terminal, temp_dir):
+        """A file deleted outside the terminal is not listed from a fresh snapshot"""
+        self._indexed(temp_dir)
+        (temp_dir / "old.txt").unlink()
+
+        terminal._cmd_find([str(temp_dir)])
+        assert "old.txt" not in "".join(terminal.output)
+
+    def test_grep_falls_back_when_index_iteration_fails(self, terminal, temp_dir, monkeypatch):
+        """An index error raised while iterating candidates falls back to os.walk"""
+        from core.search_index import SearchIndex
+        self._indexed(temp_dir)
+
+        def broken(self, *args, **kwargs):
+            raise RuntimeError("corrupt postings")
+            yield
+
+        monkeypatch.setattr(SearchIndex, "content_candidates", broken)
+        terminal._cmd_grep(["needle", "."])
+        assert any("old.txt:1:needle" in line for line in terminal.output)
+
+
 class TestCommandRegistry:
     """Test that all expected commands are registered"""
     
@@ -380,5 +446,215 @@ class TestPromptGeneration:
         assert "~" in prompt
 
 
+class TestStreamMarkerScanner:
+    """Test incremental ::EXEC:: / ::QUANTUM:: detection in streamed tokens"""
+
+    def _scan(self, tokens):
+        from widget.terminal import StreamMarkerScanner
+        scanner = StreamMarkerScanner()
+        events = []
+        for token in tokens:
+            events += scanner.feed(token)
+        return events + scanner.flush()
+
+    def test_plain_text_passes_through(self):
+        """Test text without markers is released as it arrives"""
+        assert self._scan(["ratio ", ":: 3"]) == [("text", "ratio "), ("text", ":: 3")]
+
+    def test_marker_split_across_tokens(self):
+        """Test a marker and command split over several tokens"""
+        events = self._scan(["Checking ", "::", "EX", "EC::", "git st", "atus\nDone"])
+        assert events == [
+            ("text", "Checking "),
+            ("::EXEC::", "git status"),
+            ("text", "\nDone"),
+        ]
+
+    def test_command_on_following_line(self):
+        """Test '::QUANTUM::\\naction' format and multiple markers"""
+        events = self._scan(["a::QUANTUM::\n\n bell|qubits=2 \nb::EXEC::ls\n"])
+        assert events == [
+            ("text", "a"),
+            ("::QUANTUM::", "bell|qubits=2"),
+            ("text", "\nb"),
+            ("::EXEC::", "ls"),
+            ("text", "\n"),
+        ]
+
+    def test_flush_releases_held_text(self):
+        """Test end of stream dispatches an unterminated command"""
+        assert self._scan(["run ::EXEC::pwd"]) == [("text", "run "), ("::EXEC::", "pwd")]
+        assert self._scan(["tail ::EX"]) == [("text", "tail "), ("text", "::EX")]
+        assert self._scan(["::EXEC::  "]) == [("text", "::EXEC::  ")]
+
+
+class _FakeText:
+    """Minimal text widget recording inserts"""
+
+    def __init__(self):
+        self.lines = [""]
+        self.inserts = 0
+
+    def insert(self, index, text, *tags):
+        self.inserts += 1
+        parts = text.split("\n")
+        self.lines[-1] += parts[0]
+        self.lines.extend(parts[1:])
+
+    def delete(self, start, end):
+        if end == "end":
+            self.lines = [""]
+        else:
+            del self.lines[:int(end.split(".")[0]) - 1]
+
+    def see(self, index):
+        pass
+
+
+class TestTerminalOutputBuffer:
+    """Test scrollback cap, write coalescing and paging to disk"""
+
+    @pytest.fixture
+    def widget(self):
+        return _FakeText()
+
+    def _buffer(self, widget, **kwargs):
+        from widget.output_buffer import TerminalOutputBuffer
+        buffer = TerminalOutputBuffer(**kwargs)
+        idle = []
+        buffer.attach(widget, type("Root", (), {"after_idle": lambda self, cb: idle.append(cb)})())
+        return buffer, idle
+
+    def test_writes_coalesce_per_tick(self, widget):
+        """Test queued writes land in a single insert"""
+        buffer, idle = self._buffer(widget)
+        for i in range(100):
+            buffer.write(f"line {i}\n")
+        assert widget.inserts == 0 and len(idle) == 1
+        idle.pop()()
+        assert widget.inserts == 1
+        assert widget.lines[99] == "line 99"
+
+    def test_scrollback_is_capped(self, widget):
+        """Test the widget keeps only the newest max_lines lines"""
+        buffer, idle = self._buffer(widget, max_lines=10)
+        for i in range(3):
+            buffer.write("".join(f"{i}-{j}\n" for j in range(8)))
+            idle.pop()()
+        assert widget.lines[0] == "1-6"
+        assert len(widget.lines) == 11
+        assert buffer.stats()["widget_lines"] == 10
+
+    def test_long_command_output_spills_and_pages(self, widget):
+        """Test output past one page goes to a temp file readable with more()"""
+        buffer, idle = self._buffer(widget, page_lines=5)
+        buffer.begin_command()
+        buffer.write("".join(f"row {i}\n" for i in range(12)))
+        buffer.end_command()
+        idle.pop()()
+        path = buffer.spill_path
+        try:
+            assert widget.lines[4] == "row 4"
+            assert "7 more lines of 12" in widget.lines[5]
+            with open(path) as f:
+                assert f.read().count("\n") == 12
+
+            assert buffer.more()
+            idle.pop()()
+            assert widget.lines[6:11] == [f"row {i}" for i in range(5, 10)]
+            assert buffer.more()
+            assert not buffer.more()
+        finally:
+            buffer.close()
+        assert not os.path.exists(path)
+
+
+class TestCommandExecutor:
+    """Test off-UI command execution, ordering and cancellation"""
+
+    def _executor(self):
+        from widget.command_executor import CommandExecutor
+        executor = CommandExecutor(workers=2)
+        executor.bind_ui_thread()
+        return executor
+
+    def _wait_idle(self, executor, timeout=5.0):
+        import time
+        deadline = time.time() + timeout
+        while (executor.busy or executor.jobs()) and time.time() < deadline:
+            executor.drain_ui()
+            time.sleep(0.005)
+        executor.drain_ui()
+
+    def test_foreground_commands_run_in_order(self):
+        """Test worker and UI-thread jobs keep submission order"""
+        import threading
+        import time
+        executor = self._executor()
+        order = []
+        ui_thread = threading.get_ident()
+        executor.submit("slow", "slow", lambda: (time.sleep(0.05), order.append("slow")), off_ui=True)
+        executor.submit("ui", "ui", lambda: order.append(("ui", threading.get_ident() == ui_thread)))
+        executor.submit("fast", "fast", lambda: order.append("fast"), off_ui=True)
+        self._wait_idle(executor)
+        executor.shutdown()
+        assert order == ["slow", ("ui", True), "fast"]
+
+    def test_cancel_stops_running_loop(self):
+        """Test cancel() sets the token a long loop checks"""
+        import time
+        from widget.command_executor import CommandCancelled
+        executor = self._executor()
+        finished = []
+        seen = []
+
+        def loop():
+            try:
+                for _ in range(500):
+                    executor.check()
+                    time.sleep(0.01)
+                finished.append(True)
+            except CommandCancelled:
+                seen.append("cancelled")
+                raise
+
+        executor.on_finish = lambda job: seen.append(job.status)
+        executor.submit("loop", "loop", loop, off_ui=True)
+        time.sleep(0.05)
+        assert executor.cancel() is not None
+        self._wait_idle(executor)
+        executor.shutdown()
+        assert not finished
+        assert seen == ["cancelled", "cancelled"]
+        assert executor.stats()["cancelled"] == 1
+
+    def test_background_jobs_do_not_block_foreground(self):
+        """Test '&' jobs run outside the foreground queue"""
+        import threading
+        executor = self._executor()
+        release = threading.Event()
+        ran = []
+        executor.submit("bg", "bg", release.wait, off_ui=True, background=True)
+        executor.submit("fg", "fg", lambda: ran.append("fg"), off_ui=True)
+        self._wait_idle(executor, timeout=1.0)
+        assert ran == ["fg"]
+        release.set()
+        self._wait_idle(executor)
+        executor.shutdown()
+        assert executor.stats()["commands"]["bg"]["count"] == 1
+
+    def test_latency_histogram(self):
+        """Test bucket percentiles"""
+        from widget.command_executor import LatencyHistogram
+        histogram = LatencyHistogram()
+        for ms in (0.5, 3, 3, 40, 40000):
+            histogram.record(ms)
+        summary = histogram.summary()
+        assert summary["count"] == 5
+        assert summary["p50_ms"] == 5.0
+        assert summary["max_ms"] == 40000
+        assert summary["buckets"][">30000"] == 1
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
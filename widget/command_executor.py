@@ -0,0 +1,394 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Terminal Command Executor
+
+Purpose: Run terminal commands off the Tk thread, with cancellation
+Author: Frankenstein Project
+
+Built-in commands such as grep, find or a quantum solve used to run inside
+the Enter key handler, freezing the window (live monitor included) until
+they returned. CommandExecutor takes over dispatch:
+
+    - Commands that only compute and write output run on a small worker
+      pool; output reaches the widget through TerminalOutputBuffer, whose
+      queue the Tk thread drains on its own tick.
+    - Commands that touch Tk stay on the Tk thread, but still go through
+      the same queue, so a session's commands run strictly in order.
+    - "cmd &" runs a worker-safe command in the background, outside the
+      foreground order.
+    - Each job carries a CancelToken. Long loops call check() (Ctrl-C sets
+      the token); subprocess runners register a kill callback.
+    - Run time is recorded per command in a LatencyHistogram.
+
+Tk-thread work (job starts for Tk commands, completion callbacks) is queued
+and executed by drain_ui(), which the terminal calls from its UI tick. With
+inline=True (no Tk root) every command simply runs in the caller's thread.
+"""
+
+import itertools
+import logging
+import queue
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+COMMAND_WORKERS = 4             # Worker threads (foreground job + background jobs)
+
+# Histogram bucket upper bounds, milliseconds
+LATENCY_BUCKETS_MS = (1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 30000)
+
+
+class CommandCancelled(BaseException):
+    """
+    Raised by CancelToken.check() once the command has been cancelled.
+
+    A BaseException, like KeyboardInterrupt, so the broad
+    `except Exception` handlers in command implementations let it through.
+    """
+
+
+class CancelToken:
+    """Cooperative cancellation flag shared between a job and its canceller."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._callbacks: List[Callable[[], None]] = []
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def cancel(self) -> None:
+        """Set the flag and run registered callbacks (e.g. kill a subprocess)."""
+        with self._lock:
+            if self._event.is_set():
+                return
+            self._event.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback()
+            except Exception as e:
+                logger.debug("Cancel callback failed: %s", e)
+
+    def on_cancel(self, callback: Callable[[], None]) -> None:
+        """Run callback on cancel (immediately if already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._callbacks.append(callback)
+                return
+        callback()
+
+    def check(self) -> None:
+        """Raise CommandCancelled if cancelled."""
+        if self._event.is_set():
+            raise CommandCancelled()
+
+
+class LatencyHistogram:
+    """Fixed-bucket latency histogram (milliseconds)."""
+
+    def __init__(self, buckets=LATENCY_BUCKETS_MS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)     # last bucket: overflow
+        self.count = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, ms: float) -> None:
+        slot = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if ms <= bound:
+                slot = i
+                break
+        self.counts[slot] += 1
+        self.count += 1
+        self.total_ms += ms
+        self.max_ms = max(self.max_ms, ms)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (max_ms for overflow)."""
+        if not self.count:
+            return 0.0
+        rank = p / 100.0 * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            seen += n
+            if n and seen >= rank:
+                return float(self.buckets[i]) if i < len(self.buckets) else self.max_ms
+        return self.max_ms
+
+    def summary(self) -> dict:
+        return {
+            "count": self.count,
+            "mean_ms": self.total_ms / self.count if self.count else 0.0,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "max_ms": self.max_ms,
+            "buckets": {f"<={b}" if i < len(self.buckets) else f">{self.buckets[-1]}": n
+                        for i, (b, n) in enumerate(zip(self.buckets + (None,), self.counts)) if n},
+        }
+
+
+@dataclass
+class CommandJob:
+    """One submitted command."""
+    job_id: int
+    name: str                   # Histogram key (command word)
+    command_line: str
+    run: Callable[[], None] = field(repr=False)
+    off_ui: bool = False
+    background: bool = False
+    token: CancelToken = field(default_factory=CancelToken, repr=False)
+    status: str = "queued"      # queued | running | done | cancelled | error
+    submitted: float = field(default_factory=time.perf_counter)
+    started: Optional[float] = None
+    finished: Optional[float] = None
+    error: Optional[BaseException] = field(default=None, repr=False)
+
+    @property
+    def run_ms(self) -> float:
+        if self.started is None:
+            return 0.0
+        return ((self.finished or time.perf_counter()) - self.started) * 1000
+
+    @property
+    def wait_ms(self) -> float:
+        return ((self.started or time.perf_counter()) - self.submitted) * 1000
+
+
+class CommandExecutor:
+    """
+    Sequential foreground queue plus background jobs over a worker pool.
+
+    on_start / on_finish (if set) are called on the Tk thread with the job.
+    """
+
+    def __init__(self, workers: int = COMMAND_WORKERS, inline: bool = False):
+        """
+        Args:
+            workers: Worker threads for off-UI jobs
+            inline:  Run every job synchronously in the submitting thread
+        """
+        self.workers = workers
+        self.inline = inline
+        self.on_start: Optional[Callable[[CommandJob], None]] = None
+        self.on_finish: Optional[Callable[[CommandJob], None]] = None
+
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._queue: deque = deque()
+        self._foreground: Optional[CommandJob] = None
+        self._background: Dict[int, CommandJob] = {}
+        self._ui_calls: "queue.SimpleQueue[Callable[[], None]]" = queue.SimpleQueue()
+        self._ui_thread: Optional[int] = None
+        self._local = threading.local()
+        self._pool: Optional[ThreadPoolExecutor] = None
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self._wait_ms_total = 0.0
+        self._cancelled = 0
+
+    # ── Wiring ─────────────────────────────────────────────────────────────────
+
+    def bind_ui_thread(self) -> None:
+        """Record the calling thread as the Tk thread; disables inline mode."""
+        self._ui_thread = threading.get_ident()
+        self.inline = False
+
+    def on_ui_thread(self) -> bool:
+        return self._ui_thread is None or threading.get_ident() == self._ui_thread
+
+    def call_on_ui(self, fn: Callable[[], None]) -> None:
+        """Run fn on the Tk thread (now, if already there)."""
+        if self.inline or self.on_ui_thread():
+            fn()
+        else:
+            self._ui_calls.put(fn)
+
+    def drain_ui(self) -> int:
+        """Run queued Tk-thread work. Call from the UI tick; returns calls made."""
+        calls = 0
+        while True:
+            try:
+                fn = self._ui_calls.get_nowait()
+            except queue.Empty:
+                return calls
+            calls += 1
+            try:
+                fn()
+            except Exception as e:
+                logger.warning("Terminal UI callback failed: %s", e)
+
+    def _get_pool(self) -> ThreadPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=self.workers,
+                                                thread_name_prefix="TerminalCmd")
+            return self._pool
+
+    # ── Submission ─────────────────────────────────────────────────────────────
+
+    def submit(self, name: str, command_line: str, run: Callable[[], None],
+               off_ui: bool = False, background: bool = False) -> CommandJob:
+        """
+        Queue a command.
+
+        Args:
+            name:         Command word, used as the histogram key
+            command_line: Full command line (for job listings)
+            run:          Callable doing the work and writing its output
+            off_ui:       Safe to run on a worker thread
+            background:   Run outside the foreground order (requires off_ui)
+        """
+        job = CommandJob(next(self._ids), name, command_line, run,
+                         off_ui=off_ui, background=background and off_ui)
+        if self.inline:
+            self._run(job)
+            return job
+        if job.background:
+            with self._lock:
+                self._background[job.job_id] = job
+            self._get_pool().submit(self._run, job)
+            return job
+        with self._lock:
+            self._queue.append(job)
+        self._advance()
+        return job
+
+    def _advance(self) -> None:
+        """Start the next foreground job if none is running."""
+        with self._lock:
+            if self._foreground is not None or not self._queue:
+                return
+            job = self._queue.popleft()
+            self._foreground = job
+        if job.off_ui:
+            self._get_pool().submit(self._run, job)
+        else:
+            self.call_on_ui(lambda: self._run(job))
+
+    def _run(self, job: CommandJob) -> None:
+        job.started = time.perf_counter()
+        job.status = "running"
+        if job.off_ui and self.on_start:
+            self.call_on_ui(lambda: self.on_start(job))
+        previous = getattr(self._local, "job", None)
+        self._local.job = job
+        try:
+            job.token.check()
+            job.run()
+            job.status = "cancelled" if job.token.cancelled else "done"
+        except CommandCancelled:
+            job.status = "cancelled"
+        except Exception as e:
+            job.status = "error"
+            job.error = e
+            logger.warning("Terminal command %r failed: %s", job.command_line, e)
+        finally:
+            self._local.job = previous
+            job.finished = time.perf_counter()
+            self._finish(job)
+
+    def _finish(self, job: CommandJob) -> None:
+        with self._lock:
+            histogram = self._histograms.get(job.name)
+            if histogram is None:
+                histogram = self._histograms[job.name] = LatencyHistogram()
+            histogram.record(job.run_ms)
+            self._wait_ms_total += job.wait_ms
+            if job.status == "cancelled":
+                self._cancelled += 1
+            if job.background:
+                self._background.pop(job.job_id, None)
+            elif self._foreground is job:
+                self._foreground = None
+        if self.on_finish:
+            self.call_on_ui(lambda: self.on_finish(job))
+        if not job.background:
+            self._advance()
+
+    # ── Cancellation ───────────────────────────────────────────────────────────
+
+    def current_job(self) -> Optional[CommandJob]:
+        """The job running in the calling thread, if any."""
+        return getattr(self._local, "job", None)
+
+    def check(self) -> None:
+        """Raise CommandCancelled if the calling thread's job was cancelled."""
+        job = getattr(self._local, "job", None)
+        if job is not None and job.token.cancelled:
+            raise CommandCancelled()
+
+    def cancel(self, job_id: Optional[int] = None) -> Optional[CommandJob]:
+        """
+        Cancel a job: the running foreground job by default, or any running
+        or queued job by id.
+
+        Returns:
+            The cancelled job, or None if there was nothing to cancel
+        """
+        with self._lock:
+            if job_id is None:
+                job = self._foreground
+            else:
+                job = self._background.get(job_id)
+                if job is None and self._foreground and self._foreground.job_id == job_id:
+                    job = self._foreground
+                if job is None:
+                    for queued in self._queue:
+                        if queued.job_id == job_id:
+                            self._queue.remove(queued)
+                            queued.status = "cancelled"
+                            self._cancelled += 1
+                            return queued
+        if job is not None:
+            job.token.cancel()
+        return job
+
+    # ── Introspection ──────────────────────────────────────────────────────────
+
+    @property
+    def busy(self) -> bool:
+        """True while a foreground job runs or waits."""
+        with self._lock:
+            return self._foreground is not None or bool(self._queue)
+
+    def jobs(self) -> List[CommandJob]:
+        """Running foreground job, queued jobs, then background jobs."""
+        with self._lock:
+            running = [self._foreground] if self._foreground else []
+            return running + list(self._queue) + list(self._background.values())
+
+    def stats(self) -> dict:
+        """Per-command latency histograms and executor counters."""
+        with self._lock:
+            commands = {name: h.summary() for name, h in self._histograms.items()}
+            total = sum(h.count for h in self._histograms.values())
+            return {
+                "commands": commands,
+                "completed": total,
+                "cancelled": self._cancelled,
+                "mean_wait_ms": self._wait_ms_total / total if total else 0.0,
+                "queued": len(self._queue),
+                "background": len(self._background),
+            }
+
+    def shutdown(self) -> None:
+        """Cancel everything and stop the worker pool."""
+        with self._lock:
+            jobs = ([self._foreground] if self._foreground else []) + list(self._background.values())
+            self._queue.clear()
+            pool, self._pool = self._pool, None
+        for job in jobs:
+            job.token.cancel()
+        if pool is not None:
+            pool.shutdown(wait=False, cancel_futures=True)
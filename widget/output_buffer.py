@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+FRANKENSTEIN 1.0 - Terminal Output Buffer
+
+Purpose: Bounded, coalesced output for the terminal's text widget
+Author: Frankenstein Project
+
+Every _write_output used to be an insert("end") plus see("end") on the
+CTkTextbox, and nothing was ever removed. `find` on a large tree or `cat`
+of a big file pushed hundreds of thousands of lines into the widget, and
+memory and redraw time grew with them.
+
+TerminalOutputBuffer sits between the terminal and the widget:
+
+    coalescing   writes queue up and are flushed once per event-loop tick
+                 (after_idle), one insert per run of same-tagged text
+    scrollback   the widget keeps at most max_lines lines; older lines are
+                 deleted from the top after each flush
+    pagination   between begin_command() / end_command(), a command shows
+                 at most page_lines lines. Beyond that its full output is
+                 spilled to a temporary file and more() pages through the
+                 rest of it
+
+Writes are thread-safe. Widget calls only happen in flush(), which runs on
+the Tk thread: writes made on the Tk thread schedule it with after_idle,
+writes from other threads only queue and are picked up by the terminal's
+UI tick. Paging applies to writes from the thread that called
+begin_command(), so background jobs and FRANK output are never paged.
+"""
+
+import os
+import tempfile
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# ── Tuning ─────────────────────────────────────────────────────────────────────
+
+SCROLLBACK_LINES = 5000         # Lines kept in the widget
+PAGE_LINES = 500                # Lines one command shows before spilling to disk
+SPILL_PREFIX = "frank_output_"
+
+
+def _cut_after_lines(text: str, lines: int) -> int:
+    """Index just past the lines-th newline in text (len(text) if fewer)."""
+    pos = -1
+    for _ in range(lines):
+        pos = text.find("\n", pos + 1)
+        if pos == -1:
+            return len(text)
+    return pos + 1
+
+
+class TerminalOutputBuffer:
+    """
+    Ring-buffered scrollback with per-tick write coalescing and disk paging.
+    """
+
+    def __init__(self, max_lines: int = SCROLLBACK_LINES, page_lines: int = PAGE_LINES):
+        """
+        Args:
+            max_lines:  Scrollback cap for the widget
+            page_lines: Lines a single command may show before the rest
+                        is spilled to a temporary file
+        """
+        self.max_lines = max(1, max_lines)
+        self.page_lines = max(1, page_lines)
+
+        self._widget = None
+        self._root = None
+        self._ui_thread: Optional[int] = None
+        self._lock = threading.Lock()
+        self._pending: List[Tuple[str, Optional[str]]] = []
+        self._flush_scheduled = False
+        self._widget_lines = 0
+
+        # Per-command paging
+        self._in_command = False
+        self._command_thread: Optional[int] = None
+        self._command_lines = 0
+        self._command_shown: List[str] = []
+        self._spill = None
+        self._spill_path: Optional[str] = None
+        self._spill_lines = 0
+        self._shown_bytes = 0
+
+        # Pager over the most recent spill file
+        self._pager_path: Optional[str] = None
+        self._pager_offset = 0
+        self._pager_remaining = 0
+
+        self._stats = {"writes": 0, "flushes": 0, "inserts": 0,
+                       "trimmed_lines": 0, "spilled_lines": 0}
+
+    # ── Wiring ─────────────────────────────────────────────────────────────────
+
+    def attach(self, widget, root=None) -> None:
+        """
+        Bind the text widget (and the Tk root used to schedule flushes).
+
+        Without a root every write is flushed immediately. Must be called
+        on the Tk thread.
+        """
+        self._widget = widget
+        self._root = root
+        self._ui_thread = threading.get_ident()
+        self._widget_lines = 0
+
+    @property
+    def spill_path(self) -> Optional[str]:
+        """Temporary file holding the full output of the last paged command."""
+        return self._pager_path
+
+    # ── Writing ────────────────────────────────────────────────────────────────
+
+    def write(self, text: str, tag: Optional[str] = None, paged: bool = True) -> None:
+        """
+        Queue text for the next flush.
+
+        Args:
+            text:  Text to append
+            tag:   Widget tag for the inserted range
+            paged: Count against the running command's page (False for
+                   status lines such as the pager notice)
+        """
+        if not text or self._widget is None:
+            return
+        thread = threading.get_ident()
+        with self._lock:
+            self._stats["writes"] += 1
+            if self._in_command and paged and thread == self._command_thread:
+                text = self._page(text)
+                if not text:
+                    return
+            self._pending.append((text, tag))
+            if self._flush_scheduled:
+                return
+            if self._root is not None and thread != self._ui_thread:
+                return      # Off the Tk thread: the UI tick flushes
+            self._flush_scheduled = True
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._root is None:
+            self.flush()
+            return
+        try:
+            self._root.after_idle(self.flush)
+        except Exception:
+            # Root torn down (or not a Tk root): flush inline
+            self.flush()
+
+    def flush(self) -> None:
+        """Insert all queued text and trim the scrollback. Tk thread only."""
+        with self._lock:
+            pending, self._pending = self._pending, []
+            self._flush_scheduled = False
+        widget = self._widget
+        if not pending or widget is None:
+            return
+
+        runs = self._coalesce(self._tail(pending, self.max_lines))
+        self._stats["flushes"] += 1
+        for text, tag in runs:
+            try:
+                if tag:
+                    widget.insert("end", text, tag)
+                else:
+                    widget.insert("end", text)
+            except Exception:
+                # Tags unavailable: plain insert
+                widget.insert("end", text)
+            self._stats["inserts"] += 1
+            self._widget_lines += text.count("\n")
+
+        excess = self._widget_lines - self.max_lines
+        if excess > 0:
+            try:
+                widget.delete("1.0", f"{excess + 1}.0")
+                self._widget_lines -= excess
+                self._stats["trimmed_lines"] += excess
+            except Exception:
+                pass
+        widget.see("end")
+
+    def clear(self) -> None:
+        """Drop queued output and empty the widget."""
+        with self._lock:
+            self._pending = []
+        if self._widget is not None:
+            self._widget.delete("1.0", "end")
+        self._widget_lines = 0
+
+    @staticmethod
+    def _tail(pending: List[Tuple[str, Optional[str]]], max_lines: int) -> List[Tuple[str, Optional[str]]]:
+        """Drop leading text that would be trimmed straight after insertion."""
+        total = sum(text.count("\n") for text, _ in pending)
+        drop = total - max_lines
+        if drop <= 0:
+            return pending
+        kept = []
+        for text, tag in pending:
+            if drop > 0:
+                count = text.count("\n")
+                if count < drop:
+                    drop -= count
+                    continue
+                text = text[_cut_after_lines(text, drop):]
+                drop = 0
+            if text:
+                kept.append((text, tag))
+        return kept
+
+    @staticmethod
+    def _coalesce(pending: List[Tuple[str, Optional[str]]]) -> List[Tuple[str, Optional[str]]]:
+        """Join adjacent writes with the same tag into one insert."""
+        runs: List[Tuple[List[str], Optional[str]]] = []
+        for text, tag in pending:
+            if runs and runs[-1][1] == tag:
+                runs[-1][0].append(text)
+            else:
+                runs.append(([text], tag))
+        return [("".join(parts), tag) for parts, tag in runs]
+
+    # ── Command paging ─────────────────────────────────────────────────────────
+
+    def begin_command(self) -> None:
+        """Start paging the output of one command written from this thread."""
+        with self._lock:
+            self._in_command = True
+            self._command_thread = threading.get_ident()
+            self._command_lines = 0
+            self._command_shown = []
+
+    def end_command(self) -> None:
+        """Stop paging; if the command spilled, show how to page the rest."""
+        with self._lock:
+            self._in_command = False
+            self._command_shown = []
+            spill, self._spill = self._spill, None
+            if spill is None:
+                return
+            spill.close()
+            shown = self._command_lines
+            total = self._spill_lines
+            self._pager_path = self._spill_path
+            self._pager_offset = self._shown_bytes
+            self._pager_remaining = total - shown
+        self.write(self._pager_notice(total), paged=False)
+
+    def more(self) -> bool:
+        """
+        Show the next page of the last spilled command.
+
+        Returns:
+            False if there is nothing left to show
+        """
+        with self._lock:
+            path, offset = self._pager_path, self._pager_offset
+            if not path or self._pager_remaining <= 0:
+                return False
+        lines = []
+        try:
+            with open(path, "rb") as f:
+                f.seek(offset)
+                for _ in range(self.page_lines):
+                    line = f.readline()
+                    if not line:
+                        break
+                    lines.append(line)
+                offset = f.tell()
+        except OSError:
+            return False
+        with self._lock:
+            self._pager_offset = offset
+            self._pager_remaining = max(0, self._pager_remaining - len(lines))
+            remaining = self._pager_remaining
+        self.write(b"".join(lines).decode("utf-8", errors="replace"), paged=False)
+        if remaining:
+            self.write(self._pager_notice(None), paged=False)
+        return True
+
+    def _page(self, text: str) -> str:
+        """Return the part of text to show now; spill the rest. Lock held."""
+        if self._spill is not None:
+            count = text.count("\n")
+            self._spill.write(text.encode("utf-8", errors="replace"))
+            self._spill_lines += count
+            self._stats["spilled_lines"] += count
+            return ""
+        count = text.count("\n")
+        if self._command_lines + count <= self.page_lines:
+            self._command_lines += count
+            self._command_shown.append(text)
+            return text
+
+        cut = _cut_after_lines(text, self.page_lines - self._command_lines)
+        head = text[:cut]
+        self._command_shown.append(head)
+        self._command_lines = self.page_lines
+        if not self._open_spill("".join(self._command_shown), text[cut:]):
+            # No spill file: fall back to showing everything
+            self._command_lines += count
+            return text
+        return head
+
+    def _open_spill(self, shown: str, rest: str) -> bool:
+        self._discard_pager()
+        try:
+            fd, path = tempfile.mkstemp(prefix=SPILL_PREFIX, suffix=".txt")
+            spill = os.fdopen(fd, "wb")
+            shown_bytes = shown.encode("utf-8", errors="replace")
+            spill.write(shown_bytes)
+            spill.write(rest.encode("utf-8", errors="replace"))
+        except OSError:
+            return False
+        self._spill, self._spill_path = spill, path
+        self._shown_bytes = len(shown_bytes)
+        self._spill_lines = shown.count("\n") + rest.count("\n")
+        self._stats["spilled_lines"] += self._spill_lines
+        return True
+
+    def _pager_notice(self, total: Optional[int]) -> str:
+        size = f"{self._pager_remaining} more lines"
+        if total is not None:
+            size += f" of {total}"
+        return (f"── {size} not shown. Type 'more' for the next {self.page_lines}; "
+                f"full output: {self._pager_path} ──\n")
+
+    def _discard_pager(self) -> None:
+        path, self._pager_path = self._pager_path, None
+        self._pager_remaining = 0
+        if path:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        """Remove spill files."""
+        with self._lock:
+            spill, self._spill = self._spill, None
+            if spill is not None:
+                spill.close()
+                try:
+                    os.remove(self._spill_path)
+                except OSError:
+                    pass
+            self._discard_pager()
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for writes, flushes, widget inserts, trimming and spilling."""
+        with self._lock:
+            stats = dict(self._stats)
+            stats["widget_lines"] = self._widget_lines
+            stats["pending"] = len(self._pending)
+        return stats
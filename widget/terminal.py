@@ -25,6 +25,9 @@ from datetime import datetime
 from pathlib import Path
 from typing import Optional, List, Dict, Any, Callable
 
+from widget.command_executor import CommandExecutor, CommandCancelled
+from widget.output_buffer import TerminalOutputBuffer, SCROLLBACK_LINES, PAGE_LINES
+
 # Fix Windows console encoding
 if sys.platform == 'win32':
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -76,6 +79,106 @@ class CommandHistory:
         self._position = len(self._history)
 
 
+class StreamMarkerScanner:
+    """
+    Incremental scanner for ::EXEC:: / ::QUANTUM:: markers in streamed text.
+
+    Only newly fed text is searched. Held back between feeds is at most a
+    trailing partial marker ("::EX") or, after a marker, the command line
+    that has not been terminated by a newline yet; everything else is
+    released as display text immediately.
+
+    feed() and flush() return a list of events in stream order:
+        ("text", str)          text to display
+        (marker, command)      a complete marker command, e.g. ("::EXEC::", "git status")
+    """
+
+    MARKER_QUANTUM = '::QUANTUM::'
+    MARKER_EXEC = '::EXEC::'
+    MARKERS = (MARKER_QUANTUM, MARKER_EXEC)
+
+    def __init__(self, markers=MARKERS):
+        self._markers = tuple(markers)
+        self._longest = max(map(len, self._markers))
+        self._leads = {m[0] for m in self._markers}
+        self._hold = ""                 # Partial marker, or text after an open marker
+        self._marker = None             # Marker whose command line is being collected
+        self._scanned = 0               # Chars of _hold already searched for a newline
+
+    def reset(self):
+        """Drop any held-back text (new stream)."""
+        self._hold, self._marker, self._scanned = "", None, 0
+
+    def feed(self, text: str) -> List[tuple]:
+        """Scan newly arrived text and return the events it completes."""
+        events: List[tuple] = []
+        data = self._hold + text
+        self._hold = ""
+        while data:
+            if self._marker is not None:
+                data = self._collect_command(data, events)
+                continue
+            # Held-back text is shorter than any marker, so this only
+            # re-reads a few chars in front of the new text
+            hit, marker = -1, None
+            for candidate in self._markers:
+                pos = data.find(candidate)
+                if pos != -1 and (hit == -1 or pos < hit):
+                    hit, marker = pos, candidate
+            if marker is None:
+                keep = self._partial_marker_len(data)
+                if keep < len(data):
+                    events.append(("text", data[:len(data) - keep]))
+                self._hold = data[len(data) - keep:]
+                break
+            if hit:
+                events.append(("text", data[:hit]))
+            self._marker, self._scanned = marker, 0
+            data = data[hit + len(marker):]
+        return events
+
+    def flush(self) -> List[tuple]:
+        """End of stream: release held text and any unterminated command."""
+        events: List[tuple] = []
+        if self._marker is not None:
+            command = self._hold.strip()
+            if command:
+                events.append((self._marker, command))
+            else:
+                events.append(("text", self._marker + self._hold))
+        elif self._hold:
+            events.append(("text", self._hold))
+        self.reset()
+        return events
+
+    def _collect_command(self, data: str, events: List[tuple]) -> str:
+        """Consume blank lines after a marker, then the first non-empty line."""
+        while True:
+            newline = data.find('\n', self._scanned)
+            if newline == -1:
+                self._hold, self._scanned = data, len(data)
+                return ""
+            command = data[:newline].strip()
+            if command:
+                events.append((self._marker, command))
+                self._marker, self._scanned = None, 0
+                # Remainder keeps its leading newline, as before
+                return data[newline:]
+            data, self._scanned = data[newline + 1:], 0
+
+    def _partial_marker_len(self, data: str) -> int:
+        """Length of the longest suffix of data that could start a marker."""
+        start = max(0, len(data) - self._longest + 1)
+        for lead in self._leads:
+            pos = data.find(lead, start)
+            while pos != -1:
+                tail = data[pos:]
+                if any(m.startswith(tail) for m in self._markers):
+                    return len(tail)
+                pos = data.find(lead, pos + 1)
+        return 0
+
+
 class FrankensteinTerminal:
     """
     Git Bash-style terminal emulator for Frankenstein 1.0
@@ -86,7 +189,7 @@ class FrankensteinTerminal:
     - Utilities: echo, clear, help, history, exit
     """
     
-    def __init__(self):
+    def __init__(self, scrollback_lines: int = SCROLLBACK_LINES, page_lines: int = PAGE_LINES):
         self._root: Optional[ctk.CTk] = None
         self._running = False
         self._thread: Optional[threading.Thread] = None
@@ -98,6 +201,9 @@ class FrankensteinTerminal:
         
         # UI elements
         self._output_text: Optional[ctk.CTkTextbox] = None
+        self._output = TerminalOutputBuffer(max_lines=scrollback_lines, page_lines=page_lines)
+        # Runs inline until the Tk thread binds it (see _run_terminal)
+        self._executor = CommandExecutor(inline=True)
         self._input_entry: Optional[ctk.CTkEntry] = None
         self._context_menu = None
         
@@ -121,6 +227,8 @@ class FrankensteinTerminal:
             'move': self._cmd_mv,  # Windows alias
             'clear': self._cmd_clear,
             'cls': self._cmd_clear,  # Windows alias
+            'more': self._cmd_more,
+            'jobs': self._cmd_jobs,
             'help': self._cmd_help,
             'history': self._cmd_history,
             'exit': self._cmd_exit,
@@ -236,7 +344,10 @@ class FrankensteinTerminal:
         self._frank_pending_quantum = None   # tuple(action, kwargs): quantum op awaiting approval
         self._frank_pending_tier    = 0      # int: 1=DESTROY needs CONFIRM, 2=MODIFY needs y/n
         self._frank_exec_log        = []     # list[dict]: session audit trail
-        self._frank_exec_buffer     = ""     # str: token accumulator for ::EXEC:: / ::QUANTUM:: detection
+        self._frank_scanner         = StreamMarkerScanner()  # ::EXEC:: / ::QUANTUM:: detection
+        self._frank_token_lock      = threading.Lock()
+        self._frank_token_batch     = []     # list[str]: tokens received since the last frame
+        self._frank_frame_pending   = False  # True while a frame flush is scheduled
         self._quantum_tool          = None   # QuantumTool singleton for FRANK chat dispatch
     
     def start(self) -> bool:
@@ -303,6 +414,12 @@ class FrankensteinTerminal:
         
         # Show welcome message
         self._show_welcome()
+
+        # Commands run off the Tk thread from here on
+        self._executor.on_start = self._on_job_start
+        self._executor.on_finish = self._on_job_finish
+        self._executor.bind_ui_thread()
+        self._ui_tick()
         
         # Focus the input
         self._root.after(100, lambda: self._input_entry.focus_force())
@@ -406,6 +523,7 @@ class FrankensteinTerminal:
             border_width=0
         )
         self._output_text.grid(row=0, column=0, sticky="nsew", padx=4, pady=4)
+        self._output.attach(self._output_text, self._root)
         
         # ==================== LIVE MONITOR PANEL - LAB INSTRUMENTS ====================
         self._monitor_frame = ctk.CTkFrame(
@@ -796,6 +914,7 @@ class FrankensteinTerminal:
         self._root.bind("<Control-k>", lambda e: (self._clear_input(),  "break")[1])
         self._root.bind("<Control-K>", lambda e: (self._clear_input(),  "break")[1])
         self._root.bind("<F1>",        lambda e: (self._execute_command("help"), "break")[1])
+        self._root.bind("<Control-c>", self._on_ctrl_c)
 
         # ── Frank AI toggle ─────────────────────────────────────────────────
         self._root.bind("<Control-f>", lambda e: (self._keybind_frank_toggle(), "break")[1])
@@ -950,6 +1069,8 @@ class FrankensteinTerminal:
     def _on_close(self):
         """Handle window close"""
         self._running = False
+        self._executor.shutdown()
+        self._output.close()
         self._root.destroy()
     
     def _get_prompt(self) -> str:
@@ -1146,10 +1267,8 @@ class FrankensteinTerminal:
         self._write_output(welcome, color="#00ff88")
 
     def _write_output(self, text: str, color: str = None):
-        """Write text to output area"""
-        if self._output_text:
-            self._output_text.insert("end", text)
-            self._output_text.see("end")
+        """Write text to output area (coalesced and paged by TerminalOutputBuffer)"""
+        self._output.write(text)
     
     def _write_error(self, text: str):
         """Write error message to output"""
@@ -1159,8 +1278,27 @@ class FrankensteinTerminal:
         """Write success message to output"""
         self._write_output(f"✅ {text}\n")
     
+    # Built-in commands that never touch Tk widgets: safe on a worker thread
+    _WORKER_COMMANDS = frozenset({
+        'ls', 'dir', 'cat', 'type', 'head', 'tail', 'wc', 'grep', 'find',
+    })
+    _WORKER_SYNTHESIS = frozenset({
+        'compute', 'calc', 'quantum', 'physics', 'math', 'diff', 'differentiate',
+        'integrate', 'solve', 'lorentz', 'schrodinger',
+    })
+    _WORKER_QUANTUM = frozenset({
+        'mesolve', 'decohere', 'transpile', 'encrypt', 'decrypt', 'entropy',
+    })
+    _UI_TICK_MS = 30    # Drain worker output / executor callbacks this often
+
     def _execute_command(self, command_line: str, _from_frank_guard: bool = False):
-        """Parse and execute a command"""
+        """
+        Parse and execute a command.
+
+        Commands run through the CommandExecutor in submission order: those
+        that never touch Tk on a worker thread, the rest on the Tk thread.
+        A trailing '&' runs a worker-safe command in the background.
+        """
         # Check if in FRANK chat mode — route user keyboard input to FRANK handler.
         # BUT: when _from_frank_guard=True, Frank's own ::EXEC:: dispatch or an
         # approved pending command needs to reach the real command handlers.
@@ -1169,57 +1307,158 @@ class FrankensteinTerminal:
             self._handle_frank_input(command_line)
             return
 
+        background = False
+        stripped = command_line.rstrip()
+        if stripped.endswith("&") and not stripped.endswith("&&"):
+            background = True
+            command_line = stripped[:-1].rstrip()
+
         # Check if in quantum mode - route to quantum handler
         if self._in_quantum_mode and self._quantum_mode:
-            # Show prompt with command
-            self._write_output(f"{self._quantum_mode.get_prompt()} {command_line}\n")
-            
-            # Handle in quantum mode
-            stay_in_mode = self._quantum_mode.handle_command(command_line)
-            
-            if not stay_in_mode:
-                self._in_quantum_mode = False
-                self._update_prompt()
-                # Restore FRANK to normal inference profile (Profile B)
-                try:
-                    from agents.sauron import is_loaded, get_sauron
-                    if is_loaded():
-                        get_sauron().set_quantum_active(False)
-                except Exception:
-                    pass
+            words = command_line.split()
+            name = words[0].lower() if words else ""
+            self._submit_command(
+                name, command_line,
+                lambda: self._run_quantum_command(command_line),
+                off_ui=name in self._WORKER_QUANTUM, background=background,
+            )
             return
-        
-        # Show the command with prompt
-        self._write_output(f"{self._get_prompt()} {command_line}\n")
-        
+
         # Parse command and arguments
         parts = self._parse_command(command_line)
         if not parts:
+            self._write_output(f"{self._get_prompt()} {command_line}\n")
             return
-        
+
+        cmd = parts[0].lower()
+        self._submit_command(
+            cmd, command_line,
+            lambda: self._run_command(command_line, parts, paged=not background),
+            off_ui=self._runs_off_ui(cmd, parts[1:]), background=background,
+        )
+
+    def _runs_off_ui(self, cmd: str, args: List[str]) -> bool:
+        """True if the command only computes and writes output (no Tk calls)."""
+        if cmd not in self._commands:
+            return True     # System command: subprocess only
+        if cmd in self._WORKER_COMMANDS:
+            return True
+        if cmd in ('synthesis', 'synth'):
+            return bool(args) and args[0].lower() in self._WORKER_SYNTHESIS
+        return False
+
+    def _submit_command(self, name: str, command_line: str, run: Callable,
+                        off_ui: bool, background: bool):
+        """Hand a command to the executor; background jobs are announced now."""
+        if background and not off_ui:
+            self._write_output(f"{self._get_prompt()} {command_line} &\n")
+            self._write_output(f"bg: '{name}' needs the UI thread; running in the foreground\n")
+            background = False
+        job = self._executor.submit(name, command_line, run, off_ui=off_ui, background=background)
+        if job.background:
+            self._write_output(f"{self._get_prompt()} {command_line} &\n[{job.job_id}] started\n")
+
+    def _run_command(self, command_line: str, parts: List[str], paged: bool = True):
+        """Run one parsed command (executor job body; any thread)"""
+        job = self._executor.current_job()
+        if job is None or not job.background:
+            # Show the command with prompt
+            self._write_output(f"{self._get_prompt()} {command_line}\n")
+
         cmd = parts[0].lower()
         args = parts[1:]
-        
+
         # Commands that need raw command line (to preserve quotes)
         raw_commands = {'python', 'node', 'git', 'pip', 'npm', 'conda', 'ssh', 'scp'}
-        
-        # Check if it's a built-in command
-        if cmd in self._commands:
-            try:
-                if cmd in raw_commands:
-                    # Pass raw command line for these commands
-                    self._commands[cmd](args, command_line)
-                else:
+
+        # Output past one page is spilled to disk (see 'more')
+        if paged:
+            self._output.begin_command()
+        try:
+            # Check if it's a built-in command
+            if cmd in self._commands:
+                try:
+                    if cmd in raw_commands:
+                        # Pass raw command line for these commands
+                        self._commands[cmd](args, command_line)
+                    else:
+                        self._commands[cmd](args)
+                except TypeError:
+                    # Fallback if command doesn't accept raw_line
                     self._commands[cmd](args)
-            except TypeError:
-                # Fallback if command doesn't accept raw_line
-                self._commands[cmd](args)
-            except Exception as e:
-                self._write_error(str(e))
-        else:
-            # Try to execute as system command
-            self._execute_system_command(command_line)
-    
+                except Exception as e:
+                    self._write_error(str(e))
+            else:
+                # Try to execute as system command
+                self._execute_system_command(command_line)
+        finally:
+            if paged:
+                self._output.end_command()
+
+    def _run_quantum_command(self, command_line: str):
+        """Run one quantum-mode command (executor job body; any thread)"""
+        # Show prompt with command
+        self._write_output(f"{self._quantum_mode.get_prompt()} {command_line}\n")
+
+        # Handle in quantum mode
+        stay_in_mode = self._quantum_mode.handle_command(command_line)
+
+        if not stay_in_mode:
+            self._executor.call_on_ui(self._leave_quantum_mode)
+
+    def _leave_quantum_mode(self):
+        self._in_quantum_mode = False
+        self._update_prompt()
+        # Restore FRANK to normal inference profile (Profile B)
+        try:
+            from agents.sauron import is_loaded, get_sauron
+            if is_loaded():
+                get_sauron().set_quantum_active(False)
+        except Exception:
+            pass
+
+    def _check_cancel(self):
+        """Cancellation point for long command loops (raises CommandCancelled)"""
+        self._executor.check()
+
+    # ── Executor callbacks (Tk thread) ───────────────────────────────────────
+
+    def _ui_tick(self):
+        """Tk thread: run queued executor work and flush worker output."""
+        if not self._running or not self._root:
+            return
+        self._executor.drain_ui()
+        self._output.flush()
+        self._root.after(self._UI_TICK_MS, self._ui_tick)
+
+    def _on_job_start(self, job):
+        if not job.background and self._status_label:
+            self._status_label.configure(text="  ⚡ WORKING  ", text_color=self._colors['warning_amber'])
+
+    def _on_job_finish(self, job):
+        if job.status == "cancelled":
+            label = f"[{job.job_id}] " if job.background else ""
+            self._write_output(f"^C {label}{job.command_line}: cancelled after {job.run_ms / 1000:.2f}s\n")
+        elif job.background:
+            self._write_output(f"[{job.job_id}] done ({job.run_ms / 1000:.2f}s): {job.command_line}\n")
+        if job.status == "error":
+            self._write_error(f"{job.name}: {job.error}")
+        if job.off_ui and not job.background and not self._executor.busy and self._status_label:
+            self._status_label.configure(text="  ● ALIVE  ", text_color=self._colors['electric_green'])
+        self._update_prompt()
+
+    def _on_ctrl_c(self, event=None):
+        """Ctrl+C: cancel the running command unless text is selected (copy)."""
+        try:
+            if self._root.selection_get():
+                return None
+        except Exception:
+            pass
+        job = self._executor.cancel()
+        if job is None:
+            return None
+        return "break"
+
     def _parse_command(self, command_line: str) -> List[str]:
         """Parse command line into parts, respecting quotes"""
         parts = []
@@ -1264,37 +1503,55 @@ class FrankensteinTerminal:
         return path.resolve()
     
     def _execute_system_command(self, command: str):
-        """Execute a system command via subprocess"""
+        """Execute a system command via subprocess (Ctrl+C kills it)"""
+        job = self._executor.current_job()
         try:
-            self._status_label.configure(text="  ⚡ WORKING  ", text_color=self._colors['warning_amber'])
-            self._root.update()
-            
-            # Run command
-            result = subprocess.run(
+            proc = subprocess.Popen(
                 command,
                 shell=True,
-                capture_output=True,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
                 text=True,
                 cwd=str(self._cwd),
-                timeout=30
+                # Own process group, so cancel/timeout also kill the shell's children
+                start_new_session=sys.platform != 'win32'
             )
+            if job is not None:
+                job.token.on_cancel(lambda: self._kill_process_tree(proc))
+            try:
+                stdout, stderr = proc.communicate(timeout=30)
+            except subprocess.TimeoutExpired:
+                self._kill_process_tree(proc)
+                proc.communicate()
+                self._write_error("Command timed out after 30 seconds")
+                return
+            self._check_cancel()
             
-            if result.stdout:
-                self._write_output(result.stdout)
-            if result.stderr:
-                self._write_output(result.stderr)
-            
-            if result.returncode != 0 and not result.stdout and not result.stderr:
-                self._write_error(f"Command '{command}' returned exit code {result.returncode}")
+            if stdout:
+                self._write_output(stdout)
+            if stderr:
+                self._write_output(stderr)
             
-            self._status_label.configure(text="  ● ALIVE  ", text_color=self._colors['electric_green'])
+            if proc.returncode != 0 and not stdout and not stderr:
+                self._write_error(f"Command '{command}' returned exit code {proc.returncode}")
             
-        except subprocess.TimeoutExpired:
-            self._write_error("Command timed out after 30 seconds")
-            self._status_label.configure(text="  ● ALIVE  ", text_color=self._colors['electric_green'])
         except Exception as e:
             self._write_error(f"Failed to execute: {e}")
-            self._status_label.configure(text="  ● ALIVE  ", text_color=self._colors['electric_green'])
+
+    @staticmethod
+    def _kill_process_tree(proc: subprocess.Popen):
+        """Kill a shell=True subprocess together with the command it started"""
+        if proc.poll() is not None:
+            return
+        try:
+            if sys.platform == 'win32':
+                subprocess.run(["taskkill", "/T", "/F", "/PID", str(proc.pid)],
+                               capture_output=True, timeout=10)
+            else:
+                import signal
+                os.killpg(proc.pid, signal.SIGKILL)
+        except Exception:
+            proc.kill()
 
     # ==================== BUILT-IN COMMANDS ====================
     
@@ -1382,6 +1639,7 @@ class FrankensteinTerminal:
             return
         
         for filename in args:
+            self._check_cancel()
             path = self._resolve_path(filename)
             if not path.exists():
                 self._write_error(f"cat: {filename}: No such file")
@@ -1408,6 +1666,14 @@ class FrankensteinTerminal:
             text = text.replace(f"${{{key}}}", value)
         self._write_output(text + "\n")
 
+    @staticmethod
+    def _invalidate_search(*paths: Path):
+        """Make search indexes covering written paths re-scan before find/grep use them"""
+        module = sys.modules.get("core.search_index")
+        if module is not None:
+            for path in paths:
+                module.invalidate_search_indexes(path)
+
     def _cmd_touch(self, args: List[str]):
         """Create empty file or update timestamp (touch)"""
         if not args:
@@ -1418,6 +1684,7 @@ class FrankensteinTerminal:
             path = self._resolve_path(filename)
             try:
                 path.touch()
+                self._invalidate_search(path)
                 self._write_success(f"Created/updated: {filename}")
             except Exception as e:
                 self._write_error(f"touch: {filename}: {e}")
@@ -1438,6 +1705,7 @@ class FrankensteinTerminal:
                     path.mkdir(parents=True, exist_ok=True)
                 else:
                     path.mkdir()
+                self._invalidate_search(path)
                 self._write_success(f"Created directory: {dirname}")
             except FileExistsError:
                 self._write_error(f"mkdir: {dirname}: Directory exists")
@@ -1465,11 +1733,13 @@ class FrankensteinTerminal:
                 if path.is_dir():
                     if recursive:
                         shutil.rmtree(path)
+                        self._invalidate_search(path)
                         self._write_success(f"Removed directory: {filename}")
                     else:
                         self._write_error(f"rm: {filename}: Is a directory (use -r)")
                 else:
                     path.unlink()
+                    self._invalidate_search(path)
                     self._write_success(f"Removed: {filename}")
             except Exception as e:
                 self._write_error(f"rm: {filename}: {e}")
@@ -1484,6 +1754,7 @@ class FrankensteinTerminal:
             path = self._resolve_path(dirname)
             try:
                 path.rmdir()
+                self._invalidate_search(path)
                 self._write_success(f"Removed directory: {dirname}")
             except OSError as e:
                 if "not empty" in str(e).lower():
@@ -1514,12 +1785,14 @@ class FrankensteinTerminal:
                     if recursive:
                         target = dest / src.name if dest.is_dir() else dest
                         shutil.copytree(src, target)
+                        self._invalidate_search(target)
                         self._write_success(f"Copied directory: {src_name}")
                     else:
                         self._write_error(f"cp: {src_name}: Is a directory (use -r)")
                 else:
                     target = dest / src.name if dest.is_dir() else dest
                     shutil.copy2(src, target)
+                    self._invalidate_search(target)
                     self._write_success(f"Copied: {src_name}")
             except Exception as e:
                 self._write_error(f"cp: {src_name}: {e}")
@@ -1544,14 +1817,55 @@ class FrankensteinTerminal:
             try:
                 target = dest / src.name if dest.is_dir() else dest
                 shutil.move(str(src), str(target))
+                self._invalidate_search(src, target)
                 self._write_success(f"Moved: {src_name}")
             except Exception as e:
                 self._write_error(f"mv: {src_name}: {e}")
 
     def _cmd_clear(self, args: List[str] = None):
         """Clear terminal (clear/cls)"""
-        if self._output_text:
-            self._output_text.delete("1.0", "end")
+        self._output.clear()
+
+    def _cmd_jobs(self, args: List[str] = None):
+        """List running/queued/background commands, show latency stats, or cancel one"""
+        sub = args[0].lower() if args else ""
+        if sub == "stats":
+            stats = self._executor.stats()
+            self._write_output(
+                f"\n  Commands: {stats['completed']} run, {stats['cancelled']} cancelled, "
+                f"mean queue wait {stats['mean_wait_ms']:.1f} ms\n"
+            )
+            self._write_output(f"  {'command':<14}{'count':>7}{'mean ms':>10}{'p50':>9}{'p95':>9}{'max':>10}\n")
+            for name, h in sorted(stats['commands'].items(), key=lambda kv: -kv[1]['count']):
+                self._write_output(
+                    f"  {name:<14}{h['count']:>7}{h['mean_ms']:>10.1f}{h['p50_ms']:>9.0f}"
+                    f"{h['p95_ms']:>9.0f}{h['max_ms']:>10.1f}\n"
+                )
+            self._write_output("\n")
+        elif sub == "cancel":
+            if len(args) < 2 or not args[1].isdigit():
+                self._write_error("jobs: usage: jobs cancel ID")
+                return
+            job = self._executor.cancel(int(args[1]))
+            if job is None:
+                self._write_error(f"jobs: no job {args[1]}")
+            else:
+                self._write_output(f"[{job.job_id}] cancelling: {job.command_line}\n")
+        else:
+            current = self._executor.current_job()
+            jobs = [j for j in self._executor.jobs() if j is not current]
+            if not jobs:
+                self._write_output("No running or queued commands\n")
+            for job in jobs:
+                where = "bg" if job.background else ("worker" if job.off_ui else "ui")
+                self._write_output(
+                    f"  [{job.job_id}] {job.status:<9} {where:<7}{job.run_ms / 1000:>8.2f}s  {job.command_line}\n"
+                )
+
+    def _cmd_more(self, args: List[str] = None):
+        """Show the next page of the last command whose output was spilled to disk"""
+        if not self._output.more():
+            self._write_output("more: no paged output\n")
     
     def _cmd_history(self, args: List[str]):
         """Show command history"""
@@ -1588,6 +1902,7 @@ class FrankensteinTerminal:
             return
         
         for filename in files:
+            self._check_cancel()
             path = self._resolve_path(filename)
             if not path.exists():
                 self._write_error(f"head: {filename}: No such file")
@@ -1623,6 +1938,7 @@ class FrankensteinTerminal:
             return
         
         for filename in files:
+            self._check_cancel()
             path = self._resolve_path(filename)
             if not path.exists():
                 self._write_error(f"tail: {filename}: No such file")
@@ -1645,6 +1961,7 @@ class FrankensteinTerminal:
             return
         
         for filename in files:
+            self._check_cancel()
             path = self._resolve_path(filename)
             if not path.exists():
                 self._write_error(f"wc: {filename}: No such file")
@@ -1661,7 +1978,7 @@ class FrankensteinTerminal:
                 self._write_error(f"wc: {filename}: {e}")
     
     def _cmd_grep(self, args: List[str]):
-        """Search for pattern in files (grep)"""
+        """Search for pattern in files (grep); directories are searched recursively"""
         if len(args) < 2:
             self._write_error("grep: usage: grep PATTERN FILE...")
             return
@@ -1671,22 +1988,52 @@ class FrankensteinTerminal:
         ignore_case = "-i" in args
         if ignore_case:
             files = [f for f in files if f != "-i"]
+        check_pattern = pattern.lower() if ignore_case else pattern
         
         for filename in files:
+            self._check_cancel()
             path = self._resolve_path(filename)
             if not path.exists():
                 self._write_error(f"grep: {filename}: No such file")
                 continue
             
-            try:
-                with open(path, 'r', encoding='utf-8', errors='replace') as f:
-                    for i, line in enumerate(f, 1):
-                        check_line = line.lower() if ignore_case else line
-                        check_pattern = pattern.lower() if ignore_case else pattern
-                        if check_pattern in check_line:
-                            self._write_output(f"{filename}:{i}:{line}")
-            except Exception as e:
-                self._write_error(f"grep: {filename}: {e}")
+            if path.is_dir():
+                targets = [(p, os.path.join(filename, str(p.relative_to(path))))
+                           for p in self._grep_candidates(path, pattern, ignore_case)]
+            else:
+                targets = [(path, filename)]
+            
+            for target, label in targets:
+                self._check_cancel()
+                try:
+                    with open(target, 'r', encoding='utf-8', errors='replace') as f:
+                        for i, line in enumerate(f, 1):
+                            if i % 4096 == 0:
+                                self._check_cancel()
+                            check_line = line.lower() if ignore_case else line
+                            if check_pattern in check_line:
+                                self._write_output(f"{label}:{i}:{line}")
+                except FileNotFoundError:
+                    continue        # Removed since the index snapshot
+                except Exception as e:
+                    self._write_error(f"grep: {label}: {e}")
+
+    def _grep_candidates(self, directory: Path, pattern: str, ignore_case: bool) -> List[Path]:
+        """Files under a directory that may contain pattern, via the search index"""
+        try:
+            from core.search_index import get_search_index
+            index = get_search_index(directory)
+            if index.ensure_fresh():
+                flags = re.IGNORECASE if ignore_case else 0
+                # Materialized here: the generator raises only when iterated
+                return list(index.content_candidates(re.escape(pattern), flags, under=directory))
+        except Exception:
+            pass
+        files = []
+        for dirpath, dirnames, filenames in os.walk(directory):
+            dirnames.sort()
+            files.extend(Path(dirpath) / name for name in sorted(filenames))
+        return files
 
     def _cmd_find(self, args: List[str]):
         """Find files (simplified find)"""
@@ -1707,7 +2054,26 @@ class FrankensteinTerminal:
             return
         
         try:
-            for path in start_path.rglob("*"):
+            paths = None
+            if start_path.is_dir():
+                try:
+                    from core.search_index import get_search_index
+                    index = get_search_index(start_path)
+                    if index.ensure_fresh():
+                        needle = name_pattern.replace("*", "") if name_pattern else ""
+                        glob = f"*{needle}*" if needle and not any(c in needle for c in "?[") else "*"
+                        # Skip entries removed since the index snapshot
+                        paths = [p for p, _ in index.find(glob, under=start_path, include_dirs=True,
+                                                           ignore_case=True, match_path=False)
+                                 if p.exists()]
+                except Exception:
+                    paths = None
+            if paths is None:
+                paths = start_path.rglob("*")
+            
+            for count, path in enumerate(paths):
+                if count % 256 == 0:
+                    self._check_cancel()
                 if name_pattern:
                     if name_pattern.replace("*", "") in path.name.lower():
                         self._write_output(f"{path}\n")
@@ -1777,21 +2143,14 @@ class FrankensteinTerminal:
         """Write FRANK-branded output in purple (#7c3aed). Main thread only."""
         if not self._output_text:
             return
-        try:
-            # Configure the frank_output tag once per widget lifetime
-            if not getattr(self, '_frank_tag_ready', False):
+        # Configure the frank_output tag once per widget lifetime
+        if not getattr(self, '_frank_tag_ready', False):
+            try:
                 self._output_text.tag_config("frank_output", foreground="#7c3aed")
-                self._frank_tag_ready = True
-            # Insert text and tag the inserted range
-            start = self._output_text.index("end-1c")
-            self._output_text.insert("end", text)
-            end = self._output_text.index("end-1c")
-            self._output_text.tag_add("frank_output", start, end)
-            self._output_text.see("end")
-        except Exception:
-            # Fallback: plain white if tags unavailable
-            self._output_text.insert("end", text)
-            self._output_text.see("end")
+            except Exception:
+                pass  # Plain white if tags unavailable
+            self._frank_tag_ready = True
+        self._output.write(text, "frank_output", paged=False)
 
     def _cmd_frank_ai(self, args: List[str]):
         """[FRANK] Eye of Sauron AI — Usage: frank [status|chat|ask|unload|reset|agents]"""
@@ -2890,6 +3249,9 @@ PERMANENTLY FORBIDDEN (⛔ always blocked, no override):
         self._frank_thinking    = True
         self._frank_spinner_idx = 0
         self._frank_last_active = time.time()
+        self._frank_scanner.reset()
+        with self._frank_token_lock:
+            self._frank_token_batch = []
         # Print response header
         self._write_frank("\n[FRANK]  ")
         # Start spinner in header status bar
@@ -2903,6 +3265,7 @@ PERMANENTLY FORBIDDEN (⛔ always blocked, no override):
         self._frank_thread.start()
 
     _FRANK_STREAM_TIMEOUT = 90  # seconds — max wait between tokens
+    _FRANK_FRAME_MS = 33        # token batches are rendered at most once per frame
 
     def _frank_stream_worker(self, message: str, stream_func):
         """Background thread: pull tokens with timeout and schedule GUI writes."""
@@ -2930,21 +3293,19 @@ PERMANENTLY FORBIDDEN (⛔ always blocked, no override):
                     kind, value = token_q.get(timeout=self._FRANK_STREAM_TIMEOUT)
                 except _queue.Empty:
                     # No token arrived within the timeout window
-                    self._root.after(0, lambda: self._write_frank(
+                    self._root.after(0, lambda: self._frank_stream_notice(
                         "\n[FRANK] Timed out — no response from model "
                         f"(waited {self._FRANK_STREAM_TIMEOUT}s).\n"
                     ))
                     break
                 if kind == "token":
-                    self._root.after(
-                        0, lambda t=value: self._on_frank_token(t)
-                    )
+                    self._on_frank_token(value)
                 elif kind == "done":
                     break
                 elif kind == "error":
                     err = value
                     self._root.after(
-                        0, lambda: self._write_frank(
+                        0, lambda: self._frank_stream_notice(
                             f"\n[FRANK] Stream error: {err}\n"
                         )
                     )
@@ -2954,73 +3315,52 @@ PERMANENTLY FORBIDDEN (⛔ always blocked, no override):
 
     def _on_frank_token(self, token: str):
         """
-        Main thread: handle a single streamed token.
-        Accumulates into _frank_exec_buffer watching for ::EXEC:: and ::QUANTUM:: markers.
-        ::QUANTUM::action|param=value  → dispatched to _frank_quantum_dispatch()
-        ::EXEC::command                → dispatched to _frank_guard_exec()
-        All other tokens display immediately.
-        """
-        _MARKER_QUANTUM = '::QUANTUM::'
-        _MARKER_EXEC    = '::EXEC::'
-        self._frank_exec_buffer += token
-
-        # ── Check for ::QUANTUM:: marker ────────────────────────────────────
-        if _MARKER_QUANTUM in self._frank_exec_buffer:
-            pre, _, rest = self._frank_exec_buffer.partition(_MARKER_QUANTUM)
-            # Find the first non-empty line after the marker
-            # (handles both "::QUANTUM::action" and "::QUANTUM::\naction")
-            line, remainder = self._extract_marker_command(rest)
-            if line:
-                if pre:
-                    self._write_frank(pre)
-                self._frank_exec_buffer = remainder
-                self._root.after(0, lambda l=line: self._frank_quantum_dispatch(l))
-                return
-            # Marker present but action not complete yet — keep buffering
-            return
+        Stream thread: queue a token for the next frame.
 
-        # ── Check for ::EXEC:: marker ────────────────────────────────────────
-        if _MARKER_EXEC in self._frank_exec_buffer:
-            pre, _, rest = self._frank_exec_buffer.partition(_MARKER_EXEC)
-            cmd, remainder = self._extract_marker_command(rest)
-            if cmd:
-                if pre:
-                    self._write_frank(pre)
-                self._frank_exec_buffer = remainder
-                self._root.after(0, lambda c=cmd: self._frank_guard_exec(c))
+        Schedules at most one main-thread flush per _FRANK_FRAME_MS instead
+        of one Tk callback per token.
+        """
+        with self._frank_token_lock:
+            self._frank_token_batch.append(token)
+            if self._frank_frame_pending:
                 return
-            # Marker present but command not complete yet — keep buffering
-            return
+            self._frank_frame_pending = True
+        self._root.after(self._FRANK_FRAME_MS, self._frank_render_frame)
 
-        # No marker — write full buffer (includes any post-dispatch remainder) and clear
-        self._write_frank(self._frank_exec_buffer)
-        self._frank_exec_buffer = ""
-
-    @staticmethod
-    def _extract_marker_command(rest: str):
+    def _frank_render_frame(self):
         """
-        Given the text after a ::MARKER::, return (command, remainder).
-        Handles both formats:
-          '::EXEC::git status\nMore text'   → ('git status', '\nMore text')
-          '::EXEC::\ngit status\nMore text' → ('git status', '\nMore text')
-        Returns ('', '') if no non-empty line has arrived yet.
+        Main thread: render every token received since the last frame.
+        ::QUANTUM::action|param=value  → dispatched to _frank_quantum_dispatch()
+        ::EXEC::command                → dispatched to _frank_guard_exec()
+        All other text is written with a single widget insert.
         """
-        for i, raw_line in enumerate(rest.split('\n')):
-            stripped = raw_line.strip()
-            if stripped:
-                # Found the command — remainder is everything after this line
-                consumed = '\n'.join(rest.split('\n')[:i + 1])
-                leftover = rest[len(consumed):]
-                return stripped, leftover
-        # All lines so far are empty — keep buffering
-        return '', ''
+        with self._frank_token_lock:
+            batch, self._frank_token_batch = self._frank_token_batch, []
+            self._frank_frame_pending = False
+        if batch:
+            self._frank_render_events(self._frank_scanner.feed("".join(batch)))
+
+    def _frank_render_events(self, events: List[tuple]):
+        """Main thread: write scanner text events and schedule marker dispatches."""
+        text = "".join(value for kind, value in events if kind == "text")
+        if text:
+            self._write_frank(text)
+        for kind, value in events:
+            if kind == StreamMarkerScanner.MARKER_QUANTUM:
+                self._root.after(0, lambda l=value: self._frank_quantum_dispatch(l))
+            elif kind == StreamMarkerScanner.MARKER_EXEC:
+                self._root.after(0, lambda c=value: self._frank_guard_exec(c))
+
+    def _frank_stream_notice(self, text: str):
+        """Main thread: write a stream status line after any queued tokens."""
+        self._frank_render_frame()
+        self._write_frank(text)
 
     def _on_frank_stream_done(self):
         """Main thread: called when the stream thread finishes or is interrupted."""
-        # Flush any remaining buffered text that didn't trigger ::EXEC::
-        if self._frank_exec_buffer:
-            self._write_frank(self._frank_exec_buffer)
-            self._frank_exec_buffer = ""
+        # Render queued tokens, then anything the scanner is still holding
+        self._frank_render_frame()
+        self._frank_render_events(self._frank_scanner.flush())
         self._frank_thinking = False
         self._write_frank("\n\n")
         self._frank_last_active = time.time()
@@ -5275,6 +5615,8 @@ PERMANENTLY FORBIDDEN (⛔ always blocked, no override):
                 'cp': 'cp [-r] SRC... DEST - Copy files. -r for directories',
                 'mv': 'mv SRC... DEST - Move/rename files',
                 'clear': 'clear - Clear terminal screen',
+                'more': 'more - Show the next page of long command output (full text is kept in a temp file)',
+                'jobs': 'jobs [stats|cancel ID] - List running/background commands, latency stats, cancel. Append & to run in background; Ctrl+C cancels',
                 'history': 'history - Show command history',
                 'head': 'head [-n N] FILE - Show first N lines (default 10)',
                 'tail': 'tail [-n N] FILE - Show last N lines (default 10)',